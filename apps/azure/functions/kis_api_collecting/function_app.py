@@ -1,48 +1,158 @@
 import json
 import logging
 import os
-from collections import defaultdict
+import time
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import Any, Dict, Iterable, List, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
 
 import azure.functions as func
-from antic_extensions import PsqlDBClient, RedisService
+from antic_extensions import (
+    FreshnessRegistry,
+    IndexTickStore,
+    IntradayTickStore,
+    IntradayTickWriter,
+    InvestorFlowStore,
+    MarketMoversStore,
+    PsqlDBClient,
+    RedisLease,
+    RedisService,
+    WorkerPartitioner,
+    decode_event_payload,
+    encode_event_batches,
+    get_metrics,
+    migrate_investor_trade,
+    migrate_stock_history,
+    set_metrics,
+)
+from antic_extensions.modules.database import RedisClient
+from antic_extensions.modules.metrics import OpenTelemetryMetrics, opentelemetry_tracer
+from psycopg2.extras import execute_values
 from kis_api import (
+    DEFAULT_INDEX_CODES,
+    CollectorDispatcher,
+    CollectorJob,
     KISClient,
+    KISClientPool,
     fetch_inquire_daily_itemchartprice,
+    fetch_inquire_index_price,
+    fetch_inquire_index_tickprice,
     fetch_inquire_price,
-    fetch_inquire_time_itemconclusion,
+    fetch_intstock_multprice,
     fetch_investor_trade_by_stock_daily,
     fetch_volume_rank,
+    iter_inquire_time_itemconclusion_pages,
+    load_index_codes,
 )
 from kis_api.client import KST
+from kis_api.collectors.inquire_time_itemconclusion import MARKET_OPEN_HOUR
+from kis_api.ranking import diff_volume_rank
+from kis_api.schedule import (
+    PHASE_CLOSED,
+    AdaptiveInterval,
+    KRXCalendar,
+    ranking_churn,
+    ranking_volatility,
+)
+from news_analysis import NewsDataPipelineAPI
+from news_analysis.modules import pubdate_to_datetime
 
 
 app = func.FunctionApp()  # type: ignore
 
-# 공통으로 사용할 KIS API 클라이언트. request_interval로 호출 간격을 조절한다.
-client = KISClient(
-    app_key=os.environ["KIS_APP_KEY"],
-    app_secret=os.environ["KIS_APP_SECRET"],
-    request_interval=float(os.environ.get("KIS_REQUEST_INTERVAL", 0.5) or 0.5),
+# Functions 호스트에는 scrape 할 /metrics가 없으므로, OTEL_TRACING=true이면 KIS/Redis/SQL 호출을
+# OpenTelemetry span과 Meter 히스토그램/카운터로 남긴다. azure-monitor-opentelemetry가 설치되어 있으면
+# tracer/meter provider를 설정해 Application Insights로 보낸다. (없으면 앱이 설정한 provider, 미설정 시 no-op)
+# 클라이언트에는 get_metrics() 위임 객체를 넘기므로, 로컬 harness는 import 후 set_metrics로 교체할 수 있다.
+if os.environ.get("OTEL_TRACING", "false").lower() == "true":
+    try:
+        from azure.monitor.opentelemetry import configure_azure_monitor
+    except ImportError:
+        logging.info("azure-monitor-opentelemetry is not installed, using the configured OpenTelemetry providers")
+    else:
+        configure_azure_monitor()
+    set_metrics(OpenTelemetryMetrics(
+        tracer=opentelemetry_tracer("kis_api_collecting"),
+        name="kis_api_collecting",
+    ))
+
+
+def _load_kis_credentials() -> List[Tuple[str, str]]:
+    """``KIS_APP_KEY``/``KIS_APP_SECRET``과 추가 앱 키 ``KIS_APP_KEY_2``/``KIS_APP_SECRET_2``, ``_3``, ... 목록."""
+    credentials = [(os.environ["KIS_APP_KEY"], os.environ["KIS_APP_SECRET"])]
+    index = 2
+    while os.environ.get(f"KIS_APP_KEY_{index}"):
+        credentials.append((os.environ[f"KIS_APP_KEY_{index}"], os.environ[f"KIS_APP_SECRET_{index}"]))
+        index += 1
+    return credentials
+
+
+# 앱 키별 KIS API 클라이언트. request_interval은 키마다 모든 스레드가 공유하는 호출 간격이다.
+kis_clients = [
+    KISClient(
+        app_key=app_key,
+        app_secret=app_secret,
+        # 로컬 부하 테스트에서는 test/local_harness.py의 가짜 KIS 서버 주소를 지정한다.
+        base_url=os.environ.get("KIS_BASE_URL") or KISClient.base_url,
+        request_interval=float(os.environ.get("KIS_REQUEST_INTERVAL", 0.5) or 0.5),
+        metrics=get_metrics(),
+    )
+    for app_key, app_secret in _load_kis_credentials()
+]
+# 앱 키가 여럿이면 pool이 요청을 나눠 보내므로 호출 한도가 키 수만큼 늘어난다. (KIS_CLIENT_ROUTING: least_loaded | hash)
+client = (
+    KISClientPool(kis_clients, strategy=os.environ.get("KIS_CLIENT_ROUTING") or "least_loaded")
+    if len(kis_clients) > 1
+    else kis_clients[0]
 )
 
 _redis_service: Optional[RedisService] = None
+_freshness_registry: Optional[FreshnessRegistry] = None
+_tick_store: Optional[IntradayTickStore] = None
+_movers_store: Optional[MarketMoversStore] = None
+_investor_flow_store: Optional[InvestorFlowStore] = None
+_index_tick_store: Optional[IndexTickStore] = None
+_index_codes: Optional[Dict[str, str]] = None
+_tick_writer: Optional[IntradayTickWriter] = None
+_daily_price_migrated = False
+_investor_trade_migrated = False
 _psql_client: Optional[PsqlDBClient] = None
+_news_api: Optional[NewsDataPipelineAPI] = None
+_partitioner: Optional[WorkerPartitioner] = None
+_market_calendar: Optional[KRXCalendar] = None
+
+VOLUME_RANK_SCHEDULE_KEY = "schedule:kis_volume_rank_collect"
+INDEX_CURSOR_KEY = "schedule:kis_index_collect:cursor"
+INDEX_LATEST_KEY = "index:latest"
+# 지수 하나를 갱신할 때의 KIS 호출 수 (현재값 + 시간별 지수)
+INDEX_CALLS_PER_CODE = 2
+# 지수 현재값 중 캐시할 필드 (index:latest)
+INDEX_FIELDS = (
+    "bstp_nmix_prpr",
+    "bstp_nmix_prdy_vrss",
+    "prdy_vrss_sign",
+    "bstp_nmix_prdy_ctrt",
+    "acml_vol",
+    "acml_tr_pbmn",
+    "ascn_issu_cnt",
+    "down_issu_cnt",
+    "stnr_issu_cnt",
+)
 
 
-def _build_volume_rank_schedule() -> str:
+def _build_interval_schedule(env_key: str, default: int = 300) -> str:
     """환경 변수에 정의된 초 단위 주기를 Azure Functions CRON 식으로 변환한다."""
-    raw_value = os.environ.get("VOLUME_RANK_PULLING_INTERVAL", "300")
+    raw_value = os.environ.get(env_key, str(default))
     try:
         interval = max(1, int(raw_value))
     except ValueError:
         logging.warning(
-            "VOLUME_RANK_PULLING_INTERVAL=%s 값이 잘못되어 300초로 대체합니다.",
+            "%s=%s 값이 잘못되어 %s초로 대체합니다.",
+            env_key,
             raw_value,
+            default,
         )
-        interval = 300
+        interval = default
 
     if interval < 60:
         return f"*/{interval} * * * * *"
@@ -61,6 +171,28 @@ def _build_volume_rank_schedule() -> str:
     return "0 */5 * * * *"
 
 
+def _adaptive_schedule_enabled() -> bool:
+    """ADAPTIVE_SCHEDULE=true(기본)이면 휴장 중 KIS 호출을 건너뛰고, 순위 조회 간격을 시장 상황에 맞춘다."""
+    return os.environ.get("ADAPTIVE_SCHEDULE", "true").lower() == "true"
+
+
+def _volume_rank_interval() -> int:
+    """거래량 순위 timer 주기(초). adaptive 모드에서는 가장 짧은 조회 간격이다."""
+    return max(1, _get_int_env("VOLUME_RANK_PULLING_INTERVAL", 60 if _adaptive_schedule_enabled() else 300))
+
+
+def _volume_rank_max_interval() -> int:
+    """adaptive 모드에서 가장 긴 조회 간격(초)."""
+    if not _adaptive_schedule_enabled():
+        return _volume_rank_interval()
+    return max(_volume_rank_interval(), _get_int_env("VOLUME_RANK_MAX_INTERVAL", 600))
+
+
+def _build_volume_rank_schedule() -> str:
+    """거래량 순위 수집 주기(VOLUME_RANK_PULLING_INTERVAL)를 CRON 식으로 변환한다."""
+    return _build_interval_schedule("VOLUME_RANK_PULLING_INTERVAL", _volume_rank_interval())
+
+
 def _resolve_investor_trade_date() -> str:
     """투자자 매매동향 조회일(YYYYMMDD)을 당일로 고정한다."""
     return datetime.now(KST).strftime("%Y%m%d")
@@ -85,9 +217,14 @@ def _ensure_event_sequence(
 def _extract_stock_codes(payload: str) -> List[str]:
     """volume-rank 메시지에서 종목코드를 추출한다."""
     try:
-        parsed = json.loads(payload)
-    except json.JSONDecodeError:
-        logging.warning("Skip message, invalid JSON: %s", payload)
+        parsed = decode_event_payload(payload)
+    except (ValueError, OSError) as exc:
+        logging.warning("Skip message, invalid payload (%d bytes): %s", len(payload), exc)
+        return []
+
+    token = parsed.get("fencing_token") if isinstance(parsed, dict) else None
+    if token and not _accept_fencing_token(token):
+        logging.warning("Skip volume rank message with stale fencing token=%s", token)
         return []
 
     data = parsed.get("output", parsed)
@@ -109,6 +246,33 @@ def _extract_stock_codes(payload: str) -> List[str]:
     return codes[:30]
 
 
+def _accept_fencing_token(token: Any) -> bool:
+    """거래량 순위 lease의 fencing token이 지금까지 받은 가장 큰 token 이상인지 확인한다. (확인할 수 없으면 True)"""
+    lease = _volume_rank_lease()
+    if lease is None:
+        return True
+    try:
+        return lease.accept(int(token))
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.exception("Failed to check fencing token=%s: %s", token, exc)
+        return True
+
+
+def _collect_stock_codes(events: Iterable[func.EventHubEvent]) -> List[str]:
+    """이벤트 배치 전체에서 종목코드를 한 번씩만 (처음 등장한 순서대로) 추출한다."""
+    codes: Dict[str, None] = {}
+    for event in events:
+        raw = event.get_body().decode("utf-8")
+        extracted = _extract_stock_codes(raw)
+        if not extracted:
+            logging.info(
+                "No stock codes found in message sequence=%s",
+                getattr(event, "sequence_number", None),
+            )
+        codes.update(dict.fromkeys(extracted))
+    return list(codes)
+
+
 def _get_int_env(key: str, default: int) -> int:
     try:
         return int(os.environ.get(key, default))
@@ -127,13 +291,270 @@ def _get_redis_service() -> RedisService:
         port = _get_int_env("REDIS_PORT", 6380)
         password = os.environ.get("REDIS_PASSWORD")
         database = _get_int_env("REDIS_DB", 0)
-        _redis_service = RedisService(
-            host=host, port=port, password=password, database=database
-        )
+        if os.environ.get("REDIS_SSL", "true").lower() in ("0", "false", "no"):
+            # 로컬 Redis (TLS 없음)
+            _redis_service = RedisService(
+                host=host,
+                port=port,
+                client=RedisClient(host, port, password, database, ssl=False),
+            )
+        else:
+            _redis_service = RedisService(
+                host=host, port=port, password=password, database=database
+            )
         logging.info("Redis service initialized for %s:%s/%s", host, port, database)
     return _redis_service
 
 
+# 데이터 종류별 기본 허용 지연(초). FRESHNESS_{종류}_SECONDS 환경 변수로 덮어쓴다.
+DEFAULT_FRESHNESS_BUDGETS = {
+    "current_price": 60,
+    "time_itemconclusion": 60,
+    "investor_trade": 600,
+    "daily_chartprice": 6 * 60 * 60,
+}
+
+
+def _get_freshness_registry() -> FreshnessRegistry:
+    """종목/데이터 종류별 마지막 수집 시각을 관리하는 registry를 생성/재사용한다."""
+    global _freshness_registry
+    if _freshness_registry is None:
+        budgets = {
+            data_type: _get_int_env(f"FRESHNESS_{data_type.upper()}_SECONDS", default)
+            for data_type, default in DEFAULT_FRESHNESS_BUDGETS.items()
+        }
+        _freshness_registry = FreshnessRegistry(_get_redis_service(), budgets)
+        logging.info("Freshness registry initialized with budgets=%s", budgets)
+    return _freshness_registry
+
+
+def _get_partitioner() -> Optional[WorkerPartitioner]:
+    """인스턴스 간 종목 분배를 담당하는 WorkerPartitioner를 생성/재사용한다. (WORKER_PARTITIONING=false이면 None)"""
+    global _partitioner
+    if os.environ.get("WORKER_PARTITIONING", "true").lower() != "true":
+        return None
+    if _partitioner is None:
+        # heartbeat는 dispatch 함수가 호출될 때 남기므로, 거래량 순위 주기보다 넉넉하게 유지한다.
+        ttl = _get_int_env(
+            "WORKER_HEARTBEAT_TTL_SECONDS",
+            2 * _volume_rank_max_interval(),
+        )
+        _partitioner = WorkerPartitioner(
+            _get_redis_service(),
+            "kis_volume_rank_dispatch",
+            worker_id=os.environ.get("WEBSITE_INSTANCE_ID") or None,
+            ttl=ttl,
+        )
+        logging.info("Worker partitioner initialized: worker_id=%s ttl=%s", _partitioner.worker_id, ttl)
+    return _partitioner
+
+
+def _timer_lease(name: str, env_key: str, interval: int) -> Optional[RedisLease]:
+    """timer를 주기마다 한 인스턴스만 실행하도록 하는 lease. (``env_key``<=0이면 None)
+
+    실행 후 해제하지 않으므로, 유지 시간 동안 다른 인스턴스(run_on_startup 포함)의 실행은 건너뛴다.
+    기본 유지 시간은 다음 주기의 실행과 겹치지 않도록 수집 주기보다 조금 짧게 둔다.
+    """
+    seconds = _get_int_env(env_key, max(1, interval - min(30, interval // 10)))
+    if seconds <= 0:
+        return None
+    return RedisLease(
+        _get_redis_service(),
+        name,
+        ttl_ms=seconds * 1000,
+        owner=os.environ.get("WEBSITE_INSTANCE_ID") or None,
+        # Redis 장애 시에는 중복 발행이 누락보다 낫다.
+        fail_open=True,
+    )
+
+
+def _volume_rank_lease() -> Optional[RedisLease]:
+    """거래량 순위 timer lease. (VOLUME_RANK_LEASE_SECONDS<=0이면 None)"""
+    return _timer_lease("kis_volume_rank_collect", "VOLUME_RANK_LEASE_SECONDS", _volume_rank_interval())
+
+
+def _volume_rank_shards(data: Dict[str, Any]) -> List[str]:
+    """살아 있는 dispatch worker 수만큼 종목을 consistent hashing으로 나눈 거래량 순위 메시지를 만든다. (worker가 하나 이하이면 원본 한 건)
+
+    output binding은 partition key를 지정할 수 없어 메시지가 어느 인스턴스로 갈지 정할 수 없으므로,
+    나눈 메시지는 받은 인스턴스가 그대로 수집한다. (메시지 수만큼 여러 인스턴스가 나눠 받는다)
+    """
+    payload = json.dumps(data, default=str)
+    partitioner = _get_partitioner()
+    rows = data.get("output")
+    if partitioner is None or not isinstance(rows, list):
+        return [payload]
+    try:
+        partitioner.refresh()
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.exception("Failed to read dispatch workers: %s", exc)
+        return [payload]
+    shares = partitioner.partition(
+        row["mksc_shrn_iscd"] for row in rows if isinstance(row, dict) and row.get("mksc_shrn_iscd")
+    )
+    if len(shares) <= 1:
+        return [payload]
+    return [
+        json.dumps({**data, "output": [row for row in rows if row.get("mksc_shrn_iscd") in owned]}, default=str)
+        for owned in map(set, shares.values())
+    ]
+
+
+def _record_dispatch_heartbeat() -> None:
+    """timer가 메시지를 나눌 dispatch 인스턴스 수를 알 수 있도록 heartbeat를 남긴다. (WORKER_PARTITIONING=false이면 없음)"""
+    partitioner = _get_partitioner()
+    if partitioner is None:
+        return
+    try:
+        partitioner.heartbeat()
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.exception("Failed to record dispatch heartbeat: %s", exc)
+
+
+def _get_tick_store() -> IntradayTickStore:
+    """종목별 당일 체결 틱을 누적하는 IntradayTickStore를 생성/재사용한다."""
+    global _tick_store
+    if _tick_store is None:
+        _tick_store = IntradayTickStore(
+            _get_redis_service(),
+            max_length=_get_int_env("INTRADAY_TICKS_MAX_LENGTH", 10000),
+        )
+    return _tick_store
+
+
+def _get_movers_store() -> MarketMoversStore:
+    """등락률/거래량/거래대금 순위와 업종별 합계를 갱신하는 MarketMoversStore를 생성/재사용한다."""
+    global _movers_store
+    if _movers_store is None:
+        _movers_store = MarketMoversStore(_get_redis_service())
+    return _movers_store
+
+
+def _get_investor_flow_store() -> InvestorFlowStore:
+    """투자자 매매동향 이력과 5/20/60일 누적 순매수를 갱신하는 InvestorFlowStore를 생성/재사용한다."""
+    global _investor_flow_store
+    if _investor_flow_store is None:
+        _investor_flow_store = InvestorFlowStore(_get_redis_service())
+    return _investor_flow_store
+
+
+def _get_index_tick_store() -> IndexTickStore:
+    """지수별 당일 시간별 지수를 누적하는 IndexTickStore를 생성/재사용한다."""
+    global _index_tick_store
+    if _index_tick_store is None:
+        _index_tick_store = IndexTickStore(
+            _get_redis_service(),
+            max_length=_get_int_env("INDEX_TICKS_MAX_LENGTH", 10000),
+        )
+    return _index_tick_store
+
+
+def _get_index_codes() -> Dict[str, str]:
+    """수집할 지수 코드 -> 지수명.
+
+    ``KIS_INDEX_CODES``(쉼표 구분)가 있으면 그 지수만, 없으면 ``KIS_INDEX_MASTER_PATH``(idxcode.mst)의
+    ``KIS_INDEX_GROUPS``(기본 0,1,2: 코스피/코스닥 업종, 코스피200 계열) 지수 전체, 둘 다 없으면
+    대표 지수(코스피, 코스닥, 코스피200)를 수집한다. 지수명은 master 파일에서 읽는다.
+    """
+    global _index_codes
+    if _index_codes is None:
+        master: Dict[str, str] = {}
+        path = os.environ.get("KIS_INDEX_MASTER_PATH")
+        if path:
+            groups = [group.strip() for group in os.environ.get("KIS_INDEX_GROUPS", "0,1,2").split(",") if group.strip()]
+            try:
+                master = {index.code: index.name for index in load_index_codes(path, groups=groups)}
+            except OSError as exc:
+                logging.warning("Cannot read index master %s, use default indices: %s", path, exc)
+        codes = [code.strip() for code in os.environ.get("KIS_INDEX_CODES", "").split(",") if code.strip()]
+        if not codes:
+            codes = list(master) or list(DEFAULT_INDEX_CODES)
+        _index_codes = {code: master.get(code, "") for code in codes}
+        logging.info("Index collector configured for %d indices", len(_index_codes))
+    return _index_codes
+
+
+def _index_batch_size(headline: int) -> int:
+    """주기마다 돌아가며 갱신할 지수 수. (0이면 전체)
+
+    ``INDEX_BATCH_SIZE``가 없으면 앱 키별 호출 간격(``KIS_REQUEST_INTERVAL``)으로 ``INDEX_PULLING_INTERVAL`` 동안
+    보낼 수 있는 호출 중 ``INDEX_CALL_BUDGET_PCT``%(기본 25)만 쓰도록 정한다. 지수 하나에 현재값/시간별 지수 두 번을
+    호출하며, 나머지 호출은 같은 client를 쓰는 종목 collector 몫이다.
+    """
+    if any(kis_client.request_interval <= 0 for kis_client in kis_clients):
+        default = 0
+    else:
+        calls_per_second = sum(1 / kis_client.request_interval for kis_client in kis_clients)
+        budget = (
+            _get_int_env("INDEX_PULLING_INTERVAL", 60)
+            * calls_per_second
+            * _get_int_env("INDEX_CALL_BUDGET_PCT", 25) / 100
+        )
+        default = max(1, int(budget) // INDEX_CALLS_PER_CODE - headline)
+    return _get_int_env("INDEX_BATCH_SIZE", default)
+
+
+def _next_index_batch(codes: List[str]) -> List[str]:
+    """이번 주기에 갱신할 지수. 대표 지수는 매번, 나머지는 ``_index_batch_size``개씩 돌아가며 포함한다."""
+    headline = [code for code in DEFAULT_INDEX_CODES if code in codes]
+    rest = [code for code in codes if code not in headline]
+    size = _index_batch_size(len(headline))
+    if size <= 0 or len(rest) <= size:
+        return headline + rest
+    service = _get_redis_service()
+    try:
+        start = int(service.get(INDEX_CURSOR_KEY) or 0) % len(rest)
+    except (TypeError, ValueError):
+        start = 0
+    batch = (rest + rest)[start:start + size]
+    service.set(INDEX_CURSOR_KEY, str((start + size) % len(rest)))
+    return headline + batch
+
+
+def _cache_index_prices(rows: List[Dict[str, Any]]) -> None:
+    """지수 현재값을 ``index:latest`` 해시(지수 코드 -> 요약 JSON)에 캐시한다. 전체 조회는 HGETALL 한 번이다."""
+    names = _get_index_codes()
+    snapshots = {}
+    for row in rows:
+        code = row.get("requested_fid_input_iscd")
+        if not code or row.get("bstp_nmix_prpr") in (None, ""):
+            continue
+        snapshots[code] = json.dumps(
+            {
+                "code": code,
+                "name": names.get(code, ""),
+                **{field: row.get(field) for field in INDEX_FIELDS},
+                "collected_at": row.get("collected_at"),
+            },
+            default=str,
+            ensure_ascii=False,
+        )
+    if snapshots:
+        _get_redis_service().set_hash(INDEX_LATEST_KEY, snapshots)
+
+
+def _build_index_jobs() -> List[CollectorJob]:
+    """지수에 적용할 collector 목록. 현재값을 먼저 캐시하고, 시간별 지수는 가져온 즉시 누적한다."""
+    return [
+        CollectorJob(
+            name="index_price",
+            priority=0,
+            fetch=lambda code: fetch_inquire_index_price(client, fid_input_iscd=code),
+            sink=_cache_index_prices,
+        ),
+        CollectorJob(
+            name="index_tickprice",
+            priority=1,
+            fetch=lambda code: {
+                "requested_fid_input_iscd": code,
+                "appended": _get_index_tick_store().append(
+                    code, fetch_inquire_index_tickprice(client, fid_input_iscd=code)
+                ),
+            },
+        ),
+    ]
+
+
 def _get_psql_client() -> PsqlDBClient:
     """1년치 시세 데이터를 적재할 PostgreSQL 클라이언트를 생성/재사용한다."""
     global _psql_client
@@ -154,17 +575,44 @@ def _get_psql_client() -> PsqlDBClient:
     return _psql_client
 
 
-def _get_daily_price_table() -> str:
+def _get_tick_writer() -> Optional[IntradayTickWriter]:
+    """체결 틱을 PostgreSQL(일 단위 파티션 + 1m/5m/1h 봉)에 적재하는 writer. 비활성화 시 None."""
+    global _tick_writer
+    if os.environ.get("INTRADAY_TICKS_PERSIST", "true").lower() not in ("1", "true", "yes"):
+        return None
+    if _tick_writer is None:
+        writer = IntradayTickWriter(
+            _get_psql_client(),
+            schema=os.environ.get("INTRADAY_TICKS_SCHEMA", "anticsignal"),
+        )
+        writer.ensure_schema()
+        _tick_writer = writer
+    return _tick_writer
+
+
+def _get_table_name(table_env: str, default_table: str) -> str:
     schema = os.environ.get("DAILY_PRICE_SCHEMA_NAME", "anticsignal")
-    table = os.environ.get("DAILY_PRICE_TABLE_NAME", "stock_history")
+    table = os.environ.get(table_env, default_table)
     table_name = f"{schema}.{table}"
     if not table_name or not all(ch.isalnum() or ch == "_" for ch in table):
         raise ValueError(
-            "DAILY_PRICE_TABLE_NAME 환경 변수에는 영문/숫자/언더스코어만 사용할 수 있습니다."
+            f"{table_env} 환경 변수에는 영문/숫자/언더스코어만 사용할 수 있습니다."
         )
     return table_name
 
 
+def _get_daily_price_table() -> str:
+    return _get_table_name("DAILY_PRICE_TABLE_NAME", "stock_history")
+
+
+def _get_investor_trade_table() -> str:
+    return _get_table_name("INVESTOR_TRADE_TABLE_NAME", "stock_investor_trade")
+
+
+def _get_stock_news_table() -> str:
+    return _get_table_name("NEWS_TABLE_NAME", "stock_news")
+
+
 def _cache_current_prices(payloads: List[Dict[str, Any]]) -> None:
     """주식 현재가 데이터를 Redis에 캐시한다."""
     if not payloads:
@@ -186,125 +634,594 @@ def _cache_current_prices(payloads: List[Dict[str, Any]]) -> None:
             "collected_at": str(payload.get("collected_at", "")),
         }
         service.set_hash(f"stock:{code}:current_price_fields", summary)
+    # 상승/하락률 상위, 업종 heatmap 조회용 순위와 업종 합계 (갱신한 종목만 반영)
+    try:
+        _get_movers_store().update(payloads)
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.exception("Failed to update market movers: %s", exc)
 
 
-def _cache_time_itemconclusion(rows: List[Dict[str, Any]]) -> None:
-    """당일 시간대별 체결 데이터를 Redis에 캐시한다."""
+def _refresh_current_prices_bulk(stale: Dict[str, List[str]]) -> List[str]:
+    """현재가가 오래된 종목이 ``KIS_MULTPRICE_MIN_CODES``개 이상이면 멀티종목 시세로 한 번에 갱신한다.
+
+    30종목당 한 번 호출하며, 갱신한 종목 코드를 반환한다. 실패하거나 응답에 없는 종목은
+    종목별 현재가 collector가 그대로 처리한다.
+    """
+    codes = [code for code, types in stale.items() if "current_price" in types]
+    if not codes or len(codes) < _get_int_env("KIS_MULTPRICE_MIN_CODES", 2):
+        return []
+    try:
+        rows = fetch_intstock_multprice(client, codes)
+        _cache_current_prices(rows)
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.exception("Bulk current price refresh failed, falling back to per-code calls: %s", exc)
+        return []
+    refreshed = [row["requested_fid_input_iscd"] for row in rows]
+    # 업종(bstp_kor_isnm)은 종목별 현재가에만 있으므로, 오늘 업종을 모르는 종목은 종목별 collector로 한 번 더 조회한다.
+    try:
+        unknown = set(_get_movers_store().unknown_sectors(refreshed))
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.exception("Failed to read known sectors: %s", exc)
+        unknown = set()
+    refreshed = [code for code in refreshed if code not in unknown]
+    logging.info("Refreshed current price for %d/%d codes in bulk", len(refreshed), len(codes))
+    return refreshed
+
+
+def _backfill_time_itemconclusion(code: str, hour: str) -> int:
+    """마지막으로 저장된 체결 시각(혹은 장 시작)까지 과거 방향으로 페이지를 받아 Redis/PostgreSQL에 누적한다.
+
+    페이지 단위로 바로 저장하므로 메모리는 한 페이지 크기로 유지된다. 한 번에 ``INTRADAY_BACKFILL_MAX_PAGES``
+    페이지까지만 받고, 멈춘 구간은 이어서 조회할 커서(``IntradayTickStore.backfill_cursors``)로 남긴다.
+    다음 수집은 새 체결을 먼저 받은 뒤 남은 페이지만큼 그 구간을 이어서 채운다. (장 시작까지 덮을 때까지)
+    """
+    store = _get_tick_store()
+    trading_date = datetime.now(KST)
+    stop_after = store.last_hour(code, trading_date=trading_date)
+    max_pages = _get_int_env("INTRADAY_BACKFILL_MAX_PAGES", 50)
+    # (조회 시작 커서, 기존 커서, 멈출 시각): 새 체결부터, 이어서 지난 수집에서 남은 구간을 최근 구간부터
+    ranges: List[Tuple[str, Optional[str], Optional[str]]] = [(hour, None, stop_after)]
+    ranges += [
+        (cursor, cursor, floor)
+        for cursor, floor in store.backfill_cursors(code, trading_date=trading_date).items()
+    ]
+    added = pages = 0
+    for cursor, previous, floor in ranges:
+        if 0 < max_pages <= pages:
+            break
+        oldest = None
+        for page in iter_inquire_time_itemconclusion_pages(
+            client,
+            fid_input_iscd=code,
+            fid_input_hour_1=cursor,
+            stop_after=floor,
+        ):
+            added += store.append(code, page, trading_date=trading_date, only_newer=False)
+            try:
+                writer = _get_tick_writer()
+                if writer is not None:
+                    writer.write_ticks(page, trading_date=trading_date.date())
+            except Exception as exc:  # pylint: disable=broad-except
+                logging.exception("Failed to persist intraday ticks for %s: %s", code, exc)
+            pages += 1
+            oldest = min(str(row.get("stck_cntg_hour") or cursor) for row in page)
+            if 0 < max_pages <= pages:
+                break
+        else:
+            oldest = None
+        # 장 시작/멈출 시각에 닿기 전에 페이지 제한에 걸렸으면 가장 이른 체결 시각부터 다음에 이어서 받는다.
+        if oldest is not None and oldest <= max(floor or MARKET_OPEN_HOUR, MARKET_OPEN_HOUR):
+            oldest = None
+        store.set_backfill_cursor(code, oldest, floor, trading_date=trading_date, previous=previous)
+    logging.info("Appended %d intraday ticks for %s (since=%s, pages=%d)", added, code, stop_after, pages)
+    return added
+
+
+def _cache_investor_trade(rows: List[Dict[str, Any]]) -> None:
+    """투자자 매매동향(일별) 이력으로 Redis 누적 순매수를 갱신하고 PostgreSQL에 일괄 저장한다."""
     if not rows:
         return
-    service = _get_redis_service()
-    grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    try:
+        updated = _get_investor_flow_store().update(rows)
+        logging.info("Updated investor flow for %d codes (%d rows)", updated, len(rows))
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.exception("Failed to update investor flow: %s", exc)
+    if os.environ.get("INVESTOR_TRADE_PERSIST", "true").lower() in ("1", "true", "yes"):
+        _persist_investor_trade(rows)
+
+
+def _safe_decimal(value: Any) -> Optional[Decimal]:
+    """문자열/숫자를 Decimal 로 변환한다."""
+    if value is None or value == "":
+        return None
+    try:
+        return Decimal(str(value))
+    except (InvalidOperation, ValueError, TypeError):
+        logging.warning("Cannot convert value=%s to Decimal", value)
+        return None
+
+
+def _ensure_daily_price_schema(table_name: str) -> None:
+    """stock_history 스키마 migration을 (인스턴스당 한 번) 적용한다."""
+    global _daily_price_migrated
+    if _daily_price_migrated:
+        return
+    applied = migrate_stock_history(_get_psql_client(), table_name)
+    if applied:
+        logging.info("Applied %s migrations: %s", table_name, applied)
+    _daily_price_migrated = True
+
+
+def _ensure_investor_trade_schema(table_name: str) -> None:
+    """투자자 매매동향 스키마 migration을 (인스턴스당 한 번) 적용한다."""
+    global _investor_trade_migrated
+    if _investor_trade_migrated:
+        return
+    applied = migrate_investor_trade(_get_psql_client(), table_name)
+    if applied:
+        logging.info("Applied %s migrations: %s", table_name, applied)
+    _investor_trade_migrated = True
+
+
+def _persist_investor_trade(rows: List[Dict[str, Any]]) -> None:
+    """투자자 매매동향(일별) 이력을 PostgreSQL 테이블에 일괄 upsert한다."""
+    if not rows:
+        return
+    table_name = _get_investor_trade_table()
+    _ensure_investor_trade_schema(table_name)
+    columns = [
+        "prsn_ntby_qty", "frgn_ntby_qty", "orgn_ntby_qty",
+        "prsn_ntby_tr_pbmn", "frgn_ntby_tr_pbmn", "orgn_ntby_tr_pbmn",
+    ]
+    insert_sql = (
+        f"INSERT INTO {table_name} "
+        f"(fid_input_iscd, stck_bsop_date, stck_clpr, {', '.join(columns)}, collected_at) "
+        "VALUES %s "
+        "ON CONFLICT (fid_input_iscd, stck_bsop_date) "
+        "DO UPDATE SET stck_clpr = EXCLUDED.stck_clpr, "
+        + "".join(f"{column} = EXCLUDED.{column}, " for column in columns)
+        + "collected_at = EXCLUDED.collected_at"
+    )
+    values: Dict[tuple, tuple] = {}
+    skipped = 0
     for row in rows:
         code = (
             row.get("requested_fid_input_iscd")
             or row.get("mksc_shrn_iscd")
             or row.get("stck_shrn_iscd")
         )
-        if not code:
+        trade_date = row.get("stck_bsop_date")
+        try:
+            bsop_date = datetime.strptime(str(trade_date), "%Y%m%d").date()
+        except ValueError:
+            bsop_date = None
+        if not code or bsop_date is None:
+            skipped += 1
+            logging.warning("Skip investor trade row (code=%s, date=%s)", code, trade_date)
             continue
-        grouped[code].append(row)
-    for code, items in grouped.items():
-        service.set(f"stock:{code}:intraday_ticks", json.dumps(items, default=str))
+        quantities = [_safe_decimal(row.get(column)) for column in columns]
+        # 같은 배치 안의 중복 키는 ON CONFLICT가 처리하지 못하므로 마지막 값만 남긴다.
+        values[(code, trade_date)] = (
+            code,
+            bsop_date,
+            _safe_decimal(row.get("stck_clpr")),
+            *[int(value) if value is not None and column.endswith("_qty") else value
+              for column, value in zip(columns, quantities)],
+            row.get("collected_at") or datetime.now(KST),
+        )
+    if values:
+        try:
+            with _get_psql_client().cursor("investor_trade_upsert") as cur:
+                execute_values(cur, insert_sql, list(values.values()), page_size=500)
+        except Exception as exc:
+            logging.exception(
+                "Failed to upsert investor trade rows into %s: %s", table_name, exc
+            )
+            raise
+    logging.info(
+        "Persisted %d investor trade rows into %s (skipped=%d, incoming=%d)",
+        len(values),
+        table_name,
+        skipped,
+        len(rows),
+    )
 
 
-def _cache_investor_trade(rows: List[Dict[str, Any]]) -> None:
-    """투자자 매매동향(일별) 데이터를 Redis에 캐시한다."""
+def _persist_daily_chartprice(rows: List[Dict[str, Any]]) -> None:
+    """기간별 시세(OHLCV, 거래대금) 데이터를 PostgreSQL 테이블에 일괄 upsert한다."""
     if not rows:
         return
-    service = _get_redis_service()
-    grouped: Dict[str, List[Dict[str, Any]]] = defaultdict(list)
+    table_name = _get_daily_price_table()
+    _ensure_daily_price_schema(table_name)
+    insert_sql = (
+        f"INSERT INTO {table_name} "
+        "(fid_input_iscd, fid_period_div_code, stck_bsop_date, "
+        "stck_oprc, stck_hgpr, stck_lwpr, stck_clpr, acml_vol, acml_tr_pbmn) "
+        "VALUES %s "
+        "ON CONFLICT (fid_input_iscd, fid_period_div_code, stck_bsop_date) "
+        "DO UPDATE SET stck_oprc = EXCLUDED.stck_oprc, "
+        "stck_hgpr = EXCLUDED.stck_hgpr, "
+        "stck_lwpr = EXCLUDED.stck_lwpr, "
+        "stck_clpr = EXCLUDED.stck_clpr, "
+        "acml_vol = EXCLUDED.acml_vol, "
+        "acml_tr_pbmn = EXCLUDED.acml_tr_pbmn"
+    )
+    values: Dict[tuple, tuple] = {}
+    skipped = 0
     for row in rows:
         code = (
             row.get("requested_fid_input_iscd")
             or row.get("mksc_shrn_iscd")
             or row.get("stck_shrn_iscd")
         )
-        if not code:
+        trade_date = row.get("stck_bsop_date")
+        period_code = row.get("requested_fid_period_div_code")
+        close_price = _safe_decimal(row.get("stck_clpr"))
+        open_price = _safe_decimal(row.get("stck_oprc"))
+        missing_fields = [
+            name
+            for name, value in [
+                ("fid_input_iscd", code),
+                ("stck_bsop_date", trade_date),
+                ("fid_period_div_code", period_code),
+                ("stck_clpr", close_price),
+                ("stck_oprc", open_price),
+            ]
+            if value in (None, "")
+        ]
+        if missing_fields:
+            skipped += 1
+            logging.warning(
+                "Skip chartprice row due to missing fields %s (code=%s, date=%s)",
+                ",".join(missing_fields),
+                code,
+                trade_date,
+            )
             continue
-        grouped[code].append(row)
-    for code, items in grouped.items():
-        service.set(
-            f"stock:{code}:investor_trade_daily", json.dumps(items, default=str)
+        try:
+            bsop_date = datetime.strptime(str(trade_date), "%Y%m%d").date()
+        except ValueError:
+            skipped += 1
+            logging.warning("Skip chartprice row due to invalid date %s (code=%s)", trade_date, code)
+            continue
+        volume = _safe_decimal(row.get("acml_vol"))
+        # 같은 배치 안의 중복 키는 ON CONFLICT가 처리하지 못하므로 마지막 값만 남긴다.
+        values[(code, period_code, trade_date)] = (
+            code,
+            period_code,
+            bsop_date,
+            open_price,
+            _safe_decimal(row.get("stck_hgpr")),
+            _safe_decimal(row.get("stck_lwpr")),
+            close_price,
+            int(volume) if volume is not None else None,
+            _safe_decimal(row.get("acml_tr_pbmn")),
         )
+    if values:
+        try:
+            with _get_psql_client().cursor("stock_history_upsert") as cur:
+                execute_values(cur, insert_sql, list(values.values()), page_size=500)
+        except Exception as exc:
+            logging.exception(
+                "Failed to upsert daily chart price rows into %s: %s", table_name, exc
+            )
+            raise
+    logging.info(
+        "Persisted %d chart price rows into %s (skipped=%d, incoming=%d)",
+        len(values),
+        table_name,
+        skipped,
+        len(rows),
+    )
 
 
-def _safe_decimal(value: Any) -> Optional[Decimal]:
-    """문자열/숫자를 Decimal 로 변환한다."""
-    if value is None or value == "":
+def _get_market_calendar() -> KRXCalendar:
+    """KRX 거래 달력. KRX_EXTRA_HOLIDAYS(YYYYMMDD, 쉼표 구분)로 임시 휴장일을 추가한다."""
+    global _market_calendar
+    if _market_calendar is None:
+        extra = [day for day in os.environ.get("KRX_EXTRA_HOLIDAYS", "").split(",") if day.strip()]
+        _market_calendar = KRXCalendar(extra_holidays=extra)
+    return _market_calendar
+
+
+def _market_closed(name: str) -> bool:
+    """휴장 중(주말/휴일/장 시간 외)이면 True. 각 함수는 KIS 호출 전에 확인한다."""
+    if not _adaptive_schedule_enabled():
+        return False
+    calendar = _get_market_calendar()
+    if calendar.phase() != PHASE_CLOSED:
+        return False
+    logging.info("Market is closed, skip %s until %s.", name, calendar.next_open().isoformat())
+    return True
+
+
+def _volume_rank_due(now: Optional[float] = None) -> bool:
+    """마지막 순위 조회 후 adaptive 간격이 지났는지 확인한다. (상태를 읽을 수 없으면 True)"""
+    if not _adaptive_schedule_enabled():
+        return True
+    raw = _get_redis_service().get(VOLUME_RANK_SCHEDULE_KEY)
+    if not raw:
+        return True
+    try:
+        state = json.loads(raw)
+        last_run, interval = float(state["last_run"]), float(state["interval"])
+    except (TypeError, KeyError, ValueError):
+        return True
+    now = time.time() if now is None else now
+    # timer 실행 시각의 작은 오차로 한 주기를 건너뛰지 않도록 1초 여유를 둔다.
+    if now - last_run + 1 >= interval:
+        return True
+    logging.info("Volume rank is not due for %.0f seconds (interval=%.0f), skip.", interval - (now - last_run), interval)
+    return False
+
+
+def _record_volume_rank_run(previous: List[Dict[str, Any]], data: Dict[str, Any]) -> None:
+    """직전 대비 순위 변화율과 평균 등락률로 다음 조회 간격을 정해 기록한다."""
+    if not _adaptive_schedule_enabled():
+        return
+    rows = [row for row in data.get("output") or [] if isinstance(row, dict)]
+    churn = ranking_churn(
+        [row.get("mksc_shrn_iscd") for row in previous],
+        [row.get("mksc_shrn_iscd") for row in rows],
+    )
+    volatility = ranking_volatility(rows)
+    schedule = AdaptiveInterval(
+        min_interval=_volume_rank_interval(), max_interval=_volume_rank_max_interval()
+    )
+    phase = _get_market_calendar().phase()
+    interval = schedule.next_interval(phase, churn=churn, volatility=volatility) or schedule.max_interval
+    state = {
+        "last_run": time.time(),
+        "interval": interval,
+        "phase": phase,
+        "churn": round(churn, 3),
+        "volatility": round(volatility, 3),
+    }
+    _get_redis_service().set(VOLUME_RANK_SCHEDULE_KEY, json.dumps(state))
+    logging.info("Next volume rank in %.0f seconds: %s", interval, state)
+
+
+def _record_volume_rank_run_safely(previous: List[Dict[str, Any]], data: Dict[str, Any]) -> None:
+    try:
+        _record_volume_rank_run(previous, data)
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.exception("Failed to record volume rank schedule: %s", exc)
+
+
+def _load_volume_rank_rows() -> List[Dict[str, Any]]:
+    """Redis에 저장된 최신 거래량 순위 행 (``volume_rank:latest``)."""
+    raw = _get_redis_service().get("volume_rank:latest")
+    if not raw:
+        return []
+    try:
+        rows = json.loads(raw)
+    except (TypeError, json.JSONDecodeError):
+        logging.warning("Invalid volume rank cache, ignore it.")
+        return []
+    return rows if isinstance(rows, list) else []
+
+
+def _stale_ranked_codes(codes: List[str]) -> List[str]:
+    """순위 종목 중 허용 지연(freshness budget)이 지난 데이터가 있는 종목. (확인할 수 없으면 빈 목록)"""
+    if not codes:
+        return []
+    try:
+        stale = _get_freshness_registry().stale_types(codes)
+    except Exception as exc:  # pylint: disable=broad-except
+        logging.exception("Failed to read freshness of ranked codes: %s", exc)
+        return []
+    return [code for code, types in stale.items() if types]
+
+
+def _volume_rank_message(previous: List[Dict[str, Any]], data: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    """직전 순위 대비 바뀐 종목(진입/순위 이동/거래량 변화)과 허용 지연이 지난 종목만 ``output``에 담은 메시지.
+
+    ``delta``에는 순위 변화를, ``stale``에는 순위는 그대로지만 다시 수집할 종목을 담는다. 둘 다 없으면 None.
+    ``VOLUME_RANK_DELTA=false``이거나 순위 행을 읽을 수 없으면 원본을 그대로 보낸다.
+    """
+    rows = data.get("output")
+    if os.environ.get("VOLUME_RANK_DELTA", "true").lower() != "true" or not isinstance(rows, list):
+        return data
+    delta = diff_volume_rank(
+        previous,
+        rows,
+        volume_threshold=_get_int_env("VOLUME_RANK_DELTA_VOLUME_PCT", 5) / 100,
+    )
+    changed = set(delta.changed_codes())
+    # 순위가 그대로인 종목도 freshness budget이 지나면 다시 보내야 dispatch가 갱신한다.
+    stale = _stale_ranked_codes([
+        row["mksc_shrn_iscd"] for row in rows
+        if isinstance(row, dict) and row.get("mksc_shrn_iscd") and row["mksc_shrn_iscd"] not in changed
+    ])
+    if not delta and not stale:
+        return None
+    logging.info(
+        "Volume rank delta: entered=%d left=%d moved=%d volume_changed=%d stale=%d",
+        len(delta.entered),
+        len(delta.left),
+        len(delta.moved),
+        len(delta.volume_changed),
+        len(stale),
+    )
+    dispatched = changed.union(stale)
+    return {
+        **data,
+        "output": [row for row in rows if isinstance(row, dict) and row.get("mksc_shrn_iscd") in dispatched],
+        "delta": delta.to_dict(),
+        "stale": stale,
+    }
+
+
+def _cache_volume_rank(data: Dict[str, Any]) -> None:
+    """최신 거래량 순위를 Redis에 저장해 다른 수집기(뉴스 등)가 대상 종목을 재사용하게 한다."""
+    rows = data.get("output") or []
+    if not rows:
+        return
+    _get_redis_service().set("volume_rank:latest", json.dumps(rows, default=str))
+
+
+def _load_news_targets() -> Dict[str, str]:
+    """최신 거래량 순위에서 {종목코드: 종목명} 뉴스 수집 대상을 만든다."""
+    rows = _load_volume_rank_rows()
+    limit = _get_int_env("NEWS_TARGET_LIMIT", 30)
+    targets: Dict[str, str] = {}
+    for row in rows[:limit]:
+        code = row.get("mksc_shrn_iscd")
+        name = row.get("hts_kor_isnm")
+        if code and name:
+            targets[code] = name
+    return targets
+
+
+def _get_news_api() -> NewsDataPipelineAPI:
+    """뉴스 파이프라인(네이버 API 세션 포함)을 생성/재사용한다."""
+    global _news_api
+    if _news_api is None:
+        _news_api = NewsDataPipelineAPI(
+            api_client_id=os.environ.get("NAVER_API_CLIENT_ID"),
+            api_secret_key=os.environ.get("NAVER_API_CLIENT_SECRET"),
+            metrics=get_metrics(),
+        )
+    return _news_api
+
+
+def _safe_pubdate(value: Any) -> Optional[datetime]:
+    if not value:
         return None
     try:
-        return Decimal(str(value))
-    except (InvalidOperation, ValueError, TypeError):
-        logging.warning("Cannot convert value=%s to Decimal", value)
+        return pubdate_to_datetime(value)
+    except ValueError:
+        logging.warning("Cannot parse pubDate=%s", value)
         return None
 
 
-def _persist_daily_chartprice(rows: List[Dict[str, Any]]) -> None:
-    """기간별 시세 데이터를 PostgreSQL 테이블에 upsert한다."""
+def _cache_stock_news(results: Dict[str, List[Dict[str, Any]]]) -> None:
+    """종목별 최신 뉴스 상위 N개를 Redis에 캐시한다."""
+    if not results:
+        return
+    service = _get_redis_service()
+    api = _get_news_api()
+    limit = _get_int_env("NEWS_CACHE_SIZE", 20)
+    ttl = _get_int_env("NEWS_CACHE_TTL", 6 * 60 * 60)
+    for code, items in results.items():
+        if not items:
+            continue
+        latest = api.select_top_k_by_date(items, limit, sort="descending")
+        service.set(f"stock:{code}:news", json.dumps(latest, default=str), ex=ttl)
+
+
+def _persist_stock_news(results: Dict[str, List[Dict[str, Any]]]) -> None:
+    """종목별 뉴스를 PostgreSQL 테이블에 일괄 upsert한다."""
+    collected_at = datetime.now(KST)
+    rows = []
+    for code, items in results.items():
+        for item in items:
+            link = item.get("link")
+            if not link:
+                continue
+            rows.append(
+                (
+                    code,
+                    link,
+                    item.get("originallink"),
+                    item.get("title"),
+                    item.get("content") or item.get("description"),
+                    _safe_pubdate(item.get("pubDate")),
+                    collected_at,
+                )
+            )
     if not rows:
         return
-    table_name = _get_daily_price_table()
-    client = _get_psql_client()
+    table_name = _get_stock_news_table()
     insert_sql = (
-        f"INSERT INTO {table_name} (fid_input_iscd, fid_period_div_code, stck_bsop_date, stck_clpr, stck_oprc) "
-        "VALUES (%s, %s, %s::date, %s, %s) "
-        "ON CONFLICT (fid_input_iscd, fid_period_div_code, stck_bsop_date) "
-        "DO UPDATE SET stck_clpr = EXCLUDED.stck_clpr, stck_oprc = EXCLUDED.stck_oprc"
+        f"INSERT INTO {table_name} "
+        "(fid_input_iscd, link, originallink, title, content, pub_date, collected_at) "
+        "VALUES %s "
+        "ON CONFLICT (fid_input_iscd, link) "
+        "DO UPDATE SET title = EXCLUDED.title, content = EXCLUDED.content, "
+        "collected_at = EXCLUDED.collected_at"
     )
-    inserted = 0
-    skipped = 0
     try:
-        with client.cursor() as cur:
-            for row in rows:
-                code = (
-                    row.get("requested_fid_input_iscd")
-                    or row.get("mksc_shrn_iscd")
-                    or row.get("stck_shrn_iscd")
-                )
-                trade_date = row.get("stck_bsop_date")
-                period_code = row.get("requested_fid_period_div_code")
-                close_price = _safe_decimal(row.get("stck_clpr"))
-                open_price = _safe_decimal(row.get("stck_oprc"))
-                missing_fields = [
-                    name
-                    for name, value in [
-                        ("fid_input_iscd", code),
-                        ("stck_bsop_date", trade_date),
-                        ("fid_period_div_code", period_code),
-                        ("stck_clpr", close_price),
-                        ("stck_oprc", open_price),
-                    ]
-                    if value in (None, "")
-                ]
-                if missing_fields:
-                    skipped += 1
-                    logging.warning(
-                        "Skip chartprice row due to missing fields %s. raw=%s",
-                        ",".join(missing_fields),
-                        row,
-                    )
-                    continue
-                cur.execute(
-                    insert_sql,
-                    (code, period_code, trade_date, close_price, open_price),
-                )
-                inserted += 1
+        with _get_psql_client().cursor("news_upsert") as cur:
+            execute_values(cur, insert_sql, rows, page_size=500)
     except Exception as exc:
-        logging.exception(
-            "Failed to upsert daily chart price rows into %s: %s", table_name, exc
-        )
+        logging.exception("Failed to upsert news rows into %s: %s", table_name, exc)
         raise
+    logging.info("Persisted %d news rows into %s", len(rows), table_name)
+
+
+def _get_event_hub_compression() -> Optional[str]:
+    """대용량 Event Hub 출력의 압축 방식 (EVENT_HUB_COMPRESSION: gzip | zstd | none)."""
+    value = os.environ.get("EVENT_HUB_COMPRESSION", "gzip").strip().lower()
+    return None if value in ("", "none") else value
+
+
+def _emit_daily_chartprice(
+    rows: List[Dict[str, Any]], stock_history_output: func.Out[List[str]]
+) -> None:
+    """기간별 시세를 크기 제한 내 배치로 나눠 Event Hub로 전송하고 PostgreSQL에 저장한다."""
+    batches = encode_event_batches(
+        rows,
+        max_bytes=_get_int_env("EVENT_HUB_MAX_BYTES", 960 * 1024),
+        compression=_get_event_hub_compression(),
+    )
+    stock_history_output.set(batches)
     logging.info(
-        "Persisted %d chart price rows into %s (skipped=%d, incoming=%d)",
-        inserted,
-        table_name,
-        skipped,
+        "Emitted %d chart price rows in %d events (%d bytes) to %s",
         len(rows),
+        len(batches),
+        sum(len(batch) for batch in batches),
+        STOCK_HISTORICAL_DATA_EVENT_HUB,
     )
+    _persist_daily_chartprice(rows)
+
+
+def _build_collector_jobs(stock_history_output: func.Out[List[str]]) -> List[CollectorJob]:
+    """거래량 순위 종목에 적용할 collector 목록. priority가 낮을수록 먼저 호출된다.
+
+    실시간 캐시(현재가)를 가장 먼저 채우고, 1년치 기간별 시세는 마지막에 조회한다.
+    """
+    hour = _resolve_time_itemconclusion_hour()
+    input_date = _resolve_investor_trade_date()
+    return [
+        CollectorJob(
+            name="current_price",
+            priority=0,
+            fetch=lambda code: fetch_inquire_price(client, fid_input_iscd=code),
+            sink=_cache_current_prices,
+        ),
+        CollectorJob(
+            name="time_itemconclusion",
+            priority=1,
+            # 페이지마다 바로 저장하므로 별도 sink가 없다.
+            fetch=lambda code: {
+                "requested_fid_input_iscd": code,
+                "appended": _backfill_time_itemconclusion(code, hour),
+            },
+        ),
+        CollectorJob(
+            name="investor_trade",
+            priority=2,
+            fetch=lambda code: fetch_investor_trade_by_stock_daily(
+                client, fid_input_iscd=code, fid_input_date=input_date
+            ),
+            sink=_cache_investor_trade,
+        ),
+        CollectorJob(
+            name="daily_chartprice",
+            priority=3,
+            fetch=lambda code: fetch_inquire_daily_itemchartprice(
+                client, fid_input_iscd=code
+            ),
+            sink=lambda rows: _emit_daily_chartprice(rows, stock_history_output),
+        ),
+    ]
 
 
 # Function 별 스케줄과 Event Hub를 환경 변수 기반으로 계산한다.
 VOLUME_RANK_SCHEDULE = _build_volume_rank_schedule()
+NEWS_SCHEDULE = _build_interval_schedule("NEWS_PULLING_INTERVAL", 1800)
+INDEX_SCHEDULE = _build_interval_schedule("INDEX_PULLING_INTERVAL", 60)
 DEFAULT_EVENT_HUB_NAME = os.environ["AnticSignalEventHubName"]
 VOLUME_RANK_EVENT_HUB_NAME = os.environ.get(
     "VolumeRankEventHubName", DEFAULT_EVENT_HUB_NAME
@@ -339,195 +1256,182 @@ STOCK_HISTORICAL_DATA_EVENT_HUB = os.environ.get(
 def volume_rank_collect_interval(
     myTimer: func.TimerRequest,
     kis_volume_rank_default: func.Out[str],
-    kis_volume_rank_interval: func.Out[str],
+    kis_volume_rank_interval: func.Out[List[str]],
 ) -> None:  # type: ignore
     """거래량 순위 데이터를 주기적으로 조회해 Event Hub로 전송한다."""
     if myTimer.past_due:
         logging.info("The timer is past due!")
 
+    # 휴장 중에는 호출하지 않고, 장중에는 순위 변화가 적으면 다음 주기까지 건너뛴다.
+    if _market_closed("volume rank") or not _volume_rank_due():
+        return
+
+    lease = _volume_rank_lease()
+    if lease is not None and not lease.acquire():
+        logging.info("Volume rank was published by another instance in this interval, skip.")
+        return
+
+    previous = _load_volume_rank_rows()
     data = fetch_volume_rank(client)
-    payload = json.dumps(data, default=str)
-    kis_volume_rank_default.set(payload)
-    kis_volume_rank_interval.set(payload)
+    # KIS 호출이 lease 유지 시간을 넘겨 다른 인스턴스가 실행했다면 발행하지 않는다.
+    token = None
+    if lease is not None:
+        token = lease.token
+        if not lease.renew():
+            logging.warning("Volume rank lease token=%s expired before publishing, skip.", token)
+            return
+    # 기본 Event Hub의 소비자에게는 기존처럼 매 주기 전체 순위를 그대로 보낸다.
+    # (두 출력이 같은 Event Hub를 가리키면 같은 종목을 두 번 보내지 않는다)
+    if VOLUME_RANK_EVENT_HUB_NAME != DEFAULT_EVENT_HUB_NAME:
+        kis_volume_rank_default.set(json.dumps(data, default=str))
+    # dispatch에는 직전 발행 순위와 비교해 바뀐 종목만 보낸다. 바뀐 것이 없으면 발행/캐시 갱신 없이 끝낸다.
+    message = _volume_rank_message(previous, data)
+    if message is None:
+        logging.info("Volume rank is unchanged, skip publishing.")
+        _record_volume_rank_run_safely(previous, data)
+        return
+    if token is not None:
+        # renew 뒤에 만료되어 늦게 도착한 메시지는 dispatch가 token으로 버린다. (fencing)
+        message = {**message, "fencing_token": token}
+    # dispatch 인스턴스가 여럿이면 담당 종목별로 나눠 보내, 여러 인스턴스가 동시에 받도록 한다.
+    shards = _volume_rank_shards(message)
+    kis_volume_rank_interval.set(shards)
+    # 순위 변화 없이 오래된 종목만 보냈으면 기준 순위를 유지해 거래량 변화가 계속 누적되게 한다.
+    if "delta" not in message or any(message["delta"].values()):
+        try:
+            _cache_volume_rank(data)
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.exception("Failed to cache volume rank: %s", exc)
+    _record_volume_rank_run_safely(previous, data)
     logging.info("Volume rank timer function executed.")
 
 
-# 주식 현재가 시세
-@app.function_name(name="kis_inquire_price_from_event")
-@app.event_hub_message_trigger(
-    arg_name="events",
-    event_hub_name=VOLUME_RANK_EVENT_HUB_NAME,
+# 거래량 순위 이벤트 -> 종목별 수집 (현재가, 시간대별 체결, 투자자 매매동향, 기간별 시세)
+@app.function_name(name="kis_volume_rank_dispatch_from_event")
+@app.event_hub_output(
+    arg_name="stock_history_output",
+    event_hub_name=STOCK_HISTORICAL_DATA_EVENT_HUB,
     connection="AnticSignalEventConnectionString",
-    consumer_group=EVENT_HUB_CONSUMER_GROUP,
 )
-def inquire_price_from_event(events: Sequence[func.EventHubEvent]) -> None:  # type: ignore
-    """거래량 순위 이벤트를 받아 종목 현재가를 실시간 조회하고 Redis에 저장한다."""
-    normalized_events = _ensure_event_sequence(events)
-
-    for event in normalized_events:
-        raw = event.get_body().decode("utf-8")
-        stock_codes = _extract_stock_codes(raw)
-        if not stock_codes:
-            logging.info("No stock codes found in message: %s", raw)
-            continue
-
-        enriched_payloads = []
-        for code in stock_codes:
-            try:
-                enriched_payloads.append(
-                    fetch_inquire_price(client, fid_input_iscd=code)
-                )
-            except Exception as exc:  # pylint: disable=broad-except
-                logging.exception("Failed to fetch current price for %s: %s", code, exc)
-
-        _cache_current_prices(enriched_payloads)
-        logging.info(
-            "Fetched %d current price rows for event sequence=%s",
-            len(enriched_payloads),
-            getattr(event, "sequence_number", None),
-        )
-
-
-# 당일 시간대별 체결
-@app.function_name(name="kis_inquire_time_itemconclusion_from_event")
 @app.event_hub_message_trigger(
     arg_name="events",
     event_hub_name=VOLUME_RANK_EVENT_HUB_NAME,
     connection="AnticSignalEventConnectionString",
     consumer_group=EVENT_HUB_CONSUMER_GROUP,
 )
-def inquire_time_itemconclusion_from_event(events: Sequence[func.EventHubEvent]) -> None:  # type: ignore
-    """Event Hub 메시지를 받아 당일 시간대별 체결 데이터를 조회하고 Redis에 저장한다."""
+def volume_rank_dispatch_from_event(
+    events: Sequence[func.EventHubEvent],
+    stock_history_output: func.Out[List[str]],
+) -> None:  # type: ignore
+    """거래량 순위 이벤트 배치를 한 번만 파싱하고, 종목별 collector를 우선순위 큐로 실행한다."""
     normalized_events = _ensure_event_sequence(events)
-    hour = _resolve_time_itemconclusion_hour()
-
-    for event in normalized_events:
-        raw = event.get_body().decode("utf-8")
-        stock_codes = _extract_stock_codes(raw)
-        if not stock_codes:
-            logging.info("No stock codes found in message for time conclusion: %s", raw)
-            continue
-
-        aggregated: List[Dict[str, Any]] = []
-        for code in stock_codes:
-            try:
-                aggregated.extend(
-                    fetch_inquire_time_itemconclusion(
-                        client,
-                        fid_input_iscd=code,
-                        fid_input_hour_1=hour,
-                    )
-                )
-            except Exception as exc:  # pylint: disable=broad-except
-                logging.exception(
-                    "Failed to fetch time conclusion for %s: %s", code, exc
-                )
+    stock_codes = _collect_stock_codes(normalized_events)
+    if not stock_codes:
+        logging.info("No stock codes found in %d events", len(normalized_events))
+    # 받은 메시지의 종목은 모두 이번 호출에서 수집한다. (인스턴스 간 분배는 timer가 메시지를 나눠 한다)
+    _record_dispatch_heartbeat()
+    if not stock_codes or _market_closed("stock collectors"):
+        return
 
-        _cache_time_itemconclusion(aggregated)
+    # 허용 지연 이내에 수집된 데이터는 건너뛰고, 오래됐거나 새로 순위에 든 종목만 호출한다.
+    registry = _get_freshness_registry()
+    stale = registry.stale_types(stock_codes)
+    skipped = sum(len(registry.budgets) - len(types) for types in stale.values())
+
+    # 현재가는 종목별 30회 대신 멀티종목 시세 호출로 먼저 갱신하고, 갱신된 종목은 큐에서 뺀다.
+    refreshed = _refresh_current_prices_bulk(stale)
+    if refreshed:
+        registry.mark("current_price", refreshed)
+        for code in refreshed:
+            stale[code] = [name for name in stale[code] if name != "current_price"]
+
+    dispatcher = CollectorDispatcher(
+        _build_collector_jobs(stock_history_output),
+        max_workers=_get_int_env("KIS_DISPATCH_WORKERS", 4 * len(kis_clients)),
+    )
+    reports = dispatcher.dispatch(stock_codes, jobs_for_code=stale.__getitem__)
+    for name, report in reports.items():
+        if report.stored:
+            registry.mark(name, report.succeeded)
         logging.info(
-            "Fetched %d time-item conclusion rows for event sequence=%s",
-            len(aggregated),
-            getattr(event, "sequence_number", None),
+            "Collector %s: codes=%d failed=%d rows=%d",
+            name,
+            len(report.succeeded),
+            len(report.failed),
+            len(report.rows),
         )
+    logging.info(
+        "Dispatched %d codes, skipped %d fresh collector calls",
+        len(stock_codes),
+        skipped,
+    )
 
 
-# 투자자 매매동향
-@app.function_name(name="kis_investor_trade_by_stock_daily_from_event")
-@app.event_hub_message_trigger(
-    arg_name="events",
-    event_hub_name=VOLUME_RANK_EVENT_HUB_NAME,
-    connection="AnticSignalEventConnectionString",
-    consumer_group=EVENT_HUB_CONSUMER_GROUP,
+# 업종/지수 현재값, 시간별 지수
+@app.function_name(name="kis_index_collect_interval")
+@app.timer_trigger(
+    schedule=INDEX_SCHEDULE,
+    arg_name="myTimer",
+    run_on_startup=False,
+    use_monitor=False,
 )
-def investor_trade_by_stock_daily_from_event(
-    events: Sequence[func.EventHubEvent],
-) -> None:  # type: ignore
-    """Event Hub 메시지를 받아 종목별 투자자 매매동향(일별)을 수집한다."""
-    normalized_events = _ensure_event_sequence(events)
-    input_date = _resolve_investor_trade_date()
-
-    for event in normalized_events:
-        raw = event.get_body().decode("utf-8")
-        stock_codes = _extract_stock_codes(raw)
-        if not stock_codes:
-            logging.info("No stock codes found in message for investor trade: %s", raw)
-            continue
+def index_collect_interval(myTimer: func.TimerRequest) -> None:  # type: ignore
+    """설정된 지수를 배치로 나눠 현재값은 Redis에 캐시하고, 시간별 지수는 지수별 Sorted Set에 누적한다."""
+    if myTimer.past_due:
+        logging.info("The timer is past due!")
+    if _market_closed("index collectors"):
+        return
 
-        aggregated: List[Dict[str, Any]] = []
-        for code in stock_codes:
-            try:
-                aggregated.extend(
-                    fetch_investor_trade_by_stock_daily(
-                        client,
-                        fid_input_iscd=code,
-                        fid_input_date=input_date,
-                    )
-                )
-            except Exception as exc:  # pylint: disable=broad-except
-                logging.exception(
-                    "Failed to fetch investor trade data for %s: %s", code, exc
-                )
+    lease = _timer_lease(
+        "kis_index_collect", "INDEX_LEASE_SECONDS", _get_int_env("INDEX_PULLING_INTERVAL", 60)
+    )
+    if lease is not None and not lease.acquire():
+        logging.info("Indices were collected by another instance in this interval, skip.")
+        return
 
-        if aggregated:
-            _cache_investor_trade(aggregated)
-            logging.info(
-                "Fetched %d investor trade rows for event sequence=%s",
-                len(aggregated),
-                getattr(event, "sequence_number", None),
-            )
+    codes = _next_index_batch(list(_get_index_codes()))
+    # 종목 collector와 같은 client(앱 키별 호출 간격)를 공유하므로, 적은 worker로 호출 한도를 나눠 쓴다.
+    dispatcher = CollectorDispatcher(
+        _build_index_jobs(),
+        max_workers=_get_int_env("INDEX_DISPATCH_WORKERS", len(kis_clients)),
+    )
+    reports = dispatcher.dispatch(codes)
+    for name, report in reports.items():
+        logging.info(
+            "Collector %s: indices=%d failed=%d",
+            name,
+            len(report.succeeded),
+            len(report.failed),
+        )
 
 
-@app.function_name(name="kis_inquire_daily_chartprice_from_event")
-@app.event_hub_output(
-    arg_name="stock_history_output",
-    event_hub_name=STOCK_HISTORICAL_DATA_EVENT_HUB,
-    connection="AnticSignalEventConnectionString",
-)
-@app.event_hub_message_trigger(
-    arg_name="events",
-    event_hub_name=VOLUME_RANK_EVENT_HUB_NAME,
-    connection="AnticSignalEventConnectionString",
-    consumer_group=EVENT_HUB_CONSUMER_GROUP,
+# 거래량 상위 종목 뉴스 (사전 수집)
+@app.function_name(name="news_collect_interval")
+@app.timer_trigger(
+    schedule=NEWS_SCHEDULE,
+    arg_name="myTimer",
+    run_on_startup=False,
+    use_monitor=False,
 )
-def inquire_daily_chartprice_from_event(
-    events: Sequence[func.EventHubEvent],
-    stock_history_output: func.Out[str],
-) -> None:  # type: ignore
-    """Event Hub 메시지를 받아 1년치 시세 데이터를 조회하고 PostgreSQL에 저장한다."""
-    normalized_events = _ensure_event_sequence(events)
-
-    for event in normalized_events:
-        raw = event.get_body().decode("utf-8")
-        stock_codes = _extract_stock_codes(raw)
-        if not stock_codes:
-            logging.info("No stock codes found in message for chart price: %s", raw)
-            continue
+def news_collect_interval(myTimer: func.TimerRequest) -> None:  # type: ignore
+    """최신 거래량 상위 종목의 뉴스를 일괄 수집해 Redis/PostgreSQL에 저장한다."""
+    if myTimer.past_due:
+        logging.info("The timer is past due!")
 
-        aggregated: List[Dict[str, Any]] = []
-        for code in stock_codes:
-            try:
-                aggregated.extend(
-                    fetch_inquire_daily_itemchartprice(
-                        client,
-                        fid_input_iscd=code,
-                    )
-                )
-            except Exception as exc:  # pylint: disable=broad-except
-                logging.exception(
-                    "Failed to fetch daily chart price for %s: %s", code, exc
-                )
+    targets = _load_news_targets()
+    if not targets:
+        logging.info("No volume rank cache found, skip news collection.")
+        return
 
-        if aggregated:
-            logging.info(f"historical data {aggregated}")
-            stock_history_output.set(json.dumps(aggregated, default=str))
-            logging.info(
-                "Emitted %d chart price rows to %s",
-                len(aggregated),
-                STOCK_HISTORICAL_DATA_EVENT_HUB,
-            )
-            _persist_daily_chartprice(aggregated)
-            logging.info(
-                "Fetched %d chart price rows for event sequence=%s",
-                len(aggregated),
-                getattr(event, "sequence_number", None),
-            )
+    results = _get_news_api().fetch_news_batch(
+        targets,
+        display=_get_int_env("NEWS_DISPLAY", 20),
+        max_workers=_get_int_env("NEWS_MAX_WORKERS", 4),
+    )
+    _cache_stock_news(results)
+    _persist_stock_news(results)
+    logging.info(
+        "Collected news for %d codes (%d items).",
+        len(results),
+        sum(len(items) for items in results.values()),
+    )
@@ -0,0 +1,213 @@
+"""KIS WebSocket 실시간 체결/호가를 함수 앱과 같은 Redis 키로 기록하는 상주 worker.
+
+Functions 실행 시간 제한 때문에 함수로 등록하지 않고 별도 프로세스(Container Apps, VM 등)로 실행한다.
+환경 변수는 ``function_app.py``와 같은 값을 사용한다.
+
+- 구독 종목: Redis ``volume_rank:latest``의 상위 ``REALTIME_EXECUTION_CODES``개 (체결), ``REALTIME_QUOTE_CODES``개 (호가)
+  (KIS 세션당 구독 한도 41건)
+- 체결: ``stock:{code}:current_price``, ``stock:{code}:current_price_fields``, ``stock:{code}:intraday_ticks``,
+  PostgreSQL ``stock_ticks`` (``REALTIME_PERSIST_SECONDS``마다)
+- 호가: ``stock:{code}:orderbook`` (Hash)
+- 새로 구독한 종목은 당일 한 번 REST로 장 시작부터의 체결을 채운 뒤, 현재가/체결 수집 시각을 갱신해
+  ``kis_volume_rank_dispatch_from_event``의 REST 현재가/체결 호출을 건너뛰게 한다.
+
+```sh
+python realtime_feed.py                     # 실제 KIS (KIS_REALTIME_URL 기본값)
+python test/local_harness.py --realtime     # 로컬 가짜 서버
+```
+"""
+import argparse
+import json
+import logging
+import os
+import threading
+import time
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, List, Optional, Sequence
+
+import function_app
+from kis_api.client import KST
+from kis_api.realtime import (
+    EXECUTION_TR_ID,
+    QUOTE_TR_ID,
+    REALTIME_URL,
+    KISRealtimeClient,
+    RealtimeFrame,
+    execution_to_price,
+    execution_to_tick,
+    quote_to_orderbook,
+)
+
+
+class RealtimeRedisWriter:
+    """수신 스레드에서 받은 frame을 종목별로 모아 두고 ``flush``에서 한 번에 기록한다.
+
+    현재가/호가는 종목별 마지막 값만, 체결 틱은 모두 보관한다.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._prices: Dict[str, Dict[str, Any]] = {}
+        self._orderbooks: Dict[str, Dict[str, str]] = {}
+        self._ticks: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+        self._pending_ticks: Dict[str, List[Dict[str, str]]] = defaultdict(list)
+        self.frames = 0
+
+    def on_frame(self, frame: RealtimeFrame) -> None:
+        if frame.tr_id == EXECUTION_TR_ID:
+            ticks = [(record[0], execution_to_tick(frame, record)) for record in frame.records]
+            prices = {code: execution_to_price(frame, record) for code, record in frame.latest_by_code().items()}
+            with self._lock:
+                self.frames += 1
+                self._prices.update(prices)
+                for code, tick in ticks:
+                    self._ticks[code].append(tick)
+        elif frame.tr_id == QUOTE_TR_ID:
+            books = {code: quote_to_orderbook(frame, record) for code, record in frame.latest_by_code().items()}
+            with self._lock:
+                self.frames += 1
+                self._orderbooks.update(books)
+
+    def flush(self) -> None:
+        """Redis에 현재가/틱/호가를 기록하고, 현재가/체결 수집 시각을 갱신한다."""
+        with self._lock:
+            prices, self._prices = self._prices, {}
+            books, self._orderbooks = self._orderbooks, {}
+            ticks, self._ticks = self._ticks, defaultdict(list)
+        if prices:
+            function_app._cache_current_prices(list(prices.values()))
+        store = function_app._get_tick_store()
+        for code, rows in ticks.items():
+            store.append(code, rows)
+            self._pending_ticks[code].extend(rows)
+        service = function_app._get_redis_service()
+        for code, book in books.items():
+            service.set_hash(f"stock:{code}:orderbook", book)
+        registry = function_app._get_freshness_registry()
+        if prices:
+            registry.mark("current_price", list(prices))
+        if ticks:
+            registry.mark("time_itemconclusion", list(ticks))
+
+    def persist(self) -> int:
+        """쌓인 체결 틱을 PostgreSQL ``stock_ticks``에 적재한다. (COPY + 분봉 재집계)"""
+        pending, self._pending_ticks = self._pending_ticks, defaultdict(list)
+        writer = function_app._get_tick_writer()
+        if writer is None or not pending:
+            return 0
+        rows = [dict(row, requested_fid_input_iscd=code) for code, code_rows in pending.items() for row in code_rows]
+        try:
+            writer.write_ticks(rows, trading_date=datetime.now(KST).date())
+        except Exception as exc:  # pylint: disable=broad-except
+            logging.exception("Failed to persist realtime ticks: %s", exc)
+            return 0
+        return len(rows)
+
+
+def _load_ranked_codes() -> List[str]:
+    """최신 거래량 순위(``volume_rank:latest``) 종목 코드."""
+    raw = function_app._get_redis_service().get("volume_rank:latest")
+    try:
+        rows = json.loads(raw) if raw else []
+    except (TypeError, json.JSONDecodeError):
+        logging.warning("Invalid volume rank cache, keep current subscriptions.")
+        return []
+    return [row["mksc_shrn_iscd"] for row in rows if row.get("mksc_shrn_iscd")]
+
+
+class RealtimeFeed:
+    """구독 종목 갱신, 신규 종목 backfill, 주기적 flush/persist를 담당한다."""
+
+    def __init__(
+        self,
+        url: str,
+        execution_codes: int = 30,
+        quote_codes: int = 10,
+        flush_interval: float = 0.2,
+        refresh_interval: float = 60.0,
+        persist_interval: float = 5.0,
+    ) -> None:
+        self.writer = RealtimeRedisWriter()
+        self.feed = KISRealtimeClient(function_app.kis_clients[0], self.writer.on_frame, url=url)
+        self.execution_codes = execution_codes
+        self.quote_codes = quote_codes
+        self.flush_interval = flush_interval
+        self.refresh_interval = refresh_interval
+        self.persist_interval = persist_interval
+        self._backfilled: Dict[str, str] = {}
+        self._stop = threading.Event()
+
+    def refresh_subscriptions(self, codes: Optional[Sequence[str]] = None) -> None:
+        codes = list(codes if codes is not None else _load_ranked_codes())
+        if not codes:
+            return
+        executions = codes[:self.execution_codes]
+        today = datetime.now(KST).strftime("%Y%m%d")
+        for code in executions:
+            # 구독 전 구간의 체결은 당일 REST로 채운다. (이후에는 실시간 틱만 누적)
+            # 페이지 제한으로 남은 구간이 있으면 다음 갱신 주기에 이어서 채운다.
+            if self._backfilled.get(code) != today:
+                try:
+                    function_app._backfill_time_itemconclusion(code, function_app._resolve_time_itemconclusion_hour())
+                    if not function_app._get_tick_store().backfill_cursors(code):
+                        self._backfilled[code] = today
+                except Exception as exc:  # pylint: disable=broad-except
+                    logging.exception("Failed to backfill ticks for %s: %s", code, exc)
+        self.feed.set_codes(EXECUTION_TR_ID, executions)
+        self.feed.set_codes(QUOTE_TR_ID, codes[:self.quote_codes])
+
+    def run(self, codes: Optional[Sequence[str]] = None, duration: Optional[float] = None) -> None:
+        """``stop()`` (혹은 ``duration``초 경과)까지 실행한다. ``codes``를 주면 순위 대신 고정 종목을 구독한다."""
+        self.refresh_subscriptions(codes)
+        self.feed.start()
+        started = time.monotonic()
+        next_refresh = started + self.refresh_interval
+        next_persist = started + self.persist_interval
+        try:
+            while not self._stop.wait(self.flush_interval):
+                now = time.monotonic()
+                try:
+                    self.writer.flush()
+                    if now >= next_persist:
+                        self.writer.persist()
+                        next_persist = now + self.persist_interval
+                    if codes is None and now >= next_refresh:
+                        self.refresh_subscriptions()
+                        next_refresh = now + self.refresh_interval
+                except Exception as exc:  # pylint: disable=broad-except
+                    logging.exception("Realtime feed flush failed: %s", exc)
+                if duration is not None and now - started >= duration:
+                    break
+        finally:
+            self.feed.stop()
+            self.writer.flush()
+            self.writer.persist()
+
+    def stop(self) -> None:
+        self._stop.set()
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", default=os.environ.get("KIS_REALTIME_URL") or REALTIME_URL)
+    parser.add_argument("--codes", nargs="*", help="고정 구독 종목 (기본: 거래량 순위)")
+    parser.add_argument("--duration", type=float, help="실행 시간(초). 없으면 중단할 때까지")
+    args = parser.parse_args(argv)
+
+    feed = RealtimeFeed(
+        args.url,
+        execution_codes=function_app._get_int_env("REALTIME_EXECUTION_CODES", 30),
+        quote_codes=function_app._get_int_env("REALTIME_QUOTE_CODES", 10),
+        flush_interval=function_app._get_int_env("REALTIME_FLUSH_MS", 200) / 1000,
+        refresh_interval=function_app._get_int_env("REALTIME_REFRESH_SECONDS", 60),
+        persist_interval=function_app._get_int_env("REALTIME_PERSIST_SECONDS", 5),
+    )
+    try:
+        feed.run(codes=args.codes or None, duration=args.duration)
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
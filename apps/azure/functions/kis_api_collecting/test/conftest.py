@@ -0,0 +1,62 @@
+import importlib
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from antic_extensions.testing import LocalRedisServer
+from kis_api.testing import FakeKISServer
+
+APP_DIR = Path(__file__).resolve().parents[1]
+
+# PostgreSQL 없이 실행할 수 있도록 적재는 끄고, 시간에 따라 달라지는 스케줄/lease는 테스트에서 직접 켠다.
+TEST_ENV = {
+    "KIS_APP_KEY": "local",
+    "KIS_APP_SECRET": "local",
+    "KIS_REQUEST_INTERVAL": "0",
+    "ADAPTIVE_SCHEDULE": "false",
+    "VOLUME_RANK_LEASE_SECONDS": "0",
+    "INTRADAY_TICKS_PERSIST": "false",
+    "INVESTOR_TRADE_PERSIST": "false",
+    "AnticSignalEventHubName": "kis-volume-rank",
+    "StockHistoricalDataHubName": "stock-historical-data",
+    "REDIS_SSL": "false",
+}
+
+
+@pytest.fixture(scope="session")
+def servers():
+    if LocalRedisServer.find_executable() is None:
+        pytest.skip("redis-server (or redislite) is not installed")
+    with LocalRedisServer() as redis_server, FakeKISServer() as kis_server:
+        yield redis_server, kis_server
+
+
+@pytest.fixture(scope="session")
+def function_app(servers):
+    redis_server, kis_server = servers
+    saved = dict(os.environ)
+    os.environ.update(TEST_ENV)
+    os.environ.update({
+        "KIS_BASE_URL": kis_server.base_url,
+        "REDIS_HOST": redis_server.host,
+        "REDIS_PORT": str(redis_server.port),
+        "REDIS_PASSWORD": redis_server.password,
+    })
+    sys.path.insert(0, str(APP_DIR))
+    try:
+        yield importlib.import_module("function_app")
+    finally:
+        sys.path.remove(str(APP_DIR))
+        os.environ.clear()
+        os.environ.update(saved)
+
+
+@pytest.fixture
+def app(function_app, monkeypatch):
+    """빈 Redis에 연결한 function_app 모듈. 테스트에서 바꾼 환경 변수와 캐시한 객체는 되돌린다."""
+    with function_app._get_redis_service().client.connect() as conn:
+        conn.flushdb()
+    for name in ("_partitioner", "_freshness_registry", "_movers_store", "_tick_store", "_investor_flow_store"):
+        monkeypatch.setattr(function_app, name, None)
+    return function_app
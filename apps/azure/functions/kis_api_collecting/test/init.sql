@@ -0,0 +1,2 @@
+-- function_app.py가 사용하는 스키마 (테이블은 함수가 migration으로 생성)
+CREATE SCHEMA IF NOT EXISTS anticsignal;
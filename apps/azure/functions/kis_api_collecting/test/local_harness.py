@@ -0,0 +1,329 @@
+"""function_app.py를 Azure/KIS 계정 없이 로컬에서 실행하는 부하 테스트 harness.
+
+- 가짜 KIS 서버: ``kis_api.testing.FakeKISServer`` (응답 지연/초당 호출 제한 설정 가능)
+- Event Hub: ``InMemoryEventHub``가 output binding으로 보낸 메시지를 큐에 담고,
+  해당 Event Hub를 trigger로 갖는 함수를 직접 호출한다.
+- Redis/PostgreSQL: ``docker compose -f test/docker-compose.yml up -d``로 띄운 로컬 인스턴스
+
+```sh
+docker compose -f test/docker-compose.yml up -d
+python test/local_harness.py --iterations 20 --rate 1 --latency 0.05 --rate-limit 20
+```
+"""
+import argparse
+import importlib
+import json
+import logging
+import os
+import statistics
+import sys
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+import azure.functions as func
+from antic_extensions import InMemoryMetrics, set_metrics
+from azure.functions.decorators.core import BindingDirection, Cardinality
+from kis_api.testing import FakeKISServer
+
+APP_DIR = Path(__file__).resolve().parents[1]
+
+# docker-compose.yml과 맞춘 로컬 기본값. 이미 설정된 환경 변수는 덮어쓰지 않는다.
+LOCAL_ENV = {
+    "KIS_APP_KEY": "local",
+    "KIS_APP_SECRET": "local",
+    "KIS_REQUEST_INTERVAL": "0",
+    # 한 프로세스에서 timer를 연속 실행하므로 인스턴스 간 lease는 사용하지 않는다.
+    "VOLUME_RANK_LEASE_SECONDS": "0",
+    "ADAPTIVE_SCHEDULE": "false",
+    "VOLUME_RANK_DELTA": "false",
+    "INDEX_LEASE_SECONDS": "0",
+    "AnticSignalEventHubName": "kis-volume-rank",
+    "StockHistoricalDataHubName": "stock-historical-data",
+    "REDIS_HOST": "localhost",
+    "REDIS_PORT": "6379",
+    "REDIS_PASSWORD": "localdev",
+    "REDIS_SSL": "false",
+    "POSTGRES_HOST": "localhost",
+    "POSTGRES_USER": "antic",
+    "POSTGRES_PASSWORD": "localdev",
+    "POSTGRES_DB": "antic",
+    "DAILY_PRICE_TABLE_NAME": "stock_history",
+}
+
+
+class InMemoryOut:
+    """``func.Out`` 대체. ``set``으로 받은 값을 보관한다."""
+
+    def __init__(self) -> None:
+        self._value: Any = None
+
+    def set(self, val: Any) -> None:
+        self._value = val
+
+    def get(self) -> Any:
+        return self._value
+
+
+class LocalTimer:
+    """``func.TimerRequest`` 대체."""
+
+    past_due = False
+
+
+class InMemoryEventHub:
+    """Event Hub 이름별 메시지 큐."""
+
+    def __init__(self) -> None:
+        self.queues: Dict[str, Deque[bytes]] = defaultdict(deque)
+        self.published: Dict[str, int] = defaultdict(int)
+        self.published_bytes: Dict[str, int] = defaultdict(int)
+
+    def publish(self, hub: str, value: Any) -> None:
+        """output binding 값(str, bytes 혹은 그 목록)을 메시지로 적재한다."""
+        if value is None:
+            return
+        messages = value if isinstance(value, (list, tuple)) else [value]
+        for message in messages:
+            body = message if isinstance(message, bytes) else str(message).encode("utf-8")
+            self.queues[hub].append(body)
+            self.published[hub] += 1
+            self.published_bytes[hub] += len(body)
+
+    def drain(self, hub: str, max_batch: int) -> List[bytes]:
+        queue = self.queues.get(hub)
+        batch: List[bytes] = []
+        while queue and len(batch) < max_batch:
+            batch.append(queue.popleft())
+        return batch
+
+
+class LocalFunctionHost:
+    """``func.FunctionApp``에 등록된 함수를 binding 정보에 따라 로컬에서 호출한다.
+
+    - Timer trigger 함수: ``run_timer``로 호출하고, Event Hub output 값을 ``InMemoryEventHub``로 보낸다.
+    - Event Hub trigger 함수: ``pump``가 trigger Event Hub의 메시지를 배치로 꺼내 호출한다.
+      (``cardinality``가 many가 아니면 Azure와 같이 메시지마다 한 번씩 호출)
+    """
+
+    def __init__(self, app: func.FunctionApp, hub: InMemoryEventHub, max_batch: int = 10) -> None:
+        self.hub = hub
+        self.max_batch = max_batch
+        self.durations: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self._functions: Dict[str, Any] = {f.get_function_name(): f for f in app.get_functions()}
+
+    def _bindings(self, name: str) -> List[Any]:
+        return list(self._functions[name].get_bindings())
+
+    def _invoke(self, name: str, trigger_arg: str, trigger_value: Any) -> None:
+        outputs = {
+            binding.name: (getattr(binding, "event_hub_name", None), InMemoryOut())
+            for binding in self._bindings(name)
+            if binding.direction == BindingDirection.OUT.value and binding.type == "eventHub"
+        }
+        handler: Callable[..., Any] = self._functions[name].get_user_function()
+        started = time.perf_counter()
+        try:
+            handler(**{trigger_arg: trigger_value}, **{arg: out for arg, (_, out) in outputs.items()})
+        except Exception:  # pylint: disable=broad-except
+            self.errors[name] += 1
+            logging.exception("Function %s failed", name)
+        finally:
+            self.durations[name].append(time.perf_counter() - started)
+        for hub_name, out in outputs.values():
+            self.hub.publish(hub_name, out.get())
+
+    def run_timer(self, name: str) -> None:
+        trigger = next(b for b in self._bindings(name) if b.type == "timerTrigger")
+        self._invoke(name, trigger.name, LocalTimer())
+
+    def pump(self) -> int:
+        """대기 중인 메시지가 없을 때까지 Event Hub trigger 함수를 호출하고, 처리한 메시지 수를 반환한다."""
+        processed = 0
+        while True:
+            progressed = False
+            for name in self._functions:
+                trigger = next((b for b in self._bindings(name) if b.type == "eventHubTrigger"), None)
+                if trigger is None:
+                    continue
+                many = getattr(trigger, "cardinality", None) == Cardinality.MANY
+                bodies = self.hub.drain(trigger.event_hub_name, self.max_batch if many else 1)
+                if not bodies:
+                    continue
+                events = [func.EventHubEvent(body=body) for body in bodies]
+                self._invoke(name, trigger.name, events if many else events[0])
+                processed += len(bodies)
+                progressed = True
+            if not progressed:
+                return processed
+
+
+def _summary(durations: List[float]) -> Dict[str, float]:
+    ordered = sorted(durations)
+    return {
+        "calls": len(ordered),
+        "mean_ms": round(statistics.fmean(ordered) * 1000, 1),
+        "p50_ms": round(ordered[len(ordered) // 2] * 1000, 1),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))] * 1000, 1),
+        "max_ms": round(ordered[-1] * 1000, 1),
+    }
+
+
+def _import_function_app(server: FakeKISServer, ignore_freshness: bool = False, app_keys: int = 1) -> Any:
+    os.environ["KIS_BASE_URL"] = server.base_url
+    for key, value in LOCAL_ENV.items():
+        os.environ.setdefault(key, value)
+    # 추가 앱 키는 KISClientPool로 묶인다. (가짜 서버의 호출 제한은 앱 키별로 적용)
+    for index in range(2, app_keys + 1):
+        os.environ[f"KIS_APP_KEY_{index}"] = f"local{index}"
+        os.environ[f"KIS_APP_SECRET_{index}"] = "local"
+    if ignore_freshness:
+        for data_type in ("CURRENT_PRICE", "TIME_ITEMCONCLUSION", "INVESTOR_TRADE", "DAILY_CHARTPRICE"):
+            os.environ[f"FRESHNESS_{data_type}_SECONDS"] = "0"
+    sys.path.insert(0, str(APP_DIR))
+    return importlib.import_module("function_app")
+
+
+def run(
+    iterations: int,
+    rate: float,
+    latency: float = 0.0,
+    jitter: float = 0.0,
+    rate_limit: Optional[float] = None,
+    max_batch: int = 10,
+    ignore_freshness: bool = False,
+    app_keys: int = 1,
+    indices: bool = False,
+) -> Dict[str, Any]:
+    """거래량 순위 timer를 ``rate``(회/초)로 ``iterations``번 실행하고 처리 통계를 반환한다.
+
+    ``indices``이면 매 반복마다 지수 timer(``kis_index_collect_interval``)도 실행한다.
+    """
+    with FakeKISServer(latency=latency, jitter=jitter, rate_limit=rate_limit) as server:
+        function_app = _import_function_app(server, ignore_freshness, app_keys)
+        metrics = InMemoryMetrics()
+        set_metrics(metrics)
+
+        hub = InMemoryEventHub()
+        host = LocalFunctionHost(function_app.app, hub, max_batch=max_batch)
+        started = time.perf_counter()
+        for i in range(iterations):
+            tick = time.perf_counter()
+            host.run_timer("kis_volume_rank_collect_interval")
+            if indices:
+                host.run_timer("kis_index_collect_interval")
+            host.pump()
+            if rate > 0 and i < iterations - 1:
+                time.sleep(max(0.0, 1 / rate - (time.perf_counter() - tick)))
+        elapsed = time.perf_counter() - started
+        function_app.client.close()
+        set_metrics(None)
+        snapshot = metrics.snapshot()
+
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "functions": {name: _summary(values) for name, values in host.durations.items()},
+            "errors": dict(host.errors),
+            "event_hub": {
+                name: {"messages": count, "bytes": hub.published_bytes[name]}
+                for name, count in hub.published.items()
+            },
+            "kis": {
+                "requests": dict(server.requests),
+                "requests_per_s": round(sum(server.requests.values()) / elapsed, 1) if elapsed else 0.0,
+                "throttled": server.throttled,
+                "requests_by_app_key": dict(server.requests_by_key),
+            },
+            "latency": {
+                name: {
+                    ",".join(f"{k}={v}" for k, v in series["labels"].items()): {
+                        "count": series["count"],
+                        "p50_ms": round(series["p50"] * 1000, 1),
+                        "p99_ms": round(series["p99"] * 1000, 1),
+                    }
+                    for series in histogram
+                }
+                for name, histogram in snapshot["histograms"].items()
+            },
+            "counters": {
+                name: {",".join(f"{k}={v}" for k, v in c["labels"].items()): c["value"] for c in counters}
+                for name, counters in snapshot["counters"].items()
+            },
+        }
+
+
+def run_realtime(duration: float, interval: float = 0.05) -> Dict[str, Any]:
+    """거래량 순위 timer를 한 번 실행한 뒤 ``realtime_feed``를 가짜 WebSocket 서버에 ``duration``초 연결한다."""
+    from kis_api.testing import FakeKISRealtimeServer
+
+    with FakeKISServer() as server, FakeKISRealtimeServer(interval=interval) as ws_server:
+        function_app = _import_function_app(server)
+        realtime_feed = importlib.import_module("realtime_feed")
+        host = LocalFunctionHost(function_app.app, InMemoryEventHub())
+        host.run_timer("kis_volume_rank_collect_interval")
+
+        feed = realtime_feed.RealtimeFeed(ws_server.url, refresh_interval=3600, persist_interval=1)
+        rest_before = dict(server.requests)
+        started = time.perf_counter()
+        feed.run(duration=duration)
+        elapsed = time.perf_counter() - started
+        codes = [code for tr_id, code in feed.feed.subscriptions if tr_id == "H0STCNT0"]
+        service = function_app._get_redis_service()
+        cached = {
+            field: (service.get_hash(f"stock:{codes[0]}:current_price_fields", field) or b"").decode()
+            for field in ("stck_prpr", "collected_at")
+        } if codes else {}
+        function_app.client.close()
+
+        return {
+            "elapsed_s": round(elapsed, 2),
+            "subscriptions": len(feed.feed.subscriptions),
+            "frames_sent": ws_server.frames_sent,
+            "frames_received": feed.writer.frames,
+            "frames_per_s": round(feed.writer.frames / elapsed, 1) if elapsed else 0.0,
+            "reconnects": feed.feed.reconnects,
+            "kis_rest_requests": {
+                path: count - rest_before.get(path, 0)
+                for path, count in server.requests.items()
+                if count != rest_before.get(path, 0)
+            },
+            "sample_current_price": {"code": codes[0] if codes else None, **(cached or {})},
+        }
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--iterations", type=int, default=10, help="거래량 순위 timer 실행 횟수")
+    parser.add_argument("--rate", type=float, default=1.0, help="초당 timer 실행 횟수 (0이면 대기 없음)")
+    parser.add_argument("--latency", type=float, default=0.05, help="가짜 KIS 응답 지연(초)")
+    parser.add_argument("--jitter", type=float, default=0.02, help="추가 무작위 지연 최대값(초)")
+    parser.add_argument("--rate-limit", type=float, default=20, help="가짜 KIS 초당 호출 제한 (0이면 없음)")
+    parser.add_argument("--max-batch", type=int, default=10, help="Event Hub trigger 배치 크기 (cardinality=many)")
+    parser.add_argument("--ignore-freshness", action="store_true", help="허용 지연을 0으로 두고 매번 모두 수집")
+    parser.add_argument("--app-keys", type=int, default=1, help="KIS 앱 키 수 (2 이상이면 KISClientPool 사용)")
+    parser.add_argument("--indices", action="store_true", help="지수 timer도 함께 실행 (KIS_INDEX_MASTER_PATH로 지수 목록 지정)")
+    parser.add_argument("--realtime", type=float, metavar="SECONDS", help="실시간 WebSocket worker를 N초 실행")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.realtime:
+        print(json.dumps(run_realtime(args.realtime), indent=2, ensure_ascii=False, default=str))
+        return
+    result = run(
+        args.iterations,
+        args.rate,
+        latency=args.latency,
+        jitter=args.jitter,
+        rate_limit=args.rate_limit or None,
+        max_batch=args.max_batch,
+        ignore_freshness=args.ignore_freshness,
+        app_keys=args.app_keys,
+        indices=args.indices,
+    )
+    print(json.dumps(result, indent=2, ensure_ascii=False))
+
+
+if __name__ == "__main__":
+    main()
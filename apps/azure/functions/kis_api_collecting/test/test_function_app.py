@@ -0,0 +1,154 @@
+import json
+import time
+
+import azure.functions as func
+from antic_extensions import WorkerPartitioner
+from kis_api import fetch_volume_rank
+
+
+class Out:
+    """``func.Out`` 대체."""
+
+    def __init__(self):
+        self.value = None
+
+    def set(self, val):
+        self.value = val
+
+
+class Timer:
+    """``func.TimerRequest`` 대체."""
+
+    past_due = False
+
+
+def _rank(*codes, volume=1000):
+    return {
+        "rt_cd": "0",
+        "output": [
+            {"mksc_shrn_iscd": code, "data_rank": str(rank), "acml_vol": str(volume)}
+            for rank, code in enumerate(codes, start=1)
+        ],
+    }
+
+
+def _mark_fresh(app, codes):
+    registry = app._get_freshness_registry()
+    for data_type in app.DEFAULT_FRESHNESS_BUDGETS:
+        registry.mark(data_type, codes)
+    return registry
+
+
+def _event(payload):
+    return func.EventHubEvent(body=payload.encode("utf-8"))
+
+
+def _codes(data):
+    return [row["mksc_shrn_iscd"] for row in data["output"]]
+
+
+def test_shards_are_collected_in_the_cycle_they_were_published(app, monkeypatch):
+    monkeypatch.setenv("WORKER_PARTITIONING", "true")
+    # 다른 dispatch 인스턴스가 살아 있으면 timer는 종목을 두 메시지로 나눈다.
+    other = WorkerPartitioner(app._get_redis_service(), "kis_volume_rank_dispatch", worker_id="other")
+    other.heartbeat()
+    app._record_dispatch_heartbeat()
+    data = fetch_volume_rank(app.client)
+    shards = app._volume_rank_shards(data)
+    assert len(shards) == 2
+    assert sorted(code for shard in shards for code in _codes(json.loads(shard))) == sorted(_codes(data))
+
+    # 기간별 시세(PostgreSQL 적재)는 최근에 수집한 것으로 두고, 나머지 collector만 호출되게 한다.
+    registry = app._get_freshness_registry()
+    codes = _codes(data)
+    registry.mark("daily_chartprice", codes)
+
+    # partition key가 없어 두 메시지 모두 이 인스턴스로 와도, 다른 인스턴스 담당 종목까지 이번 호출에서 수집한다.
+    for shard in shards:
+        app.volume_rank_dispatch_from_event([_event(shard)], Out())
+    assert registry.stale_types(codes) == {code: [] for code in codes}
+    with app._get_redis_service().client.connect() as conn:
+        handoff = conn.keys("workers:kis_volume_rank_dispatch:*:handoff")
+    assert handoff == []
+
+
+def test_volume_rank_message_sends_changed_and_stale_codes(app, monkeypatch):
+    monkeypatch.setenv("VOLUME_RANK_DELTA", "true")
+    previous = _rank("A", "B", "C")["output"]
+    registry = _mark_fresh(app, ["A", "B", "C", "D"])
+    assert app._volume_rank_message(previous, _rank("A", "B", "C")) is None
+
+    # A는 그대로, C는 3위 -> 2위, D는 새로 진입, B는 이탈
+    message = app._volume_rank_message(previous, _rank("A", "C", "D"))
+    assert _codes(message) == ["C", "D"]
+    assert message["delta"]["entered"] == ["D"] and message["delta"]["left"] == ["B"]
+    assert message["stale"] == []
+
+    # 순위가 그대로여도 허용 지연이 지난 종목은 다시 보낸다.
+    registry.mark("current_price", ["A"], at=time.time() - 3600)
+    message = app._volume_rank_message(previous, _rank("A", "B", "C"))
+    assert _codes(message) == ["A"] and message["stale"] == ["A"]
+    assert not any(message["delta"].values())
+
+    monkeypatch.setenv("VOLUME_RANK_DELTA", "false")
+    data = _rank("A", "B", "C")
+    assert app._volume_rank_message(previous, data) is data
+
+
+def test_timer_sends_the_full_ranking_to_the_default_hub(app, monkeypatch):
+    monkeypatch.setenv("VOLUME_RANK_DELTA", "true")
+    monkeypatch.setenv("VOLUME_RANK_LEASE_SECONDS", "60")
+    monkeypatch.setattr(app, "VOLUME_RANK_EVENT_HUB_NAME", "kis-volume-rank-dispatch")
+    data = fetch_volume_rank(app.client)
+
+    default, interval = Out(), Out()
+    app.volume_rank_collect_interval(Timer(), default, interval)
+    assert json.loads(default.value) == json.loads(json.dumps(data, default=str))
+    message = json.loads(interval.value[0])
+    assert _codes(message) == _codes(data) and message["fencing_token"] == 1
+
+    # 순위가 그대로이고 모두 최근에 수집했으면 dispatch에는 보내지 않지만, 기본 Event Hub에는 그대로 보낸다.
+    _mark_fresh(app, _codes(data))
+    with app._get_redis_service().client.connect() as conn:
+        conn.delete("lease:kis_volume_rank_collect")
+    default, interval = Out(), Out()
+    app.volume_rank_collect_interval(Timer(), default, interval)
+    assert json.loads(default.value) == json.loads(json.dumps(data, default=str))
+    assert interval.value is None
+
+
+def test_stale_fencing_token_is_dropped(app, monkeypatch):
+    monkeypatch.setenv("VOLUME_RANK_LEASE_SECONDS", "60")
+    payload = _rank("A", "B")
+    assert app._extract_stock_codes(json.dumps({**payload, "fencing_token": 5})) == ["A", "B"]
+    assert app._extract_stock_codes(json.dumps({**payload, "fencing_token": 5})) == ["A", "B"]
+    # lease가 만료된 뒤 늦게 발행된 이전 token의 메시지는 버린다.
+    assert app._extract_stock_codes(json.dumps({**payload, "fencing_token": 4})) == []
+    assert app._extract_stock_codes(json.dumps(payload)) == ["A", "B"]
+
+    monkeypatch.setenv("VOLUME_RANK_LEASE_SECONDS", "0")
+    assert app._extract_stock_codes(json.dumps({**payload, "fencing_token": 1})) == ["A", "B"]
+
+
+def test_volume_rank_is_not_split_for_a_single_worker(app, monkeypatch):
+    data = _rank("A", "B", "C")
+    monkeypatch.setenv("WORKER_PARTITIONING", "false")
+    assert app._volume_rank_shards(data) == [json.dumps(data, default=str)]
+
+    monkeypatch.setenv("WORKER_PARTITIONING", "true")
+    app._record_dispatch_heartbeat()
+    assert app._volume_rank_shards(data) == [json.dumps(data, default=str)]
+
+
+def test_volume_rank_runs_again_after_the_adaptive_interval(app, monkeypatch):
+    monkeypatch.setenv("ADAPTIVE_SCHEDULE", "true")
+    monkeypatch.setenv("VOLUME_RANK_PULLING_INTERVAL", "60")
+    monkeypatch.setenv("VOLUME_RANK_MAX_INTERVAL", "600")
+    assert app._volume_rank_due()
+
+    app._record_volume_rank_run(_rank("A", "B")["output"], _rank("B", "C"))
+    state = json.loads(app._get_redis_service().get(app.VOLUME_RANK_SCHEDULE_KEY))
+    assert 60 <= state["interval"] <= 600 and state["churn"] > 0
+    now = state["last_run"]
+    assert not app._volume_rank_due(now=now + 1)
+    assert app._volume_rank_due(now=now + state["interval"])
@@ -13,6 +13,7 @@ app = CoreApp(
     version="0.1.0"
 )
 app.register_routes()
+app.init_metrics()
 app.init_logging(
     development=True
 )
@@ -2,8 +2,29 @@ __all__ = (
     'CoreApp',
 )
 import logging
-from fastapi import FastAPI
-from ..routes import eventhub, core, stock, news
+import time
+from fastapi import FastAPI, Request, Response
+from antic_extensions.modules.metrics import (
+    PrometheusMetrics,
+    get_metrics,
+    opentelemetry_tracer,
+    set_metrics,
+)
+from ..routes import eventhub, core, stock, news, market
+
+
+def _route_template(request: Request) -> str:
+    """메트릭 라벨용 경로 템플릿 (예: `/api/v1/stock/realtime/{stock_unique_id}`).
+
+    include_router로 등록된 라우트는 FastAPI 버전에 따라 prefix 없이 `scope["route"]`에 담기므로,
+    요청 경로에서 라우트 경로의 segment 수만큼을 뺀 나머지를 prefix로 붙인다.
+    """
+    route = request.scope.get("route")
+    path = getattr(route, "path", None)
+    if path is None:
+        return "unmatched"
+    parts = request.scope["path"].split("/")
+    return "/".join(parts[:len(parts) - path.count("/")]) + path
 
 
 class CoreApp(
@@ -33,5 +54,44 @@ class CoreApp(
         self.include_router(core.router, prefix="/api/v1", tags=["Chat"])
         self.include_router(stock.router, prefix="/api/v1/stock", tags=["Cloud"])
         self.include_router(news.router, prefix="/api/v1/news", tags=["Cloud"])
+        self.include_router(market.router, prefix="/api/v1/market", tags=["Cloud"])
         self.include_router(eventhub.router, prefix="/api/v1/eventhub", tags=["Cloud"])
 
+
+    def init_metrics(self, tracing=False):
+        """Prometheus 메트릭(`GET /metrics`)과 요청별 지연 시간 미들웨어를 등록한다.
+
+        Redis/PostgreSQL 클라이언트의 명령별 지연 시간, cache hit/miss도 같은 registry로 노출된다.
+        `prometheus_client`가 설치되어 있지 않으면 등록하지 않는다.
+
+        :param tracing: (bool) True이면 OpenTelemetry span도 기록한다. (exporter 설정은 배포 환경에서)
+        """
+        try:
+            metrics = PrometheusMetrics(tracer=opentelemetry_tracer() if tracing else None)
+        except ImportError as e:
+            logging.getLogger("src").warning(f"Metrics are disabled: {e}")
+            return
+        set_metrics(metrics)
+
+        @self.middleware("http")
+        async def record_request_latency(request: Request, call_next):
+            started = time.perf_counter()
+            status = 500
+            try:
+                response = await call_next(request)
+                status = response.status_code
+                return response
+            finally:
+                get_metrics().observe(
+                    "http_request_seconds",
+                    time.perf_counter() - started,
+                    method=request.method,
+                    route=_route_template(request),
+                    status=status,
+                )
+
+        def render_metrics():
+            body, content_type = metrics.render()
+            return Response(content=body, media_type=content_type)
+
+        self.add_api_route("/metrics", render_metrics, methods=["GET"], include_in_schema=False)
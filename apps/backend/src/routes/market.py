@@ -0,0 +1,47 @@
+from typing import Optional
+from fastapi import Depends, APIRouter, HTTPException
+from ..services import RealtimeStockInfoCacheService
+from ..core.clients import (
+    get_redis_service_client,
+    RedisService
+)
+
+router = APIRouter()
+
+
+## /api/v1/market/indices
+@router.get("/indices")
+def get_market_indices(
+        codes: Optional[str] = None,
+        redis_client: RedisService = Depends(get_redis_service_client)
+):
+    """[GET] 업종/지수(코스피, 코스닥, 코스피200, 업종 지수 등)의 최신 값을 받습니다.
+
+    ``codes``는 쉼표로 구분한 지수 코드이며(예: ``0001,1001``), 생략하면 캐시된 전체 지수를 반환합니다.
+    """
+    service = RealtimeStockInfoCacheService(
+        redis_client
+    )
+    targets = [code.strip() for code in codes.split(",") if code.strip()] if codes else None
+    return service.cache_index_snapshots(targets)
+
+
+## /api/v1/market/indices/{index_code}/ticks
+@router.get("/indices/{index_code}/ticks")
+def get_market_index_ticks(
+        index_code: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        redis_client: RedisService = Depends(get_redis_service_client)
+):
+    """[GET] 해당 지수의 당일 시간별 지수를 ``start``~``end``(HHMMSS) 구간으로 받습니다."""
+    service = RealtimeStockInfoCacheService(
+        redis_client
+    )
+    try:
+        return service.cache_index_ticks(
+            str(index_code), start=start, end=end, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
@@ -1,10 +1,12 @@
 from fastapi import Depends, APIRouter, HTTPException
 from ..services import (
-    HistoricalStockDataQueryService 
+    HistoricalStockDataQueryService,
+    RealtimeStockInfoCacheService,
 )
 from ..core.clients import (
     get_psql_client, 
-    PsqlDBClient
+    get_redis_service_client,
+    PsqlDBClient, RedisService
 )
 
 router = APIRouter()
@@ -14,10 +16,19 @@ router = APIRouter()
 @router.get("/stock/{unique_id}")
 def get_stock_news_data(
         unique_id: str,
-        sql_client: PsqlDBClient = Depends(get_psql_client)
+        limit: int = 20,
+        sql_client: PsqlDBClient = Depends(get_psql_client),
+        redis_client: RedisService = Depends(get_redis_service_client)
 ):
-    """[GET] 해당 주식 종목에 대한 뉴스 감정 분석 데이터를 받도록 합니다."""
+    """[GET] 해당 주식 종목에 대한 뉴스 감정 분석 데이터를 받도록 합니다.
+
+    수집 Function이 미리 캐시해 둔 Redis 데이터를 먼저 사용하고, 없으면 PostgreSQL을 조회합니다.
+    """
+    if not 0 < limit <= 100:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 100")
     id = str(unique_id)
+    cached = RealtimeStockInfoCacheService(redis_client).cache_stock_news(id)
+    if cached:
+        return cached[:limit]
     service = HistoricalStockDataQueryService(sql_client)
-    ...
-    
\ No newline at end of file
+    return service.query_stock_news_data(id, limit=limit)
@@ -1,3 +1,5 @@
+from datetime import datetime, time, timedelta, timezone
+from typing import Literal, Optional
 from fastapi import Depends, APIRouter, HTTPException
 from ..services import (
     RealtimeStockInfoCacheService,
@@ -24,6 +26,77 @@ def get_stock_top10(
     )
     ...
 
+## /api/v1/stock/movers
+@router.get("/movers")
+def get_stock_movers(
+        metric: Literal['change_rate', 'volume', 'trading_value'] = 'change_rate',
+        order: Literal['desc', 'asc'] = 'desc',
+        limit: int = 20,
+        redis_client: RedisService = Depends(get_redis_service_client)
+):
+    """[GET] 등락률(상승/하락)/거래량/거래대금 상위 종목을 받습니다. 하락률 상위는 ``order=asc``입니다."""
+    if not 0 < limit <= 100:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 100")
+    service = RealtimeStockInfoCacheService(
+        redis_client
+    )
+    return service.cache_market_movers(metric, order=order, limit=limit)
+
+
+## /api/v1/stock/sectors
+@router.get("/sectors")
+def get_stock_sectors(
+        order_by: Literal['change_rate', 'volume', 'trading_value', 'count', 'advancers', 'decliners'] = 'change_rate',
+        order: Literal['desc', 'asc'] = 'desc',
+        redis_client: RedisService = Depends(get_redis_service_client)
+):
+    """[GET] 업종별 평균 등락률, 거래량/거래대금 합계, 상승/하락 종목 수(heatmap)를 받습니다."""
+    service = RealtimeStockInfoCacheService(
+        redis_client
+    )
+    return service.cache_sector_heatmap(order_by=order_by, order=order)
+
+
+## /api/v1/stock/investor-flow
+@router.get("/investor-flow")
+def get_stock_investor_flow_ranking(
+        investor: Literal['foreign', 'institution', 'personal'] = 'foreign',
+        window: int = 20,
+        order: Literal['desc', 'asc'] = 'desc',
+        limit: int = 20,
+        redis_client: RedisService = Depends(get_redis_service_client)
+):
+    """[GET] 투자자별 최근 ``window``(5, 20, 60)거래일 누적 순매수 거래대금 상위 종목을 받습니다. 순매도 상위는 ``order=asc``입니다."""
+    if not 0 < limit <= 100:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 100")
+    service = RealtimeStockInfoCacheService(
+        redis_client
+    )
+    try:
+        return service.cache_investor_flow_ranking(investor, window=window, order=order, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+## /api/v1/stock/investor-flow/{unique_id}
+@router.get("/investor-flow/{unique_id}")
+def get_stock_investor_flow(
+        unique_id: str,
+        days: int = 0,
+        redis_client: RedisService = Depends(get_redis_service_client)
+):
+    """[GET] 해당 종목의 투자자별 5/20/60일 누적 순매수와 (``days``를 주면) 최근 일별 매매동향을 받습니다."""
+    if not 0 <= days <= 60:
+        raise HTTPException(status_code=400, detail="days must be between 0 and 60")
+    service = RealtimeStockInfoCacheService(
+        redis_client
+    )
+    flow = service.cache_investor_flow(str(unique_id), days=days)
+    if flow is None:
+        raise HTTPException(status_code=404, detail=f"No investor flow for {unique_id}")
+    return flow
+
+
 ## /api/v1/stock/realtime
 @router.get("/realtime/{unique_id}")
 def get_stock_realtime_data(
@@ -38,17 +111,69 @@ def get_stock_realtime_data(
     data = service.cache_stock_realtime_data(uniq_id)
     return data
 
+
+## /api/v1/stock/ticks
+@router.get("/ticks/{unique_id}")
+def get_stock_intraday_ticks(
+        unique_id: str,
+        start: Optional[str] = None,
+        end: Optional[str] = None,
+        limit: Optional[int] = None,
+        redis_client: RedisService = Depends(get_redis_service_client)
+):
+    """[GET] 해당 종목의 당일 시간대별 체결을 ``start``~``end``(HHMMSS) 구간으로 받습니다."""
+    service = RealtimeStockInfoCacheService(
+        redis_client
+    )
+    try:
+        return service.cache_stock_intraday_ticks(
+            str(unique_id), start=start, end=end, limit=limit
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+
+## /api/v1/stock/bars
+@router.get("/bars/{unique_id}")
+def get_stock_intraday_bars(
+        unique_id: str,
+        timeframe: Literal['1m', '5m', '1h'] = '1m',
+        start: Optional[datetime] = None,
+        end: Optional[datetime] = None,
+        sql_client: PsqlDBClient = Depends(get_psql_client)
+):
+    """[GET] 해당 종목의 분/시간봉(OHLCV)을 받습니다. 기본 구간은 오늘(KST) 하루입니다."""
+    kst = timezone(timedelta(hours=9))
+    if start is None:
+        start = datetime.combine(datetime.now(kst).date(), time(0), tzinfo=kst)
+    elif start.tzinfo is None:
+        start = start.replace(tzinfo=kst)
+    if end is None:
+        end = start + timedelta(days=1)
+    elif end.tzinfo is None:
+        end = end.replace(tzinfo=kst)
+    if start >= end:
+        raise HTTPException(status_code=400, detail="start must be earlier than end")
+    service = HistoricalStockDataQueryService(
+        sql_client
+    )
+    return service.query_intraday_bars(str(unique_id), timeframe, start, end)
+
     
 ## /api/v1/stock/history
 @router.get("/history/{unique_id}")
 def get_stock_history_data(
         unique_id: str,
+        period: Literal['D', 'W', 'M', 'Y'] = 'D',
+        limit: int = 250,
         sql_client: PsqlDBClient = Depends(get_psql_client)
 ):
-    """[GET] 해당 종목에 대한 주식 히스토리 데이터를 받습니다."""
+    """[GET] 해당 종목에 대한 주식 히스토리(OHLCV) 데이터를 최신순으로 받습니다."""
+    if not 0 < limit <= 2500:
+        raise HTTPException(status_code=400, detail="limit must be between 1 and 2500")
     id = str(unique_id)
     service = HistoricalStockDataQueryService(
         sql_client
     )
-    ...
+    return service.query_historical_stock_data(id, period=period, limit=limit)
 
@@ -1,6 +1,7 @@
 """SQL DB로 부터 누적 주식 데이터를 `Query`합니다.
 """
-from antic_extensions import PsqlDBClient
+from antic_extensions import IntradayTickWriter, PsqlDBClient
+from datetime import datetime
 from typing import Optional
 from ..settings import api_settings
 
@@ -43,25 +44,99 @@ class HistoricalStockDataQueryService:
 
     def query_historical_stock_data(
             self,
-            stock_unique_id: str
+            stock_unique_id: str,
+            period: str='D',
+            limit: int=250
     ):
-        """해당 종목의 주식 누적 데이터를 Psql로 부터 받아온다.  
+        """해당 종목의 주식 누적 데이터(OHLCV, 거래대금)를 Psql로 부터 최신순으로 받아온다.  
+
+        ``(fid_input_iscd, stck_bsop_date DESC)`` covering 인덱스만으로 처리되는 조회입니다.  
         
         :param stock_unique_id: (str) 주식 종목 코드 입력.  
+        :param period: (str) 기간 구분. 'D' | 'W' | 'M' | 'Y'  
+        :param limit: (int) 최신순으로 가져올 최대 개수.  
 
         """
-        ...
+        query = (
+            "SELECT stck_bsop_date, stck_oprc, stck_hgpr, stck_lwpr, stck_clpr, acml_vol, acml_tr_pbmn "
+            f"FROM {api_settings.SQL_HISTORY_TABLE} "
+            "WHERE fid_input_iscd = %s AND fid_period_div_code = %s "
+            "ORDER BY stck_bsop_date DESC "
+            "LIMIT %s"
+        )
+        with self._sql_client.cursor('stock_history_select') as cur:  # type: ignore
+            cur.execute(query, (stock_unique_id, period, limit))
+            rows = cur.fetchall()
+
+        def _num(value):
+            return int(value) if value is not None else None
+
+        return [
+            {
+                'stck_bsop_date': bsop_date.isoformat(),
+                'stck_oprc': _num(oprc),
+                'stck_hgpr': _num(hgpr),
+                'stck_lwpr': _num(lwpr),
+                'stck_clpr': _num(clpr),
+                'acml_vol': _num(vol),
+                'acml_tr_pbmn': _num(amount),
+            }
+            for bsop_date, oprc, hgpr, lwpr, clpr, vol, amount in rows
+        ]
 
 
     def query_stock_news_data(
             self,
-            stock_unique_id: str
+            stock_unique_id: str,
+            limit: int=20
     ):
         """해당 종목에 대한 뉴스 기분석 데이터를 Query해서 받아온다.  
         
         :param stock_unique_id: (str) 주식 종목 코드 입력.  
+        :param limit: (int) 최신순으로 가져올 최대 개수.  
 
         """
-        ...
+        query = (
+            "SELECT link, originallink, title, content, pub_date "
+            f"FROM {api_settings.SQL_NEWS_TABLE} "
+            "WHERE fid_input_iscd = %s "
+            "ORDER BY pub_date DESC NULLS LAST "
+            "LIMIT %s"
+        )
+        with self._sql_client.cursor('news_select') as cur:  # type: ignore
+            cur.execute(query, (stock_unique_id, limit))
+            rows = cur.fetchall()
+        return [
+            {
+                'link': link,
+                'originallink': originallink,
+                'title': title,
+                'content': content,
+                'pubDate': pub_date.isoformat() if pub_date else None,
+            }
+            for link, originallink, title, content, pub_date in rows
+        ]
 
+    def query_intraday_bars(
+            self,
+            stock_unique_id: str,
+            timeframe: str,
+            start: datetime,
+            end: datetime
+    ):
+        """수집 Function이 집계해 둔 분/시간봉(OHLCV)을 ``[start, end)`` 구간으로 받아온다.  
 
+        수집 Function이 적재에 쓰는 ``IntradayTickWriter.query_bars``를 그대로 사용하며,
+        ``(fid_input_iscd, timeframe, bucket)`` 인덱스만으로 처리되는 범위 조회입니다.  
+
+        :param stock_unique_id: (str) 주식 종목 코드 입력.  
+        :param timeframe: (str) 봉 단위. '1m' | '5m' | '1h'  
+        :param start: (datetime) 시작 시각 (포함)  
+        :param end: (datetime) 종료 시각 (미포함)  
+
+        """
+        writer = IntradayTickWriter(
+            self._sql_client,  # type: ignore
+            schema=api_settings.SQL_BARS_SCHEMA,
+        )
+        return writer.query_bars(stock_unique_id, timeframe, start, end)
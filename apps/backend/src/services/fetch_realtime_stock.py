@@ -3,9 +3,17 @@
 import json
 import pprint
 from typing import Optional
-from antic_extensions import RedisService
+from antic_extensions import (
+    RedisService,
+    IntradayTickStore,
+    IndexTickStore,
+    MarketMoversStore,
+    InvestorFlowStore,
+)
 from .schema_enums import (
     REDIS_STOCK_CURRENT_PRICE,
+    REDIS_STOCK_NEWS,
+    REDIS_INDEX_LATEST,
 )
 from ..settings import api_settings
 import logging
@@ -85,5 +93,169 @@ class RealtimeStockInfoCacheService:
                     if k in FILTER_TARGETS}
         return data
 
+    def cache_stock_news(self, stock_unique_id: str):
+        """수집 Function이 미리 계산해 둔 종목별 최신 뉴스를 Redis로 부터 받아옵니다.
+
+        :param stock_unique_id: (str) 주식 종목 코드 입력.  
+
+        """
+        data = None
+        try:
+            data = self.redis_client.get(
+                REDIS_STOCK_NEWS.format(id=stock_unique_id)
+            )
+            data = json.loads(data) # type: ignore
+        except TypeError as e:
+            logging.warning(e)
+        except Exception as e:
+            logging.error(e)
+        return data if isinstance(data, list) else None
+
+    def cache_stock_intraday_ticks(
+            self,
+            stock_unique_id: str,
+            start: Optional[str]=None,
+            end: Optional[str]=None,
+            limit: Optional[int]=None,
+    ):
+        """수집 Function이 누적한 당일 시간대별 체결(틱)을 시간순으로 받아옵니다.
+
+        :param stock_unique_id: (str) 주식 종목 코드 입력.  
+        :param start: (str) 시작 체결 시각 ``HHMMSS`` (기본값: 장 시작 전부터)  
+        :param end: (str) 종료 체결 시각 ``HHMMSS`` (기본값: 장 마감 후까지)  
+        :param limit: (int) 최대 반환 개수  
+
+        """
+        store = IntradayTickStore(self.redis_client)
+        try:
+            return store.range(stock_unique_id, start=start, end=end, limit=limit)
+        except ValueError:
+            raise
+        except Exception as e:
+            logging.error(e)
+        return []
+
+    def cache_market_movers(
+            self,
+            metric: str='change_rate',
+            order: str='desc',
+            limit: int=20,
+    ):
+        """수집 Function이 미리 계산해 둔 등락률/거래량/거래대금 순위를 받아옵니다.
+
+        :param metric: (str) ``change_rate``(등락률), ``volume``(거래량), ``trading_value``(거래대금)  
+        :param order: (str) ``desc``(상위, 상승률) 혹은 ``asc``(하위, 하락률)  
+        :param limit: (int) 최대 반환 개수  
 
+        """
+        store = MarketMoversStore(self.redis_client)
+        try:
+            return store.top(metric, count=limit, ascending=order == 'asc')
+        except ValueError:
+            raise
+        except Exception as e:
+            logging.error(e)
+        return []
 
+    def cache_sector_heatmap(self, order_by: str='change_rate', order: str='desc'):
+        """수집 Function이 미리 계산해 둔 업종별 평균 등락률, 거래량/거래대금, 상승/하락 종목 수를 받아옵니다.
+
+        :param order_by: (str) 정렬 기준 (``change_rate``, ``volume``, ``trading_value``, ``count``...)  
+        :param order: (str) ``desc`` 혹은 ``asc``  
+
+        """
+        store = MarketMoversStore(self.redis_client)
+        try:
+            return store.sectors(order_by=order_by, ascending=order == 'asc')
+        except ValueError:
+            raise
+        except Exception as e:
+            logging.error(e)
+        return []
+
+    def cache_investor_flow(self, stock_unique_id: str, days: int=0):
+        """수집 Function이 미리 계산해 둔 종목의 투자자별(개인/외국인/기관) 5/20/60일 누적 순매수를 받아옵니다.
+
+        :param stock_unique_id: (str) 종목 코드  
+        :param days: (int) 함께 받을 일별 매매동향 수 (최근 영업일부터, 0이면 생략)  
+
+        """
+        store = InvestorFlowStore(self.redis_client)
+        try:
+            flow = store.get(stock_unique_id)
+            if flow is not None and days > 0:
+                flow['history'] = store.history(stock_unique_id, count=days)
+            return flow
+        except Exception as e:
+            logging.error(e)
+        return None
+
+    def cache_investor_flow_ranking(
+            self,
+            investor: str='foreign',
+            window: int=20,
+            order: str='desc',
+            limit: int=20,
+    ):
+        """투자자별 ``window``거래일 누적 순매수 거래대금(백만원) 순위를 받아옵니다.
+
+        :param investor: (str) ``foreign``(외국인), ``institution``(기관), ``personal``(개인)  
+        :param window: (int) 누적 기간 (5, 20, 60 거래일)  
+        :param order: (str) ``desc``(순매수 상위) 혹은 ``asc``(순매도 상위)  
+        :param limit: (int) 최대 반환 개수  
+
+        """
+        store = InvestorFlowStore(self.redis_client)
+        try:
+            return store.top(investor, window=window, count=limit, ascending=order == 'asc')
+        except ValueError:
+            raise
+        except Exception as e:
+            logging.error(e)
+        return []
+
+    def cache_index_snapshots(self, codes: Optional[list]=None):
+        """수집 Function이 캐시한 업종/지수의 최신 값을 지수 코드순으로 받아옵니다.
+
+        :param codes: (list) 지수 코드 목록 (기본값: 캐시된 전체 지수)  
+
+        """
+        data = None
+        try:
+            data = self.redis_client.get_hash(REDIS_INDEX_LATEST)
+        except Exception as e:
+            logging.error(e)
+        snapshots = []
+        for code, raw in (data or {}).items():
+            code = code.decode('utf-8') if isinstance(code, bytes) else code
+            if codes and code not in codes:
+                continue
+            try:
+                snapshots.append(json.loads(raw))
+            except (TypeError, ValueError) as e:
+                logging.warning(e)
+        return sorted(snapshots, key=lambda item: item.get('code', ''))
+
+    def cache_index_ticks(
+            self,
+            index_code: str,
+            start: Optional[str]=None,
+            end: Optional[str]=None,
+            limit: Optional[int]=None,
+    ):
+        """수집 Function이 누적한 업종/지수의 당일 시간별 지수를 시간순으로 받아옵니다.
+
+        :param index_code: (str) 지수 코드 (예: ``0001`` 코스피, ``1001`` 코스닥)  
+        :param start: (str) 시작 시각 ``HHMMSS``  
+        :param end: (str) 종료 시각 ``HHMMSS``  
+        :param limit: (int) 최대 반환 개수  
+
+        """
+        store = IndexTickStore(self.redis_client)
+        try:
+            return store.range(index_code, start=start, end=end, limit=limit)
+        except ValueError:
+            raise
+        except Exception as e:
+            logging.error(e)
+        return []
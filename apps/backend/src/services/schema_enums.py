@@ -8,8 +8,32 @@ REDIS_STOCK_CURRENT_PRICE       = "stock:{id}:current_price"
 # REDIS_STOCK_CURRENT_PRICE_FIELD = "stock:{id}:current_price_fields"     # Hash
 # '''주식 현재 가격 필드'''
 
-# REDIS_STOCK_INTRADAY_TICKS      = "stock:{id}:intraday_ticks"
-# '''주식 당일 발생 모든 가격 변동'''
+REDIS_STOCK_INTRADAY_TICKS      = "stock:{id}:intraday_ticks"     # Sorted Set
+'''주식 당일 발생 모든 가격 변동 (score: YYYYMMDDHHMMSS, ``IntradayTickStore``)'''
+
+REDIS_STOCK_NEWS                = "stock:{id}:news"
+'''종목별 최신 뉴스 (수집 Function이 사전 계산)'''
+
+REDIS_MARKET_MOVERS             = "market:movers:{metric}"     # Sorted Set
+'''등락률/거래량/거래대금 순위 (metric: change_rate, volume, trading_value, ``MarketMoversStore``)'''
+
+REDIS_MARKET_SECTORS            = "market:sectors:{aggregate}"     # Hash
+'''업종별 종목 수, 등락률 합계, 거래량/거래대금 합계, 상승/하락 종목 수 (``MarketMoversStore``)'''
+
+REDIS_STOCK_INVESTOR_DAILY      = "stock:{id}:investor_daily"     # Hash
+'''종목별 투자자 매매동향(일별) 최근 60거래일 (영업일 -> 순매수 JSON, ``InvestorFlowStore``)'''
+
+REDIS_STOCK_INVESTOR_FLOW       = "stock:{id}:investor_flow"     # Hash
+'''종목별 투자자(개인/외국인/기관) 5/20/60일 누적 순매수 수량/거래대금 (``InvestorFlowStore``)'''
+
+REDIS_INVESTOR_FLOW_RANKING     = "investor_flow:{investor}:{window}"     # Sorted Set
+'''투자자별 누적 순매수 거래대금 순위 (investor: personal, foreign, institution / window: 5, 20, 60)'''
+
+REDIS_INDEX_LATEST              = "index:latest"     # Hash
+'''업종/지수 코드 -> 최신 지수 요약 JSON (수집 Function이 배치로 갱신)'''
+
+REDIS_INDEX_TICKS               = "index:{id}:ticks"     # Sorted Set
+'''업종/지수 당일 시간별 지수 (score: YYYYMMDDHHMMSS, ``IndexTickStore``)'''
 
 REDIS_STOCK_TOP_10              = "volume_rank:top10"
 '''주식 TOP 10 실시간 정보'''
@@ -20,6 +20,9 @@ class ApiSettings(BaseSettings):
     SQL_PORT: int               = 5432
     SQL_PASSWORD: Optional[str] = getenv('SQL_PASSWORD')
     SQL_DATABASE: str           = getenv('SQL_DATABASE', 'postgres')
+    SQL_HISTORY_TABLE: str      = getenv('SQL_HISTORY_TABLE', 'anticsignal.stock_history')
+    SQL_NEWS_TABLE: str         = getenv('SQL_NEWS_TABLE', 'anticsignal.stock_news')
+    SQL_BARS_SCHEMA: str        = getenv('SQL_BARS_SCHEMA', 'anticsignal')  # {schema}.stock_bars
     
     # Redis Settings
     REDIS_HOST: str             = getenv('REDIS_HOST', 'localhost')
@@ -0,0 +1,64 @@
+"""백엔드 조회 API를 ASGI 테스트 클라이언트로 측정한다. (로컬 Redis/PostgreSQL)"""
+from datetime import date, datetime, timedelta, timezone
+
+import pytest
+
+from conftest import BENCH_CODES
+
+KST = timezone(timedelta(hours=9))
+CODE = BENCH_CODES[0]
+
+
+@pytest.fixture(scope="module")
+def backend_client(redis_service, psql_client, kis_client, daily_chart_rows):
+    pytest.importorskip("fastapi")
+    from fastapi.testclient import TestClient
+    from psycopg2.extras import execute_values
+
+    from antic_extensions import IntradayTickStore, IntradayTickWriter, migrate_stock_history
+    from kis_api import fetch_inquire_price, fetch_inquire_time_itemconclusion
+    from src.core.app import CoreApp
+    from src.core.clients import get_psql_client, get_redis_service_client
+    from src.settings import api_settings
+
+    # 조회 대상 데이터 준비
+    price = fetch_inquire_price(kis_client, CODE)
+    redis_service.client._client.set(f"stock:{CODE}:current_price", __import__("json").dumps(price, default=str))
+    ticks = fetch_inquire_time_itemconclusion(kis_client, CODE, "100000")
+    IntradayTickStore(redis_service).append(CODE, ticks)
+    writer = IntradayTickWriter(psql_client)
+    writer.ensure_schema()
+    writer.write_ticks(ticks, trading_date=datetime.now(KST).date())
+    migrate_stock_history(psql_client, api_settings.SQL_HISTORY_TABLE)
+    with psql_client.cursor() as cur:
+        execute_values(
+            cur,
+            f"INSERT INTO {api_settings.SQL_HISTORY_TABLE} "
+            "(fid_input_iscd, fid_period_div_code, stck_bsop_date, stck_clpr, stck_oprc, "
+            "stck_hgpr, stck_lwpr, acml_vol, acml_tr_pbmn) VALUES %s ON CONFLICT DO NOTHING",
+            [
+                (row["requested_fid_input_iscd"], "D", date(*map(int, (row["stck_bsop_date"][:4], row["stck_bsop_date"][4:6], row["stck_bsop_date"][6:]))),
+                 row["stck_clpr"], row["stck_oprc"], row["stck_hgpr"], row["stck_lwpr"], row["acml_vol"], row["acml_tr_pbmn"])
+                for row in daily_chart_rows
+            ],
+        )
+
+    app = CoreApp()
+    app.register_routes()
+    app.dependency_overrides[get_redis_service_client] = lambda: redis_service
+    app.dependency_overrides[get_psql_client] = lambda: psql_client
+    with TestClient(app) as client:
+        yield client
+
+
+@pytest.mark.benchmark(group="backend")
+@pytest.mark.parametrize("path", [
+    f"/api/v1/stock/realtime/{CODE}",
+    f"/api/v1/stock/ticks/{CODE}",
+    f"/api/v1/stock/bars/{CODE}?timeframe=1m",
+    f"/api/v1/stock/history/{CODE}?limit=250",
+])
+def test_route(benchmark, backend_client, path):
+    response = benchmark(backend_client.get, path)
+    assert response.status_code == 200
+    assert response.json()
@@ -0,0 +1,29 @@
+"""수집 함수 앱의 저장 단계 (Redis 캐시, PostgreSQL 일봉 upsert)를 로컬 Redis/PostgreSQL로 측정한다."""
+import pytest
+
+from kis_api import fetch_inquire_price
+
+from conftest import BENCH_CODES
+
+
+@pytest.mark.benchmark(group="function_app")
+def test_cache_current_prices(benchmark, function_app, kis_client):
+    payloads = [fetch_inquire_price(kis_client, code) for code in BENCH_CODES]
+    benchmark(function_app._cache_current_prices, payloads)
+
+
+@pytest.mark.benchmark(group="function_app")
+def test_persist_daily_chartprice(benchmark, function_app, daily_chart_rows):
+    """이미 적재된 행을 다시 upsert 하는 정상 상태 비용 (종목 10개 x 1년치)."""
+    function_app._persist_daily_chartprice(daily_chart_rows)
+    benchmark.pedantic(
+        function_app._persist_daily_chartprice, args=(daily_chart_rows,), rounds=20, iterations=1, warmup_rounds=1,
+    )
+
+
+@pytest.mark.benchmark(group="function_app")
+def test_encode_daily_chartprice_batches(benchmark, function_app, daily_chart_rows):
+    from antic_extensions import encode_event_batches
+
+    batches = benchmark(encode_event_batches, daily_chart_rows, compression="gzip")
+    assert batches
@@ -0,0 +1,41 @@
+"""KISClient 요청 오버헤드와 collector별 처리 시간 (가짜 KIS 서버, 응답 지연 0)."""
+import pytest
+
+from kis_api import (
+    fetch_inquire_daily_itemchartprice,
+    fetch_inquire_index_price,
+    fetch_inquire_index_tickprice,
+    fetch_inquire_price,
+    fetch_inquire_time_itemconclusion,
+    fetch_intstock_multprice,
+    fetch_investor_trade_by_stock_daily,
+    fetch_volume_rank,
+)
+from kis_api.collectors import inquire_price
+from kis_api.testing import DEFAULT_CODES
+
+COLLECTORS = {
+    "volume_rank": lambda client: fetch_volume_rank(client),
+    "inquire_price": lambda client: fetch_inquire_price(client, "005930"),
+    "intstock_multprice_30": lambda client: fetch_intstock_multprice(client, DEFAULT_CODES),
+    "time_itemconclusion": lambda client: fetch_inquire_time_itemconclusion(client, "005930", "100000"),
+    "investor_trade": lambda client: fetch_investor_trade_by_stock_daily(client, "005930", "20241231"),
+    "daily_itemchartprice": lambda client: fetch_inquire_daily_itemchartprice(client, "005930", "20240101", "20241231"),
+    "index_price": lambda client: fetch_inquire_index_price(client, "0001"),
+    "index_tickprice": lambda client: fetch_inquire_index_tickprice(client, "0001"),
+}
+
+
+@pytest.mark.benchmark(group="kis_api")
+def test_request_overhead(benchmark, kis_client):
+    """인증 헤더/호출 간격/연결 풀을 거치는 ``KISClient.request`` 한 번의 비용."""
+    params = {"FID_COND_MRKT_DIV_CODE": "J", "FID_INPUT_ISCD": "005930"}
+    headers = {"tr_id": inquire_price.TR_ID, "custtype": "P"}
+    result = benchmark(kis_client.request, "GET", inquire_price.API_PATH, params=params, headers=headers)
+    assert result["rt_cd"] == "0"
+
+
+@pytest.mark.benchmark(group="kis_api.collectors")
+@pytest.mark.parametrize("name", list(COLLECTORS))
+def test_collector(benchmark, kis_client, no_chunk_sleep, name):
+    assert benchmark(COLLECTORS[name], kis_client)
@@ -0,0 +1,50 @@
+"""뉴스 전처리 (HTML 태그 제거, 날짜 기준 top-k 선택)를 합성 뉴스 코퍼스로 측정한다."""
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from news_analysis.modules import TextTagCleaner
+from news_analysis.service import NaverNewsDataProcessorService
+
+KST = timezone(timedelta(hours=9))
+_WORDS = ("반도체", "실적", "외국인", "순매수", "HBM", "AI", "수출", "전망", "목표주가", "상향", "배당", "신제품")
+
+
+def _corpus(size: int, seed: int = 7) -> list[dict]:
+    rng = random.Random(seed)
+    start = datetime(2025, 11, 10, 9, 0, tzinfo=KST)
+    items = []
+    for i in range(size):
+        words = [rng.choice(_WORDS) for _ in range(40)]
+        words[rng.randrange(40)] = "<b>삼성전자</b>"
+        pub = start - timedelta(minutes=rng.randrange(60 * 24 * 14))
+        items.append({
+            "title": f"<b>삼성전자</b> {' '.join(words[:6])} &quot;{i}&quot;",
+            "originallink": f"https://news.example.com/{i}",
+            "link": f"https://n.news.naver.com/mnews/article/001/{i:010d}",
+            "description": " ".join(words) + " &amp; ...",
+            "pubDate": pub.strftime("%a, %d %b %Y %H:%M:%S +0900"),
+        })
+    return items
+
+
+@pytest.fixture(scope="module")
+def corpus():
+    return _corpus(5_000)
+
+
+@pytest.mark.benchmark(group="news_analysis")
+def test_text_tag_cleaner(benchmark, corpus):
+    cleaner = TextTagCleaner()
+    descriptions = [item["description"] for item in corpus[:500]]
+    cleaned = benchmark(lambda: [cleaner(text) for text in descriptions])
+    assert "<b>" not in cleaned[0]
+
+
+@pytest.mark.benchmark(group="news_analysis")
+@pytest.mark.parametrize("k", [10, 100])
+def test_select_top_k_by_date_from(benchmark, corpus, k):
+    service = NaverNewsDataProcessorService()
+    result = benchmark(service.select_top_k_by_date_from, corpus, k)
+    assert len(result) == k
@@ -0,0 +1,128 @@
+"""벤치마크 공통 fixture.
+
+- KIS: ``kis_api.testing.FakeKISServer`` (지연 0, 호출 제한 없음)으로 클라이언트/collector 오버헤드만 측정한다.
+- Redis/PostgreSQL: 함수 앱 harness의 ``test/docker-compose.yml``로 띄운 로컬 인스턴스를 사용하며,
+  접속할 수 없으면 해당 벤치마크는 skip 된다.
+"""
+import os
+import socket
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+ROOT = Path(__file__).resolve().parents[1]
+FUNCTION_APP_DIR = ROOT / "apps" / "azure" / "functions" / "kis_api_collecting"
+
+REDIS_HOST = os.environ.setdefault("REDIS_HOST", "localhost")
+REDIS_PORT = int(os.environ.setdefault("REDIS_PORT", "6379"))
+REDIS_PASSWORD = os.environ.setdefault("REDIS_PASSWORD", "localdev")
+POSTGRES_HOST = os.environ.setdefault("POSTGRES_HOST", "localhost")
+POSTGRES_USER = os.environ.setdefault("POSTGRES_USER", "antic")
+POSTGRES_PASSWORD = os.environ.setdefault("POSTGRES_PASSWORD", "localdev")
+POSTGRES_DB = os.environ.setdefault("POSTGRES_DB", "antic")
+# 백엔드 설정(apps/backend/src/settings.py)은 import 시점에 환경 변수를 읽는다.
+os.environ.setdefault("SQL_HOST", POSTGRES_HOST)
+os.environ.setdefault("SQL_USER", POSTGRES_USER)
+os.environ.setdefault("SQL_PASSWORD", POSTGRES_PASSWORD)
+os.environ.setdefault("SQL_DATABASE", POSTGRES_DB)
+
+BENCH_CODES = ("005930", "000660", "373220", "207940", "005380", "000270", "068270", "005490", "035420", "051910")
+
+
+def _reachable(host: str, port: int) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=0.5):
+            return True
+    except OSError:
+        return False
+
+
+@pytest.fixture(scope="session")
+def fake_kis_server():
+    from kis_api.testing import FakeKISServer
+
+    with FakeKISServer() as server:
+        yield server
+
+
+@pytest.fixture(scope="session")
+def kis_client(fake_kis_server):
+    from kis_api import KISClient
+
+    client = KISClient(
+        app_key="bench",
+        app_secret="bench",
+        base_url=fake_kis_server.base_url,
+        request_interval=0,
+    )
+    yield client
+    client.close()
+
+
+@pytest.fixture(scope="session")
+def redis_service():
+    if not _reachable(REDIS_HOST, REDIS_PORT):
+        pytest.skip(f"Redis is not reachable at {REDIS_HOST}:{REDIS_PORT}")
+    from antic_extensions import RedisService
+    from antic_extensions.modules.database import RedisClient
+
+    return RedisService(
+        REDIS_HOST,
+        REDIS_PORT,
+        client=RedisClient(REDIS_HOST, REDIS_PORT, REDIS_PASSWORD, 0, ssl=False),
+    )
+
+
+@pytest.fixture(scope="session")
+def psql_client():
+    if not _reachable(POSTGRES_HOST, 5432):
+        pytest.skip(f"PostgreSQL is not reachable at {POSTGRES_HOST}:5432")
+    from antic_extensions import PsqlDBClient
+
+    client = PsqlDBClient(POSTGRES_HOST, POSTGRES_USER, POSTGRES_PASSWORD, POSTGRES_DB)
+    with client.cursor() as cur:
+        cur.execute("CREATE SCHEMA IF NOT EXISTS anticsignal")
+    return client
+
+
+@pytest.fixture(scope="session")
+def function_app(fake_kis_server, redis_service, psql_client):
+    """로컬 서비스에 연결된 ``function_app`` 모듈."""
+    pytest.importorskip("azure.functions")
+    sys.path.insert(0, str(FUNCTION_APP_DIR / "test"))
+    sys.path.insert(0, str(FUNCTION_APP_DIR))
+    from local_harness import LOCAL_ENV
+
+    os.environ["KIS_BASE_URL"] = fake_kis_server.base_url
+    for key, value in LOCAL_ENV.items():
+        os.environ.setdefault(key, value)
+    import function_app as module
+
+    module._redis_service = redis_service
+    module._psql_client = psql_client
+    yield module
+    module.client.close()
+
+
+@pytest.fixture(scope="session")
+def no_chunk_sleep():
+    """일봉 collector의 구간 사이 고정 대기(0.5초)를 생략한다. 가짜 서버에서는 의미가 없다."""
+    from kis_api.collectors import inquire_daily_itemchartprice
+
+    with pytest.MonkeyPatch.context() as patch:
+        patch.setattr(inquire_daily_itemchartprice, "time", SimpleNamespace(sleep=lambda _: None))
+        yield
+
+
+@pytest.fixture(scope="session")
+def daily_chart_rows(kis_client, no_chunk_sleep):
+    """``BENCH_CODES`` 종목의 1년치 일봉 (collector 결과 형식)."""
+    from kis_api import fetch_inquire_daily_itemchartprice
+
+    return [
+        row
+        for code in BENCH_CODES
+        for row in fetch_inquire_daily_itemchartprice(kis_client, code, "20240101", "20241231")
+    ]
@@ -7,14 +7,67 @@ def set_logger():
 
 __all__ = (
     'RedisService',
+    'FreshnessRegistry',
+    'IntradayTickStore',
+    'IndexTickStore',
+    'WorkerPartitioner',
+    'RedisLease',
+    'MarketMoversStore',
+    'InvestorFlowStore',
     'PsqlDBClient',
+    'Migration',
+    'apply_migrations',
+    'migrate_stock_history',
+    'migrate_investor_trade',
+    'ColumnarDataset',
+    'news_dataset',
+    'daily_chartprice_dataset',
+    'IntradayTickWriter',
+    'encode_event_batches',
+    'decode_event_payload',
+    'Metrics',
+    'InMemoryMetrics',
+    'PrometheusMetrics',
+    'OpenTelemetryMetrics',
+    'get_metrics',
+    'set_metrics',
     'USE_LOGGER'
 )
 USE_LOGGER = True
 if USE_LOGGER:
     set_logger()
 
-from .service import RedisService
-from .modules.database import PsqlDBClient
+from .service import (
+    RedisService,
+    FreshnessRegistry,
+    IntradayTickStore,
+    IndexTickStore,
+    WorkerPartitioner,
+    RedisLease,
+    MarketMoversStore,
+    InvestorFlowStore,
+)
+from .modules.database import (
+    PsqlDBClient,
+    Migration,
+    apply_migrations,
+    migrate_stock_history,
+    migrate_investor_trade,
+)
+from .modules.columnar import (
+    ColumnarDataset,
+    news_dataset,
+    daily_chartprice_dataset,
+)
+from .modules.timeseries import IntradayTickWriter
+from .modules.eventhub import encode_event_batches, decode_event_payload
+from .modules.metrics import (
+    Metrics,
+    InMemoryMetrics,
+    PrometheusMetrics,
+    OpenTelemetryMetrics,
+    get_metrics,
+    set_metrics,
+)
 
 
@@ -0,0 +1,300 @@
+"""뉴스/KIS 수집 결과를 Parquet(Arrow) 데이터셋으로 저장하고 읽는다.
+
+JSON 문자열로만 존재하던 데이터를 컬럼 타입(날짜, 정수 가격, 실수 비율)을 갖춘 Parquet로 저장해
+오프라인 분석/학습에서 JSON 재파싱 없이 필요한 컬럼과 파티션만 읽을 수 있게 한다.
+
+`pyarrow`는 선택 의존성입니다. (`pip install antic_extensions[columnar]`)
+
+```python
+dataset = daily_chartprice_dataset('./data/daily_chartprice')
+dataset.write(rows)     # fetch_inquire_daily_itemchartprice 결과
+table = dataset.read(
+    columns=['stck_bsop_date', 'stck_clpr'],
+    filters=[('fid_input_iscd', '=', '005930'), ('stck_bsop_date', '>=', date(2025, 1, 1))],
+)
+```
+"""
+from datetime import date, datetime, timezone, timedelta
+from decimal import Decimal, InvalidOperation
+from email.utils import parsedate_to_datetime
+from typing import Any, Callable, Iterable, Mapping, NamedTuple, Optional, Sequence
+import logging
+import uuid
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    'ColumnSpec',
+    'ColumnarDataset',
+    'NEWS_CONTENT_COLUMNS',
+    'DAILY_CHARTPRICE_COLUMNS',
+    'news_dataset',
+    'daily_chartprice_dataset',
+)
+
+KST = timezone(timedelta(hours=9))
+
+
+def _import_pyarrow():
+    try:
+        import pyarrow
+        import pyarrow.dataset
+        import pyarrow.parquet
+    except ImportError as e:
+        raise ImportError(
+            "Columnar export requires 'pyarrow'. "
+            "(pip install antic_extensions[columnar])"
+        ) from e
+    return pyarrow
+
+
+def _to_str(value: Any) -> Optional[str]:
+    if value is None or value == '':
+        return None
+    return str(value)
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if value is None or value == '':
+        return None
+    try:
+        return int(Decimal(str(value)))
+    except (InvalidOperation, ValueError):
+        logger.warning(f"Cannot convert value={value!r} to int")
+        return None
+
+
+def _to_float(value: Any) -> Optional[float]:
+    if value is None or value == '':
+        return None
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        logger.warning(f"Cannot convert value={value!r} to float")
+        return None
+
+
+def _to_date(value: Any) -> Optional[date]:
+    """'YYYYMMDD' 혹은 date/datetime 값을 date로 변환한다."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value.date()
+    if isinstance(value, date):
+        return value
+    try:
+        return datetime.strptime(str(value), '%Y%m%d').date()
+    except ValueError:
+        logger.warning(f"Cannot convert value={value!r} to date")
+        return None
+
+
+def _to_datetime(value: Any) -> Optional[datetime]:
+    """epoch(초), ISO 문자열, datetime 값을 tz-aware datetime으로 변환한다."""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime):
+        return value if value.tzinfo else value.replace(tzinfo=KST)
+    if isinstance(value, (int, float)):
+        return datetime.fromtimestamp(value, tz=KST)
+    try:
+        parsed = datetime.fromisoformat(str(value))
+    except ValueError:
+        try:
+            # 네이버 pubDate (RFC 2822) 형식
+            parsed = parsedate_to_datetime(str(value))
+        except (TypeError, ValueError):
+            logger.warning(f"Cannot convert value={value!r} to datetime")
+            return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=KST)
+
+
+class ColumnSpec(NamedTuple):
+    """Parquet 컬럼 정의.
+
+    ``source``가 없으면 컬럼명과 같은 키를, 튜플이면 값이 있는 첫 번째 키를 원본 dict에서 읽는다.
+    """
+    name: str
+    type: str
+    convert: Callable[[Any], Any]
+    source: Optional[str | tuple[str, ...]] = None
+
+    def pick(self, row: Mapping[str, Any]) -> Any:
+        keys = self.source or self.name
+        if isinstance(keys, str):
+            return row.get(keys)
+        for key in keys:
+            value = row.get(key)
+            if value not in (None, ''):
+                return value
+        return None
+
+
+_ARROW_TYPES: dict[str, Callable[[Any], Any]] = {
+    'string': lambda pa: pa.string(),
+    'int64': lambda pa: pa.int64(),
+    'float64': lambda pa: pa.float64(),
+    'date32': lambda pa: pa.date32(),
+    'timestamp': lambda pa: pa.timestamp('s', tz='Asia/Seoul'),
+}
+
+NEWS_CONTENT_COLUMNS: tuple[ColumnSpec, ...] = (
+    ColumnSpec('fid_input_iscd', 'string', _to_str),
+    ColumnSpec('link', 'string', _to_str),
+    ColumnSpec('originallink', 'string', _to_str),
+    ColumnSpec('title', 'string', _to_str),
+    ColumnSpec('content', 'string', _to_str),
+    ColumnSpec('pub_date', 'timestamp', _to_datetime, source=('pubTimestamp', 'pubDate')),
+)
+'''``NaverNewsContentTDict`` 항목 (+ 종목 코드)'''
+
+DAILY_CHARTPRICE_COLUMNS: tuple[ColumnSpec, ...] = (
+    ColumnSpec('fid_input_iscd', 'string', _to_str, source=('requested_fid_input_iscd', 'stck_shrn_iscd')),
+    ColumnSpec('fid_period_div_code', 'string', _to_str, source='requested_fid_period_div_code'),
+    ColumnSpec('stck_bsop_date', 'date32', _to_date),
+    ColumnSpec('stck_oprc', 'int64', _to_int),
+    ColumnSpec('stck_hgpr', 'int64', _to_int),
+    ColumnSpec('stck_lwpr', 'int64', _to_int),
+    ColumnSpec('stck_clpr', 'int64', _to_int),
+    ColumnSpec('acml_vol', 'int64', _to_int),
+    ColumnSpec('acml_tr_pbmn', 'int64', _to_int),
+    ColumnSpec('prdy_vrss', 'int64', _to_int),
+    ColumnSpec('prdy_vrss_sign', 'string', _to_str),
+    ColumnSpec('prtt_rate', 'float64', _to_float),
+    ColumnSpec('mod_yn', 'string', _to_str),
+    ColumnSpec('collected_at', 'timestamp', _to_datetime),
+)
+'''``fetch_inquire_daily_itemchartprice`` 결과 행'''
+
+
+class ColumnarDataset:
+    """파티션된 Parquet 데이터셋에 dict 행을 일괄 기록하고, 컬럼/조건을 지정해 읽는다.
+
+    >>> dataset = ColumnarDataset('./data/news', NEWS_CONTENT_COLUMNS, partition_by=('fid_input_iscd',))
+    >>> dataset.write(rows)
+    >>> dataset.read(columns=['title'], filters=[('fid_input_iscd', '=', '005930')])
+    """
+    def __init__(
+            self,
+            root: str,
+            columns: Sequence[ColumnSpec],
+            partition_by: Sequence[str]=(),
+            batch_size: int=50_000,
+    ) -> None:
+        """
+        :param root: (str) 데이터셋 루트 디렉터리 (로컬 경로)
+        :param columns: (Sequence[ColumnSpec]) 컬럼 정의
+        :param partition_by: (Sequence[str]) Hive 파티션 컬럼 (예: ``fid_input_iscd=005930/``)
+        :param batch_size: (int) 한 번에 Arrow 테이블로 변환할 최대 행 수
+        """
+        names = {c.name for c in columns}
+        unknown = set(partition_by) - names
+        if unknown:
+            raise ValueError(f"Unknown partition columns: {unknown}")
+        self._root = root
+        self._columns = tuple(columns)
+        self._partition_by = tuple(partition_by)
+        self._batch_size = batch_size
+
+    @property
+    def schema(self):
+        pa = _import_pyarrow()
+        return pa.schema([
+            (c.name, _ARROW_TYPES[c.type](pa)) for c in self._columns
+        ])
+
+    def _to_table(self, rows: Sequence[Mapping[str, Any]]):
+        pa = _import_pyarrow()
+        arrays = {
+            c.name: [c.convert(c.pick(row)) for row in rows]
+            for c in self._columns
+        }
+        return pa.Table.from_pydict(arrays, schema=self.schema)
+
+    def write(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """행을 ``batch_size``씩 Arrow 테이블로 변환해 Parquet 파일로 추가 기록하고, 기록한 행 수를 반환한다."""
+        pa = _import_pyarrow()
+        written = 0
+        batch: list[Mapping[str, Any]] = []
+        token = uuid.uuid4().hex
+
+        def flush(part: int) -> None:
+            table = self._to_table(batch)
+            pa.dataset.write_dataset(
+                table,
+                self._root,
+                format='parquet',
+                partitioning=list(self._partition_by) or None,
+                partitioning_flavor='hive' if self._partition_by else None,
+                basename_template=f"part-{token}-{part}-{{i}}.parquet",
+                existing_data_behavior='overwrite_or_ignore',
+            )
+
+        part = 0
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= self._batch_size:
+                flush(part)
+                written += len(batch)
+                batch = []
+                part += 1
+        if batch:
+            flush(part)
+            written += len(batch)
+        logger.info(f"Wrote {written} rows to {self._root}")
+        return written
+
+    def read(
+            self,
+            columns: Optional[Sequence[str]]=None,
+            filters: Optional[Sequence[tuple[str, str, Any]]]=None,
+    ):
+        """컬럼 프로젝션과 조건(파티션/행 그룹 통계 기반 pushdown)으로 ``pyarrow.Table``을 읽는다.
+
+        :param columns: 읽을 컬럼 목록 (None이면 전체)
+        :param filters: ``[(컬럼, 연산자, 값), ...]`` 형식의 AND 조건.
+                        연산자: ``=``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in``
+        """
+        pa = _import_pyarrow()
+        dataset = pa.dataset.dataset(
+            self._root,
+            format='parquet',
+            schema=self.schema,
+            partitioning='hive' if self._partition_by else None,
+        )
+        expression = None
+        for name, op, value in filters or ():
+            field = pa.dataset.field(name)
+            if op == 'in':
+                cond = field.isin(list(value))
+            else:
+                cond = {
+                    '=': field == value,
+                    '==': field == value,
+                    '!=': field != value,
+                    '<': field < value,
+                    '<=': field <= value,
+                    '>': field > value,
+                    '>=': field >= value,
+                }.get(op)
+                if cond is None:
+                    raise ValueError(f"Unsupported filter operator: {op}")
+            expression = cond if expression is None else expression & cond
+        return dataset.to_table(
+            columns=list(columns) if columns else None,
+            filter=expression,
+        )
+
+
+def news_dataset(root: str) -> ColumnarDataset:
+    """종목 코드로 파티션된 뉴스 데이터셋. 행에는 ``fid_input_iscd``가 포함되어야 한다."""
+    return ColumnarDataset(
+        root, NEWS_CONTENT_COLUMNS, partition_by=('fid_input_iscd',)
+    )
+
+
+def daily_chartprice_dataset(root: str) -> ColumnarDataset:
+    """종목 코드로 파티션된 일/주/월봉 시세 데이터셋."""
+    return ColumnarDataset(
+        root, DAILY_CHARTPRICE_COLUMNS, partition_by=('fid_input_iscd',)
+    )
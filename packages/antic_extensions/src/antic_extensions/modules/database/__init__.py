@@ -1,3 +1,3 @@
-
 from .psql import *
-from .redis import *
\ No newline at end of file
+from .redis import *
+from .migrations import *
\ No newline at end of file
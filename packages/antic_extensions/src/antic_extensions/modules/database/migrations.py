@@ -0,0 +1,146 @@
+from typing import NamedTuple, Sequence
+import logging
+
+from .abs import SqlConnectorShape
+
+__all__ = (
+    'Migration',
+    'apply_migrations',
+    'STOCK_HISTORY_MIGRATIONS',
+    'migrate_stock_history',
+    'INVESTOR_TRADE_MIGRATIONS',
+    'migrate_investor_trade',
+)
+logger = logging.getLogger(__name__)
+
+MIGRATIONS_TABLE = 'public.antic_schema_migrations'
+
+
+class Migration(NamedTuple):
+    """버전이 매겨진 스키마 변경. ``sql``의 ``{table}`` 등은 ``apply_migrations``의 인자로 치환된다."""
+    version: int
+    name: str
+    sql: str
+
+
+def apply_migrations(
+        client: SqlConnectorShape,
+        component: str,
+        migrations: Sequence[Migration],
+        **params: str,
+) -> list[int]:
+    """``component``에 아직 적용되지 않은 migration을 버전 순서대로 적용하고, 적용한 버전 목록을 반환한다.
+
+    각 migration은 하나의 트랜잭션에서 실행되며, 여러 인스턴스가 동시에 호출해도
+    advisory lock으로 한 번만 적용된다. 적용 이력은 ``antic_schema_migrations`` 테이블에 남는다.
+
+    >>> apply_migrations(client, 'stock_history:anticsignal.stock_history', STOCK_HISTORY_MIGRATIONS,
+                         table='anticsignal.stock_history', name='stock_history')
+        [1, 2]
+    """
+    versions = [m.version for m in migrations]
+    if len(set(versions)) != len(versions):
+        raise ValueError(f"Duplicated migration versions: {versions}")
+
+    with client.cursor() as cur:
+        cur.execute(
+            f"CREATE TABLE IF NOT EXISTS {MIGRATIONS_TABLE} ("
+            "component TEXT NOT NULL, "
+            "version INTEGER NOT NULL, "
+            "name TEXT NOT NULL, "
+            "applied_at TIMESTAMPTZ NOT NULL DEFAULT now(), "
+            "PRIMARY KEY (component, version))"
+        )
+
+    applied: list[int] = []
+    for migration in sorted(migrations, key=lambda m: m.version):
+        with client.cursor() as cur:
+            cur.execute("SELECT pg_advisory_xact_lock(hashtext(%s))", (component,))
+            cur.execute(
+                f"SELECT 1 FROM {MIGRATIONS_TABLE} WHERE component = %s AND version = %s",
+                (component, migration.version),
+            )
+            if cur.fetchone():
+                continue
+            cur.execute(migration.sql.format(**params))
+            cur.execute(
+                f"INSERT INTO {MIGRATIONS_TABLE} (component, version, name) VALUES (%s, %s, %s)",
+                (component, migration.version, migration.name),
+            )
+        logger.info(f"Applied migration {component} v{migration.version}: {migration.name}")
+        applied.append(migration.version)
+    return applied
+
+
+STOCK_HISTORY_MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, 'create stock_history', """
+CREATE TABLE IF NOT EXISTS {table} (
+    fid_input_iscd VARCHAR(12) NOT NULL,
+    fid_period_div_code VARCHAR(1) NOT NULL,
+    stck_bsop_date DATE NOT NULL,
+    stck_clpr NUMERIC NOT NULL,
+    stck_oprc NUMERIC NOT NULL,
+    PRIMARY KEY (fid_input_iscd, fid_period_div_code, stck_bsop_date)
+);
+"""),
+    Migration(2, 'add high/low/volume/amount and covering index', """
+ALTER TABLE {table}
+    ADD COLUMN IF NOT EXISTS stck_hgpr NUMERIC,
+    ADD COLUMN IF NOT EXISTS stck_lwpr NUMERIC,
+    ADD COLUMN IF NOT EXISTS acml_vol BIGINT,
+    ADD COLUMN IF NOT EXISTS acml_tr_pbmn NUMERIC(20, 0);
+CREATE INDEX IF NOT EXISTS {name}_code_date_idx
+    ON {table} (fid_input_iscd, stck_bsop_date DESC)
+    INCLUDE (fid_period_div_code, stck_oprc, stck_hgpr, stck_lwpr, stck_clpr, acml_vol, acml_tr_pbmn);
+"""),
+)
+'''``anticsignal.stock_history`` (일/주/월봉) 스키마 이력'''
+
+
+def migrate_stock_history(
+        client: SqlConnectorShape,
+        table: str='anticsignal.stock_history',
+) -> list[int]:
+    """``stock_history`` 테이블을 최신 스키마로 맞춘다."""
+    return apply_migrations(
+        client,
+        f'stock_history:{table}',
+        STOCK_HISTORY_MIGRATIONS,
+        table=table,
+        name=table.split('.')[-1],
+    )
+
+
+INVESTOR_TRADE_MIGRATIONS: tuple[Migration, ...] = (
+    Migration(1, 'create investor trade daily', """
+CREATE TABLE IF NOT EXISTS {table} (
+    fid_input_iscd VARCHAR(12) NOT NULL,
+    stck_bsop_date DATE NOT NULL,
+    stck_clpr NUMERIC,
+    prsn_ntby_qty BIGINT,
+    frgn_ntby_qty BIGINT,
+    orgn_ntby_qty BIGINT,
+    prsn_ntby_tr_pbmn NUMERIC(20, 0),
+    frgn_ntby_tr_pbmn NUMERIC(20, 0),
+    orgn_ntby_tr_pbmn NUMERIC(20, 0),
+    collected_at TIMESTAMPTZ NOT NULL DEFAULT now(),
+    PRIMARY KEY (fid_input_iscd, stck_bsop_date)
+);
+CREATE INDEX IF NOT EXISTS {name}_date_idx ON {table} (stck_bsop_date);
+"""),
+)
+'''종목별 투자자 매매동향(일별) 테이블 스키마 이력'''
+
+
+def migrate_investor_trade(
+        client: SqlConnectorShape,
+        table: str='anticsignal.stock_investor_trade',
+) -> list[int]:
+    """투자자 매매동향(일별) 테이블을 최신 스키마로 맞춘다."""
+    return apply_migrations(
+        client,
+        f'investor_trade:{table}',
+        INVESTOR_TRADE_MIGRATIONS,
+        table=table,
+        name=table.split('.')[-1],
+    )
@@ -2,6 +2,7 @@ from psycopg2 import pool, extensions
 from typing import Generator
 from contextlib import contextmanager
 from .abs import SqlConnectorShape
+from ..metrics import get_metrics
 
 __all__ = (
     'PsqlDBClient',
@@ -51,9 +52,13 @@ class PsqlDBClient(
         self._connect(dsn, minconn, maxconn)
 
     @contextmanager
-    def cursor(self) -> Generator[extensions.cursor, None, None]:
-        with super().cursor() as cur:
-            yield cur
+    def cursor(self, statement: str='query') -> Generator[extensions.cursor, None, None]:
+        """
+        :param statement: (str) 지연 시간 메트릭(``sql_transaction_seconds``)의 ``statement`` 라벨
+        """
+        with get_metrics().timer('sql_transaction_seconds', statement=statement):
+            with super().cursor() as cur:
+                yield cur
 
     def _connect(self, dsn, minconn, maxconn):
         if self._pool:
@@ -3,6 +3,8 @@ import threading
 import logging
 from contextlib import contextmanager
 from ssl import CERT_NONE, CERT_OPTIONAL
+from redis.client import Pipeline
+from ..metrics import get_metrics
 
 
 __all__ = (
@@ -10,6 +12,48 @@ __all__ = (
 )
 logger = logging.getLogger(__name__)
 
+# 값이 없으면 cache miss로 보는 조회 명령
+_CACHE_LOOKUP_COMMANDS = frozenset((
+    'GET', 'HGET', 'HGETALL', 'HMGET', 'MGET', 'ZRANGE', 'ZRANGEBYSCORE', 'ZREVRANGE', 'LRANGE',
+))
+
+
+def _is_hit(result) -> bool:
+    if isinstance(result, (list, tuple)):
+        return any(value is not None for value in result)
+    return bool(result)
+
+
+class _InstrumentedPipeline(Pipeline):
+    """``execute`` 한 번을 ``redis_command_seconds{command=PIPELINE}``으로 기록합니다."""
+
+    def execute(self, raise_on_error=True):
+        if not self.command_stack:
+            return super().execute(raise_on_error)
+        with get_metrics().timer('redis_command_seconds', command='PIPELINE'):
+            return super().execute(raise_on_error)
+
+
+class _InstrumentedRedis(redis.Redis):
+    """명령별 지연(``redis_command_seconds``)과 조회 명령의 hit/miss(``redis_cache_lookups_total``)를 기록합니다."""
+
+    def execute_command(self, *args, **options):
+        command = str(args[0]).upper() if args else 'UNKNOWN'
+        metrics = get_metrics()
+        with metrics.timer('redis_command_seconds', command=command):
+            result = super().execute_command(*args, **options)
+        if command in _CACHE_LOOKUP_COMMANDS:
+            metrics.inc(
+                'redis_cache_lookups_total', command=command, result='hit' if _is_hit(result) else 'miss'
+            )
+        return result
+
+    def pipeline(self, transaction=True, shard_hint=None) -> Pipeline:
+        return _InstrumentedPipeline(
+            self.connection_pool, self.response_callbacks, transaction, shard_hint
+        )
+
+
 class RedisClient:
     """`Azure Managed Redis`에 연결하는 Client를 구성합니다.
 
@@ -70,7 +114,7 @@ class RedisClient:
             max_connections = kwargs.pop('max_connections', None)
             if RedisClient._pool is None:
                 RedisClient._pool = redis.ConnectionPool()
-            self._client = redis.Redis(
+            self._client = _InstrumentedRedis(
                 connection_pool=RedisClient._pool.from_url(
                     f"{_protocol}://:{kwargs.get('password')}@{kwargs.get('host')}:{kwargs.get('port')}/{kwargs.get('database')}"
                 ),
@@ -0,0 +1,308 @@
+"""hot path 계측 (타이머/카운터/히스토그램 + OpenTelemetry span).
+
+기본값은 아무것도 기록하지 않는 ``Metrics``이며, 프로세스 시작 시 한 번 ``set_metrics``로 구현을 교체한다.
+``get_metrics()``는 항상 같은 위임 객체를 반환하므로, 교체 전에 주입한 곳에도 적용된다.
+
+- ``InMemoryMetrics``: 최근 샘플로 p50/p99 등을 계산 (테스트, 로컬 부하 테스트)
+- ``PrometheusMetrics``: ``prometheus_client`` 히스토그램/카운터 (``pip install antic_extensions[metrics]``)
+- ``OpenTelemetryMetrics``: OpenTelemetry Meter의 히스토그램/카운터. scrape 할 ``/metrics``가 없는 곳(Functions)에서
+  exporter(Application Insights 등)로 보낸다. (``pip install antic_extensions[otel]``)
+- ``opentelemetry_tracer()``: 타이머마다 OpenTelemetry span을 연다. (``pip install antic_extensions[otel]``)
+
+계측 대상(``kis_api.KISClient``, ``news_analysis`` 스크랩 서비스 등)은 아래 두 메서드만 사용하므로,
+이 패키지를 의존하지 않는 곳에는 ``metrics`` 인자로 같은 객체를 넘긴다.
+
+```python
+set_metrics(PrometheusMetrics(tracer=opentelemetry_tracer()))
+metrics = get_metrics()
+
+with metrics.timer('kis_request_seconds', tr_id='FHKST01010100') as labels:
+    ...                     # 종료 시 labels['outcome'] = 'ok' | 'error'
+metrics.inc('redis_cache_lookups_total', command='GET', result='hit')
+```
+"""
+from collections import defaultdict, deque
+from contextlib import contextmanager, nullcontext
+from typing import Any, Deque, Dict, Iterator, Optional, Tuple
+import logging
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    'Metrics',
+    'InMemoryMetrics',
+    'PrometheusMetrics',
+    'OpenTelemetryMetrics',
+    'get_metrics',
+    'set_metrics',
+    'opentelemetry_tracer',
+)
+
+LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+'''초 단위 히스토그램 버킷 (Redis 1ms ~ KIS/스크랩 10s)'''
+
+_LabelKey = Tuple[Tuple[str, str], ...]
+
+
+def _label_key(labels: Dict[str, Any]) -> _LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+class Metrics:
+    """계측 인터페이스이자 no-op 기본 구현."""
+
+    def __init__(self, tracer: Any=None) -> None:
+        """
+        :param tracer: (optional) OpenTelemetry ``Tracer``. 지정하면 ``timer``/``span``마다 span을 연다.
+        """
+        self._tracer = tracer
+
+    def inc(self, name: str, value: float=1.0, **labels: Any) -> None:
+        """카운터 ``name``을 ``value``만큼 증가시킨다."""
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """히스토그램 ``name``에 값을 기록한다."""
+
+    def span(self, name: str, **attributes: Any):
+        """OpenTelemetry span (tracer가 없으면 아무것도 하지 않음)."""
+        if self._tracer is None:
+            return nullcontext()
+        return self._tracer.start_as_current_span(
+            name, attributes={k: str(v) for k, v in attributes.items()}
+        )
+
+    @contextmanager
+    def timer(self, name: str, **labels: Any) -> Iterator[Dict[str, Any]]:
+        """블록 실행 시간(초)을 ``name`` 히스토그램에 기록한다.
+
+        ``outcome`` 라벨(``ok`` | ``error``)이 자동으로 추가된다. 같은 ``name``은 항상 같은 라벨 키를 사용해야 한다.
+        """
+        labels = dict(labels)
+        started = time.perf_counter()
+        with self.span(name, **labels):
+            try:
+                yield labels
+                labels.setdefault('outcome', 'ok')
+            except BaseException:
+                labels['outcome'] = 'error'
+                raise
+            finally:
+                self.observe(name, time.perf_counter() - started, **labels)
+
+
+class InMemoryMetrics(Metrics):
+    """카운터와 최근 ``max_samples``개의 관측값을 메모리에 보관한다."""
+
+    def __init__(self, max_samples: int=10_000, tracer: Any=None) -> None:
+        super().__init__(tracer)
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Dict[_LabelKey, float]] = defaultdict(lambda: defaultdict(float))
+        self._samples: Dict[str, Dict[_LabelKey, Deque[float]]] = defaultdict(dict)
+        self._totals: Dict[str, Dict[_LabelKey, Tuple[int, float]]] = defaultdict(dict)
+
+    def inc(self, name: str, value: float=1.0, **labels: Any) -> None:
+        with self._lock:
+            self._counters[name][_label_key(labels)] += value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        key = _label_key(labels)
+        with self._lock:
+            series = self._samples[name].get(key)
+            if series is None:
+                series = self._samples[name][key] = deque(maxlen=self._max_samples)
+            series.append(value)
+            count, total = self._totals[name].get(key, (0, 0.0))
+            self._totals[name][key] = (count + 1, total + value)
+
+    def counter(self, name: str, **labels: Any) -> float:
+        """라벨이 일치하는 (지정하지 않은 라벨은 합산) 카운터 값."""
+        wanted = _label_key(labels)
+        with self._lock:
+            return sum(
+                value for key, value in self._counters.get(name, {}).items()
+                if set(wanted) <= set(key)
+            )
+
+    def percentile(self, name: str, q: float, **labels: Any) -> Optional[float]:
+        """라벨이 일치하는 최근 관측값의 ``q`` 분위수 (0 ~ 1). 관측값이 없으면 None."""
+        wanted = _label_key(labels)
+        with self._lock:
+            values = sorted(
+                value
+                for key, series in self._samples.get(name, {}).items()
+                if set(wanted) <= set(key)
+                for value in series
+            )
+        if not values:
+            return None
+        return values[min(len(values) - 1, int(q * len(values)))]
+
+    def snapshot(self) -> Dict[str, Any]:
+        """``{name: [{labels, count, sum, p50, p99}]}`` 와 카운터 값."""
+        with self._lock:
+            histograms = {
+                name: [
+                    {
+                        'labels': dict(key),
+                        'count': self._totals[name][key][0],
+                        'sum': self._totals[name][key][1],
+                        'p50': sorted(series)[int(0.5 * len(series))],
+                        'p99': sorted(series)[min(len(series) - 1, int(0.99 * len(series)))],
+                    }
+                    for key, series in by_key.items() if series
+                ]
+                for name, by_key in self._samples.items()
+            }
+            counters = {
+                name: [{'labels': dict(key), 'value': value} for key, value in by_key.items()]
+                for name, by_key in self._counters.items()
+            }
+        return {'histograms': histograms, 'counters': counters}
+
+
+class PrometheusMetrics(Metrics):
+    """``prometheus_client`` 히스토그램/카운터로 기록한다. 메트릭은 처음 사용할 때 라벨 키와 함께 생성된다."""
+
+    def __init__(self, registry: Any=None, buckets=LATENCY_BUCKETS, tracer: Any=None) -> None:
+        """
+        :param registry: (optional) ``prometheus_client.CollectorRegistry`` (기본값: 새 registry)
+        :param buckets: 히스토그램 버킷 (초)
+        """
+        super().__init__(tracer)
+        try:
+            import prometheus_client
+        except ImportError as e:
+            raise ImportError(
+                "PrometheusMetrics requires 'prometheus_client'. "
+                "(pip install antic_extensions[metrics])"
+            ) from e
+        self._prometheus = prometheus_client
+        self.registry = registry or prometheus_client.CollectorRegistry()
+        self._buckets = buckets
+        self._lock = threading.Lock()
+        self._metrics: Dict[str, Tuple[Any, Tuple[str, ...]]] = {}
+
+    def _get(self, kind: str, name: str, labels: Dict[str, Any]) -> Any:
+        entry = self._metrics.get(name)
+        if entry is None:
+            with self._lock:
+                entry = self._metrics.get(name)
+                if entry is None:
+                    label_names = tuple(sorted(labels))
+                    if kind == 'histogram':
+                        metric = self._prometheus.Histogram(
+                            name, name, label_names, registry=self.registry, buckets=self._buckets
+                        )
+                    else:
+                        metric = self._prometheus.Counter(name, name, label_names, registry=self.registry)
+                    entry = self._metrics[name] = (metric, label_names)
+        metric, label_names = entry
+        if tuple(sorted(labels)) != label_names:
+            logger.warning(f"Metric {name} expects labels {label_names}, got {tuple(sorted(labels))}")
+            return None
+        return metric.labels(**{k: str(v) for k, v in labels.items()}) if label_names else metric
+
+    def inc(self, name: str, value: float=1.0, **labels: Any) -> None:
+        metric = self._get('counter', name, labels)
+        if metric is not None:
+            metric.inc(value)
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        metric = self._get('histogram', name, labels)
+        if metric is not None:
+            metric.observe(value)
+
+    def render(self) -> Tuple[bytes, str]:
+        """``/metrics`` 응답 본문과 Content-Type."""
+        return self._prometheus.generate_latest(self.registry), self._prometheus.CONTENT_TYPE_LATEST
+
+
+class OpenTelemetryMetrics(Metrics):
+    """OpenTelemetry ``Meter``의 히스토그램/카운터로 기록한다. 내보내기는 앱이 설정한 ``MeterProvider``의 몫이다."""
+
+    def __init__(self, meter: Any=None, buckets=LATENCY_BUCKETS, tracer: Any=None, name: str='anticsignal') -> None:
+        """
+        :param meter: (optional) OpenTelemetry ``Meter`` (기본값: ``metrics.get_meter(name)``)
+        :param buckets: 히스토그램 버킷 권고값 (초)
+        """
+        super().__init__(tracer)
+        if meter is None:
+            try:
+                from opentelemetry import metrics
+            except ImportError as e:
+                raise ImportError(
+                    "OpenTelemetryMetrics requires 'opentelemetry-api'. "
+                    "(pip install antic_extensions[otel])"
+                ) from e
+            meter = metrics.get_meter(name)
+        self._meter = meter
+        self._buckets = list(buckets)
+        self._lock = threading.Lock()
+        self._instruments: Dict[str, Any] = {}
+
+    def _get(self, kind: str, name: str) -> Any:
+        instrument = self._instruments.get(name)
+        if instrument is None:
+            with self._lock:
+                instrument = self._instruments.get(name)
+                if instrument is None:
+                    if kind == 'histogram':
+                        instrument = self._meter.create_histogram(
+                            name, unit='s', explicit_bucket_boundaries_advisory=self._buckets
+                        )
+                    else:
+                        instrument = self._meter.create_counter(name)
+                    self._instruments[name] = instrument
+        return instrument
+
+    def inc(self, name: str, value: float=1.0, **labels: Any) -> None:
+        self._get('counter', name).add(value, attributes={k: str(v) for k, v in labels.items()})
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        self._get('histogram', name).record(value, attributes={k: str(v) for k, v in labels.items()})
+
+
+class _MetricsProxy(Metrics):
+    """``set_metrics``로 지정한 구현에 위임한다."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.target: Metrics = Metrics()
+
+    def inc(self, name: str, value: float=1.0, **labels: Any) -> None:
+        self.target.inc(name, value, **labels)
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        self.target.observe(name, value, **labels)
+
+    def span(self, name: str, **attributes: Any):
+        return self.target.span(name, **attributes)
+
+    def timer(self, name: str, **labels: Any):
+        return self.target.timer(name, **labels)
+
+
+_metrics = _MetricsProxy()
+
+
+def get_metrics() -> Metrics:
+    """프로세스 공통 계측 객체. (기본값: no-op)"""
+    return _metrics
+
+
+def set_metrics(metrics: Optional[Metrics]) -> None:
+    """프로세스 공통 계측 구현을 교체한다. ``None``이면 no-op으로 되돌린다."""
+    _metrics.target = metrics or Metrics()
+
+
+def opentelemetry_tracer(name: str='anticsignal') -> Any:
+    """OpenTelemetry ``Tracer``. ``opentelemetry-api``가 없으면 None. (exporter 설정은 호출하는 앱의 몫)"""
+    try:
+        from opentelemetry import trace
+    except ImportError:
+        logger.info('opentelemetry-api is not installed, spans are disabled')
+        return None
+    return trace.get_tracer(name)
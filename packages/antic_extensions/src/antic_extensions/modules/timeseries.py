@@ -0,0 +1,342 @@
+"""당일 체결(틱) 데이터를 PostgreSQL에 저장하고 1분/5분/1시간 OHLCV 봉으로 집계한다.
+
+- ``stock_ticks``: 체결 시각(``traded_at``) 기준 일 단위 RANGE 파티션 + BRIN 인덱스. ``COPY``로 일괄 적재.
+  같은 초에 여러 번 체결될 수 있으므로 체결마다 다른 누적 거래량(``acml_vol``)까지 키에 포함한다.
+  (REST와 실시간으로 같은 체결을 받으면 한 번만 저장된다.)
+- ``stock_bars``: 봉 단위(``timeframe``: 1m/5m/1h)별 OHLCV. 적재된 틱이 걸친 구간만 다시 집계해 upsert 한다.
+  ``(fid_input_iscd, timeframe, bucket)`` 고유 인덱스에 OHLCV를 INCLUDE 하므로 차트 조회는 index-only scan으로 처리된다.
+
+봉 집계에 ``date_bin``을 사용하므로 PostgreSQL 14 이상이 필요하다.
+
+```python
+writer = IntradayTickWriter(client)
+writer.ensure_schema()
+writer.write_ticks(rows)    # fetch_inquire_time_itemconclusion 결과 (1m/5m/1h 봉 자동 갱신)
+writer.query_bars('005930', '5m', start, end)
+```
+"""
+from datetime import date, datetime, time, timedelta, timezone
+from decimal import Decimal, InvalidOperation
+from typing import Any, Iterable, Mapping, NamedTuple, Optional, Sequence
+import csv
+import io
+import logging
+
+from .database import PsqlDBClient
+
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    'BAR_INTERVALS',
+    'TickRow',
+    'IntradayTickWriter',
+    'to_tick_row',
+)
+
+KST = timezone(timedelta(hours=9))
+
+BAR_INTERVALS: dict[str, str] = {
+    '1m': '1 minute',
+    '5m': '5 minutes',
+    '1h': '1 hour',
+}
+'''봉 단위 -> PostgreSQL interval'''
+
+
+class TickRow(NamedTuple):
+    fid_input_iscd: str
+    traded_at: datetime
+    price: int
+    volume: int
+    acml_vol: int = 0
+
+
+def _to_int(value: Any) -> Optional[int]:
+    if value is None or value == '':
+        return None
+    try:
+        return int(Decimal(str(value)))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+def _trading_date(value: Any) -> date:
+    if isinstance(value, datetime):
+        return value.astimezone(KST).date() if value.tzinfo else value.date()
+    if isinstance(value, date):
+        return value
+    if isinstance(value, str) and value:
+        try:
+            return _trading_date(datetime.fromisoformat(value))
+        except ValueError:
+            pass
+    return datetime.now(KST).date()
+
+
+def to_tick_row(row: Mapping[str, Any], trading_date: Optional[date]=None) -> Optional[TickRow]:
+    """KIS 시간대별 체결 행을 ``TickRow``로 변환한다. 필수 값이 없으면 None.
+
+    체결일은 ``trading_date``, 없으면 행의 ``collected_at`` 날짜를 사용한다. 체결량은 REST(output2)의 ``cnqn``,
+    없으면 실시간(``H0STCNT0``)의 ``cntg_vol``을 사용한다.
+    """
+    code = row.get('requested_fid_input_iscd') or row.get('stck_shrn_iscd')
+    hour = str(row.get('stck_cntg_hour') or '').zfill(6)
+    price = _to_int(row.get('stck_prpr'))
+    if not code or not row.get('stck_cntg_hour') or len(hour) != 6 or not hour.isdigit() or price is None:
+        return None
+    day = trading_date or _trading_date(row.get('collected_at'))
+    try:
+        traded_time = time(int(hour[:2]), int(hour[2:4]), int(hour[4:]))
+    except ValueError:
+        return None
+    return TickRow(
+        fid_input_iscd=str(code),
+        traded_at=datetime.combine(day, traded_time, tzinfo=KST),
+        price=price,
+        volume=_to_int(row.get('cnqn') or row.get('cntg_vol')) or 0,
+        acml_vol=_to_int(row.get('acml_vol')) or 0,
+    )
+
+
+class IntradayTickWriter:
+    """체결 틱을 일 단위 파티션 테이블에 ``COPY``로 적재하고, 봉 테이블을 증분 집계한다."""
+
+    def __init__(
+            self,
+            client: PsqlDBClient,
+            schema: str='anticsignal',
+            intervals: Sequence[str]=tuple(BAR_INTERVALS),
+    ) -> None:
+        """
+        :param client: (PsqlDBClient) PostgreSQL 클라이언트
+        :param schema: (str) 테이블을 생성할 스키마
+        :param intervals: (Sequence[str]) 적재 시 갱신할 봉 단위 (``BAR_INTERVALS``의 키)
+        """
+        unknown = set(intervals) - set(BAR_INTERVALS)
+        if unknown:
+            raise ValueError(f"Unknown bar intervals: {unknown}")
+        self._client = client
+        self._schema = schema
+        self._intervals = tuple(intervals)
+        self._partitions: set[date] = set()
+
+    @property
+    def ticks_table(self) -> str:
+        return f"{self._schema}.stock_ticks"
+
+    @property
+    def bars_table(self) -> str:
+        return f"{self._schema}.stock_bars"
+
+    def schema_sql(self) -> str:
+        """테이블/인덱스 DDL (멱등). 체결 시각만 키로 만든 기존 틱 테이블은 누적 거래량(``acml_vol``)을 키에 추가한다."""
+        return f"""
+CREATE SCHEMA IF NOT EXISTS {self._schema};
+
+CREATE TABLE IF NOT EXISTS {self.ticks_table} (
+    fid_input_iscd VARCHAR(12) NOT NULL,
+    traded_at TIMESTAMPTZ NOT NULL,
+    price BIGINT NOT NULL,
+    volume BIGINT NOT NULL DEFAULT 0,
+    acml_vol BIGINT NOT NULL DEFAULT 0,
+    PRIMARY KEY (fid_input_iscd, traded_at, acml_vol)
+) PARTITION BY RANGE (traded_at);
+
+ALTER TABLE {self.ticks_table} ADD COLUMN IF NOT EXISTS acml_vol BIGINT NOT NULL DEFAULT 0;
+DO $$
+BEGIN
+    IF NOT EXISTS (
+        SELECT 1
+        FROM pg_index i
+        JOIN pg_attribute a ON a.attrelid = i.indrelid AND a.attnum = ANY(i.indkey)
+        WHERE i.indrelid = '{self.ticks_table}'::regclass AND i.indisprimary AND a.attname = 'acml_vol'
+    ) THEN
+        ALTER TABLE {self.ticks_table} DROP CONSTRAINT IF EXISTS stock_ticks_pkey;
+        ALTER TABLE {self.ticks_table} ADD PRIMARY KEY (fid_input_iscd, traded_at, acml_vol);
+    END IF;
+END $$;
+
+CREATE INDEX IF NOT EXISTS stock_ticks_traded_at_brin
+    ON {self.ticks_table} USING BRIN (traded_at);
+
+CREATE TABLE IF NOT EXISTS {self.bars_table} (
+    fid_input_iscd VARCHAR(12) NOT NULL,
+    timeframe VARCHAR(4) NOT NULL,
+    bucket TIMESTAMPTZ NOT NULL,
+    open BIGINT NOT NULL,
+    high BIGINT NOT NULL,
+    low BIGINT NOT NULL,
+    close BIGINT NOT NULL,
+    volume BIGINT NOT NULL,
+    tick_count INTEGER NOT NULL
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS stock_bars_range_idx
+    ON {self.bars_table} (fid_input_iscd, timeframe, bucket)
+    INCLUDE (open, high, low, close, volume);
+
+CREATE INDEX IF NOT EXISTS stock_bars_bucket_brin
+    ON {self.bars_table} USING BRIN (bucket);
+"""
+
+    def ensure_schema(self) -> None:
+        with self._client.cursor('tick_schema') as cur:
+            cur.execute(self.schema_sql())
+        logger.info(f"Ensured intraday tables in schema {self._schema}")
+
+    def _partition_name(self, day: date) -> str:
+        return f"{self.ticks_table}_{day:%Y%m%d}"
+
+    def ensure_partition(self, day: date) -> None:
+        """``day``(KST) 하루치 틱 파티션을 생성한다. (이미 있으면 무시)"""
+        if day in self._partitions:
+            return
+        start = datetime.combine(day, time(0), tzinfo=KST)
+        end = start + timedelta(days=1)
+        with self._client.cursor('tick_partition') as cur:
+            cur.execute(
+                f"CREATE TABLE IF NOT EXISTS {self._partition_name(day)} "
+                f"PARTITION OF {self.ticks_table} "
+                f"FOR VALUES FROM ('{start.isoformat()}') TO ('{end.isoformat()}')"
+            )
+        self._partitions.add(day)
+
+    @staticmethod
+    def _to_csv(ticks: Iterable[TickRow]) -> io.StringIO:
+        buf = io.StringIO()
+        writer = csv.writer(buf)
+        for tick in ticks:
+            writer.writerow((tick.fid_input_iscd, tick.traded_at.isoformat(), tick.price, tick.volume, tick.acml_vol))
+        buf.seek(0)
+        return buf
+
+    def write_ticks(
+            self,
+            rows: Iterable[Mapping[str, Any]],
+            trading_date: Optional[date]=None,
+            rollup: bool=True,
+    ) -> int:
+        """틱을 ``COPY``로 적재하고 (이미 있는 체결은 무시), 새로 적재한 행 수를 반환한다.
+
+        체결은 (종목, 체결 시각, 누적 거래량)으로 구분한다. 누적 거래량이 없는 행은 같은 초의 체결을 하나로 합친다.
+        (체결량 합계, 마지막 행의 가격) ``rollup=True``이면 적재된 틱이 걸친 봉 구간만 다시 집계한다.
+        """
+        ticks: dict[tuple[str, datetime, int], TickRow] = {}
+        for row in rows:
+            tick = to_tick_row(row, trading_date)
+            if tick is None:
+                continue
+            key = (tick.fid_input_iscd, tick.traded_at, tick.acml_vol)
+            merged = ticks.get(key)
+            if merged is None:
+                ticks[key] = tick
+            elif not tick.acml_vol:
+                ticks[key] = tick._replace(volume=merged.volume + tick.volume)
+        if not ticks:
+            return 0
+        for day in {tick.traded_at.date() for tick in ticks.values()}:
+            self.ensure_partition(day)
+
+        with self._client.cursor('tick_copy') as cur:
+            # COPY는 충돌을 처리하지 못하므로 임시 테이블에 적재한 뒤 병합한다.
+            cur.execute(
+                "CREATE TEMP TABLE IF NOT EXISTS _stock_ticks_stage "
+                f"(LIKE {self.ticks_table} INCLUDING DEFAULTS) ON COMMIT DELETE ROWS"
+            )
+            cur.copy_expert(
+                "COPY _stock_ticks_stage (fid_input_iscd, traded_at, price, volume, acml_vol) "
+                "FROM STDIN WITH (FORMAT csv)",
+                self._to_csv(ticks.values()),
+            )
+            cur.execute(
+                f"INSERT INTO {self.ticks_table} (fid_input_iscd, traded_at, price, volume, acml_vol) "
+                "SELECT fid_input_iscd, traded_at, price, volume, acml_vol FROM _stock_ticks_stage "
+                "ON CONFLICT (fid_input_iscd, traded_at, acml_vol) DO NOTHING"
+            )
+            inserted = cur.rowcount
+        logger.info(f"Copied {len(ticks)} ticks into {self.ticks_table} (new={inserted})")
+
+        if rollup and inserted:
+            windows: dict[str, tuple[datetime, datetime]] = {}
+            for code, traded_at, _ in ticks:
+                low, high = windows.get(code, (traded_at, traded_at))
+                windows[code] = (min(low, traded_at), max(high, traded_at))
+            for code, (start, end) in windows.items():
+                self.refresh_bars(code, start, end)
+        return inserted
+
+    def refresh_bars(
+            self,
+            code: str,
+            start: datetime,
+            end: datetime,
+            intervals: Optional[Sequence[str]]=None,
+    ) -> None:
+        """``[start, end]`` 구간이 걸친 봉을 틱에서 다시 집계해 upsert 한다."""
+        origin = datetime.combine(date(2000, 1, 3), time(0), tzinfo=KST)
+        with self._client.cursor('bar_refresh') as cur:
+            for interval in intervals or self._intervals:
+                step = BAR_INTERVALS[interval]
+                cur.execute(
+                    f"""
+INSERT INTO {self.bars_table}
+    (fid_input_iscd, timeframe, bucket, open, high, low, close, volume, tick_count)
+SELECT
+    fid_input_iscd,
+    %(timeframe)s,
+    date_bin(%(step)s::interval, traded_at, %(origin)s) AS bucket,
+    (array_agg(price ORDER BY traded_at, acml_vol))[1],
+    max(price),
+    min(price),
+    (array_agg(price ORDER BY traded_at DESC, acml_vol DESC))[1],
+    sum(volume),
+    count(*)
+FROM {self.ticks_table}
+WHERE fid_input_iscd = %(code)s
+  AND traded_at >= date_bin(%(step)s::interval, %(start)s::timestamptz, %(origin)s)
+  AND traded_at < date_bin(%(step)s::interval, %(end)s::timestamptz, %(origin)s) + %(step)s::interval
+GROUP BY fid_input_iscd, bucket
+ON CONFLICT (fid_input_iscd, timeframe, bucket) DO UPDATE SET
+    open = EXCLUDED.open,
+    high = EXCLUDED.high,
+    low = EXCLUDED.low,
+    close = EXCLUDED.close,
+    volume = EXCLUDED.volume,
+    tick_count = EXCLUDED.tick_count
+""",
+                    {
+                        'timeframe': interval,
+                        'step': step,
+                        'origin': origin,
+                        'code': code,
+                        'start': start,
+                        'end': end,
+                    },
+                )
+
+    def query_bars(
+            self,
+            code: str,
+            interval: str,
+            start: datetime,
+            end: datetime,
+    ) -> list[dict[str, Any]]:
+        """``[start, end)`` 구간의 봉을 시간순으로 반환한다."""
+        if interval not in BAR_INTERVALS:
+            raise ValueError(f"Unknown bar interval: {interval}")
+        with self._client.cursor('bar_query') as cur:
+            cur.execute(
+                "SELECT bucket, open, high, low, close, volume "
+                f"FROM {self.bars_table} "
+                "WHERE fid_input_iscd = %s AND timeframe = %s AND bucket >= %s AND bucket < %s "
+                "ORDER BY bucket",
+                (code, interval, start, end),
+            )
+            rows = cur.fetchall()
+        return [
+            {
+                'bucket': bucket.isoformat(),
+                'open': open_, 'high': high, 'low': low, 'close': close, 'volume': volume,
+            }
+            for bucket, open_, high, low, close, volume in rows
+        ]
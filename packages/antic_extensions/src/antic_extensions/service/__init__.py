@@ -1 +1,7 @@
-from .redis import *
\ No newline at end of file
+from .redis import *
+from .freshness import *
+from .ticks import *
+from .partition import *
+from .lease import *
+from .movers import *
+from .flows import *
\ No newline at end of file
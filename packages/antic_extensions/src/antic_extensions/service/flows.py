@@ -0,0 +1,324 @@
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+import json
+import logging
+
+from redis.exceptions import WatchError
+
+from .redis import RedisService
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    'InvestorFlowStore',
+)
+
+# 순위 구간의 종목 코드/score와 종목별 기준일을 한 번에 읽는다.
+_TOP_SCRIPT = """
+local members
+if ARGV[3] == '1' then
+    members = redis.call('zrevrange', KEYS[1], ARGV[1], ARGV[2], 'WITHSCORES')
+else
+    members = redis.call('zrange', KEYS[1], ARGV[1], ARGV[2], 'WITHSCORES')
+end
+local as_of = {}
+for i = 1, #members, 2 do
+    as_of[#as_of + 1] = redis.call('zscore', KEYS[2], members[i]) or false
+end
+return {members, as_of}
+"""
+
+# 기준일(KEYS[1]의 score)이 ARGV[1]보다 오래된 종목을 기준일과 모든 순위(KEYS[2..])에서 뺀다.
+_PRUNE_SCRIPT = """
+local stale = redis.call('zrangebyscore', KEYS[1], '-inf', '(' .. ARGV[1])
+if #stale == 0 then
+    return 0
+end
+for i = 1, #KEYS do
+    redis.call('zrem', KEYS[i], unpack(stale))
+end
+return #stale
+"""
+
+
+def _decode(value: Any) -> Any:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(str(value).replace(',', ''))
+    except (TypeError, ValueError):
+        return None
+
+
+class InvestorFlowStore:
+    """종목별 투자자 매매동향(일별)을 보관하고, 투자자별 최근 N거래일 누적 순매수를 미리 계산해 둡니다.
+
+    - ``stock:{code}:investor_daily`` (Hash): 영업일(``YYYYMMDD``) -> 투자자별 순매수 수량/거래대금 JSON.
+      가장 긴 기간(``windows``의 최댓값)만큼의 최근 거래일만 남깁니다.
+    - ``stock:{code}:investor_flow`` (Hash): ``{investor}:{qty|value}:{window}`` -> 최근 ``window`` 거래일 누적 순매수,
+      ``as_of`` (마지막 영업일), ``days`` (보관한 거래일 수)
+    - ``investor_flow:{investor}:{window}`` (Sorted Set): 종목 코드 -> 누적 순매수 거래대금 (종목 간 순위)
+    - ``investor_flow:as_of`` (Sorted Set): 종목 코드 -> 순위에 반영된 마지막 영업일 (``YYYYMMDD``)
+
+    누적 합계는 새로 들어온 날, 값이 바뀐 날(장중 당일 값), 기간에서 밀려난 날만 더하고 빼므로
+    같은 이력을 다시 받으면 쓰기가 없습니다. 합계가 없으면(만료 등) 보관된 이력 전체로 다시 계산합니다.
+    종목 키는 ``WATCH`` 후 읽고 ``MULTI``로 쓰므로, 다른 작업자가 그 사이 같은 종목을 갱신하면 다시 읽어 계산합니다.
+    종목 키는 마지막 갱신 후 ``ttl``이 지나면 만료되고, 순위에서도 기준일이 ``ttl``보다 오래된 종목은 갱신 때 제거합니다.
+
+    >>> store = InvestorFlowStore(service)
+    >>> store.update(rows)                       # fetch_investor_trade_by_stock_daily 결과 (여러 종목 가능)
+        1
+    >>> store.get('005930')
+        {'code': '005930', 'as_of': '20261016', 'days': 30,
+         'flows': {'foreign': {'5': {'qty': 12000.0, 'value': 840.0}, ...}, ...}}
+    >>> store.top('foreign', window=20, count=10)    # 외국인 20일 순매수 상위
+        [{'rank': 1, 'code': '005930', 'value': 1520.0, 'as_of': '20261016'}, ...]
+    """
+    # 투자자 이름 -> 응답 필드 접두어
+    INVESTORS = {
+        'personal': 'prsn',
+        'foreign': 'frgn',
+        'institution': 'orgn',
+    }
+    # 순매수 수량/거래대금(백만원) 응답 필드 접미어
+    MEASURES = {
+        'qty': '_ntby_qty',
+        'value': '_ntby_tr_pbmn',
+    }
+    DAILY_KEY_TEMPLATE = 'stock:{code}:investor_daily'
+    FLOW_KEY_TEMPLATE = 'stock:{code}:investor_flow'
+    RANKING_KEY_TEMPLATE = 'investor_flow:{investor}:{window}'
+    AS_OF_KEY = 'investor_flow:as_of'
+    # WATCH 충돌 시 다시 시도하는 횟수
+    MAX_RETRIES = 5
+    CODE_KEYS = ('requested_fid_input_iscd', 'mksc_shrn_iscd', 'stck_shrn_iscd')
+    DATE_KEY = 'stck_bsop_date'
+
+    def __init__(
+        self,
+        service: RedisService,
+        windows: Sequence[int]=(5, 20, 60),
+        ttl: timedelta=timedelta(days=120),
+    ) -> None:
+        """
+        Args:
+            service (RedisService): 저장에 사용할 Redis 서비스
+            windows (Sequence[int]): 누적 기간(거래일 수)
+            ttl (timedelta): 종목 키 보관 기간 (마지막 갱신 기준)
+        """
+        if not windows or min(windows) <= 0:
+            raise ValueError(f'windows must be positive: {windows}')
+        self._service = service
+        self._windows = tuple(sorted(set(windows)))
+        self._ttl = int(ttl.total_seconds())
+
+    @property
+    def windows(self) -> Tuple[int, ...]:
+        return self._windows
+
+    def _daily_key(self, code: str) -> str:
+        return self.DAILY_KEY_TEMPLATE.format(code=code)
+
+    def _flow_key(self, code: str) -> str:
+        return self.FLOW_KEY_TEMPLATE.format(code=code)
+
+    def ranking_key(self, investor: str, window: int) -> str:
+        if investor not in self.INVESTORS:
+            raise ValueError(f'Unknown investor: {investor} (expected one of {sorted(self.INVESTORS)})')
+        if window not in self._windows:
+            raise ValueError(f'Unknown window: {window} (expected one of {list(self._windows)})')
+        return self.RANKING_KEY_TEMPLATE.format(investor=investor, window=window)
+
+    def _fields(self) -> List[str]:
+        return [prefix + suffix for prefix in self.INVESTORS.values() for suffix in self.MEASURES.values()]
+
+    def _daily(self, rows: Iterable[Mapping[str, Any]]) -> Dict[str, Dict[str, Dict[str, float]]]:
+        """종목 코드 -> 영업일 -> 응답 필드별 순매수."""
+        fields = self._fields()
+        daily: Dict[str, Dict[str, Dict[str, float]]] = defaultdict(dict)
+        for row in rows:
+            code = next((row[key] for key in self.CODE_KEYS if row.get(key)), None)
+            day = str(row.get(self.DATE_KEY) or '')
+            if not code or len(day) != 8 or not day.isdigit():
+                continue
+            daily[code][day] = {field: _number(row.get(field)) or 0.0 for field in fields}
+        return daily
+
+    def _window_deltas(
+        self,
+        before: Mapping[str, Mapping[str, float]],
+        after: Mapping[str, Mapping[str, float]],
+    ) -> Dict[str, float]:
+        """``{investor}:{measure}:{window}`` -> 누적 합계 변화. 기간에 들어오거나 빠진 날과 값이 바뀐 날만 계산한다."""
+        before_days, after_days = sorted(before, reverse=True), sorted(after, reverse=True)
+        by_field = {
+            prefix + suffix: (investor, measure)
+            for investor, prefix in self.INVESTORS.items()
+            for measure, suffix in self.MEASURES.items()
+        }
+        deltas: Dict[str, float] = defaultdict(float)
+        for window in self._windows:
+            old, new = set(before_days[:window]), set(after_days[:window])
+            for days, values, sign, other in ((new, after, 1, old), (old, before, -1, new)):
+                for day in days:
+                    if day in other and before[day] == after[day]:
+                        continue
+                    for field, value in values[day].items():
+                        if field in by_field:
+                            investor, measure = by_field[field]
+                            deltas[f'{investor}:{measure}:{window}'] += sign * value
+        return deltas
+
+    def update(self, rows: Iterable[Mapping[str, Any]]) -> int:
+        """매매동향 응답 행으로 이력과 누적 순매수를 갱신하고, 값이 바뀐 종목 수를 반환합니다."""
+        daily = self._daily(rows)
+        if not daily:
+            return 0
+        codes = list(daily)
+        keys = [key for code in codes for key in (self._daily_key(code), self._flow_key(code))]
+        newest = max(day for days in daily.values() for day in days)
+        cutoff = (datetime.strptime(newest, '%Y%m%d') - timedelta(seconds=self._ttl)).strftime('%Y%m%d')
+        rankings = [self.ranking_key(investor, window) for investor in self.INVESTORS for window in self._windows]
+        updated = None
+        with self._service.client.connect() as conn:
+            for _ in range(self.MAX_RETRIES):
+                with conn.pipeline(transaction=True) as pipe:
+                    pipe.watch(*keys)
+                    reads = conn.pipeline(transaction=False)
+                    for key in keys:
+                        reads.hgetall(key)
+                    stored = reads.execute()
+                    pipe.multi()
+                    as_of = self._queue_updates(pipe, codes, daily, stored)
+                    if not as_of:
+                        updated = 0
+                        break
+                    pipe.zadd(self.AS_OF_KEY, {code: int(day) for code, day in as_of.items()})
+                    pipe.eval(_PRUNE_SCRIPT, 1 + len(rankings), self.AS_OF_KEY, *rankings, cutoff)
+                    try:
+                        pipe.execute()
+                    except WatchError:
+                        continue
+                    updated = len(as_of)
+                    break
+        if updated is None:
+            logger.warning(f'Investor flow update for {len(codes)} codes gave up after {self.MAX_RETRIES} conflicts')
+            return 0
+        return updated
+
+    def _queue_updates(
+        self,
+        pipe: Any,
+        codes: Sequence[str],
+        daily: Mapping[str, Mapping[str, Dict[str, float]]],
+        stored: Sequence[Any],
+    ) -> Dict[str, str]:
+        """저장된 이력/합계(``stored``)와 새 이력을 합쳐 바뀐 종목의 쓰기를 ``pipe``에 쌓고, 종목 -> 기준일을 반환한다."""
+        longest = self._windows[-1]
+        as_of: Dict[str, str] = {}
+        for index, code in enumerate(codes):
+            history = {
+                _decode(day): json.loads(_decode(raw)) for day, raw in (stored[2 * index] or {}).items()
+            }
+            flows = {_decode(k): _number(_decode(v)) for k, v in (stored[2 * index + 1] or {}).items()}
+            merged = {**history, **daily[code]}
+            kept = sorted(merged, reverse=True)[:longest]
+            merged = {day: merged[day] for day in kept}
+            # 보관 기간보다 오래된 날은 버리고, 새로 들어왔거나 값이 바뀐 날만 반영한다.
+            changed = {day: values for day, values in merged.items() if history.get(day) != values}
+            dropped = [day for day in history if day not in merged]
+            if not changed and not dropped and flows:
+                continue
+            # 합계가 없으면 이전 이력이 없는 것으로 보고 보관된 이력 전체를 더한다.
+            deltas = self._window_deltas(history if flows else {}, merged)
+            totals = {
+                f'{investor}:{measure}:{window}': (flows.get(f'{investor}:{measure}:{window}') or 0.0)
+                + deltas.get(f'{investor}:{measure}:{window}', 0.0)
+                for investor in self.INVESTORS
+                for measure in self.MEASURES
+                for window in self._windows
+            }
+            if changed:
+                pipe.hset(self._daily_key(code), mapping={
+                    day: json.dumps(values) for day, values in changed.items()
+                })
+            if dropped:
+                pipe.hdel(self._daily_key(code), *dropped)
+            pipe.hset(self._flow_key(code), mapping={**totals, 'as_of': kept[0], 'days': len(kept)})
+            pipe.expire(self._daily_key(code), self._ttl)
+            pipe.expire(self._flow_key(code), self._ttl)
+            for investor in self.INVESTORS:
+                for window in self._windows:
+                    pipe.zadd(self.ranking_key(investor, window), {code: totals[f'{investor}:value:{window}']})
+            as_of[code] = kept[0]
+        return as_of
+
+    def get(self, code: str) -> Optional[Dict[str, Any]]:
+        """종목의 투자자별/기간별 누적 순매수. 수집 이력이 없으면 None."""
+        values = None
+        with self._service.client.connect() as conn:
+            values = conn.hgetall(self._flow_key(code))
+        if not values:
+            return None
+        values = {_decode(k): _decode(v) for k, v in values.items()}
+        return {
+            'code': code,
+            'as_of': values.get('as_of'),
+            'days': int(_number(values.get('days')) or 0),
+            'flows': {
+                investor: {
+                    str(window): {
+                        measure: _number(values.get(f'{investor}:{measure}:{window}')) or 0.0
+                        for measure in self.MEASURES
+                    }
+                    for window in self._windows
+                }
+                for investor in self.INVESTORS
+            },
+        }
+
+    def history(self, code: str, count: Optional[int]=None) -> List[Dict[str, Any]]:
+        """보관된 일별 매매동향을 최근 영업일부터 반환합니다. (``stck_bsop_date``와 응답 필드)"""
+        values = None
+        with self._service.client.connect() as conn:
+            values = conn.hgetall(self._daily_key(code))
+        if not values:
+            return []
+        rows = sorted(
+            ({self.DATE_KEY: _decode(day), **json.loads(_decode(raw))} for day, raw in values.items()),
+            key=lambda row: row[self.DATE_KEY],
+            reverse=True,
+        )
+        return rows[:count] if count is not None else rows
+
+    def top(
+        self,
+        investor: str='foreign',
+        window: int=20,
+        count: int=10,
+        ascending: bool=False,
+    ) -> List[Dict[str, Any]]:
+        """``investor``의 ``window``거래일 누적 순매수 거래대금 상위(``ascending``이면 순매도 상위) 종목."""
+        key = self.ranking_key(investor, window)
+        if count <= 0:
+            return []
+        result = None
+        with self._service.client.connect() as conn:
+            result = conn.eval(
+                _TOP_SCRIPT, 2, key, self.AS_OF_KEY,
+                0, count - 1, 0 if ascending else 1,
+            )
+        if not result:
+            return []
+        members, as_of = result
+        return [
+            {
+                'rank': index + 1,
+                'code': _decode(members[2 * index]),
+                'value': _number(_decode(members[2 * index + 1])),
+                'as_of': None if day is None else f'{int(_number(_decode(day)) or 0):08d}',
+            }
+            for index, day in enumerate(as_of)
+        ]
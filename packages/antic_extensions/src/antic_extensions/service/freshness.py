@@ -0,0 +1,126 @@
+from typing import Iterable, Mapping, Optional
+import logging
+import time
+
+from .redis import RedisService
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    'FreshnessRegistry',
+)
+
+
+class FreshnessRegistry:
+    """종목/데이터 종류별 마지막 수집 시각을 Redis에 기록하고, 허용 지연(staleness budget)을 넘긴 종목만 골라냅니다.
+
+    종목마다 하나의 해시(``stock:{code}:freshness``)에 ``{데이터 종류: epoch 초}``를 저장합니다.
+    기록이 없는 종목(새로 순위에 든 종목)은 항상 오래된 것으로 간주합니다.
+
+    >>> registry = FreshnessRegistry(service, budgets={'current_price': 60, 'daily_chartprice': 6 * 3600})
+    >>> registry.stale_types(['005930', '000660'])
+        {'005930': ['daily_chartprice'], '000660': ['current_price', 'daily_chartprice']}
+    >>> registry.mark('current_price', ['005930'])
+    """
+    KEY_TEMPLATE = 'stock:{code}:freshness'
+
+    def __init__(
+        self,
+        service: RedisService,
+        budgets: Mapping[str, float],
+        ttl: Optional[int]=24 * 60 * 60,
+    ) -> None:
+        """
+        Args:
+            service (RedisService): 기록에 사용할 Redis 서비스
+            budgets (Mapping[str, float]): 데이터 종류 -> 허용 지연(초). 0 이하이면 항상 다시 수집합니다.
+            ttl (int, optional): 해시 만료 시간(초). 오래 순위에 들지 않은 종목의 기록을 정리합니다.
+        """
+        self._service = service
+        self._budgets = dict(budgets)
+        self._ttl = ttl
+
+    @property
+    def budgets(self) -> dict[str, float]:
+        return dict(self._budgets)
+
+    def _key(self, code: str) -> str:
+        return self.KEY_TEMPLATE.format(code=code)
+
+    def last_updated(self, codes: Iterable[str]) -> dict[str, dict[str, float]]:
+        """종목별 ``{데이터 종류: 마지막 수집 epoch}``를 반환합니다. 조회 실패 시 빈 dict를 반환합니다."""
+        codes = list(dict.fromkeys(codes))
+        result: dict[str, dict[str, float]] = {code: {} for code in codes}
+        if not codes:
+            return result
+        types = list(self._budgets)
+        values = None
+        with self._service.client.connect() as conn:
+            pipe = conn.pipeline(transaction=False)
+            for code in codes:
+                pipe.hmget(self._key(code), types)
+            values = pipe.execute()
+        if values is None:
+            logger.warning('Cannot read freshness registry, treat every code as stale')
+            return result
+        for code, row in zip(codes, values):
+            for data_type, raw in zip(types, row or ()):
+                if raw is None:
+                    continue
+                try:
+                    result[code][data_type] = float(raw)
+                except (TypeError, ValueError):
+                    logger.warning(f'Invalid freshness value: {code}/{data_type}={raw!r}')
+        return result
+
+    def stale_types(
+        self,
+        codes: Iterable[str],
+        data_types: Optional[Iterable[str]]=None,
+        now: Optional[float]=None,
+    ) -> dict[str, list[str]]:
+        """종목별로 다시 수집해야 하는 데이터 종류 목록을 반환합니다. (입력 순서 유지)
+
+        Args:
+            codes (Iterable[str]): 종목 코드
+            data_types (Iterable[str], optional): 확인할 데이터 종류. 없으면 ``budgets``의 모든 종류.
+            now (float, optional): 기준 epoch 초 (기본값: 현재 시각)
+        """
+        now = time.time() if now is None else now
+        data_types = list(data_types) if data_types is not None else list(self._budgets)
+        updated = self.last_updated(codes)
+        result: dict[str, list[str]] = {}
+        for code, stamps in updated.items():
+            result[code] = [
+                data_type for data_type in data_types
+                if data_type not in stamps
+                or now - stamps[data_type] >= self._budgets.get(data_type, 0)
+            ]
+        return result
+
+    def mark(
+        self,
+        data_type: str,
+        codes: Iterable[str],
+        at: Optional[float]=None,
+    ) -> bool:
+        """``codes``의 ``data_type`` 수집 시각을 기록합니다.
+
+        Returns
+        -------
+        bool: 기록 성공 여부.
+        """
+        codes = list(dict.fromkeys(codes))
+        if not codes:
+            return True
+        at = time.time() if at is None else at
+        done = False
+        with self._service.client.connect() as conn:
+            pipe = conn.pipeline(transaction=False)
+            for code in codes:
+                key = self._key(code)
+                pipe.hset(key, data_type, at)
+                if self._ttl:
+                    pipe.expire(key, self._ttl)
+            pipe.execute()
+            done = True
+        return done
@@ -0,0 +1,161 @@
+from typing import Optional
+import logging
+import os
+import socket
+import uuid
+
+from .redis import RedisService
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    'RedisLease',
+)
+
+# 값이 자신의 owner일 때만 만료 시간을 연장/삭제한다.
+_RENEW_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('pexpire', KEYS[1], ARGV[2])
+end
+return 0
+"""
+_RELEASE_SCRIPT = """
+if redis.call('get', KEYS[1]) == ARGV[1] then
+    return redis.call('del', KEYS[1])
+end
+return 0
+"""
+# 지금까지 받은 가장 큰 token 이상일 때만 기록하고 받아들인다.
+_ACCEPT_SCRIPT = """
+local highest = tonumber(redis.call('get', KEYS[1]) or '0')
+if tonumber(ARGV[1]) < highest then
+    return 0
+end
+redis.call('set', KEYS[1], ARGV[1])
+return 1
+"""
+
+
+class RedisLease:
+    """``SET NX PX`` 기반의 만료되는 lease(분산 lock)입니다.
+
+    획득할 때마다 ``lease:{name}:fence``를 증가시킨 fencing token을 발급합니다. lease가 만료된 뒤 늦게 끝난
+    작업이 결과를 덮어쓰지 않도록, 저장소 쓰기 전에 ``renew``로 소유 여부를 확인하거나 token을 함께 기록하세요.
+    token을 받는 쪽은 ``accept``로 지금까지 받은 가장 큰 token(``lease:{name}:accepted``)보다 오래된 결과를 버립니다.
+    Redis를 사용할 수 없으면 ``fail_open``(기본값 False)을 결과로 사용합니다. (True이면 lock 없이 실행)
+
+    >>> lease = RedisLease(service, 'kis_volume_rank_collect', ttl_ms=240_000)
+    >>> if lease.acquire():
+    ...     data = fetch_volume_rank(client)
+    ...     if lease.renew():            # 아직 lease를 가지고 있을 때만 발행
+    ...         publish(data, fencing_token=lease.token)
+    >>> RedisLease(service, 'kis_volume_rank_collect', ttl_ms=240_000).accept(message['fencing_token'])
+        True
+    >>> with RedisLease(service, 'daily_migration', ttl_ms=60_000) as acquired:
+    ...     if acquired:
+    ...         migrate()                # 블록을 벗어나면 release
+    """
+    KEY_TEMPLATE = 'lease:{name}'
+    FENCE_KEY_TEMPLATE = 'lease:{name}:fence'
+    ACCEPTED_KEY_TEMPLATE = 'lease:{name}:accepted'
+
+    def __init__(
+        self,
+        service: RedisService,
+        name: str,
+        ttl_ms: int,
+        owner: Optional[str]=None,
+        fail_open: bool=False,
+    ) -> None:
+        """
+        Args:
+            service (RedisService): lease 저장에 사용할 Redis 서비스
+            name (str): lease 이름
+            ttl_ms (int): lease 유지 시간(ms). ``renew``로 연장하지 않으면 이 시간 뒤 다른 owner가 획득할 수 있습니다.
+            owner (str, optional): owner 식별자 (기본값: ``{hostname}:{pid}:{난수}``)
+            fail_open (bool): Redis를 사용할 수 없을 때 ``acquire``/``renew``가 성공한 것으로 볼지 여부.
+                중복 실행보다 누락이 나쁜 작업(주기 수집 등)에 사용합니다.
+        """
+        self._service = service
+        self.name = name
+        self.ttl_ms = ttl_ms
+        self.owner = owner or f'{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}'
+        self.fail_open = fail_open
+        self.token: Optional[int] = None
+
+    @property
+    def key(self) -> str:
+        return self.KEY_TEMPLATE.format(name=self.name)
+
+    @property
+    def fence_key(self) -> str:
+        return self.FENCE_KEY_TEMPLATE.format(name=self.name)
+
+    @property
+    def accepted_key(self) -> str:
+        return self.ACCEPTED_KEY_TEMPLATE.format(name=self.name)
+
+    def acquire(self) -> bool:
+        """lease를 획득하면 fencing token(``token``)을 발급하고 True를 반환합니다."""
+        acquired = done = None
+        with self._service.client.connect() as conn:
+            acquired = conn.set(self.key, self.owner, nx=True, px=self.ttl_ms)
+            if acquired:
+                self.token = int(conn.incr(self.fence_key))
+            done = True
+        if not done:
+            logger.warning(f'Cannot reach lease {self.name}, acquired={self.fail_open}')
+            self.token = 0 if self.fail_open else None
+            return self.fail_open
+        if not acquired:
+            self.token = None
+            logger.debug(f'Lease {self.name} is held by another owner')
+            return False
+        logger.info(f'Lease {self.name} acquired by {self.owner} (token={self.token})')
+        return True
+
+    def renew(self, ttl_ms: Optional[int]=None) -> bool:
+        """아직 lease를 가지고 있으면 만료 시간을 ``ttl_ms``(기본값: 생성 시 ttl)로 연장하고 True를 반환합니다."""
+        if self.token is None:
+            return False
+        renewed = done = None
+        with self._service.client.connect() as conn:
+            renewed = conn.eval(_RENEW_SCRIPT, 1, self.key, self.owner, ttl_ms or self.ttl_ms)
+            done = True
+        if not done:
+            logger.warning(f'Cannot reach lease {self.name}, renewed={self.fail_open}')
+            return self.fail_open
+        if not renewed:
+            logger.warning(f'Lease {self.name} was lost by {self.owner} (token={self.token})')
+            self.token = None
+            return False
+        return True
+
+    def release(self) -> bool:
+        """자신이 가진 lease만 삭제합니다."""
+        if self.token is None:
+            return False
+        released = None
+        with self._service.client.connect() as conn:
+            released = conn.eval(_RELEASE_SCRIPT, 1, self.key, self.owner)
+        self.token = None
+        return bool(released)
+
+    def accept(self, token: int) -> bool:
+        """(받는 쪽) ``token``이 지금까지 받은 가장 큰 token 이상이면 기록하고 True, 더 오래된 token이면 False."""
+        accepted = done = None
+        with self._service.client.connect() as conn:
+            accepted = conn.eval(_ACCEPT_SCRIPT, 1, self.accepted_key, int(token))
+            done = True
+        if not done:
+            logger.warning(f'Cannot reach lease {self.name}, accept token={token}: {self.fail_open}')
+            return self.fail_open
+        if not accepted:
+            logger.warning(f'Lease {self.name} token={token} is older than an accepted token')
+            return False
+        return True
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *exc) -> None:
+        self.release()
@@ -0,0 +1,265 @@
+from datetime import datetime, time, timedelta, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional
+import json
+import logging
+
+from redis.exceptions import WatchError
+
+from .redis import RedisService
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    'MarketMoversStore',
+)
+
+KST = timezone(timedelta(hours=9))
+
+# 순위 구간의 종목 코드/score와 종목 요약을 한 번에 읽는다.
+_TOP_SCRIPT = """
+local members
+if ARGV[3] == '1' then
+    members = redis.call('zrevrange', KEYS[1], ARGV[1], ARGV[2], 'WITHSCORES')
+else
+    members = redis.call('zrange', KEYS[1], ARGV[1], ARGV[2], 'WITHSCORES')
+end
+if #members == 0 then
+    return {members, {}}
+end
+local codes = {}
+for i = 1, #members, 2 do
+    codes[#codes + 1] = members[i]
+end
+return {members, redis.call('hmget', KEYS[2], unpack(codes))}
+"""
+
+
+def _decode(value: Any) -> Any:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+def _number(value: Any) -> Optional[float]:
+    try:
+        return float(str(value).replace(',', ''))
+    except (TypeError, ValueError):
+        return None
+
+
+class MarketMoversStore:
+    """현재가 수집 시 등락률/거래량/거래대금 순위와 업종별 합계를 미리 계산해 둡니다.
+
+    - ``market:movers:{metric}`` (Sorted Set): 종목 코드 -> ``prdy_ctrt``/``acml_vol``/``acml_tr_pbmn``
+    - ``market:stocks`` (Hash): 종목 코드 -> 마지막으로 반영한 요약 JSON (이름, 업종, 현재가, 지표)
+    - ``market:sectors:{aggregate}`` (Hash): 업종(``bstp_kor_isnm``) -> 종목 수, 등락률 합계, 거래량, 거래대금,
+      상승/하락 종목 수. 종목의 직전 값과의 차이만 ``HINCRBYFLOAT``하므로 쓰기 비용은 갱신한 종목 수에 비례합니다.
+      직전 값은 ``market:stocks``를 ``WATCH``한 뒤 읽고 ``MULTI``로 쓰므로, 그 사이 다른 작업자가 갱신하면 다시 계산합니다.
+
+    상위/하위 종목(``top``)과 업종 heatmap(``sectors``)은 전체 종목을 읽지 않고 Redis 한 번 왕복으로 조회합니다.
+    업종이 없는 응답(멀티종목 시세 등)은 마지막으로 알려진 업종을 유지하고, 업종을 모르는 종목은 순위에만 반영합니다.
+    키는 다음 날 장 시작 전(``expire_time``)에 만료됩니다.
+
+    >>> store = MarketMoversStore(service)
+    >>> store.update(rows)                       # fetch_inquire_price / fetch_intstock_multprice 결과
+        30
+    >>> store.top('change_rate', count=10)       # 상승률 상위
+        [{'code': '005930', 'name': '삼성전자', 'sector': '전기·전자', 'change_rate': 3.1, ...}, ...]
+    >>> store.top('change_rate', count=10, ascending=True)   # 하락률 상위
+    >>> store.sectors()
+        [{'sector': '전기·전자', 'count': 12, 'change_rate': 1.25, 'advancers': 9, ...}, ...]
+    """
+    # 지표 이름 -> 현재가 응답 필드
+    METRICS = {
+        'change_rate': 'prdy_ctrt',
+        'volume': 'acml_vol',
+        'trading_value': 'acml_tr_pbmn',
+    }
+    SECTOR_AGGREGATES = ('count', 'change_rate_sum', 'volume', 'trading_value', 'advancers', 'decliners')
+    MOVERS_KEY_TEMPLATE = 'market:movers:{metric}'
+    STOCKS_KEY = 'market:stocks'
+    SECTORS_KEY_TEMPLATE = 'market:sectors:{aggregate}'
+    CODE_KEYS = ('mksc_shrn_iscd', 'stck_shrn_iscd', 'requested_fid_input_iscd')
+    NAME_KEYS = ('hts_kor_isnm', 'inter_kor_isnm')
+    SECTOR_KEY = 'bstp_kor_isnm'
+    # WATCH 충돌 시 다시 시도하는 횟수
+    MAX_RETRIES = 5
+
+    def __init__(self, service: RedisService, expire_time: time=time(8, 0)) -> None:
+        """
+        Args:
+            service (RedisService): 저장에 사용할 Redis 서비스
+            expire_time (time): 키 만료 시각 (다음 날, KST)
+        """
+        self._service = service
+        self._expire_time = expire_time
+
+    def movers_key(self, metric: str) -> str:
+        if metric not in self.METRICS:
+            raise ValueError(f'Unknown metric: {metric} (expected one of {sorted(self.METRICS)})')
+        return self.MOVERS_KEY_TEMPLATE.format(metric=metric)
+
+    def _sectors_key(self, aggregate: str) -> str:
+        return self.SECTORS_KEY_TEMPLATE.format(aggregate=aggregate)
+
+    def _expire_at(self, now: Optional[datetime]=None) -> int:
+        day = (now or datetime.now(KST)).astimezone(KST).date() + timedelta(days=1)
+        return int(datetime.combine(day, self._expire_time, tzinfo=KST).timestamp())
+
+    def _summaries(self, rows: Iterable[Mapping[str, Any]]) -> Dict[str, Dict[str, Any]]:
+        summaries: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            code = next((row[key] for key in self.CODE_KEYS if row.get(key)), None)
+            change_rate = _number(row.get(self.METRICS['change_rate']))
+            if not code or change_rate is None:
+                continue
+            summaries[code] = {
+                'code': code,
+                'name': next((row[key] for key in self.NAME_KEYS if row.get(key)), None),
+                'sector': row.get(self.SECTOR_KEY) or None,
+                'price': _number(row.get('stck_prpr')),
+                'change_rate': change_rate,
+                'volume': _number(row.get(self.METRICS['volume'])) or 0.0,
+                'trading_value': _number(row.get(self.METRICS['trading_value'])) or 0.0,
+            }
+        return summaries
+
+    @staticmethod
+    def _contribution(summary: Mapping[str, Any]) -> Dict[str, float]:
+        change_rate = summary['change_rate']
+        return {
+            'count': 1,
+            'change_rate_sum': change_rate,
+            'volume': summary['volume'],
+            'trading_value': summary['trading_value'],
+            'advancers': 1 if change_rate > 0 else 0,
+            'decliners': 1 if change_rate < 0 else 0,
+        }
+
+    def _deltas(
+        self,
+        summaries: Mapping[str, Dict[str, Any]],
+        previous: Mapping[str, Mapping[str, Any]],
+    ) -> Dict[tuple, float]:
+        """업종 합계: (업종, 항목) -> 이전 값을 빼고 새 값을 더한 차이. 빠진 이름/업종은 직전 값으로 채운다."""
+        deltas: Dict[tuple, float] = {}
+        for code, summary in summaries.items():
+            before = previous.get(code)
+            if before is not None and not summary['name']:
+                summary['name'] = before.get('name')
+            if before is not None and not summary['sector']:
+                summary['sector'] = before.get('sector')
+            if before is not None and before.get('sector'):
+                for aggregate, value in self._contribution(before).items():
+                    deltas[(before['sector'], aggregate)] = deltas.get((before['sector'], aggregate), 0) - value
+            if summary['sector']:
+                for aggregate, value in self._contribution(summary).items():
+                    deltas[(summary['sector'], aggregate)] = deltas.get((summary['sector'], aggregate), 0) + value
+        return deltas
+
+    def update(self, rows: Iterable[Mapping[str, Any]], now: Optional[datetime]=None) -> int:
+        """현재가 응답 행으로 순위와 업종 합계를 갱신하고, 반영한 종목 수를 반환합니다."""
+        received = self._summaries(rows)
+        if not received:
+            return 0
+        codes = list(received)
+        expire_at = self._expire_at(now)
+        updated = None
+        with self._service.client.connect() as conn:
+            for _ in range(self.MAX_RETRIES):
+                with conn.pipeline(transaction=True) as pipe:
+                    # 직전 값을 읽은 뒤 다른 작업자가 같은 Hash를 바꾸면 EXEC가 실패하고 다시 계산한다.
+                    pipe.watch(self.STOCKS_KEY)
+                    previous = {
+                        code: json.loads(_decode(raw))
+                        for code, raw in zip(codes, pipe.hmget(self.STOCKS_KEY, codes))
+                        if raw
+                    }
+                    summaries = {code: dict(summary) for code, summary in received.items()}
+                    deltas = self._deltas(summaries, previous)
+
+                    pipe.multi()
+                    for metric in self.METRICS:
+                        pipe.zadd(self.movers_key(metric), {code: summary[metric] for code, summary in summaries.items()})
+                        pipe.expireat(self.movers_key(metric), expire_at)
+                    pipe.hset(self.STOCKS_KEY, mapping={
+                        code: json.dumps(summary, ensure_ascii=False) for code, summary in summaries.items()
+                    })
+                    pipe.expireat(self.STOCKS_KEY, expire_at)
+                    for (sector, aggregate), value in deltas.items():
+                        if value:
+                            pipe.hincrbyfloat(self._sectors_key(aggregate), sector, value)
+                    for aggregate in self.SECTOR_AGGREGATES:
+                        pipe.expireat(self._sectors_key(aggregate), expire_at)
+                    try:
+                        pipe.execute()
+                    except WatchError:
+                        continue
+                    updated = len(summaries)
+                    break
+        if updated is None:
+            logger.warning(f'Market movers update for {len(codes)} codes gave up after {self.MAX_RETRIES} conflicts')
+            return 0
+        return updated
+
+    def unknown_sectors(self, codes: Iterable[str]) -> List[str]:
+        """오늘 업종이 반영되지 않은 종목 코드. (업종이 있는 종목별 현재가로 한 번 더 조회할 대상)"""
+        codes = list(codes)
+        if not codes:
+            return []
+        values = None
+        with self._service.client.connect() as conn:
+            values = conn.hmget(self.STOCKS_KEY, codes)
+        if values is None:
+            return []
+        return [code for code, raw in zip(codes, values) if not raw or not json.loads(_decode(raw)).get('sector')]
+
+    def top(self, metric: str='change_rate', count: int=10, ascending: bool=False) -> List[Dict[str, Any]]:
+        """``metric`` 기준 상위(``ascending``이면 하위) ``count``개 종목의 요약을 순위순으로 반환합니다."""
+        if count <= 0:
+            return []
+        result = None
+        with self._service.client.connect() as conn:
+            result = conn.eval(
+                _TOP_SCRIPT, 2, self.movers_key(metric), self.STOCKS_KEY,
+                0, count - 1, 0 if ascending else 1,
+            )
+        if not result:
+            return []
+        members, summaries = result
+        movers = []
+        for index, raw in enumerate(summaries):
+            code, score = _decode(members[2 * index]), _number(_decode(members[2 * index + 1]))
+            summary = json.loads(_decode(raw)) if raw else {'code': code}
+            summary[metric] = score
+            movers.append({'rank': index + 1, **summary})
+        return movers
+
+    def sectors(self, order_by: str='change_rate', ascending: bool=False) -> List[Dict[str, Any]]:
+        """업종별 종목 수, 평균 등락률(``change_rate``), 거래량/거래대금 합계, 상승/하락 종목 수를 반환합니다."""
+        values = None
+        with self._service.client.connect() as conn:
+            pipe = conn.pipeline(transaction=False)
+            for aggregate in self.SECTOR_AGGREGATES:
+                pipe.hgetall(self._sectors_key(aggregate))
+            values = pipe.execute()
+        if not values:
+            return []
+        by_aggregate = {
+            aggregate: {_decode(k): _number(_decode(v)) or 0.0 for k, v in (mapping or {}).items()}
+            for aggregate, mapping in zip(self.SECTOR_AGGREGATES, values)
+        }
+        sectors = []
+        for sector, count in by_aggregate['count'].items():
+            count = round(count)
+            if count <= 0:
+                continue
+            sectors.append({
+                'sector': sector,
+                'count': count,
+                'change_rate': round(by_aggregate['change_rate_sum'].get(sector, 0.0) / count, 2),
+                'volume': round(by_aggregate['volume'].get(sector, 0.0)),
+                'trading_value': round(by_aggregate['trading_value'].get(sector, 0.0)),
+                'advancers': round(by_aggregate['advancers'].get(sector, 0.0)),
+                'decliners': round(by_aggregate['decliners'].get(sector, 0.0)),
+            })
+        if sectors and order_by not in sectors[0]:
+            raise ValueError(f'Unknown sector field: {order_by}')
+        return sorted(sectors, key=lambda item: item[order_by], reverse=not ascending)
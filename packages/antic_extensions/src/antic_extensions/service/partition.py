@@ -0,0 +1,213 @@
+from typing import Iterable, Optional
+import bisect
+import logging
+import os
+import socket
+import time
+import zlib
+
+from .redis import RedisService
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    'WorkerPartitioner',
+)
+
+
+class WorkerPartitioner:
+    """살아 있는 worker 집합 위에서 종목 코드를 consistent hashing으로 나눠 맡깁니다.
+
+    worker는 ``claim`` 혹은 ``heartbeat``를 호출할 때마다 Sorted Set(``workers:{group}:heartbeats``)에 ``{worker_id: epoch 초}``로
+    heartbeat를 남기며, ``ttl``초 이상 heartbeat가 없는 worker는 목록에서 제외됩니다.
+    worker마다 가상 노드(``replicas``개)를 hash ring에 배치하므로, worker가 늘거나 줄어도 약 1/N 종목만 주인이 바뀝니다.
+
+    ``claim``은 입력 종목 중 자신이 맡은 종목과 다른 worker가 넘겨준 종목(``workers:{group}:{worker_id}:handoff``)을
+    반환하고, 나머지는 주인 worker의 inbox로 넘깁니다. inbox는 ``{종목 코드: 처음 넘긴 epoch 초}`` Sorted Set입니다.
+    넘겨받을 worker가 ``handoff_timeout``초 넘게 heartbeat를 남기지 않았으면 넘기지 않고 직접 처리하며,
+    다른 worker의 inbox에 ``handoff_timeout``초 넘게 남아 있는 종목은 가져와 처리합니다. (주인이 그 주기에 호출되지
+    않았거나 죽은 경우에도 ``ttl``까지 기다리지 않는다.) Redis를 사용할 수 없으면 입력 종목을 모두 반환합니다.
+    (중복 수집이 누락보다 낫다.)
+
+    >>> partitioner = WorkerPartitioner(service, 'kis_dispatch', worker_id='instance-a')
+    >>> partitioner.claim(['005930', '000660', '035720'])
+        ['005930', '035720']
+    >>> partitioner.partition(['005930', '000660', '035720'])
+        {'instance-a': ['005930', '035720'], 'instance-b': ['000660']}
+    """
+    HEARTBEAT_KEY_TEMPLATE = 'workers:{group}:heartbeats'
+    INBOX_KEY_TEMPLATE = 'workers:{group}:{worker}:handoff'
+
+    def __init__(
+        self,
+        service: RedisService,
+        group: str,
+        worker_id: Optional[str]=None,
+        ttl: int=600,
+        replicas: int=64,
+        handoff_timeout: Optional[int]=None,
+    ) -> None:
+        """
+        Args:
+            service (RedisService): heartbeat/inbox 저장에 사용할 Redis 서비스
+            group (str): 같은 종목 집합을 나눠 맡는 worker 그룹 이름
+            worker_id (str, optional): worker 식별자 (기본값: ``{hostname}:{pid}``)
+            ttl (int): heartbeat 유효 시간(초). 호출 주기보다 길어야 합니다.
+            replicas (int): worker당 hash ring 가상 노드 수
+            handoff_timeout (int, optional): 넘긴 종목을 주인이 가져가길 기다리는 시간(초). 호출 주기 정도로 둡니다.
+                (기본값: ``ttl``의 절반)
+        """
+        self._service = service
+        self.group = group
+        self.worker_id = worker_id or f'{socket.gethostname()}:{os.getpid()}'
+        self._ttl = ttl
+        self._replicas = max(1, replicas)
+        self._handoff_timeout = ttl // 2 if handoff_timeout is None else handoff_timeout
+        self._members: tuple[str, ...] = ()
+        self._ring_hashes: list[int] = []
+        self._ring_members: list[str] = []
+
+    @property
+    def members(self) -> tuple[str, ...]:
+        """마지막으로 확인한 살아 있는 worker 목록 (정렬)."""
+        return self._members
+
+    def _heartbeat_key(self) -> str:
+        return self.HEARTBEAT_KEY_TEMPLATE.format(group=self.group)
+
+    def _inbox_key(self, worker: str) -> str:
+        return self.INBOX_KEY_TEMPLATE.format(group=self.group, worker=worker)
+
+    def _set_members(self, members: Iterable[str]) -> None:
+        members = tuple(sorted(set(members)))
+        if members == self._members:
+            return
+        ring = sorted(
+            (zlib.crc32(f'{member}#{replica}'.encode()), member)
+            for member in members
+            for replica in range(self._replicas)
+        )
+        self._members = members
+        self._ring_hashes = [h for h, _ in ring]
+        self._ring_members = [member for _, member in ring]
+        logger.info(f'Worker group {self.group} members: {list(members)}')
+
+    @staticmethod
+    def _decode(value) -> str:
+        return value.decode() if isinstance(value, bytes) else str(value)
+
+    def refresh(self, now: Optional[float]=None) -> tuple[str, ...]:
+        """heartbeat를 남기지 않고 살아 있는 worker 목록만 갱신합니다. (분배만 하는 쪽에서 사용)"""
+        now = time.time() if now is None else now
+        values = None
+        with self._service.client.connect() as conn:
+            values = conn.zrangebyscore(self._heartbeat_key(), now - self._ttl, '+inf')
+        if values is None:
+            logger.warning(f'Cannot read worker group {self.group}, keep previous members')
+        else:
+            self._set_members(self._decode(v) for v in values)
+        return self._members
+
+    def heartbeat(self, now: Optional[float]=None) -> tuple[str, ...]:
+        """heartbeat를 남기고 살아 있는 worker 목록을 갱신합니다. (분배된 종목을 받은 그대로 처리하는 쪽에서 사용)"""
+        now = time.time() if now is None else now
+        key = self._heartbeat_key()
+        values = None
+        with self._service.client.connect() as conn:
+            pipe = conn.pipeline()
+            pipe.zadd(key, {self.worker_id: now})
+            pipe.zremrangebyscore(key, '-inf', now - self._ttl)
+            pipe.expire(key, self._ttl)
+            pipe.zrange(key, 0, -1)
+            values = pipe.execute()
+        if values is None:
+            logger.warning(f'Cannot reach worker group {self.group}, keep previous members')
+        else:
+            self._set_members(self._decode(v) for v in values[3])
+        return self._members
+
+    def owner(self, code: str) -> str:
+        """``code``를 맡은 worker. 확인된 worker가 없으면 자신."""
+        if not self._ring_hashes:
+            return self.worker_id
+        position = bisect.bisect(self._ring_hashes, zlib.crc32(code.encode()))
+        return self._ring_members[position % len(self._ring_members)]
+
+    def partition(self, codes: Iterable[str]) -> dict[str, list[str]]:
+        """worker별 담당 종목 (입력 순서 유지). ``refresh`` 혹은 ``claim`` 이후의 worker 목록을 사용합니다."""
+        result: dict[str, list[str]] = {}
+        for code in dict.fromkeys(codes):
+            result.setdefault(self.owner(code), []).append(code)
+        return result
+
+    def claim(self, codes: Iterable[str], now: Optional[float]=None) -> list[str]:
+        """heartbeat를 남기고, 자신이 처리할 종목(담당 종목 + inbox로 넘겨받은 종목)을 반환합니다."""
+        codes = list(dict.fromkeys(codes))
+        now = time.time() if now is None else now
+        key = self._heartbeat_key()
+        inbox = self._inbox_key(self.worker_id)
+        values = None
+        with self._service.client.connect() as conn:
+            pipe = conn.pipeline()
+            pipe.zadd(key, {self.worker_id: now})
+            pipe.zremrangebyscore(key, '-inf', now - self._ttl)
+            pipe.expire(key, self._ttl)
+            pipe.zrange(key, 0, -1, withscores=True)
+            pipe.zrange(inbox, 0, -1)
+            pipe.delete(inbox)
+            values = pipe.execute()
+        if values is None:
+            logger.warning(f'Cannot reach worker group {self.group}, claim every code')
+            return codes
+        heartbeats = {self._decode(member): float(score) for member, score in values[3]}
+        self._set_members(heartbeats)
+        received = [self._decode(v) for v in values[4]]
+        others = [worker for worker in heartbeats if worker != self.worker_id]
+        if others:
+            received += self._take_over(others, now)
+
+        shares = self.partition(codes)
+        claimed = shares.pop(self.worker_id, [])
+        for worker in others:
+            # 한 주기 넘게 호출되지 않은 worker에게는 넘기지 않는다.
+            if heartbeats[worker] < now - self._handoff_timeout:
+                claimed += shares.pop(worker, [])
+        if shares:
+            handed = False
+            with self._service.client.connect() as conn:
+                pipe = conn.pipeline(transaction=False)
+                for worker, handoff in shares.items():
+                    # 이미 넘긴 종목은 처음 넘긴 시각을 유지한다.
+                    pipe.zadd(self._inbox_key(worker), {code: now for code in handoff}, nx=True)
+                    pipe.expire(self._inbox_key(worker), self._ttl)
+                pipe.execute()
+                handed = True
+            if handed:
+                logger.info(f'Handed off {sum(map(len, shares.values()))} codes to {list(shares)}')
+            else:
+                # 넘기지 못한 종목은 직접 처리한다.
+                claimed += [code for handoff in shares.values() for code in handoff]
+        return list(dict.fromkeys(claimed + received))
+
+    def _take_over(self, workers: Iterable[str], now: float) -> list[str]:
+        """다른 worker의 inbox에서 ``handoff_timeout``초 넘게 가져가지 않은 종목을 가져옵니다."""
+        workers = list(workers)
+        deadline = now - self._handoff_timeout
+        values = None
+        with self._service.client.connect() as conn:
+            # 읽기와 삭제를 한 트랜잭션으로 실행하므로 주인/다른 worker와 같은 종목을 중복으로 가져가지 않는다.
+            pipe = conn.pipeline()
+            for worker in workers:
+                pipe.zrangebyscore(self._inbox_key(worker), '-inf', deadline)
+                pipe.zremrangebyscore(self._inbox_key(worker), '-inf', deadline)
+            values = pipe.execute()
+        if not values:
+            return []
+        taken = [self._decode(code) for found in values[::2] for code in found]
+        if taken:
+            logger.warning(f'Took over {len(taken)} codes not claimed within {self._handoff_timeout}s')
+        return taken
+
+    def leave(self) -> None:
+        """worker 목록에서 즉시 빠집니다. (종료 시)"""
+        with self._service.client.connect() as conn:
+            conn.zrem(self._heartbeat_key(), self.worker_id)
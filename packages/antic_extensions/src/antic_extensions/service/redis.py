@@ -151,7 +151,7 @@ class RedisService:
             }
             "
         """
-        if not isinstance(key, str) or (key and not isinstance(key, str)):
+        if not isinstance(name, str) or (key is not None and not isinstance(key, str)):
             raise TypeError(f"Invalid key or name type: {name}")
         try:
             with self.client.connect() as conn:
@@ -0,0 +1,267 @@
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Any, Iterable, Mapping, Optional, Union
+import json
+import logging
+
+import redis
+
+from .redis import RedisService
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    'IntradayTickStore',
+    'IndexTickStore',
+)
+
+KST = timezone(timedelta(hours=9))
+
+
+def _decode(value: Any) -> Any:
+    return value.decode('utf-8') if isinstance(value, bytes) else value
+
+
+class IntradayTickStore:
+    """당일 시간대별 체결(틱)을 종목별 Sorted Set에 시간순으로 누적합니다.
+
+    score는 ``YYYYMMDDHHMMSS`` 정수(체결 시각 ``stck_cntg_hour`` 기준)이며, 이미 저장된 마지막
+    시각 이후의 틱만 추가하므로 쓰기 비용은 새 틱 수에 비례합니다. 이전 거래일 틱은 쓰기 시 제거되고,
+    키는 다음 날 장 시작 전(``expire_time``)에 만료됩니다.
+
+    >>> store = IntradayTickStore(service)
+    >>> store.append('005930', rows)       # fetch_inquire_time_itemconclusion 결과
+        12
+    >>> store.range('005930', start='090000', end='100000')
+        [{'stck_cntg_hour': '090000', 'stck_prpr': '78000', ...}, ...]
+
+    과거 방향 backfill이 페이지 제한으로 중간에 멈추면, 이어서 조회할 커서와 멈출 시각을
+    ``{키}:backfill`` (Hash, ``YYYYMMDDHHMMSS`` 커서 -> ``stop_after``)에 남겨 다음 수집이 남은 구간을 채웁니다.
+
+    >>> store.set_backfill_cursor('005930', '093015', stop_after=None)     # 09:30:15부터 장 시작까지 남음
+    >>> store.backfill_cursors('005930')
+        {'093015': None}
+    """
+    KEY_TEMPLATE = 'stock:{code}:intraday_ticks'
+    TIME_KEY = 'stck_cntg_hour'
+    # 호출마다 달라지는 메타데이터는 저장하지 않는다. (틱 중복 판정에 영향을 주지 않도록)
+    VOLATILE_KEYS = frozenset({
+        'rt_cd', 'msg_cd', 'msg1', 'collected_at',
+        'requested_fid_input_hour_1', 'requested_fid_cond_mrkt_div_code',
+    })
+    # 지정하면 이 필드만 저장한다. (None이면 ``VOLATILE_KEYS`` 외 전체)
+    FIELDS: Optional[frozenset] = None
+
+    def __init__(
+        self,
+        service: RedisService,
+        max_length: int=10_000,
+        expire_time: time=time(8, 0),
+    ) -> None:
+        """
+        Args:
+            service (RedisService): 저장에 사용할 Redis 서비스
+            max_length (int): 종목별 최대 보관 틱 수. 초과분은 오래된 순으로 제거합니다.
+            expire_time (time): 키 만료 시각 (다음 날, KST)
+        """
+        self._service = service
+        self._max_length = max_length
+        self._expire_time = expire_time
+
+    def _key(self, code: str) -> str:
+        return self.KEY_TEMPLATE.format(code=code)
+
+    def _backfill_key(self, code: str) -> str:
+        return self._key(code) + ':backfill'
+
+    @staticmethod
+    def _trading_date(value: Union[date, datetime, str, None]) -> str:
+        if value is None:
+            return datetime.now(KST).strftime('%Y%m%d')
+        if isinstance(value, datetime):
+            return value.astimezone(KST).strftime('%Y%m%d')
+        if isinstance(value, date):
+            return value.strftime('%Y%m%d')
+        return str(value)
+
+    @staticmethod
+    def _score(trading_date: str, hour: Any) -> Optional[int]:
+        if not hour:
+            return None
+        hour = str(hour).zfill(6)
+        if len(hour) != 6 or not hour.isdigit():
+            return None
+        return int(trading_date + hour)
+
+    def _expire_at(self, trading_date: str) -> int:
+        day = datetime.strptime(trading_date, '%Y%m%d').date() + timedelta(days=1)
+        return int(datetime.combine(day, self._expire_time, tzinfo=KST).timestamp())
+
+    def append(
+        self,
+        code: str,
+        rows: Iterable[Mapping[str, Any]],
+        trading_date: Union[date, datetime, str, None]=None,
+        only_newer: bool=True,
+    ) -> int:
+        """마지막으로 저장된 체결 시각 이후의 틱만 추가하고, 추가한 틱 수를 반환합니다.
+
+        ``only_newer=False``이면 저장된 마지막 시각과 비교하지 않고 없는 시각만 추가합니다.
+        (과거 방향으로 페이지를 받아오는 backfill 용도, 같은 시각은 한 번만 저장)
+        """
+        trading_date = self._trading_date(trading_date)
+        by_score: dict[int, str] = {}
+        for row in rows:
+            score = self._score(trading_date, row.get(self.TIME_KEY))
+            if score is None or score in by_score:
+                continue
+            tick = {
+                k: v for k, v in row.items()
+                if k not in self.VOLATILE_KEYS and (self.FIELDS is None or k in self.FIELDS)
+            }
+            by_score[score] = json.dumps(tick, default=str, sort_keys=True, ensure_ascii=False)
+        if not by_score:
+            return 0
+
+        key = self._key(code)
+        added = 0
+        with self._service.client.connect() as conn:
+            try:
+                if only_newer:
+                    last = conn.zrange(key, -1, -1, withscores=True)
+                    last_score = int(last[0][1]) if last else -1
+                    new = {member: score for score, member in by_score.items() if score > last_score}
+                else:
+                    pipe = conn.pipeline(transaction=False)
+                    for score in by_score:
+                        pipe.zcount(key, score, score)
+                    counts = pipe.execute()
+                    new = {
+                        member: score
+                        for (score, member), count in zip(by_score.items(), counts)
+                        if not count
+                    }
+            except redis.ResponseError:
+                # 이전 형식(JSON 문자열) 키가 남아 있으면 교체한다.
+                logger.info(f'Replace legacy intraday tick key: {key}')
+                conn.delete(key)
+                new = {member: score for score, member in by_score.items()}
+            pipe = conn.pipeline(transaction=False)
+            # 이전 거래일 틱 제거
+            pipe.zremrangebyscore(key, '-inf', f'({trading_date}000000')
+            if new:
+                pipe.zadd(key, new, nx=True)
+            pipe.zremrangebyrank(key, 0, -(self._max_length + 1))
+            pipe.expireat(key, self._expire_at(trading_date))
+            pipe.execute()
+            added = len(new)
+        return added
+
+    def last_hour(
+        self,
+        code: str,
+        trading_date: Union[date, datetime, str, None]=None,
+    ) -> Optional[str]:
+        """해당 거래일에 저장된 마지막 체결 시각(``HHMMSS``). 없으면 None."""
+        trading_date = self._trading_date(trading_date)
+        last = None
+        with self._service.client.connect() as conn:
+            last = conn.zrange(self._key(code), -1, -1, withscores=True)
+        if not last:
+            return None
+        score = str(int(last[0][1]))
+        if not score.startswith(trading_date):
+            return None
+        return score[-6:]
+
+    def backfill_cursors(
+        self,
+        code: str,
+        trading_date: Union[date, datetime, str, None]=None,
+    ) -> dict[str, Optional[str]]:
+        """해당 거래일에 채우지 못한 구간: 이어서 조회할 커서(``HHMMSS``) -> ``stop_after`` (장 시작까지면 None). 최근 구간부터."""
+        trading_date = self._trading_date(trading_date)
+        values = None
+        with self._service.client.connect() as conn:
+            values = conn.hgetall(self._backfill_key(code))
+        cursors = {
+            _decode(field)[-6:]: _decode(value) or None
+            for field, value in (values or {}).items()
+            if _decode(field).startswith(trading_date)
+        }
+        return dict(sorted(cursors.items(), reverse=True))
+
+    def set_backfill_cursor(
+        self,
+        code: str,
+        cursor: Optional[str],
+        stop_after: Optional[str]=None,
+        trading_date: Union[date, datetime, str, None]=None,
+        previous: Optional[str]=None,
+    ) -> None:
+        """``previous`` 커서를 지우고, ``cursor``가 있으면 ``cursor``부터 ``stop_after``(None이면 장 시작)까지를 남은 구간으로 기록합니다."""
+        if cursor is None and previous is None:
+            return
+        trading_date = self._trading_date(trading_date)
+        key = self._backfill_key(code)
+        with self._service.client.connect() as conn:
+            pipe = conn.pipeline(transaction=True)
+            if previous is not None and previous != cursor:
+                pipe.hdel(key, trading_date + previous)
+            if cursor is not None:
+                pipe.hset(key, trading_date + cursor, stop_after or '')
+                pipe.expireat(key, self._expire_at(trading_date))
+            pipe.execute()
+
+    def range(
+        self,
+        code: str,
+        start: Optional[str]=None,
+        end: Optional[str]=None,
+        trading_date: Union[date, datetime, str, None]=None,
+        limit: Optional[int]=None,
+    ) -> list[dict[str, Any]]:
+        """체결 시각(``HHMMSS``) 구간 ``[start, end]``의 틱을 시간순으로 반환합니다.
+
+        Args:
+            code (str): 종목 코드
+            start (str, optional): 시작 시각 (기본값: 000000)
+            end (str, optional): 종료 시각 (기본값: 235959)
+            trading_date (optional): 거래일 (기본값: 오늘, KST)
+            limit (int, optional): 최대 반환 개수 (시작 시각부터)
+        """
+        trading_date = self._trading_date(trading_date)
+        low = self._score(trading_date, start or '000000')
+        high = self._score(trading_date, end or '235959')
+        if low is None or high is None:
+            raise ValueError(f'Invalid time range: {start}~{end}')
+        members = None
+        with self._service.client.connect() as conn:
+            if limit:
+                members = conn.zrangebyscore(self._key(code), low, high, start=0, num=limit)
+            else:
+                members = conn.zrangebyscore(self._key(code), low, high)
+        return [json.loads(m) for m in members or ()]
+
+    def latest(self, code: str, count: int=30) -> list[dict[str, Any]]:
+        """가장 최근 ``count``개의 틱을 시간순으로 반환합니다."""
+        members = None
+        with self._service.client.connect() as conn:
+            members = conn.zrange(self._key(code), -count, -1)
+        return [json.loads(m) for m in members or ()]
+
+
+class IndexTickStore(IntradayTickStore):
+    """업종/지수 시간별(초) 지수(``fetch_inquire_index_tickprice``)를 지수별 Sorted Set에 누적합니다.
+
+    ``IntradayTickStore``와 같은 방식(score ``YYYYMMDDHHMMSS``, 새 틱만 추가, 다음 날 만료)이며, 수백 개 지수를
+    보관하므로 시각/지수/등락/거래량 필드만 저장합니다.
+
+    >>> store = IndexTickStore(service)
+    >>> store.append('0001', fetch_inquire_index_tickprice(client, '0001'))
+    >>> store.range('0001', start='090000', end='093000')
+        [{'stck_cntg_hour': '090000', 'bstp_nmix_prpr': '2650.12', ...}, ...]
+    """
+    KEY_TEMPLATE = 'index:{code}:ticks'
+    FIELDS = frozenset({
+        'stck_cntg_hour', 'bstp_nmix_prpr', 'bstp_nmix_prdy_vrss', 'prdy_vrss_sign',
+        'bstp_nmix_prdy_ctrt', 'cntg_vol', 'acml_vol',
+    })
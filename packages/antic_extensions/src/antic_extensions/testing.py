@@ -0,0 +1,115 @@
+"""테스트/로컬 harness용 Redis 서버.
+
+``LocalRedisServer``는 ``redis-server`` 프로세스를 빈 포트에 띄우고 종료 시 정리합니다.
+실행 파일은 ``PATH``의 ``redis-server``를 우선 사용하고, 없으면 ``redislite``에 포함된 실행 파일을 사용합니다.
+
+```python
+with LocalRedisServer() as server:
+    service = RedisService(client=server.client())
+    service.set('key', 'value')
+```
+"""
+from typing import Optional
+import logging
+import shutil
+import socket
+import subprocess
+import tempfile
+import time
+
+from .modules.database import RedisClient
+logger = logging.getLogger(__name__)
+
+__all__ = (
+    'LocalRedisServer',
+)
+
+
+class LocalRedisServer:
+    """임시 디렉터리와 빈 포트에서 실행하는 ``redis-server`` (영속화 없음)."""
+
+    def __init__(self, password: str='localtest', executable: Optional[str]=None, startup_timeout: float=5.0) -> None:
+        """
+        Args:
+            password (str): ``requirepass`` 암호
+            executable (str, optional): ``redis-server`` 경로 (기본값: ``find_executable()``)
+            startup_timeout (float): 서버가 연결을 받을 때까지 기다리는 시간(초)
+        """
+        self.host = '127.0.0.1'
+        self.port: Optional[int] = None
+        self.password = password
+        self._executable = executable or self.find_executable()
+        self._startup_timeout = startup_timeout
+        self._process: Optional[subprocess.Popen] = None
+        self._workdir: Optional[tempfile.TemporaryDirectory] = None
+
+    @staticmethod
+    def find_executable() -> Optional[str]:
+        """``redis-server`` 실행 파일 경로. 찾지 못하면 None."""
+        path = shutil.which('redis-server')
+        if path:
+            return path
+        try:
+            import redislite
+        except ImportError:
+            return None
+        return getattr(redislite, '__redis_executable__', None)
+
+    @staticmethod
+    def _free_port() -> int:
+        with socket.socket() as sock:
+            sock.bind(('127.0.0.1', 0))
+            return sock.getsockname()[1]
+
+    def start(self) -> 'LocalRedisServer':
+        if self._executable is None:
+            raise RuntimeError('redis-server executable not found (install redis-server or redislite)')
+        self._workdir = tempfile.TemporaryDirectory(prefix='antic-redis-')
+        self.port = self._free_port()
+        self._process = subprocess.Popen(
+            [
+                self._executable,
+                '--port', str(self.port),
+                '--bind', self.host,
+                '--requirepass', self.password,
+                '--dir', self._workdir.name,
+                '--save', '',
+                '--appendonly', 'no',
+            ],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        deadline = time.monotonic() + self._startup_timeout
+        while True:
+            try:
+                socket.create_connection((self.host, self.port), timeout=0.1).close()
+                break
+            except OSError:
+                if self._process.poll() is not None or time.monotonic() > deadline:
+                    self.stop()
+                    raise RuntimeError(f'redis-server did not start on {self.host}:{self.port}')
+                time.sleep(0.02)
+        logger.info(f'Local redis-server started: {self.host}:{self.port}')
+        return self
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            try:
+                self._process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                self._process.kill()
+            self._process = None
+        if self._workdir is not None:
+            self._workdir.cleanup()
+            self._workdir = None
+
+    def client(self) -> RedisClient:
+        """이 서버에 연결한 ``RedisClient``."""
+        return RedisClient(self.host, self.port, self.password, 0, ssl=False)
+
+    def __enter__(self) -> 'LocalRedisServer':
+        return self.start()
+
+    def __exit__(self, *exc) -> None:
+        self.stop()
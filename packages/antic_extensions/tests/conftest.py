@@ -0,0 +1,86 @@
+import pytest
+from redis.connection import Connection
+
+from antic_extensions.modules.database.redis import _InstrumentedPipeline
+from antic_extensions.service import RedisService
+from antic_extensions.testing import LocalRedisServer
+
+
+@pytest.fixture(scope='session')
+def redis_server():
+    if LocalRedisServer.find_executable() is None:
+        pytest.skip('redis-server (or redislite) is not installed')
+    with LocalRedisServer() as server:
+        yield server
+
+
+@pytest.fixture
+def redis_client(redis_server):
+    """빈 DB에 연결한 ``RedisClient`` (응답은 bytes)."""
+    client = redis_server.client()
+    with client.connect() as conn:
+        conn.flushdb()
+    yield client
+    client.close()
+
+
+@pytest.fixture
+def redis_service(redis_client):
+    return RedisService(client=redis_client)
+
+
+@pytest.fixture
+def writes(redis_client):
+    """서버가 기록한 변경 수(``rdb_changes_since_last_save``)를 반환하는 함수. 저장을 끈 서버라 누적된다."""
+    def count():
+        with redis_client.connect() as conn:
+            return int(conn.info('persistence')['rdb_changes_since_last_save'])
+    return count
+
+
+class _RoundTrips:
+    """보낸 요청 수. 명령 하나와 pipeline 실행 하나가 각각 한 번이다."""
+
+    def __init__(self):
+        self.count = 0
+
+    def reset(self):
+        self.count = 0
+
+
+@pytest.fixture
+def round_trips(redis_client, monkeypatch):
+    counter = _RoundTrips()
+    send = Connection.send_packed_command
+
+    def counted(self, command, check_health=True):
+        counter.count += 1
+        return send(self, command, check_health)
+    monkeypatch.setattr(Connection, 'send_packed_command', counted)
+    return counter
+
+
+@pytest.fixture
+def before_exec(monkeypatch):
+    """다음 ``WATCH`` 트랜잭션의 EXEC 직전에 한 번 실행할 함수를 등록한다. (다른 작업자의 동시 쓰기)
+
+    등록한 함수는 다른 연결을 사용하므로, WATCH한 key를 바꾸면 서버가 실제로 트랜잭션을 취소한다.
+    반환값의 ``pending``은 아직 실행되지 않았으면 True.
+    """
+    class Hook:
+        pending = False
+        fn = None
+
+        def __call__(self, fn):
+            self.fn, self.pending = fn, True
+
+    hook = Hook()
+    execute = _InstrumentedPipeline.execute
+
+    def patched(self, raise_on_error=True):
+        if hook.pending and self.watching:
+            hook.pending = False
+            hook.fn()
+        return execute(self, raise_on_error)
+    monkeypatch.setattr(_InstrumentedPipeline, 'execute', patched)
+    return hook
@@ -0,0 +1,55 @@
+import pytest
+from datetime import date
+pytest.importorskip('pyarrow')
+
+
+def _chart_rows(code, days):
+    return [
+        {
+            'requested_fid_input_iscd': code,
+            'requested_fid_period_div_code': 'D',
+            'stck_bsop_date': f'202501{d:02d}',
+            'stck_oprc': '57400', 'stck_hgpr': '58900',
+            'stck_lwpr': '57000', 'stck_clpr': str(58000 + d),
+            'acml_vol': '12345678', 'acml_tr_pbmn': '712345678900',
+            'prdy_vrss': '-100', 'prdy_vrss_sign': '5', 'prtt_rate': '0.00',
+            'mod_yn': 'N', 'collected_at': '2025-03-19T14:05:00+09:00',
+        }
+        for d in days
+    ]
+
+
+def test_daily_chartprice_round_trip_with_pushdown(tmp_path):
+    from src.antic_extensions.modules.columnar import daily_chartprice_dataset
+
+    dataset = daily_chartprice_dataset(str(tmp_path))
+    written = dataset.write(
+        _chart_rows('005930', range(1, 11)) + _chart_rows('000660', range(1, 4))
+    )
+    assert written == 13
+    assert (tmp_path / 'fid_input_iscd=005930').is_dir()
+
+    table = dataset.read(
+        columns=['stck_bsop_date', 'stck_clpr'],
+        filters=[
+            ('fid_input_iscd', '=', '005930'),
+            ('stck_bsop_date', '>=', date(2025, 1, 8)),
+        ],
+    )
+    assert table.column_names == ['stck_bsop_date', 'stck_clpr']
+    assert table.column('stck_clpr').to_pylist() == [58008, 58009, 58010]
+
+
+def test_news_dataset_parses_pubdate(tmp_path):
+    from src.antic_extensions.modules.columnar import news_dataset
+
+    dataset = news_dataset(str(tmp_path))
+    dataset.write([{
+        'fid_input_iscd': '005930',
+        'link': 'https://n.news.naver.com/a',
+        'originallink': 'https://press.example.com/a',
+        'title': '제목', 'content': '본문',
+        'pubDate': 'Tue, 11 Nov 2025 07:00:00 +0900',
+    }])
+    row = dataset.read(columns=['pub_date']).to_pylist()[0]
+    assert int(row['pub_date'].timestamp()) == 1762812000
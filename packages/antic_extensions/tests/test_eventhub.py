@@ -0,0 +1,26 @@
+import json
+
+from antic_extensions.modules.eventhub import decode_event_payload, encode_event_batches
+
+
+def _rows(n):
+    return [{'stck_bsop_date': f'2025{i:04d}', 'stck_clpr': '58000', 'requested_fid_input_iscd': '005930'}
+            for i in range(n)]
+
+
+def test_encode_event_batches_respects_max_bytes():
+    rows = _rows(100)
+    batches = encode_event_batches(rows, max_bytes=1024)
+    assert len(batches) > 1
+    assert all(len(b.encode('utf-8')) <= 1024 for b in batches)
+    assert [r for b in batches for r in json.loads(b)] == rows
+
+
+def test_gzip_batches_roundtrip_and_shrink():
+    rows = _rows(500)
+    plain = encode_event_batches(rows)
+    compressed = encode_event_batches(rows, compression='gzip')
+    assert json.loads(compressed[0])['content_encoding'] == 'gzip'
+    assert len(compressed[0]) < len(plain[0])
+    assert decode_event_payload(compressed[0].encode('utf-8')) == rows
+    assert decode_event_payload(plain[0]) == rows
@@ -0,0 +1,70 @@
+from datetime import timedelta
+
+from antic_extensions.service import InvestorFlowStore
+
+
+def _rows(code, values):
+    """``values``: 영업일 -> 외국인 순매수 거래대금. 개인은 그 반대, 기관은 0으로 둔다."""
+    return [
+        {'requested_fid_input_iscd': code, 'stck_bsop_date': day,
+         'frgn_ntby_qty': str(value * 10), 'frgn_ntby_tr_pbmn': str(value),
+         'prsn_ntby_qty': str(-value * 10), 'prsn_ntby_tr_pbmn': str(-value),
+         'orgn_ntby_qty': '0', 'orgn_ntby_tr_pbmn': '0'}
+        for day, value in values.items()
+    ]
+
+
+def test_rolling_net_buy_sums_update_incrementally(redis_client, redis_service, writes):
+    store = InvestorFlowStore(redis_service, windows=(2, 3))
+    assert store.update(
+        _rows('A', {'20261014': 1, '20261013': 2, '20261012': 4, '20261009': 8})
+        + _rows('B', {'20261014': -5})
+    ) == 2
+    flows = store.get('A')
+    assert (flows['as_of'], flows['days']) == ('20261014', 3)     # 가장 긴 기간만큼만 보관
+    assert flows['flows']['foreign'] == {'2': {'qty': 30.0, 'value': 3.0}, '3': {'qty': 70.0, 'value': 7.0}}
+    assert flows['flows']['personal']['3']['value'] == -7.0
+
+    # 같은 이력은 쓰기가 없다.
+    before = writes()
+    assert store.update(_rows('A', {'20261014': 1, '20261013': 2})) == 0
+    assert writes() == before
+
+    # 다음 영업일이 들어오고 당일 값이 정정되면, 기간에서 밀려난 날을 빼고 새 날을 더한다.
+    assert store.update(_rows('A', {'20261015': 16, '20261014': 3})) == 1
+    assert store.get('A')['flows']['foreign']['2']['value'] == 19.0            # 16 + 3
+    assert store.get('A')['flows']['foreign']['3']['value'] == 21.0            # 16 + 3 + 2
+    assert [row['stck_bsop_date'] for row in store.history('A')] == ['20261015', '20261014', '20261013']
+
+    assert [(m['rank'], m['code'], m['value'], m['as_of']) for m in store.top('foreign', window=3)] == [
+        (1, 'A', 21.0, '20261015'), (2, 'B', -5.0, '20261014'),
+    ]
+    assert store.top('foreign', window=3, count=1, ascending=True)[0]['code'] == 'B'
+
+    # 합계가 사라지면 보관된 이력 전체로 다시 계산한다.
+    with redis_client.connect() as conn:
+        conn.delete('stock:A:investor_flow')
+    assert store.update(_rows('A', {'20261015': 16})) == 1
+    assert store.get('A')['flows']['foreign']['3']['value'] == 21.0
+
+
+def test_concurrent_update_retries_on_the_latest_history(redis_service, before_exec):
+    store = InvestorFlowStore(redis_service, windows=(2, 3))
+    store.update(_rows('A', {'20261013': 2, '20261012': 4}))
+
+    # 읽은 뒤 EXEC 전에 다른 작업자가 같은 종목을 갱신하면 다시 읽어 계산한다.
+    before_exec(lambda: store.update(_rows('A', {'20261014': 1})))
+    assert store.update(_rows('A', {'20261015': 16})) == 1
+    assert not before_exec.pending
+    assert store.get('A')['flows']['foreign']['3']['value'] == 19.0            # 16 + 1 + 2
+    assert store.get('A')['days'] == 3
+
+
+def test_ranking_drops_codes_older_than_ttl(redis_service):
+    store = InvestorFlowStore(redis_service, windows=(2,), ttl=timedelta(days=30))
+    store.update(_rows('A', {'20260901': 5}) + _rows('B', {'20261001': 3}))
+    assert [m['code'] for m in store.top('foreign', window=2)] == ['A', 'B']
+
+    # B의 기준일(20261001)은 남고, 30일보다 오래된 A는 순위와 기준일에서 빠진다.
+    store.update(_rows('C', {'20261016': 1}))
+    assert [(m['code'], m['as_of']) for m in store.top('foreign', window=2)] == [('B', '20261001'), ('C', '20261016')]
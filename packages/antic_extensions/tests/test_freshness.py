@@ -0,0 +1,18 @@
+from antic_extensions.service import FreshnessRegistry
+
+
+def test_freshness_registry_returns_only_stale_types(redis_service):
+    registry = FreshnessRegistry(
+        redis_service,
+        budgets={'current_price': 60, 'daily_chartprice': 3600},
+    )
+    registry.mark('current_price', ['005930', '000660'], at=1000)
+    registry.mark('daily_chartprice', ['005930'], at=1000)
+
+    stale = registry.stale_types(['005930', '000660', '035720'], now=1030)
+    assert stale == {
+        '005930': [],
+        '000660': ['daily_chartprice'],
+        '035720': ['current_price', 'daily_chartprice'],
+    }
+    assert registry.stale_types(['005930'], now=1060)['005930'] == ['current_price']
@@ -0,0 +1,60 @@
+from contextlib import contextmanager
+import time
+
+from antic_extensions.service import RedisLease, RedisService
+
+
+def test_lease_is_exclusive_until_expiry_and_fenced(redis_client, redis_service):
+    service = redis_service
+    a = RedisLease(service, 'kis_volume_rank_collect', ttl_ms=300, owner='a')
+    b = RedisLease(service, 'kis_volume_rank_collect', ttl_ms=300, owner='b')
+
+    assert a.acquire() and a.token == 1
+    assert not b.acquire() and b.token is None
+
+    time.sleep(0.2)
+    with redis_client.connect() as conn:
+        remaining = conn.pttl('lease:kis_volume_rank_collect')
+    assert a.renew()                    # 다시 300ms
+    with redis_client.connect() as conn:
+        renewed = conn.pttl('lease:kis_volume_rank_collect') > remaining
+    assert renewed
+    assert not b.acquire()
+
+    time.sleep(0.35)
+    assert b.acquire() and b.token == 2
+    assert not a.renew() and a.token is None     # 만료 후 늦게 끝난 작업은 소유권을 잃는다
+    assert not a.release()
+    with redis_client.connect() as conn:
+        owner = conn.get('lease:kis_volume_rank_collect')
+    assert owner == b'b'
+
+    # 받는 쪽은 가장 큰 token보다 오래된 결과(만료 후 늦게 발행된 a의 결과)를 버린다.
+    consumer = RedisLease(service, 'kis_volume_rank_collect', ttl_ms=1000)
+    assert consumer.accept(2) and consumer.accept(2)
+    assert not consumer.accept(1)
+
+
+def test_lease_context_manager_releases(redis_service):
+    service = redis_service
+    with RedisLease(service, 'daily_migration', ttl_ms=1000, owner='a') as acquired:
+        assert acquired
+        assert not RedisLease(service, 'daily_migration', ttl_ms=1000, owner='b').acquire()
+    assert RedisLease(service, 'daily_migration', ttl_ms=1000, owner='b').acquire()
+
+
+class _UnreachableRedisClient:
+    @contextmanager
+    def connect(self):
+        try:
+            yield None              # RedisClient.connect처럼 연결 오류를 기록만 하고 삼킨다.
+        except Exception:
+            pass
+
+
+def test_lease_fail_open_when_redis_is_unreachable():
+    service = RedisService(client=_UnreachableRedisClient())   # type: ignore
+    assert not RedisLease(service, 'kis_volume_rank_collect', ttl_ms=1000).acquire()
+    lease = RedisLease(service, 'kis_volume_rank_collect', ttl_ms=1000, fail_open=True)
+    assert lease.acquire() and lease.renew()
+    assert lease.accept(1)
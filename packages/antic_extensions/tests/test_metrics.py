@@ -0,0 +1,116 @@
+import pytest
+
+from antic_extensions.modules.metrics import (
+    InMemoryMetrics,
+    Metrics,
+    OpenTelemetryMetrics,
+    PrometheusMetrics,
+    get_metrics,
+    set_metrics,
+)
+
+
+def test_timer_records_outcome_and_percentiles():
+    metrics = InMemoryMetrics()
+    for _ in range(9):
+        with metrics.timer('kis_request_seconds', tr_id='FHKST01010100'):
+            pass
+    with pytest.raises(RuntimeError):
+        with metrics.timer('kis_request_seconds', tr_id='FHKST01010100'):
+            raise RuntimeError('boom')
+
+    snapshot = {
+        s['labels']['outcome']: s for s in metrics.snapshot()['histograms']['kis_request_seconds']
+    }
+    assert snapshot['ok']['count'] == 9 and snapshot['error']['count'] == 1
+    assert metrics.percentile('kis_request_seconds', 0.5, tr_id='FHKST01010100') is not None
+    assert metrics.percentile('kis_request_seconds', 0.5, tr_id='other') is None
+
+
+def test_counter_sums_unspecified_labels():
+    metrics = InMemoryMetrics()
+    metrics.inc('redis_cache_lookups_total', command='GET', result='hit')
+    metrics.inc('redis_cache_lookups_total', command='GET', result='miss')
+    metrics.inc('redis_cache_lookups_total', command='HGETALL', result='hit')
+    assert metrics.counter('redis_cache_lookups_total', result='hit') == 2
+    assert metrics.counter('redis_cache_lookups_total') == 3
+
+
+def test_set_metrics_swaps_backend_behind_shared_proxy():
+    proxy = get_metrics()
+    metrics = InMemoryMetrics()
+    set_metrics(metrics)
+    try:
+        proxy.inc('kis_responses_total', tr_id='tokenP', status=200)
+    finally:
+        set_metrics(None)
+    proxy.inc('kis_responses_total', tr_id='tokenP', status=200)
+    assert metrics.counter('kis_responses_total') == 1
+    assert isinstance(proxy.target, Metrics) and not isinstance(proxy.target, InMemoryMetrics)
+
+
+def test_prometheus_render_and_label_mismatch():
+    pytest.importorskip('prometheus_client')
+    metrics = PrometheusMetrics()
+    with metrics.timer('sql_transaction_seconds', statement='stock_history_upsert'):
+        pass
+    metrics.inc('redis_cache_lookups_total', command='GET', result='miss')
+    metrics.inc('redis_cache_lookups_total', command='GET')     # 라벨 키 불일치는 기록하지 않음
+
+    body, content_type = metrics.render()
+    text = body.decode()
+    assert content_type.startswith('text/plain')
+    assert 'sql_transaction_seconds_count{outcome="ok",statement="stock_history_upsert"} 1.0' in text
+    assert 'redis_cache_lookups_total{command="GET",result="miss"} 1.0' in text
+
+
+class _RecordingMeter:
+    """SDK 없이 ``Meter``에 전달된 계측 값을 기록한다."""
+
+    def __init__(self):
+        self.created = []
+        self.points = []
+
+    def _instrument(self, kind, name, **kwargs):
+        self.created.append((kind, name, kwargs))
+        meter = self
+
+        class _Instrument:
+            def add(self, value, attributes=None):
+                meter.points.append((name, value, attributes))
+
+            record = add
+        return _Instrument()
+
+    def create_counter(self, name, **kwargs):
+        return self._instrument('counter', name, **kwargs)
+
+    def create_histogram(self, name, **kwargs):
+        return self._instrument('histogram', name, **kwargs)
+
+
+def test_opentelemetry_metrics_records_through_meter():
+    meter = _RecordingMeter()
+    metrics = OpenTelemetryMetrics(meter=meter)
+    for _ in range(2):
+        with metrics.timer('kis_request_seconds', tr_id='FHKST01010100'):
+            pass
+    metrics.inc('redis_cache_lookups_total', command='GET', result='hit')
+
+    assert [(kind, name) for kind, name, _ in meter.created] == [
+        ('histogram', 'kis_request_seconds'), ('counter', 'redis_cache_lookups_total'),
+    ]
+    assert meter.created[0][2]['unit'] == 's'
+    assert [(name, attributes) for name, _, attributes in meter.points] == [
+        ('kis_request_seconds', {'tr_id': 'FHKST01010100', 'outcome': 'ok'}),
+        ('kis_request_seconds', {'tr_id': 'FHKST01010100', 'outcome': 'ok'}),
+        ('redis_cache_lookups_total', {'command': 'GET', 'result': 'hit'}),
+    ]
+
+
+def test_opentelemetry_metrics_default_meter_is_a_noop_without_sdk():
+    pytest.importorskip('opentelemetry')
+    metrics = OpenTelemetryMetrics()
+    metrics.inc('kis_responses_total', tr_id='tokenP', status=200)
+    with metrics.timer('sql_transaction_seconds', statement='stock_history_upsert'):
+        pass
@@ -0,0 +1,45 @@
+from contextlib import contextmanager
+
+from antic_extensions.modules.database import (
+    STOCK_HISTORY_MIGRATIONS,
+    migrate_investor_trade,
+    migrate_stock_history,
+)
+
+
+class _RecordingClient:
+    """실행된 SQL을 기록하고, 적용 이력 조회에는 ``applied`` 버전만 있다고 응답한다."""
+    def __init__(self, applied=()):
+        self.applied = set(applied)
+        self.statements = []
+        self._last = None
+
+    @contextmanager
+    def cursor(self):
+        yield self
+
+    def execute(self, sql, params=None):
+        self.statements.append(sql)
+        self._last = params
+        if 'INSERT INTO public.antic_schema_migrations' in sql:
+            self.applied.add(params[1])
+
+    def fetchone(self):
+        return (1,) if self._last and self._last[-1] in self.applied else None
+
+
+def test_migrate_stock_history_applies_only_pending_versions():
+    client = _RecordingClient(applied={1})
+    assert migrate_stock_history(client, 'anticsignal.stock_history') == [2]   # type: ignore[arg-type]
+    ddl = [s for s in client.statements if 'ALTER TABLE anticsignal.stock_history' in s]
+    assert len(ddl) == 1 and 'stock_history_code_date_idx' in ddl[0]
+
+    assert migrate_stock_history(client, 'anticsignal.stock_history') == []   # type: ignore[arg-type]
+    assert [m.version for m in STOCK_HISTORY_MIGRATIONS] == [1, 2]
+
+
+def test_migrate_investor_trade_creates_table_once():
+    client = _RecordingClient()
+    assert migrate_investor_trade(client, 'anticsignal.stock_investor_trade') == [1]   # type: ignore[arg-type]
+    assert any('stock_investor_trade_date_idx' in s for s in client.statements)
+    assert migrate_investor_trade(client, 'anticsignal.stock_investor_trade') == []   # type: ignore[arg-type]
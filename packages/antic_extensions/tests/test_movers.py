@@ -0,0 +1,54 @@
+from antic_extensions.service import MarketMoversStore
+
+
+def _row(code, sector, rate, volume):
+    return {
+        'stck_shrn_iscd': code, 'bstp_kor_isnm': sector, 'stck_prpr': '10000',
+        'prdy_ctrt': str(rate), 'acml_vol': str(volume), 'acml_tr_pbmn': str(volume * 10000),
+    }
+
+
+def test_movers_and_sector_aggregates_update_incrementally(redis_service, round_trips):
+    store = MarketMoversStore(redis_service)
+    assert store.update([
+        _row('A', '전기·전자', 3.0, 100), _row('B', '전기·전자', -1.0, 300), _row('C', '화학', 1.5, 200),
+    ]) == 3
+
+    # 멀티종목 시세처럼 업종이 없는 행은 직전 업종에 반영한다.
+    round_trips.reset()
+    update = _row('A', None, -2.0, 150)
+    update['requested_fid_input_iscd'] = update.pop('stck_shrn_iscd')
+    assert store.update([update]) == 1
+    assert round_trips.count == 3                 # WATCH + 직전 값 조회 + 쓰기 트랜잭션
+
+    round_trips.reset()
+    assert [m['code'] for m in store.top('change_rate', count=2)] == ['C', 'B']
+    losers = store.top('change_rate', count=2, ascending=True)
+    assert [(m['rank'], m['code'], m['sector'], m['change_rate']) for m in losers] == [
+        (1, 'A', '전기·전자', -2.0), (2, 'B', '전기·전자', -1.0),
+    ]
+    assert store.top('volume', count=1)[0]['code'] == 'B'
+    assert store.sectors() == [
+        {'sector': '화학', 'count': 1, 'change_rate': 1.5, 'volume': 200, 'trading_value': 2000000,
+         'advancers': 1, 'decliners': 0},
+        {'sector': '전기·전자', 'count': 2, 'change_rate': -1.5, 'volume': 450, 'trading_value': 4500000,
+         'advancers': 0, 'decliners': 2},
+    ]
+    assert round_trips.count == 4                 # 조회마다 한 번 왕복
+
+    store.update([{'requested_fid_input_iscd': 'D', 'prdy_ctrt': '0.5'}])
+    assert store.unknown_sectors(['A', 'D', 'E']) == ['D', 'E']
+
+
+def test_concurrent_update_keeps_sector_totals(redis_service, before_exec):
+    store = MarketMoversStore(redis_service)
+    store.update([_row('A', '화학', 1.0, 100), _row('B', '화학', 2.0, 100)])
+
+    # 직전 값을 읽은 뒤 다른 작업자가 같은 종목을 바꾸면, 다시 읽어 그 값을 뺀다.
+    before_exec(lambda: store.update([_row('A', '화학', 5.0, 300)]))
+    assert store.update([_row('A', '화학', -1.0, 400)]) == 1
+    assert not before_exec.pending
+    assert store.sectors() == [
+        {'sector': '화학', 'count': 2, 'change_rate': 0.5, 'volume': 500, 'trading_value': 5000000,
+         'advancers': 1, 'decliners': 1},
+    ]
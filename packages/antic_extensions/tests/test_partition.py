@@ -0,0 +1,68 @@
+from antic_extensions.service import WorkerPartitioner
+
+
+CODES = [f'{i:06d}' for i in range(1, 101)]
+
+
+def _workers(service, *names):
+    return [WorkerPartitioner(service, 'kis_dispatch', worker_id=name, ttl=60) for name in names]
+
+
+def test_claim_splits_codes_and_hands_off_the_rest(redis_service):
+    a, b = _workers(redis_service, 'a', 'b')
+    assert a.claim(CODES, now=1000) == CODES        # b 합류 전에는 a가 모두 담당
+
+    b_first = b.claim(CODES, now=1001)
+    a_second = a.claim(CODES, now=1002)
+    assert a.members == b.members == ('a', 'b')
+    assert set(a_second).isdisjoint(b_first)
+    assert set(a_second) | set(b_first) == set(CODES)
+    assert 20 < len(b_first) < 80
+
+    # a가 받은 배치의 b 담당 종목은 b의 다음 claim에서 처리된다.
+    assert set(b.claim([], now=1003)) == set(b.partition(CODES)['b'])
+
+
+def test_expired_worker_leaves_the_ring(redis_service):
+    a, b, c = _workers(redis_service, 'a', 'b', 'c')
+    for worker in (a, b, c):
+        worker.claim([], now=1000)
+    assert a.refresh(now=1000) == ('a', 'b', 'c')
+    owners = {code: a.owner(code) for code in CODES}
+
+    a.claim([], now=1040)
+    b.claim([], now=1070)       # c는 ttl(60초) 동안 heartbeat 없음
+    assert b.members == ('a', 'b')
+    moved = [code for code in CODES if b.owner(code) != owners[code]]
+    assert moved and all(owners[code] == 'c' for code in moved)
+
+
+def test_codes_of_a_silent_worker_are_taken_over(redis_service):
+    a, b, c = _workers(redis_service, 'a', 'b', 'c')
+    for worker in (a, b, c):
+        worker.claim([], now=1000)
+    first = a.claim(CODES, now=1010)
+    owned_by_b = set(a.partition(CODES)['b'])
+    assert owned_by_b.isdisjoint(first)
+
+    # b가 handoff_timeout(30초) 동안 호출되지 않으면 inbox에 남은 종목을 다른 worker가 가져간다.
+    assert owned_by_b.isdisjoint(c.claim([], now=1035))
+    assert set(c.claim([], now=1041)) >= owned_by_b
+    assert not owned_by_b & set(a.claim([], now=1042))       # 한 번만 가져간다.
+    assert b.claim([], now=1043) == []
+
+    # heartbeat가 오래된 worker에게는 넘기지 않고 직접 처리한다.
+    a.claim([], now=1080)
+    assert set(b.claim(CODES, now=1090)) >= set(b.partition(CODES)['c'])
+
+
+def test_heartbeat_joins_the_ring_without_handing_off(redis_client, redis_service):
+    a, b = _workers(redis_service, 'a', 'b')
+    assert a.heartbeat(now=1000) == ('a',)
+    assert b.heartbeat(now=1001) == ('a', 'b')
+    assert a.refresh(now=1002) == ('a', 'b')
+
+    # 분배된 종목을 받은 그대로 처리하는 worker는 inbox를 쓰지 않는다.
+    with redis_client.connect() as conn:
+        keys = conn.keys('workers:kis_dispatch:*')
+    assert keys == [b'workers:kis_dispatch:heartbeats']
@@ -0,0 +1,81 @@
+from datetime import datetime, timedelta
+
+from antic_extensions.service import IndexTickStore, IntradayTickStore
+from antic_extensions.service.ticks import KST
+
+# 키는 거래일 다음 날 08:00에 만료되므로, 실제 서버에서는 오늘 이후의 거래일로 쓴다.
+_TODAY = datetime.now(KST).date()
+DAY = _TODAY.strftime('%Y%m%d')
+NEXT_DAY = (_TODAY + timedelta(days=1)).strftime('%Y%m%d')
+
+
+def _ticks(*hours):
+    return [
+        {'stck_cntg_hour': h, 'stck_prpr': '78000', 'cntg_vol': '10',
+         'collected_at': f'2025-03-19 {h}', 'requested_fid_input_iscd': '005930'}
+        for h in hours
+    ]
+
+
+def test_intraday_ticks_append_only_new_and_read_range(redis_service):
+    store = IntradayTickStore(redis_service, max_length=4)
+
+    # KIS 응답은 최신 시각부터 내려온다.
+    assert store.append('005930', _ticks('090002', '090001', '090000'), trading_date=DAY) == 3
+    assert store.append('005930', _ticks('090003', '090002', '090001'), trading_date=DAY) == 1
+    assert store.append('005930', _ticks('090004'), trading_date=DAY) == 1
+
+    # max_length를 넘긴 가장 오래된 틱은 제거된다.
+    hours = [t['stck_cntg_hour'] for t in store.range('005930', trading_date=DAY)]
+    assert hours == ['090001', '090002', '090003', '090004']
+    assert 'collected_at' not in store.latest('005930', 1)[0]
+    assert len(store.range('005930', '090002', '090003', trading_date=DAY)) == 2
+
+    # 다음 거래일 첫 쓰기에서 이전 거래일 틱은 정리된다.
+    store.append('005930', _ticks('090000'), trading_date=NEXT_DAY)
+    assert store.range('005930', trading_date=DAY) == []
+    assert len(store.range('005930', trading_date=NEXT_DAY)) == 1
+
+
+def test_intraday_ticks_backfill_adds_older_pages(redis_service):
+    store = IntradayTickStore(redis_service)
+
+    assert store.last_hour('005930', trading_date=DAY) is None
+    store.append('005930', _ticks('100001', '100000'), trading_date=DAY)
+    assert store.last_hour('005930', trading_date=DAY) == '100001'
+
+    # 과거 페이지는 only_newer=False로 추가하고, 이미 있는 시각은 건너뛴다.
+    added = store.append('005930', _ticks('100000', '095959'), trading_date=DAY, only_newer=False)
+    assert added == 1
+    hours = [t['stck_cntg_hour'] for t in store.range('005930', trading_date=DAY)]
+    assert hours == ['095959', '100000', '100001']
+
+
+def test_index_ticks_keep_compact_fields(redis_client, redis_service):
+    store = IndexTickStore(redis_service)
+    rows = [{'stck_cntg_hour': '090001', 'bstp_nmix_prpr': '2650.12', 'cntg_vol': '10',
+             'acml_tr_pbmn': '9876543', 'requested_fid_input_iscd': '0001'}]
+    assert store.append('0001', rows, trading_date=DAY) == 1
+    with redis_client.connect() as conn:
+        keys = conn.keys('*')
+    assert keys == [b'index:0001:ticks']
+    assert store.latest('0001') == [{'stck_cntg_hour': '090001', 'bstp_nmix_prpr': '2650.12', 'cntg_vol': '10'}]
+
+
+def test_intraday_ticks_backfill_cursors_resume_by_trading_date(redis_client, redis_service):
+    store = IntradayTickStore(redis_service)
+    assert store.backfill_cursors('005930', trading_date=DAY) == {}
+
+    # 페이지 제한으로 멈춘 구간: 새 체결 구간(10:00:01까지)과 첫 수집 구간(장 시작까지)
+    store.set_backfill_cursor('005930', '093015', trading_date=DAY)
+    store.set_backfill_cursor('005930', '101500', stop_after='100001', trading_date=DAY)
+    assert store.backfill_cursors('005930', trading_date=DAY) == {'101500': '100001', '093015': None}
+
+    # 이어서 받은 만큼 커서를 옮기고, 다 채운 구간은 지운다.
+    store.set_backfill_cursor('005930', '091000', trading_date=DAY, previous='093015')
+    store.set_backfill_cursor('005930', None, trading_date=DAY, previous='101500')
+    assert store.backfill_cursors('005930', trading_date=DAY) == {'091000': None}
+    assert store.backfill_cursors('005930', trading_date=NEXT_DAY) == {}
+    with redis_client.connect() as conn:
+        ttl = conn.ttl('stock:005930:intraday_ticks:backfill')
+    assert ttl > 0
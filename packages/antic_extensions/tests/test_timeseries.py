@@ -0,0 +1,111 @@
+from datetime import date, datetime, timedelta, timezone
+import os
+
+import pytest
+
+from antic_extensions.modules.timeseries import IntradayTickWriter, to_tick_row
+
+KST = timezone(timedelta(hours=9))
+
+
+def test_to_tick_row_uses_collected_date_and_kst():
+    tick = to_tick_row({
+        'requested_fid_input_iscd': '005930',
+        'stck_cntg_hour': '90501',
+        'stck_prpr': '78100',
+        'cntg_vol': '15',
+        'collected_at': datetime(2025, 3, 19, 9, 6, tzinfo=KST),
+    })
+    assert tick is not None
+    assert tick.traded_at == datetime(2025, 3, 19, 9, 5, 1, tzinfo=KST)
+    assert (tick.price, tick.volume) == (78100, 15)
+    assert to_tick_row({'requested_fid_input_iscd': '005930', 'stck_cntg_hour': '',
+                        'stck_prpr': '1'}) is None
+
+
+def test_to_tick_row_reads_rest_execution_volume():
+    # REST inquire-time-itemconclusion(output2)은 체결량을 cnqn으로 준다.
+    tick = to_tick_row(
+        {'requested_fid_input_iscd': '005930', 'stck_cntg_hour': '090501', 'stck_prpr': '78100',
+         'cnqn': '27', 'acml_vol': '1200345'},
+        trading_date=date(2025, 3, 19),
+    )
+    assert tick is not None and (tick.volume, tick.acml_vol) == (27, 1200345)
+
+
+def test_tick_copy_buffer_is_csv():
+    tick = to_tick_row(
+        {'requested_fid_input_iscd': '005930', 'stck_cntg_hour': '153000', 'stck_prpr': '78000'},
+        trading_date=date(2025, 3, 19),
+    )
+    buf = IntradayTickWriter._to_csv([tick])   # type: ignore[list-item]
+    assert buf.read() == '005930,2025-03-19T15:30:00+09:00,78000,0,0\r\n'
+
+
+@pytest.fixture
+def psql_client():
+    """``SQL_HOST``가 설정된 PostgreSQL(14 이상)에서만 실행한다."""
+    if not os.getenv('SQL_HOST'):
+        pytest.skip('SQL_HOST is not set')
+    from antic_extensions.modules.database import PsqlDBClient
+    client = PsqlDBClient(
+        os.getenv('SQL_HOST'),
+        os.getenv('SQL_USER'),
+        os.getenv('SQL_PASSWORD'),
+        os.getenv('SQL_DATABASE'),
+    )
+    yield client
+    with client.cursor() as cur:
+        cur.execute('DROP SCHEMA IF EXISTS test_timeseries CASCADE')
+
+
+def test_write_ticks_rolls_up_bars_and_queries_range(psql_client):
+    writer = IntradayTickWriter(psql_client, schema='test_timeseries')
+    writer.ensure_schema()
+
+    def ticks(*items):
+        return [{'requested_fid_input_iscd': '005930', 'stck_cntg_hour': hour, 'stck_prpr': str(price),
+                 'cntg_vol': str(volume)} for hour, price, volume in items]
+
+    day = date(2025, 3, 19)
+    assert writer.write_ticks(ticks(('090001', 100, 1), ('090030', 105, 2), ('090459', 98, 3)), trading_date=day) == 3
+    # 늦게 들어온 같은 구간 틱은 해당 봉만 다시 집계하고, 중복 체결 시각은 무시한다.
+    assert writer.write_ticks(ticks(('090030', 999, 9), ('090500', 101, 4), ('090000', 99, 5)), trading_date=day) == 2
+
+    start = datetime(2025, 3, 19, 9, tzinfo=KST)
+    bars = writer.query_bars('005930', '1m', start, start + timedelta(hours=1))
+    assert [(b['open'], b['high'], b['low'], b['close'], b['volume']) for b in bars] == [
+        (99, 105, 99, 105, 8), (98, 98, 98, 98, 3), (101, 101, 101, 101, 4),
+    ]
+    assert [datetime.fromisoformat(b['bucket']) for b in bars] == [
+        start, start + timedelta(minutes=4), start + timedelta(minutes=5),
+    ]
+    five = writer.query_bars('005930', '5m', start, start + timedelta(hours=1))
+    assert [(b['open'], b['high'], b['low'], b['close'], b['volume']) for b in five] == [
+        (99, 105, 98, 98, 11), (101, 101, 101, 101, 4),
+    ]
+    # 구간 끝(end)은 포함하지 않는다.
+    assert len(writer.query_bars('005930', '1m', start, start + timedelta(minutes=5))) == 2
+
+
+def test_write_ticks_keeps_every_execution_in_the_same_second(psql_client):
+    writer = IntradayTickWriter(psql_client, schema='test_timeseries')
+    writer.ensure_schema()
+    day = date(2025, 3, 19)
+
+    def tick(hour, price, volume, acml_vol):
+        return {'requested_fid_input_iscd': '005930', 'stck_cntg_hour': hour, 'stck_prpr': str(price),
+                'cnqn': str(volume), 'acml_vol': str(acml_vol)}
+
+    # 같은 초의 두 체결은 누적 거래량으로 구분하고, 다시 받은 같은 체결(REST 재조회)은 한 번만 저장한다.
+    assert writer.write_ticks([tick('090001', 100, 5, 5), tick('090001', 101, 7, 12)], trading_date=day) == 2
+    assert writer.write_ticks([tick('090001', 101, 7, 12), tick('090001', 99, 3, 15)], trading_date=day) == 1
+    # 누적 거래량이 없는 행은 같은 초를 하나로 합친다.
+    assert writer.write_ticks([
+        {'requested_fid_input_iscd': '005930', 'stck_cntg_hour': '090002', 'stck_prpr': '98', 'cntg_vol': '2'},
+        {'requested_fid_input_iscd': '005930', 'stck_cntg_hour': '090002', 'stck_prpr': '97', 'cntg_vol': '4'},
+    ], trading_date=day) == 1
+
+    start = datetime(2025, 3, 19, 9, tzinfo=KST)
+    bars = writer.query_bars('005930', '1m', start, start + timedelta(minutes=1))
+    assert [(b['open'], b['high'], b['low'], b['close'], b['volume']) for b in bars] == [(100, 101, 97, 97, 21)]
@@ -6,6 +6,10 @@ Azure Functions, 백엔드 서비스 등에서 동일 로직을 재사용하려
 """
 
 from .client import KISClient
+# 여러 앱 키의 KISClient를 묶어 호출 한도를 합산하는 pool (collector의 client 인자로 사용)
+from .pool import KISClientPool
+# 종목별 collector 우선순위 dispatcher
+from .dispatcher import CollectorDispatcher, CollectorJob, DispatchReport
 # 국내업종현재지수_API collector -> inquire-index-price
 from .collectors.inquire_index_price import fetch_inquire_index_price
 # 국내업종 시간별지수(초) collector -> inquire-index-tickprice
@@ -16,18 +20,50 @@ from .collectors.inquire_daily_itemchartprice import fetch_inquire_daily_itemcha
 from .collectors.investor_trade_by_stock_daily import fetch_investor_trade_by_stock_daily
 # 주식현재가시세_API collector -> inquire-price
 from .collectors.inquire_price import fetch_inquire_price
+# 관심종목(멀티종목) 시세조회 API collector -> intstock-multprice (최대 30종목/호출)
+from .collectors.intstock_multprice import fetch_intstock_multprice
 # 주식현재가_당일시간대별체결_API collector -> inquire-time-itemconclusion
-from .collectors.inquire_time_itemconclusion import fetch_inquire_time_itemconclusion
+from .collectors.inquire_time_itemconclusion import (
+    fetch_inquire_time_itemconclusion,
+    iter_inquire_time_itemconclusion_pages,
+)
 # 거래량 순위 API collector -> volume-rank
 from .collectors.volume_rank import fetch_volume_rank
+# 실시간 체결가/호가 WebSocket 클라이언트 -> H0STCNT0, H0STASP0 (websockets 필요)
+from .realtime import KISRealtimeClient, RealtimeFrame, decode_frame
+# KRX 거래 달력 / 순위 변화에 따른 수집 주기 계산
+from .schedule import AdaptiveInterval, KRXCalendar, ranking_churn, ranking_volatility
+# 거래량 순위 변화(진입/이탈/순위 이동/거래량 변화) 계산
+from .ranking import RankingDelta, diff_volume_rank
+# 업종/지수 코드 마스터(idxcode.mst)
+from .indices import DEFAULT_INDEX_CODES, IndexCode, load_index_codes, parse_index_codes
 
 __all__ = [
     "KISClient",
+    "KISClientPool",
+    "CollectorDispatcher",
+    "CollectorJob",
+    "DispatchReport",
     "fetch_inquire_daily_itemchartprice",
     "fetch_inquire_index_price",
     "fetch_inquire_index_tickprice",
     "fetch_investor_trade_by_stock_daily",
     "fetch_inquire_price",
+    "fetch_intstock_multprice",
     "fetch_inquire_time_itemconclusion",
+    "iter_inquire_time_itemconclusion_pages",
     "fetch_volume_rank",
+    "KISRealtimeClient",
+    "RealtimeFrame",
+    "decode_frame",
+    "KRXCalendar",
+    "AdaptiveInterval",
+    "ranking_churn",
+    "ranking_volatility",
+    "RankingDelta",
+    "diff_volume_rank",
+    "DEFAULT_INDEX_CODES",
+    "IndexCode",
+    "load_index_codes",
+    "parse_index_codes",
 ]
@@ -1,7 +1,9 @@
 from __future__ import annotations
 
 import logging
+import threading
 import time
+from contextlib import nullcontext
 from dataclasses import dataclass, field
 from datetime import timezone, timedelta
 from typing import Any, Mapping, MutableMapping, Optional
@@ -25,17 +27,68 @@ DEFAULT_HEADERS = {
 
 @dataclass
 class KISClient:
-    """Minimal client that handles token issuance and authenticated requests."""
+    """Minimal client that handles token issuance and authenticated requests.
+
+    The client is safe to share between threads: requests reuse one pooled
+    ``httpx.Client`` and ``request_interval`` is enforced as a shared budget,
+    i.e. concurrent callers are handed consecutive send slots spaced by the
+    interval instead of each sleeping on its own clock.
+
+    ``metrics`` is any object exposing ``timer(name, **labels)`` and
+    ``inc(name, value=1, **labels)`` (e.g. ``antic_extensions.get_metrics()``).
+    When set, every request records ``kis_request_seconds{tr_id, outcome}`` and
+    ``kis_responses_total{tr_id, status}``; token issuance is recorded under
+    ``tr_id="tokenP"``. The default ``None`` records nothing.
+    """
 
     app_key: str
     app_secret: str
     base_url: str = "https://openapi.koreainvestment.com:9443"
     timeout: float = 10.0
     request_interval: float = 0.0
+    max_connections: int = 10
+    metrics: Optional[Any] = field(default=None, repr=False)
 
     _token_expires_at: float = field(default=0.0, init=False, repr=False)
     _access_token: Optional[str] = field(default=None, init=False, repr=False)
-    _last_request_at: float = field(default=0.0, init=False, repr=False)
+    _next_request_at: float = field(default=0.0, init=False, repr=False)
+    _rate_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _token_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _http_lock: threading.Lock = field(default_factory=threading.Lock, init=False, repr=False)
+    _http: Optional[httpx.Client] = field(default=None, init=False, repr=False)
+
+    @property
+    def http(self) -> httpx.Client:
+        """Pooled keep-alive HTTP client shared by every request."""
+        with self._http_lock:
+            if self._http is None:
+                self._http = httpx.Client(
+                    timeout=self.timeout,
+                    limits=httpx.Limits(
+                        max_connections=self.max_connections,
+                        max_keepalive_connections=self.max_connections,
+                    ),
+                )
+            return self._http
+
+    def close(self) -> None:
+        with self._http_lock:
+            if self._http is not None:
+                self._http.close()
+                self._http = None
+
+    def _timer(self, tr_id: str):
+        if self.metrics is None:
+            return nullcontext()
+        return self.metrics.timer("kis_request_seconds", tr_id=tr_id)
+
+    def _send(self, tr_id: str, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        with self._timer(tr_id):
+            resp = self.http.request(method, url, **kwargs)
+            if self.metrics is not None:
+                self.metrics.inc("kis_responses_total", tr_id=tr_id, status=resp.status_code)
+            resp.raise_for_status()
+        return resp
 
     def _issue_token(self) -> None:
         """Fetch a new access token when none exists or it is expired."""
@@ -45,9 +98,7 @@ class KISClient:
             "appkey": self.app_key,
             "appsecret": self.app_secret,
         }
-        with httpx.Client(timeout=self.timeout) as client:
-            resp = client.post(url, json=payload)
-            resp.raise_for_status()
+        resp = self._send("tokenP", "POST", url, json=payload)
         data = resp.json()
         self._access_token = data["access_token"]
         # Renew five minutes before expiration to avoid race conditions.
@@ -56,13 +107,27 @@ class KISClient:
 
     def _auth_headers(self) -> Mapping[str, str]:
         if not self._access_token or time.time() >= self._token_expires_at:
-            self._issue_token()
+            with self._token_lock:
+                # Another thread may have renewed the token while we waited.
+                if not self._access_token or time.time() >= self._token_expires_at:
+                    self._issue_token()
         return {
             "authorization": f"Bearer {self._access_token}",
             "appkey": self.app_key,
             "appsecret": self.app_secret,
         }
 
+    def _wait_for_slot(self) -> None:
+        """Reserve the next send slot in the shared rate budget and sleep until it."""
+        if self.request_interval <= 0:
+            return
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_request_at)
+            self._next_request_at = slot + self.request_interval
+        if slot > now:
+            time.sleep(slot - now)
+
     def request(
         self,
         method: str,
@@ -73,15 +138,15 @@ class KISClient:
         headers: Optional[Mapping[str, str]] = None,
     ) -> Any:
         """Common request helper that injects auth headers and returns JSON."""
-        if self.request_interval > 0 and self._last_request_at:
-            elapsed = time.time() - self._last_request_at
-            remaining = self.request_interval - elapsed
-            if remaining > 0:
-                time.sleep(remaining)
         url = f"{self.base_url}{path}"
         merged_headers = {**DEFAULT_HEADERS, **self._auth_headers(), **(headers or {})}
-        with httpx.Client(timeout=self.timeout) as client:
-            resp = client.request(method.upper(), url, params=params, json=json, headers=merged_headers)
-            resp.raise_for_status()
-        self._last_request_at = time.time()
+        self._wait_for_slot()
+        resp = self._send(
+            merged_headers.get("tr_id", path),
+            method.upper(),
+            url,
+            params=params,
+            json=json,
+            headers=merged_headers,
+        )
         return resp.json()
@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-from datetime import datetime
-from typing import Any, Dict, List
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterator, List, Optional
 
 from ..client import KISClient, KST
 
 # 주식현재가_당일시간대별체결_API 명세서 기반 collector
-__all__ = ["fetch_inquire_time_itemconclusion"]
+__all__ = [
+    "fetch_inquire_time_itemconclusion",
+    "iter_inquire_time_itemconclusion_pages",
+]
 
 API_PATH = "/uapi/domestic-stock/v1/quotations/inquire-time-itemconclusion"
 # API 문서: https://apiportal.koreainvestment.com/apiservice-apiservice?/uapi/domestic-stock/v1/quotations/inquire-time-itemconclusion
 TR_ID = "FHPST01060000"
 METHOD = "GET"
+MARKET_OPEN_HOUR = "090000"
 
 
 def fetch_inquire_time_itemconclusion(
@@ -49,3 +53,63 @@ def fetch_inquire_time_itemconclusion(
     for item in response.get("output2") or []:
         ticks.append({**metadata, **item})
     return ticks
+
+
+def _previous_second(hour: str) -> Optional[str]:
+    """HHMMSS 기준 1초 전 시각. 자정(000000) 이전이면 None."""
+    try:
+        parsed = datetime.strptime(hour, "%H%M%S")
+    except ValueError:
+        return None
+    if parsed.time().isoformat() == "00:00:00":
+        return None
+    return (parsed - timedelta(seconds=1)).strftime("%H%M%S")
+
+
+def iter_inquire_time_itemconclusion_pages(
+    client: KISClient,
+    fid_input_iscd: str,
+    fid_input_hour_1: Optional[str] = None,
+    *,
+    stop_hour: str = MARKET_OPEN_HOUR,
+    stop_after: Optional[str] = None,
+    max_pages: Optional[int] = None,
+    fid_cond_mrkt_div_code: str = "J",
+    custtype: str = "P",
+) -> Iterator[List[Dict[str, Any]]]:
+    """당일 시간대별 체결을 ``fid_input_hour_1``부터 과거 방향으로 한 페이지씩 yield 한다.
+
+    각 페이지의 가장 이른 체결 시각 1초 전을 다음 요청의 커서로 사용하며,
+    장 시작(``stop_hour``) 혹은 이미 저장된 마지막 체결 시각(``stop_after``)에 도달하면 멈춘다.
+    ``stop_after`` 이하의 틱은 결과에서 제외된다. 호출 간격은 ``KISClient.request_interval``을 따른다.
+
+    >>> for page in iter_inquire_time_itemconclusion_pages(client, "005930", stop_after="101500"):
+    ...     store.append("005930", page, only_newer=False)
+    """
+    cursor: Optional[str] = fid_input_hour_1 or datetime.now(KST).strftime("%H%M%S")
+    pages = 0
+    while cursor and (max_pages is None or pages < max_pages):
+        rows = fetch_inquire_time_itemconclusion(
+            client,
+            fid_input_iscd,
+            cursor,
+            fid_cond_mrkt_div_code=fid_cond_mrkt_div_code,
+            custtype=custtype,
+        )
+        pages += 1
+        hours = [str(row.get("stck_cntg_hour") or "") for row in rows]
+        hours = [hour for hour in hours if hour]
+        if not hours:
+            return
+        if stop_after:
+            rows = [row for row in rows if str(row.get("stck_cntg_hour") or "") > stop_after]
+        if rows:
+            yield rows
+        oldest = min(hours)
+        if oldest <= stop_hour or (stop_after and oldest <= stop_after):
+            return
+        next_cursor = _previous_second(oldest)
+        if next_cursor is None or next_cursor >= cursor:
+            # 커서가 줄어들지 않으면 같은 페이지를 반복 조회하게 되므로 멈춘다.
+            return
+        cursor = next_cursor
@@ -0,0 +1,84 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+from typing import Any, Dict, Iterable, List
+
+from ..client import KISClient, KST
+
+# 관심종목(멀티종목) 시세조회 API 명세서 기반 collector
+__all__ = ["fetch_intstock_multprice", "MAX_CODES_PER_REQUEST"]
+
+API_PATH = "/uapi/domestic-stock/v1/quotations/intstock-multprice"
+# API 문서: https://apiportal.koreainvestment.com/apiservice-apiservice?/uapi/domestic-stock/v1/quotations/intstock-multprice
+TR_ID = "FHKST11300006"
+METHOD = "GET"
+MAX_CODES_PER_REQUEST = 30
+
+# 멀티종목 응답 필드 -> 주식현재가 시세(inquire-price) 필드. 나머지 필드는 그대로 유지한다.
+PRICE_FIELDS = {
+    "inter_shrn_iscd": "stck_shrn_iscd",
+    "inter2_prpr": "stck_prpr",
+    "inter2_prdy_vrss": "prdy_vrss",
+    "inter2_oprc": "stck_oprc",
+    "inter2_hgpr": "stck_hgpr",
+    "inter2_lwpr": "stck_lwpr",
+    "inter2_mxpr": "stck_mxpr",
+    "inter2_llam": "stck_llam",
+    "inter2_sdpr": "stck_sdpr",
+    "inter2_prdy_clpr": "stck_prdy_clpr",
+    "inter2_askp": "askp",
+    "inter2_bidp": "bidp",
+}
+
+
+def fetch_intstock_multprice(
+    client: KISClient,
+    fid_input_iscds: Iterable[str],
+    *,
+    fid_cond_mrkt_div_code: str = "J",
+    custtype: str = "P",
+    chunk_size: int = MAX_CODES_PER_REQUEST,
+) -> List[Dict[str, Any]]:
+    """관심종목(멀티종목) 시세조회 API 호출 래퍼.
+
+    종목 코드를 ``chunk_size``(최대 30)개씩 나눠 호출하고, 각 종목 결과를
+    ``fetch_inquire_price``와 같은 형태(``stck_prpr``, ``requested_fid_input_iscd`` 등)로 반환한다.
+    중복 코드는 한 번만 조회하며, 응답에 없는 종목은 결과에서 빠진다.
+    """
+    codes = list(dict.fromkeys(fid_input_iscds))
+    chunk_size = max(1, min(chunk_size, MAX_CODES_PER_REQUEST))
+    rows: List[Dict[str, Any]] = []
+    for start in range(0, len(codes), chunk_size):
+        chunk = codes[start:start + chunk_size]
+        params: Dict[str, str] = {}
+        for i, code in enumerate(chunk, start=1):
+            params[f"FID_COND_MRKT_DIV_CODE_{i}"] = fid_cond_mrkt_div_code
+            params[f"FID_INPUT_ISCD_{i}"] = code
+        response = client.request(
+            METHOD,
+            API_PATH,
+            params=params,
+            headers={"tr_id": TR_ID, "custtype": custtype},
+        )
+        collected_at = datetime.now(KST).replace(second=0, microsecond=0)
+        by_code = {
+            item.get("inter_shrn_iscd"): item for item in response.get("output") or []
+        }
+        missing = [code for code in chunk if code not in by_code]
+        if missing:
+            logging.warning("intstock-multprice returned no quote for %s", missing)
+        for code in chunk:
+            item = by_code.get(code)
+            if item is None:
+                continue
+            rows.append({
+                "rt_cd": response.get("rt_cd"),
+                "msg_cd": response.get("msg_cd"),
+                "msg1": response.get("msg1"),
+                "collected_at": collected_at,
+                "requested_fid_input_iscd": code,
+                **item,
+                **{target: item[source] for source, target in PRICE_FIELDS.items() if source in item},
+            })
+    return rows
@@ -22,7 +22,11 @@ def fetch_investor_trade_by_stock_daily(
     *,
     fid_cond_mrkt_div_code: str = "J",
 ) -> List[Mapping[str, Any]]:
-    """Call the volume-rank API and return the enriched payload."""
+    """Call the investor-trade API and return every daily row of ``output2``.
+
+    Rows are newest first (``rows[0]`` is ``fid_input_date``) and each carries the
+    response metadata and requested code/date. Empty padding rows are dropped.
+    """
     params = {
         "FID_COND_MRKT_DIV_CODE": fid_cond_mrkt_div_code,
         "FID_INPUT_ISCD": fid_input_iscd,
@@ -40,16 +44,18 @@ def fetch_investor_trade_by_stock_daily(
 
     collected_at = datetime.now(KST).replace(second=0, microsecond=0)
     enriched: List[Mapping[str, Any]] = []
-    item = response.get("output2", [])[0]
-    enriched.append(
-        {
-            "rt_cd": response.get("rt_cd"),
-            "msg_cd": response.get("msg_cd"),
-            "msg1": response.get("msg1"),
-            "collected_at": collected_at,
-            "requested_fid_input_iscd": fid_input_iscd,
-            "requested_fid_input_date": fid_input_date,
-            **item,
-        }
-    )
+    for item in response.get("output2") or []:
+        if not isinstance(item, Mapping) or not item.get("stck_bsop_date"):
+            continue
+        enriched.append(
+            {
+                "rt_cd": response.get("rt_cd"),
+                "msg_cd": response.get("msg_cd"),
+                "msg1": response.get("msg1"),
+                "collected_at": collected_at,
+                "requested_fid_input_iscd": fid_input_iscd,
+                "requested_fid_input_date": fid_input_date,
+                **item,
+            }
+        )
     return enriched
@@ -0,0 +1,137 @@
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, Iterable, List, Mapping, Optional, Sequence
+
+# 종목별 수집 작업을 하나의 우선순위 큐로 스케줄링하는 dispatcher
+__all__ = ["CollectorJob", "CollectorDispatcher", "DispatchReport"]
+
+FetchFn = Callable[[str], Any]
+SinkFn = Callable[[List[Dict[str, Any]]], None]
+
+
+@dataclass(frozen=True)
+class CollectorJob:
+    """One collector applied to every dispatched stock code.
+
+    ``fetch`` receives a stock code and may return a single row (mapping) or a
+    list of rows. ``sink`` receives every row of the job once all of its codes
+    are done, so a high-priority job is stored without waiting for the rest.
+    Lower ``priority`` values run first.
+    """
+
+    name: str
+    priority: int
+    fetch: FetchFn
+    sink: Optional[SinkFn] = None
+
+
+@dataclass
+class DispatchReport:
+    """Per-job outcome of a dispatch run.
+
+    ``stored`` is true once the sink accepted the rows (or the job has no sink).
+    """
+
+    rows: List[Dict[str, Any]] = field(default_factory=list)
+    succeeded: List[str] = field(default_factory=list)
+    failed: List[str] = field(default_factory=list)
+    stored: bool = False
+
+
+class CollectorDispatcher:
+    """Drain ``(job, code)`` work items through one priority queue.
+
+    Every job/code pair is enqueued up front and ``max_workers`` threads pull
+    the lowest priority value first. All workers share the caller's
+    ``KISClient`` and therefore its rate budget, so e.g. realtime prices for
+    every code are requested before any history call is made.
+
+    >>> dispatcher = CollectorDispatcher([
+    ...     CollectorJob("current_price", 0, lambda code: fetch_inquire_price(client, code), cache),
+    ...     CollectorJob("daily_chart", 9, lambda code: fetch_inquire_daily_itemchartprice(client, code), persist),
+    ... ])
+    >>> reports = dispatcher.dispatch(["005930", "000660"])
+    """
+
+    def __init__(self, jobs: Sequence[CollectorJob], *, max_workers: int = 4) -> None:
+        names = [job.name for job in jobs]
+        if len(set(names)) != len(names):
+            raise ValueError(f"Duplicated collector job names: {names}")
+        self._jobs = {job.name: job for job in jobs}
+        self._max_workers = max(1, max_workers)
+
+    def dispatch(
+        self,
+        codes: Iterable[str],
+        *,
+        jobs_for_code: Optional[Callable[[str], Iterable[str]]] = None,
+    ) -> Dict[str, DispatchReport]:
+        """Run every job for every code and return a report per job name.
+
+        ``jobs_for_code`` optionally narrows the job names scheduled for a code
+        (e.g. to skip data that is still fresh).
+        """
+        work: "queue.PriorityQueue[tuple[int, int, str, str]]" = queue.PriorityQueue()
+        pending: Dict[str, int] = {name: 0 for name in self._jobs}
+        reports: Dict[str, DispatchReport] = {name: DispatchReport() for name in self._jobs}
+        seq = 0
+        for code in dict.fromkeys(codes):
+            names = self._jobs.keys() if jobs_for_code is None else jobs_for_code(code)
+            for name in names:
+                job = self._jobs[name]
+                work.put((job.priority, seq, name, code))
+                pending[name] += 1
+                seq += 1
+
+        lock = threading.Lock()
+
+        def finish(name: str) -> None:
+            job = self._jobs[name]
+            report = reports[name]
+            if job.sink is None or not report.rows:
+                report.stored = True
+                return
+            try:
+                job.sink(report.rows)
+                report.stored = True
+            except Exception as exc:  # pylint: disable=broad-except
+                logging.exception("Collector sink %s failed: %s", name, exc)
+
+        def worker() -> None:
+            while True:
+                try:
+                    _, _, name, code = work.get_nowait()
+                except queue.Empty:
+                    return
+                job = self._jobs[name]
+                rows: List[Dict[str, Any]] = []
+                ok = True
+                try:
+                    result = job.fetch(code)
+                    if isinstance(result, Mapping):
+                        rows = [dict(result)]
+                    elif result:
+                        rows = list(result)
+                except Exception as exc:  # pylint: disable=broad-except
+                    ok = False
+                    logging.exception("Collector %s failed for %s: %s", name, code, exc)
+                with lock:
+                    report = reports[name]
+                    report.rows.extend(rows)
+                    (report.succeeded if ok else report.failed).append(code)
+                    pending[name] -= 1
+                    done = pending[name] == 0
+                if done:
+                    finish(name)
+
+        if seq:
+            workers = min(self._max_workers, seq)
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                for _ in range(workers):
+                    executor.submit(worker)
+        return reports
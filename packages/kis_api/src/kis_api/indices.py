@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+from pathlib import Path
+from typing import Iterable, List, NamedTuple, Optional, Union
+
+# 업종/지수 코드 마스터(idxcode.mst) 파서
+__all__ = ["IndexCode", "load_index_codes", "parse_index_codes", "DEFAULT_INDEX_CODES"]
+
+# 코스피 종합, 코스닥 종합, 코스피200
+DEFAULT_INDEX_CODES = ("0001", "1001", "2001")
+
+
+class IndexCode(NamedTuple):
+    """``idxcode.mst``의 한 행. ``code``는 지수 API의 ``FID_INPUT_ISCD``(4자리)이다."""
+
+    code: str
+    name: str
+    group: str
+
+
+def parse_index_codes(lines: Iterable[str], groups: Optional[Iterable[str]] = None) -> List[IndexCode]:
+    """``idxcode.mst`` 행(그룹 1자리 + 지수 코드 4자리 + 지수명)을 파싱한다.
+
+    그룹은 ``0`` 코스피 업종, ``1`` 코스닥 업종, ``2`` 코스피200 계열, ``4`` KRX 등이다.
+    ``groups``를 주면 해당 그룹만 남긴다. 이름이 없는 행(``99999`` 등)은 건너뛴다.
+    """
+    allowed = set(groups) if groups is not None else None
+    codes: List[IndexCode] = []
+    for line in lines:
+        line = line.rstrip("\r\n")
+        group, code, name = line[:1], line[1:5], line[5:].strip()
+        if len(code) != 4 or not name or (allowed is not None and group not in allowed):
+            continue
+        codes.append(IndexCode(code, name, group))
+    return codes
+
+
+def load_index_codes(
+    path: Union[str, Path],
+    groups: Optional[Iterable[str]] = None,
+    encoding: str = "cp949",
+) -> List[IndexCode]:
+    """KIS에서 내려받은 ``idxcode.mst``(cp949)를 읽는다.
+
+    >>> load_index_codes("scripts/kis_test/idxcode.mst", groups=["0", "1"])[:2]
+    [IndexCode(code='0001', name='종합', group='0'), IndexCode(code='0002', name='대형주', group='0')]
+    """
+    with open(path, encoding=encoding) as f:
+        return parse_index_codes(f, groups=groups)
@@ -0,0 +1,128 @@
+from __future__ import annotations
+
+import bisect
+import threading
+import time
+import zlib
+from typing import Any, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from .client import KISClient
+
+# 여러 앱 키(계정)의 KISClient를 묶어 호출 한도를 합산하는 pool
+__all__ = ["KISClientPool", "ROUTE_LEAST_LOADED", "ROUTE_HASH"]
+
+ROUTE_LEAST_LOADED = "least_loaded"
+ROUTE_HASH = "hash"
+# 종목 코드로 라우팅할 때 참조하는 요청 파라미터
+CODE_PARAM = "FID_INPUT_ISCD"
+
+
+class KISClientPool:
+    """Route requests across several ``KISClient`` instances (one per app key).
+
+    Each client keeps its own token and ``request_interval`` budget, so the
+    pool's throughput is the sum of its members'. The pool exposes the same
+    ``request`` method as ``KISClient`` and can be passed as the ``client``
+    argument of every ``fetch_*`` collector.
+
+    - ``least_loaded`` (default): the client whose next send slot is earliest,
+      ties broken by the fewest in-flight requests.
+    - ``hash``: consistent hash of the stock code (``FID_INPUT_ISCD``) so a
+      code always lands on the same key, and adding a key only moves ~1/N of
+      the codes. Requests without a code fall back to ``least_loaded``.
+
+    >>> pool = KISClientPool.from_credentials(
+    ...     [("key1", "secret1"), ("key2", "secret2")], request_interval=0.05
+    ... )
+    >>> fetch_inquire_price(pool, fid_input_iscd="005930")
+    """
+
+    def __init__(
+        self,
+        clients: Sequence[KISClient],
+        *,
+        strategy: str = ROUTE_LEAST_LOADED,
+        replicas: int = 64,
+    ) -> None:
+        if not clients:
+            raise ValueError("KISClientPool requires at least one client")
+        if strategy not in (ROUTE_LEAST_LOADED, ROUTE_HASH):
+            raise ValueError(f"Unknown routing strategy: {strategy}")
+        self.clients: List[KISClient] = list(clients)
+        self.strategy = strategy
+        self._lock = threading.Lock()
+        self._in_flight = [0] * len(self.clients)
+        # 앱 키 기준의 가상 노드를 배치하므로, 키 순서와 무관하게 같은 종목은 같은 키로 간다.
+        ring: List[Tuple[int, int]] = sorted(
+            (zlib.crc32(f"{client.app_key}#{replica}".encode()), index)
+            for index, client in enumerate(self.clients)
+            for replica in range(max(1, replicas))
+        )
+        self._ring_hashes = [h for h, _ in ring]
+        self._ring_clients = [index for _, index in ring]
+
+    @classmethod
+    def from_credentials(
+        cls,
+        credentials: Iterable[Tuple[str, str]],
+        *,
+        strategy: str = ROUTE_LEAST_LOADED,
+        **client_kwargs: Any,
+    ) -> "KISClientPool":
+        """``(app_key, app_secret)`` 목록으로 같은 설정(``base_url``, ``request_interval`` 등)의 client를 만든다."""
+        clients = [
+            KISClient(app_key=app_key, app_secret=app_secret, **client_kwargs)
+            for app_key, app_secret in credentials
+        ]
+        return cls(clients, strategy=strategy)
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    @property
+    def base_url(self) -> str:
+        return self.clients[0].base_url
+
+    @property
+    def metrics(self) -> Optional[Any]:
+        return self.clients[0].metrics
+
+    def close(self) -> None:
+        for client in self.clients:
+            client.close()
+
+    def _hash_index(self, code: str) -> int:
+        position = bisect.bisect(self._ring_hashes, zlib.crc32(code.encode()))
+        return self._ring_clients[position % len(self._ring_clients)]
+
+    def _least_loaded_index(self) -> int:
+        now = time.monotonic()
+        return min(
+            range(len(self.clients)),
+            key=lambda i: (max(now, self.clients[i]._next_request_at), self._in_flight[i]),
+        )
+
+    def _select(self, params: Optional[Mapping[str, Any]]) -> int:
+        code = (params or {}).get(CODE_PARAM)
+        if self.strategy == ROUTE_HASH and code:
+            return self._hash_index(str(code))
+        return self._least_loaded_index()
+
+    def request(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: Optional[Mapping[str, Any]] = None,
+        json: Optional[Any] = None,
+        headers: Optional[Mapping[str, str]] = None,
+    ) -> Any:
+        """Same contract as ``KISClient.request``, sent through the selected member."""
+        with self._lock:
+            index = self._select(params)
+            self._in_flight[index] += 1
+        try:
+            return self.clients[index].request(method, path, params=params, json=json, headers=headers)
+        finally:
+            with self._lock:
+                self._in_flight[index] -= 1
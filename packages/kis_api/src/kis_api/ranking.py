@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Mapping, Tuple
+
+# 거래량 순위 변화(진입/이탈/순위 이동/거래량 변화) 계산
+__all__ = [
+    "RankingDelta",
+    "diff_volume_rank",
+]
+
+CODE_FIELD = "mksc_shrn_iscd"
+
+
+def _int(value: Any) -> int:
+    try:
+        return int(float(value or 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+def _index_rows(rows: Iterable[Mapping[str, Any]]) -> Dict[str, Tuple[int, Mapping[str, Any]]]:
+    """종목 코드 -> (순위, 행). 순위는 ``data_rank``, 없으면 목록 순서(1부터)."""
+    indexed: Dict[str, Tuple[int, Mapping[str, Any]]] = {}
+    for position, row in enumerate(rows, start=1):
+        if not isinstance(row, Mapping) or not row.get(CODE_FIELD):
+            continue
+        indexed.setdefault(row[CODE_FIELD], (_int(row.get("data_rank")) or position, row))
+    return indexed
+
+
+@dataclass
+class RankingDelta:
+    """직전 거래량 순위 대비 변화.
+
+    - ``entered``/``left``: 새로 순위에 든 종목 / 순위에서 빠진 종목 (현재/직전 순위 순서)
+    - ``moved``: 순위가 바뀐 종목 -> (직전 순위, 현재 순위)
+    - ``volume_changed``: 누적 거래량이 기준 이상 바뀐 종목 -> (직전 거래량, 현재 거래량)
+    """
+
+    entered: List[str] = field(default_factory=list)
+    left: List[str] = field(default_factory=list)
+    moved: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+    volume_changed: Dict[str, Tuple[int, int]] = field(default_factory=dict)
+
+    def __bool__(self) -> bool:
+        return bool(self.entered or self.left or self.moved or self.volume_changed)
+
+    def changed_codes(self) -> List[str]:
+        """다시 수집할 종목 (진입, 순위 이동, 거래량 변화). 이탈 종목은 제외한다."""
+        codes: Dict[str, None] = dict.fromkeys(self.entered)
+        codes.update(dict.fromkeys(self.moved))
+        codes.update(dict.fromkeys(self.volume_changed))
+        return list(codes)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "entered": list(self.entered),
+            "left": list(self.left),
+            "moved": {code: list(ranks) for code, ranks in self.moved.items()},
+            "volume_changed": {code: list(volumes) for code, volumes in self.volume_changed.items()},
+        }
+
+
+def diff_volume_rank(
+    previous: Iterable[Mapping[str, Any]],
+    current: Iterable[Mapping[str, Any]],
+    volume_threshold: float = 0.05,
+) -> RankingDelta:
+    """거래량 순위 ``output`` 행 두 개를 비교한다.
+
+    ``volume_threshold``는 직전 누적 거래량(``acml_vol``) 대비 변화율이다. (0이면 거래량이 조금이라도 바뀌면 포함)
+    직전 순위가 비어 있으면 현재 순위 전체가 ``entered``가 된다.
+
+    >>> delta = diff_volume_rank(previous_rows, data["output"], volume_threshold=0.1)
+    >>> if delta:
+    ...     publish({**data, "output": [row for row in data["output"] if row["mksc_shrn_iscd"] in delta.changed_codes()]})
+    """
+    before = _index_rows(previous)
+    after = _index_rows(current)
+    delta = RankingDelta(
+        entered=[code for code in after if code not in before],
+        left=[code for code in before if code not in after],
+    )
+    for code, (rank, row) in after.items():
+        if code not in before:
+            continue
+        previous_rank, previous_row = before[code]
+        if rank != previous_rank:
+            delta.moved[code] = (previous_rank, rank)
+        previous_volume, volume = _int(previous_row.get("acml_vol")), _int(row.get("acml_vol"))
+        if volume != previous_volume and abs(volume - previous_volume) >= volume_threshold * previous_volume:
+            delta.volume_changed[code] = (previous_volume, volume)
+    return delta
@@ -0,0 +1,402 @@
+"""KIS 실시간(WebSocket) 시세 client.
+
+REST 호출 한도를 쓰지 않고 체결가(``H0STCNT0``)와 호가(``H0STASP0``)를 초 단위 이하 지연으로 받는다.
+``pip install kis_api[realtime]`` (``websockets``)이 필요하다.
+
+```python
+feed = KISRealtimeClient(client, on_frame=print)
+feed.subscribe(EXECUTION_TR_ID, ["005930", "000660"])
+feed.start()        # 백그라운드 스레드, 끊기면 재접속 후 구독을 다시 등록한다.
+```
+
+데이터 frame은 ``암호화여부|TR_ID|건수|필드^필드^...`` 형식이며, ``decode_frame``은 레코드를 dict로
+바꾸지 않고 값 목록 그대로 담는다. 필요한 필드만 ``RealtimeFrame.value``/``execution_to_price`` 등으로 꺼낸다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import threading
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .client import KISClient, KST
+
+__all__ = [
+    "EXECUTION_TR_ID",
+    "QUOTE_TR_ID",
+    "REALTIME_URL",
+    "MAX_SUBSCRIPTIONS",
+    "RealtimeFrame",
+    "KISRealtimeClient",
+    "decode_frame",
+    "execution_to_price",
+    "execution_to_tick",
+    "quote_to_orderbook",
+]
+
+REALTIME_URL = "ws://ops.koreainvestment.com:21000"
+APPROVAL_PATH = "/oauth2/Approval"
+EXECUTION_TR_ID = "H0STCNT0"  # 국내주식 실시간체결가 (KRX)
+QUOTE_TR_ID = "H0STASP0"  # 국내주식 실시간호가 (KRX)
+PINGPONG_TR_ID = "PINGPONG"
+# 한 세션에서 등록할 수 있는 실시간 구독 수 (체결/호가 합산)
+MAX_SUBSCRIPTIONS = 41
+
+EXECUTION_FIELDS: Tuple[str, ...] = (
+    "mksc_shrn_iscd", "stck_cntg_hour", "stck_prpr", "prdy_vrss_sign", "prdy_vrss", "prdy_ctrt",
+    "wghn_avrg_stck_prc", "stck_oprc", "stck_hgpr", "stck_lwpr", "askp1", "bidp1", "cntg_vol",
+    "acml_vol", "acml_tr_pbmn", "seln_cntg_csnu", "shnu_cntg_csnu", "ntby_cntg_csnu", "cttr",
+    "seln_cntg_smtn", "shnu_cntg_smtn", "ccld_dvsn", "shnu_rate", "prdy_vol_vrss_acml_vol_rate",
+    "oprc_hour", "oprc_vrss_prpr_sign", "oprc_vrss_prpr", "hgpr_hour", "hgpr_vrss_prpr_sign",
+    "hgpr_vrss_prpr", "lwpr_hour", "lwpr_vrss_prpr_sign", "lwpr_vrss_prpr", "bsop_date",
+    "new_mkop_cls_code", "trht_yn", "askp_rsqn1", "bidp_rsqn1", "total_askp_rsqn",
+    "total_bidp_rsqn", "vol_tnrt", "prdy_smns_hour_acml_vol", "prdy_smns_hour_acml_vol_rate",
+    "hour_cls_code", "mrkt_trtm_cls_code", "vi_stnd_prc",
+)
+QUOTE_FIELDS: Tuple[str, ...] = (
+    ("mksc_shrn_iscd", "bsop_hour", "hour_cls_code")
+    + tuple(f"askp{i}" for i in range(1, 11))
+    + tuple(f"bidp{i}" for i in range(1, 11))
+    + tuple(f"askp_rsqn{i}" for i in range(1, 11))
+    + tuple(f"bidp_rsqn{i}" for i in range(1, 11))
+    + (
+        "total_askp_rsqn", "total_bidp_rsqn", "ovtm_total_askp_rsqn", "ovtm_total_bidp_rsqn",
+        "antc_cnpr", "antc_cnqn", "antc_vol", "antc_cntg_vrss", "antc_cntg_vrss_sign",
+        "antc_cntg_prdy_ctrt", "acml_vol", "total_askp_rsqn_icdc", "total_bidp_rsqn_icdc",
+        "ovtm_total_askp_icdc", "ovtm_total_bidp_icdc", "stck_deal_cls_code",
+    )
+)
+FIELDS: Dict[str, Tuple[str, ...]] = {
+    EXECUTION_TR_ID: EXECUTION_FIELDS,
+    QUOTE_TR_ID: QUOTE_FIELDS,
+}
+_FIELD_INDEX: Dict[str, Dict[str, int]] = {
+    tr_id: {name: i for i, name in enumerate(fields)} for tr_id, fields in FIELDS.items()
+}
+
+FrameHandler = Callable[["RealtimeFrame"], None]
+
+
+@dataclass(frozen=True)
+class RealtimeFrame:
+    """One decoded data frame. ``records`` keep the raw values in ``FIELDS[tr_id]`` order."""
+
+    tr_id: str
+    records: Tuple[Sequence[str], ...]
+
+    def value(self, record: Sequence[str], name: str) -> str:
+        """Field ``name`` of one of ``records`` (lookup by precomputed index)."""
+        return record[_FIELD_INDEX[self.tr_id][name]]
+
+    def latest_by_code(self) -> Dict[str, Sequence[str]]:
+        """Last record per stock code (records are in time order within a frame)."""
+        return {record[0]: record for record in self.records}
+
+
+def decode_frame(raw: str) -> Optional[RealtimeFrame]:
+    """Decode a pipe-delimited data frame. Returns None for control (JSON) messages.
+
+    Encrypted frames (order notices) are not supported and are skipped.
+    Raises ``ValueError`` for a truncated or malformed data frame.
+    """
+    if not raw or raw[0] not in "01":
+        return None
+    parts = raw.split("|", 3)
+    if len(parts) != 4:
+        raise ValueError(f"Malformed realtime frame: {raw[:200]!r}")
+    encrypted, tr_id, count, payload = parts
+    if encrypted == "1":
+        logging.warning("Skip encrypted realtime frame %s", tr_id)
+        return None
+    values = payload.split("^")
+    count = max(1, int(count))
+    width = len(FIELDS[tr_id]) if tr_id in FIELDS else len(values) // count
+    if len(values) < width * count:
+        raise ValueError(f"Truncated realtime frame {tr_id}: {len(values)} values for {count} records")
+    records = tuple(values[i * width:(i + 1) * width] for i in range(count))
+    return RealtimeFrame(tr_id, records)
+
+
+def _pick(frame: RealtimeFrame, record: Sequence[str], names: Iterable[str]) -> Dict[str, str]:
+    index = _FIELD_INDEX[frame.tr_id]
+    return {name: record[index[name]] for name in names}
+
+
+def _traded_at(frame: RealtimeFrame, record: Sequence[str]) -> datetime:
+    return datetime.strptime(
+        frame.value(record, "bsop_date") + frame.value(record, "stck_cntg_hour"), "%Y%m%d%H%M%S"
+    ).replace(tzinfo=KST)
+
+
+def execution_to_price(frame: RealtimeFrame, record: Sequence[str]) -> Dict[str, Any]:
+    """Execution record in the ``fetch_inquire_price`` shape (current price cache)."""
+    price = _pick(
+        frame,
+        record,
+        (
+            "stck_prpr", "prdy_vrss", "prdy_vrss_sign", "prdy_ctrt", "stck_oprc", "stck_hgpr",
+            "stck_lwpr", "acml_vol", "acml_tr_pbmn", "wghn_avrg_stck_prc",
+        ),
+    )
+    code = record[0]
+    return {
+        "collected_at": _traded_at(frame, record),
+        "requested_fid_input_iscd": code,
+        "stck_shrn_iscd": code,
+        **price,
+    }
+
+
+def execution_to_tick(frame: RealtimeFrame, record: Sequence[str]) -> Dict[str, str]:
+    """Execution record in the ``inquire-time-itemconclusion`` (output2) tick shape."""
+    index = _FIELD_INDEX[frame.tr_id]
+    return {
+        "stck_cntg_hour": record[index["stck_cntg_hour"]],
+        "stck_prpr": record[index["stck_prpr"]],
+        "prdy_vrss": record[index["prdy_vrss"]],
+        "prdy_vrss_sign": record[index["prdy_vrss_sign"]],
+        "prdy_ctrt": record[index["prdy_ctrt"]],
+        "askp": record[index["askp1"]],
+        "bidp": record[index["bidp1"]],
+        "tday_rltv": record[index["cttr"]],
+        "acml_vol": record[index["acml_vol"]],
+        "cntg_vol": record[index["cntg_vol"]],
+    }
+
+
+def quote_to_orderbook(frame: RealtimeFrame, record: Sequence[str]) -> Dict[str, str]:
+    """Quote record as a flat order book (10 levels, totals, expected execution)."""
+    return _pick(frame, record, QUOTE_FIELDS[1:])
+
+
+class KISRealtimeClient:
+    """KIS WebSocket 실시간 시세 client.
+
+    - 접속키(approval key)는 ``client``의 REST 주소(``/oauth2/Approval``)에서 발급해 한 세션 동안 사용하고,
+      재접속할 때 다시 발급한다.
+    - 연결이 끊기거나 접속(handshake)에 실패하면 ``reconnect_delay``부터 ``max_reconnect_delay``까지 지수적으로
+      늘려 재접속하고, 등록된 구독을 모두 다시 보낸다. 예상하지 못한 예외도 기록한 뒤 재접속한다.
+    - 구독은 ``MAX_SUBSCRIPTIONS``개까지만 등록하고, 넘는 종목은 경고를 남기고 버린다.
+    - ``PINGPONG`` 메시지는 그대로 돌려보낸다. 해석할 수 없는 frame과 ``on_frame`` 예외는 기록만 하고 수신을 계속한다.
+
+    :param client: 인증 정보와 REST 주소를 제공하는 ``KISClient`` (``metrics``가 있으면 frame/재접속 수를 기록)
+    :param on_frame: 데이터 frame 마다 (수신 스레드에서) 호출된다.
+    :param url: WebSocket 주소 (모의투자: ``ws://ops.koreainvestment.com:31000``)
+    """
+
+    def __init__(
+        self,
+        client: KISClient,
+        on_frame: FrameHandler,
+        *,
+        url: str = REALTIME_URL,
+        custtype: str = "P",
+        reconnect_delay: float = 1.0,
+        max_reconnect_delay: float = 30.0,
+        open_timeout: float = 10.0,
+    ) -> None:
+        self.client = client
+        self.on_frame = on_frame
+        self.url = url
+        self.custtype = custtype
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.open_timeout = open_timeout
+        self.reconnects = 0
+        self._approval_key: Optional[str] = None
+        # 등록 순서를 유지하는 (tr_id, 종목코드) 구독 목록
+        self._subscriptions: Dict[Tuple[str, str], None] = {}
+        self._lock = threading.Lock()
+        self._ws: Any = None
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def subscriptions(self) -> List[Tuple[str, str]]:
+        with self._lock:
+            return list(self._subscriptions)
+
+    def issue_approval_key(self, refresh: bool = False) -> str:
+        """WebSocket 접속키를 발급한다. (``refresh``가 아니면 발급된 키를 재사용)"""
+        if refresh or self._approval_key is None:
+            resp = self.client.http.post(
+                f"{self.client.base_url}{APPROVAL_PATH}",
+                json={
+                    "grant_type": "client_credentials",
+                    "appkey": self.client.app_key,
+                    "secretkey": self.client.app_secret,
+                },
+            )
+            resp.raise_for_status()
+            self._approval_key = resp.json()["approval_key"]
+        return self._approval_key
+
+    def _message(self, tr_type: str, tr_id: str, code: str) -> str:
+        return json.dumps({
+            "header": {
+                "approval_key": self.issue_approval_key(),
+                "custtype": self.custtype,
+                "tr_type": tr_type,
+                "content-type": "utf-8",
+            },
+            "body": {"input": {"tr_id": tr_id, "tr_key": code}},
+        })
+
+    def _send(self, messages: Iterable[str]) -> None:
+        ws = self._ws
+        if ws is None:
+            return
+        try:
+            for message in messages:
+                ws.send(message)
+        except Exception as exc:  # pylint: disable=broad-except
+            # 연결이 끊긴 경우 재접속 시 구독 목록 전체를 다시 보낸다.
+            logging.warning("Realtime subscription message not sent: %s", exc)
+
+    def subscribe(self, tr_id: str, codes: Iterable[str]) -> List[str]:
+        """종목들을 구독하고 새로 등록한 종목 코드를 반환한다.
+
+        이미 구독 중인 종목은 건너뛰고, ``MAX_SUBSCRIPTIONS``를 넘는 종목은 (앞에서부터 채우고) 등록하지 않는다.
+        """
+        with self._lock:
+            new = [(tr_id, code) for code in dict.fromkeys(codes) if (tr_id, code) not in self._subscriptions]
+            capacity = max(0, MAX_SUBSCRIPTIONS - len(self._subscriptions))
+            if len(new) > capacity:
+                logging.warning(
+                    "KIS accepts up to %d realtime subscriptions per session, dropped %d %s codes: %s",
+                    MAX_SUBSCRIPTIONS,
+                    len(new) - capacity,
+                    tr_id,
+                    [code for _, code in new[capacity:]],
+                )
+                new = new[:capacity]
+            self._subscriptions.update(dict.fromkeys(new))
+        self._send(self._message("1", tr_id, code) for tr_id, code in new)
+        return [code for _, code in new]
+
+    def unsubscribe(self, tr_id: str, codes: Iterable[str]) -> None:
+        """종목 구독을 해제한다."""
+        with self._lock:
+            removed = [(tr_id, code) for code in dict.fromkeys(codes) if (tr_id, code) in self._subscriptions]
+            for key in removed:
+                del self._subscriptions[key]
+        self._send(self._message("2", tr_id, code) for tr_id, code in removed)
+
+    def set_codes(self, tr_id: str, codes: Iterable[str]) -> List[str]:
+        """``tr_id`` 구독을 ``codes``로 맞추고 새로 등록한 종목 코드를 반환한다.
+
+        빠진 종목은 먼저 해제해 구독 한도를 비운다.
+        """
+        codes = list(dict.fromkeys(codes))
+        wanted = set(codes)
+        stale = [code for sub_tr_id, code in self.subscriptions if sub_tr_id == tr_id and code not in wanted]
+        self.unsubscribe(tr_id, stale)
+        return self.subscribe(tr_id, codes)
+
+    def _handle_control(self, ws: Any, raw: str) -> None:
+        try:
+            message = json.loads(raw)
+        except json.JSONDecodeError:
+            logging.warning("Unknown realtime message: %.200s", raw)
+            return
+        header = message.get("header") or {}
+        if header.get("tr_id") == PINGPONG_TR_ID:
+            ws.send(raw)
+            return
+        body = message.get("body") or {}
+        if body.get("rt_cd") not in (None, "0"):
+            logging.warning(
+                "Realtime %s %s rejected: %s %s",
+                header.get("tr_id"),
+                header.get("tr_key"),
+                body.get("msg_cd"),
+                body.get("msg1"),
+            )
+        else:
+            logging.debug("Realtime %s %s: %s", header.get("tr_id"), header.get("tr_key"), body.get("msg1"))
+
+    def _receive(self, ws: Any) -> None:
+        metrics = self.client.metrics
+        for raw in ws:
+            if isinstance(raw, bytes):
+                raw = raw.decode("utf-8")
+            try:
+                frame = decode_frame(raw)
+            except (ValueError, IndexError) as exc:
+                logging.warning("Skip undecodable realtime frame: %s", exc)
+                if metrics is not None:
+                    metrics.inc("kis_realtime_frames_dropped_total")
+                continue
+            if frame is None:
+                self._handle_control(ws, raw)
+                continue
+            if metrics is not None:
+                metrics.inc("kis_realtime_frames_total", tr_id=frame.tr_id)
+            try:
+                self.on_frame(frame)
+            except Exception as exc:  # pylint: disable=broad-except
+                logging.exception("Realtime frame handler failed for %s: %s", frame.tr_id, exc)
+
+    def run(self) -> None:
+        """``stop()``이 호출될 때까지 접속/수신하고, 끊기면 재접속한다. (blocking)"""
+        try:
+            from websockets.exceptions import WebSocketException
+            from websockets.sync.client import connect
+        except ImportError as e:
+            raise ImportError(
+                "KISRealtimeClient requires 'websockets'. (pip install kis_api[realtime])"
+            ) from e
+
+        delay = self.reconnect_delay
+        refresh_key = False
+        while not self._stop.is_set():
+            try:
+                with connect(self.url, open_timeout=self.open_timeout) as ws:
+                    # 끊겼던 세션의 접속키는 만료/무효화되었을 수 있으므로 재접속마다 새로 발급한다.
+                    self.issue_approval_key(refresh=refresh_key)
+                    refresh_key = True
+                    self._ws = ws
+                    subscriptions = self.subscriptions
+                    self._send(self._message("1", tr_id, code) for tr_id, code in subscriptions)
+                    logging.info("Realtime connected to %s (%d subscriptions)", self.url, len(subscriptions))
+                    delay = self.reconnect_delay
+                    self._receive(ws)
+            except (WebSocketException, OSError, TimeoutError) as exc:
+                # ConnectionClosed, InvalidStatus/InvalidHandshake (접속 거부) 포함
+                logging.warning("Realtime connection lost: %s", exc)
+            except Exception as exc:  # pylint: disable=broad-except
+                logging.exception("Realtime session failed, reconnecting: %s", exc)
+            finally:
+                self._ws = None
+            if self._stop.wait(delay):
+                break
+            delay = min(delay * 2, self.max_reconnect_delay)
+            self.reconnects += 1
+            if self.client.metrics is not None:
+                self.client.metrics.inc("kis_realtime_reconnects_total")
+
+    def start(self) -> "KISRealtimeClient":
+        """``run()``을 데몬 스레드에서 시작한다."""
+        if self._thread is None or not self._thread.is_alive():
+            self._stop.clear()
+            self._thread = threading.Thread(target=self.run, name="kis-realtime", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self, timeout: Optional[float] = 5.0) -> None:
+        self._stop.set()
+        ws = self._ws
+        if ws is not None:
+            ws.close()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def __enter__(self) -> "KISRealtimeClient":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
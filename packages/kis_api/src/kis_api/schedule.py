@@ -0,0 +1,210 @@
+from __future__ import annotations
+
+import logging
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Any, Dict, Iterable, Mapping, Optional, Sequence, Set, Tuple, Union
+
+from .client import KST
+
+# KRX 거래 달력과 시장 상황에 따른 수집 주기 계산
+__all__ = [
+    "KRXCalendar",
+    "AdaptiveInterval",
+    "ranking_churn",
+    "ranking_volatility",
+    "PHASE_CLOSED",
+    "PHASE_PRE_OPEN",
+    "PHASE_REGULAR",
+    "PHASE_AFTER_HOURS",
+]
+
+PHASE_CLOSED = "closed"
+PHASE_PRE_OPEN = "pre_open"  # 장전 시간외/동시호가 (08:30 ~ 정규장 시작)
+PHASE_REGULAR = "regular"  # 정규장 (종가 동시호가 포함)
+PHASE_AFTER_HOURS = "after_hours"  # 장후 시간외 종가/단일가 (정규장 종료 ~ 18:00)
+
+PRE_OPEN = time(8, 30)
+REGULAR_OPEN = time(9, 0)
+REGULAR_CLOSE = time(15, 30)
+AFTER_HOURS_CLOSE = time(18, 0)
+
+# KRX 휴장일 (주말, 1월 1일, 연말 휴장일 제외). 매년 말 거래소 공지로 갱신하고,
+# 임시 휴장일은 ``extra_holidays``로 추가한다.
+KRX_HOLIDAYS = frozenset(
+    date.fromisoformat(value)
+    for value in (
+        # 2025
+        "2025-01-27", "2025-01-28", "2025-01-29", "2025-01-30", "2025-03-03",
+        "2025-05-01", "2025-05-05", "2025-05-06", "2025-06-03", "2025-06-06", "2025-08-15",
+        "2025-10-03", "2025-10-06", "2025-10-07", "2025-10-08", "2025-10-09", "2025-12-25",
+        # 2026
+        "2026-02-16", "2026-02-17", "2026-02-18", "2026-03-02", "2026-05-01",
+        "2026-05-05", "2026-05-25", "2026-06-03", "2026-08-17", "2026-09-24", "2026-09-25",
+        "2026-10-05", "2026-10-09", "2026-12-25",
+    )
+)
+# 휴장일 표가 있는 연도. 이외의 연도는 주말/1월 1일/연말 휴장일만 반영되므로 경고한다.
+KRX_HOLIDAY_YEARS = frozenset(day.year for day in KRX_HOLIDAYS)
+# 정규장 시간이 바뀌는 날 (수능일 10시 ~ 16시 30분). 연초 개장일 10시 개장은 규칙으로 처리한다.
+KRX_SHIFTED_SESSIONS: Mapping[date, Tuple[time, time]] = {
+    date(2025, 11, 13): (time(10, 0), time(16, 30)),
+    date(2026, 11, 19): (time(10, 0), time(16, 30)),
+}
+FIRST_DAY_OPEN = time(10, 0)
+
+DateLike = Union[date, str]
+
+
+def _to_date(value: DateLike) -> date:
+    if isinstance(value, date):
+        return value
+    value = value.strip()
+    return datetime.strptime(value, "%Y%m%d").date() if len(value) == 8 else date.fromisoformat(value)
+
+
+class KRXCalendar:
+    """KRX 거래일과 시간대(장전/정규장/장후/휴장)를 판별한다. 시각은 모두 KST 기준이다.
+
+    >>> calendar = KRXCalendar(extra_holidays=["20270209"])   # 임시 휴장일
+    >>> calendar.phase(datetime(2026, 10, 19, 10, 0, tzinfo=KST))
+    'regular'
+    >>> calendar.next_open(datetime(2026, 10, 17, 12, 0, tzinfo=KST))   # 토요일
+    datetime.datetime(2026, 10, 19, 9, 0, tzinfo=...)
+
+    ``KRX_HOLIDAYS``에 없는 연도(``extra_holidays``로 추가한 연도 제외)를 판별하면 연도마다 한 번 경고를 남긴다.
+    """
+
+    def __init__(
+        self,
+        extra_holidays: Iterable[DateLike] = (),
+        shifted_sessions: Optional[Mapping[DateLike, Tuple[time, time]]] = None,
+    ) -> None:
+        self.holidays = KRX_HOLIDAYS | {_to_date(value) for value in extra_holidays}
+        self.holiday_years = KRX_HOLIDAY_YEARS | {day.year for day in self.holidays}
+        self._warned_years: Set[int] = set()
+        self.shifted_sessions: Dict[date, Tuple[time, time]] = {
+            **KRX_SHIFTED_SESSIONS,
+            **{_to_date(day): hours for day, hours in (shifted_sessions or {}).items()},
+        }
+
+    def _is_business_day(self, day: date) -> bool:
+        if day.year not in self.holiday_years and day.year not in self._warned_years:
+            self._warned_years.add(day.year)
+            logging.warning(
+                "KRX holiday table has no entries for %s; only weekends and year-end closures are applied "
+                "(update KRX_HOLIDAYS or pass extra_holidays)", day.year,
+            )
+        return day.weekday() < 5 and day not in self.holidays and (day.month, day.day) != (1, 1)
+
+    def is_trading_day(self, day: date) -> bool:
+        """주말/휴장일/1월 1일/연말 휴장일(그 해 마지막 평일 영업일)이 아니면 True."""
+        if not self._is_business_day(day):
+            return False
+        # 연말 휴장일: 이후 같은 해에 영업일이 없으면 그 해의 마지막 영업일이다.
+        following = day + timedelta(days=1)
+        while following.year == day.year:
+            if self._is_business_day(following):
+                return True
+            following += timedelta(days=1)
+        return False
+
+    def _is_first_trading_day(self, day: date) -> bool:
+        previous = day - timedelta(days=1)
+        while previous.year == day.year:
+            if self.is_trading_day(previous):
+                return False
+            previous -= timedelta(days=1)
+        return True
+
+    def regular_session(self, day: date) -> Optional[Tuple[datetime, datetime]]:
+        """``day`` 정규장 시작/종료 시각. 휴장일이면 None. (연초 개장일은 10시 개장)"""
+        if not self.is_trading_day(day):
+            return None
+        open_at, close_at = self.shifted_sessions.get(day, (REGULAR_OPEN, REGULAR_CLOSE))
+        if day not in self.shifted_sessions and self._is_first_trading_day(day):
+            open_at = FIRST_DAY_OPEN
+        return (
+            datetime.combine(day, open_at, tzinfo=KST),
+            datetime.combine(day, close_at, tzinfo=KST),
+        )
+
+    def phase(self, now: Optional[datetime] = None) -> str:
+        """``now``(기본값: 현재 시각)의 시장 시간대."""
+        now = (now or datetime.now(KST)).astimezone(KST)
+        session = self.regular_session(now.date())
+        if session is None:
+            return PHASE_CLOSED
+        open_at, close_at = session
+        if open_at <= now < close_at:
+            return PHASE_REGULAR
+        if datetime.combine(now.date(), PRE_OPEN, tzinfo=KST) <= now < open_at:
+            return PHASE_PRE_OPEN
+        if close_at <= now < max(close_at, datetime.combine(now.date(), AFTER_HOURS_CLOSE, tzinfo=KST)):
+            return PHASE_AFTER_HOURS
+        return PHASE_CLOSED
+
+    def is_open(self, now: Optional[datetime] = None, *, include_extended: bool = True) -> bool:
+        """정규장(``include_extended``이면 장전/장후 시간외 포함) 중인지 여부."""
+        phase = self.phase(now)
+        if include_extended:
+            return phase != PHASE_CLOSED
+        return phase == PHASE_REGULAR
+
+    def next_open(self, now: Optional[datetime] = None) -> datetime:
+        """``now`` 이후 가장 가까운 정규장 시작 시각 (진행 중이면 당일 시작 시각)."""
+        now = (now or datetime.now(KST)).astimezone(KST)
+        day = now.date()
+        for _ in range(366):
+            session = self.regular_session(day)
+            if session is not None and now < session[1]:
+                return session[0]
+            day += timedelta(days=1)
+        raise ValueError(f"No KRX session within a year after {now}")
+
+
+def ranking_churn(previous: Sequence[str], current: Sequence[str]) -> float:
+    """직전 순위에 없던 종목의 비율 (0 ~ 1). 직전 순위가 없으면 1."""
+    if not current:
+        return 0.0
+    if not previous:
+        return 1.0
+    known = set(previous)
+    return sum(1 for code in current if code not in known) / len(current)
+
+
+def ranking_volatility(rows: Iterable[Mapping[str, Any]]) -> float:
+    """순위 종목의 평균 |전일 대비율| (%)."""
+    values = []
+    for row in rows:
+        try:
+            values.append(abs(float(row.get("prdy_ctrt") or 0)))
+        except (TypeError, ValueError):
+            continue
+    return sum(values) / len(values) if values else 0.0
+
+
+@dataclass(frozen=True)
+class AdaptiveInterval:
+    """시장 시간대와 순위 변화에 따라 다음 수집까지의 간격(초)을 정한다.
+
+    정규장에서는 ``churn``/``churn_threshold``와 ``volatility``/``volatility_threshold`` 중 큰 값(0 ~ 1)에
+    비례해 ``max_interval``에서 ``min_interval``로 줄어든다. 장전/장후에는 ``max_interval``, 휴장 중에는 None.
+    """
+
+    min_interval: float = 60.0
+    max_interval: float = 600.0
+    churn_threshold: float = 0.3
+    volatility_threshold: float = 5.0
+
+    def next_interval(self, phase: str, churn: float = 0.0, volatility: float = 0.0) -> Optional[float]:
+        if phase == PHASE_CLOSED:
+            return None
+        if phase != PHASE_REGULAR:
+            return self.max_interval
+        activity = max(
+            churn / self.churn_threshold if self.churn_threshold > 0 else 1.0,
+            volatility / self.volatility_threshold if self.volatility_threshold > 0 else 1.0,
+        )
+        activity = min(1.0, max(0.0, activity))
+        return self.max_interval - (self.max_interval - self.min_interval) * activity
@@ -0,0 +1,645 @@
+"""Local stand-in for the KIS OpenAPI used by tests and load tests.
+
+``FakeKISServer`` is a threaded HTTP server that issues tokens and answers the
+quotation endpoints used by ``kis_api.collectors``. Responses are either
+recorded JSON payloads (e.g. ``scripts/kis_test/국내주식정보조회예시응답.json``)
+or the deterministic synthetic generators in ``synthetic_responses``.
+Latency and the per-second rate limit (KIS returns ``EGW00201``) are configurable.
+
+```python
+with FakeKISServer(latency=0.05, rate_limit=20) as server:
+    client = KISClient(app_key="local", app_secret="local", base_url=server.base_url)
+    fetch_inquire_price(client, "005930")
+```
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+import zlib
+from collections import Counter, defaultdict, deque
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Mapping, Optional, Union
+from urllib.parse import parse_qsl, urlsplit
+
+from .client import KST
+
+__all__ = [
+    "FakeKISServer",
+    "FakeKISRealtimeServer",
+    "synthetic_execution_frame",
+    "synthetic_quote_frame",
+    "ResponseHandler",
+    "load_recorded_response",
+    "synthetic_responses",
+]
+
+ResponseHandler = Callable[[Mapping[str, str]], Mapping[str, Any]]
+"""Receives the query parameters (upper-case KIS names) and returns the JSON body."""
+
+TOKEN_PATH = "/oauth2/tokenP"
+APPROVAL_PATH = "/oauth2/Approval"
+RATE_LIMIT_BODY = {
+    "rt_cd": "1",
+    "msg_cd": "EGW00201",
+    "msg1": "초당 거래건수를 초과하였습니다.",
+}
+DEFAULT_CODES = (
+    "005930", "000660", "373220", "207940", "005380", "000270", "068270", "005490",
+    "035420", "051910", "006400", "105560", "055550", "012330", "028260", "066570",
+    "003670", "096770", "034730", "032830", "011200", "035720", "086790", "015760",
+    "017670", "010130", "009150", "033780", "018260", "003550",
+)
+
+
+def load_recorded_response(path: Union[str, Path]) -> Dict[str, Any]:
+    """Load a recorded KIS JSON response to be replayed as-is."""
+    return json.loads(Path(path).read_text(encoding="utf-8"))
+
+
+def _ok(**outputs: Any) -> Dict[str, Any]:
+    return {"rt_cd": "0", "msg_cd": "MCA00000", "msg1": "정상처리 되었습니다.", **outputs}
+
+
+def _base_price(code: str) -> int:
+    return 5_000 + zlib.crc32(code.encode()) % 2_000 * 50
+
+
+# 종목 코드 기반의 결정적인 업종/전일 대비율 (-3.00% ~ +2.99%)
+SECTORS = ("전기·전자", "화학", "운송장비·부품", "금융", "제약", "IT 서비스")
+
+
+def _sector(code: str) -> str:
+    return SECTORS[zlib.crc32(code.encode()) % len(SECTORS)]
+
+
+def _change(code: str) -> Dict[str, str]:
+    rate = zlib.adler32(code.encode()) % 600 - 300
+    sign = "2" if rate > 0 else "5" if rate < 0 else "3"
+    return {
+        "prdy_vrss_sign": sign,
+        "prdy_vrss": str(_base_price(code) * rate // 10_000),
+        "prdy_ctrt": f"{rate / 100:.2f}",
+    }
+
+
+def _volume_rank(params: Mapping[str, str], codes=DEFAULT_CODES) -> Dict[str, Any]:
+    output = []
+    for rank, code in enumerate(codes, start=1):
+        price = _base_price(code)
+        output.append({
+            "hts_kor_isnm": f"종목{code}",
+            "mksc_shrn_iscd": code,
+            "data_rank": str(rank),
+            "stck_prpr": str(price),
+            **_change(code),
+            "acml_vol": str(10_000_000 // rank),
+            "acml_tr_pbmn": str(10_000_000 // rank * price),
+        })
+    return _ok(output=output)
+
+
+def _inquire_price(params: Mapping[str, str]) -> Dict[str, Any]:
+    code = params.get("FID_INPUT_ISCD", "")
+    price = _base_price(code)
+    return _ok(output={
+        "stck_shrn_iscd": code,
+        "bstp_kor_isnm": _sector(code),
+        "stck_prpr": str(price),
+        **_change(code),
+        "stck_oprc": str(price - price // 200),
+        "stck_hgpr": str(price + price // 100),
+        "stck_lwpr": str(price - price // 100),
+        "acml_vol": "2550032",
+        "acml_tr_pbmn": str(2_550_032 * price),
+    })
+
+
+def _intstock_multprice(params: Mapping[str, str]) -> Dict[str, Any]:
+    output = []
+    for i in range(1, 31):
+        code = params.get(f"FID_INPUT_ISCD_{i}")
+        if not code:
+            break
+        price = _base_price(code)
+        change = _change(code)
+        output.append({
+            "inter_shrn_iscd": code,
+            "inter_kor_isnm": f"종목{code}",
+            "inter2_prpr": str(price),
+            "inter2_prdy_vrss": change["prdy_vrss"],
+            "prdy_vrss_sign": change["prdy_vrss_sign"],
+            "prdy_ctrt": change["prdy_ctrt"],
+            "inter2_oprc": str(price - price // 200),
+            "inter2_hgpr": str(price + price // 100),
+            "inter2_lwpr": str(price - price // 100),
+            "acml_vol": "2550032",
+            "acml_tr_pbmn": str(2_550_032 * price),
+        })
+    return _ok(output=output)
+
+
+def _time_itemconclusion(params: Mapping[str, str], page_size: int = 30, step: int = 10) -> Dict[str, Any]:
+    """Ticks every ``step`` seconds walking back from FID_INPUT_HOUR_1 to 09:00:00."""
+    code = params.get("FID_INPUT_ISCD", "")
+    price = _base_price(code)
+    try:
+        cursor = datetime.strptime(params.get("FID_INPUT_HOUR_1") or "153000", "%H%M%S")
+    except ValueError:
+        cursor = datetime.strptime("153000", "%H%M%S")
+    cursor = min(cursor, datetime.strptime("153000", "%H%M%S"))
+    cursor -= timedelta(seconds=cursor.second % step)
+    market_open = datetime.strptime("090000", "%H%M%S")
+    rows = []
+    while cursor >= market_open and len(rows) < page_size:
+        seconds = (cursor - market_open).seconds
+        rows.append({
+            "stck_cntg_hour": cursor.strftime("%H%M%S"),
+            "stck_prpr": str(price + (seconds // step) % 20 * 10 - 100),
+            "prdy_vrss": str(price // 100),
+            "prdy_vrss_sign": "2",
+            "prdy_ctrt": "1.00",
+            "cnqn": str(100 + seconds % 900),
+            "acml_vol": str(seconds * 50),
+        })
+        cursor -= timedelta(seconds=step)
+    return _ok(output1={"stck_prpr": str(price), "prdy_vrss": str(price // 100)}, output2=rows)
+
+
+def _investor_trade(params: Mapping[str, str], max_rows: int = 30) -> Dict[str, Any]:
+    """Daily net buying per investor for the weekdays up to FID_INPUT_DATE_1, newest first."""
+    code = params.get("FID_INPUT_ISCD", "")
+    price = _base_price(code)
+    try:
+        day = datetime.strptime(params.get("FID_INPUT_DATE_1") or datetime.now(KST).strftime("%Y%m%d"), "%Y%m%d")
+    except ValueError:
+        return {"rt_cd": "1", "msg_cd": "OPSQ2001", "msg1": "INPUT_FIELD_NAME FID_INPUT_DATE 오류", "output2": []}
+    rows: List[Dict[str, Any]] = []
+    while len(rows) < max_rows:
+        if day.weekday() < 5:
+            # (종목, 일자)마다 고정된 값이라 다시 조회해도 같은 이력이 나온다.
+            seed = zlib.crc32(f"{code}{day:%Y%m%d}".encode()) % 1_000
+            quantities = {"prsn": seed * 10 - 5_000, "frgn": 5_000 - seed * 7, "orgn": seed * 3 - 1_500}
+            rows.append({
+                "stck_bsop_date": day.strftime("%Y%m%d"),
+                "stck_clpr": str(price),
+                **{f"{investor}_ntby_qty": str(qty) for investor, qty in quantities.items()},
+                **{f"{investor}_ntby_tr_pbmn": str(qty * price // 1_000_000) for investor, qty in quantities.items()},
+            })
+        day -= timedelta(days=1)
+    return _ok(output1={"stck_prpr": str(price)}, output2=rows)
+
+
+def _daily_itemchartprice(params: Mapping[str, str], max_rows: int = 100) -> Dict[str, Any]:
+    """Weekday candles between FID_INPUT_DATE_1 and FID_INPUT_DATE_2, newest first (max 100 like KIS)."""
+    code = params.get("FID_INPUT_ISCD", "")
+    price = _base_price(code)
+    try:
+        start = datetime.strptime(params.get("FID_INPUT_DATE_1", ""), "%Y%m%d")
+        end = datetime.strptime(params.get("FID_INPUT_DATE_2", ""), "%Y%m%d")
+    except ValueError:
+        return {"rt_cd": "1", "msg_cd": "OPSQ2001", "msg1": "INPUT_FIELD_NAME FID_INPUT_DATE 오류", "output2": []}
+    rows: List[Dict[str, Any]] = []
+    day = end
+    while day >= start and len(rows) < max_rows:
+        if day.weekday() < 5:
+            close = price + (day.toordinal() % 40 - 20) * 10
+            rows.append({
+                "stck_bsop_date": day.strftime("%Y%m%d"),
+                "stck_oprc": str(close - 50),
+                "stck_hgpr": str(close + 100),
+                "stck_lwpr": str(close - 100),
+                "stck_clpr": str(close),
+                "acml_vol": str(1_000_000 + day.toordinal() % 500_000),
+                "acml_tr_pbmn": str((1_000_000 + day.toordinal() % 500_000) * close),
+            })
+        day -= timedelta(days=1)
+    return _ok(output1={"stck_shrn_iscd": code, "stck_prpr": str(price)}, output2=rows)
+
+
+def _index_value(code: str) -> float:
+    return 500 + zlib.crc32(code.encode()) % 3_000
+
+
+def _index_price(params: Mapping[str, str]) -> Dict[str, Any]:
+    code = params.get("FID_INPUT_ISCD", "")
+    value = _index_value(code)
+    change = _change(code)
+    return _ok(output={
+        "bstp_nmix_prpr": f"{value:.2f}",
+        "bstp_nmix_prdy_vrss": f"{value * float(change['prdy_ctrt']) / 100:.2f}",
+        "prdy_vrss_sign": change["prdy_vrss_sign"],
+        "bstp_nmix_prdy_ctrt": change["prdy_ctrt"],
+        "acml_vol": "412345678",
+        "acml_tr_pbmn": "9876543",
+        "ascn_issu_cnt": str(zlib.crc32(code.encode()) % 300),
+        "down_issu_cnt": str(zlib.adler32(code.encode()) % 300),
+        "stnr_issu_cnt": "20",
+    })
+
+
+def _index_tickprice(params: Mapping[str, str]) -> Dict[str, Any]:
+    code = params.get("FID_INPUT_ISCD", "")
+    value = _index_value(code)
+    now = datetime.now(KST)
+    return _ok(output=[
+        {
+            "stck_cntg_hour": (now - timedelta(seconds=i)).strftime("%H%M%S"),
+            "bstp_nmix_prpr": f"{value + (i % 10) / 10:.2f}",
+            "bstp_nmix_prdy_vrss": "0.00",
+            "prdy_vrss_sign": "3",
+            "bstp_nmix_prdy_ctrt": "0.00",
+            "acml_tr_pbmn": "9876543",
+            "acml_vol": "412345678",
+            "cntg_vol": str(1_000 + i),
+        }
+        for i in range(30)
+    ])
+
+
+def synthetic_responses() -> Dict[str, ResponseHandler]:
+    """Deterministic generators for every endpoint used by ``kis_api.collectors``.
+
+    Prices derive from the stock code, so repeated runs produce identical payloads.
+    """
+    from .collectors import (
+        inquire_daily_itemchartprice,
+        inquire_index_price,
+        inquire_index_tickprice,
+        inquire_price,
+        inquire_time_itemconclusion,
+        intstock_multprice,
+        investor_trade_by_stock_daily,
+        volume_rank,
+    )
+
+    return {
+        volume_rank.API_PATH: _volume_rank,
+        inquire_price.API_PATH: _inquire_price,
+        intstock_multprice.API_PATH: _intstock_multprice,
+        inquire_time_itemconclusion.API_PATH: _time_itemconclusion,
+        investor_trade_by_stock_daily.API_PATH: _investor_trade,
+        inquire_daily_itemchartprice.API_PATH: _daily_itemchartprice,
+        inquire_index_price.API_PATH: _index_price,
+        inquire_index_tickprice.API_PATH: _index_tickprice,
+    }
+
+
+class FakeKISServer:
+    """Threaded HTTP server that mimics the KIS token and quotation endpoints.
+
+    Args:
+        responses: API path -> recorded JSON body or ``ResponseHandler``.
+            Defaults to ``synthetic_responses()``; given entries override them.
+        latency: Seconds added to every quotation response.
+        jitter: Extra uniformly random latency (0 ~ ``jitter`` seconds).
+        rate_limit: Requests per second accepted per app key (``appkey`` header), like
+            the real gateway. Excess requests get HTTP 500 with ``EGW00201``.
+            ``None`` disables it.
+        host, port: Bind address. Port 0 picks a free port.
+    """
+
+    def __init__(
+        self,
+        responses: Optional[Mapping[str, Union[Mapping[str, Any], ResponseHandler]]] = None,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        rate_limit: Optional[float] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        self.responses: Dict[str, Union[Mapping[str, Any], ResponseHandler]] = {
+            **synthetic_responses(),
+            **(responses or {}),
+        }
+        self.latency = latency
+        self.jitter = jitter
+        self.rate_limit = rate_limit
+        self.requests: Counter = Counter()
+        self.requests_by_key: Counter = Counter()
+        self.throttled = 0
+        self._windows: Dict[str, Deque[float]] = defaultdict(deque)
+        self._lock = threading.Lock()
+        self._server = ThreadingHTTPServer((host, port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeKISServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="fake-kis", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeKISServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def replay(self, path: str, recorded: Union[str, Path, Mapping[str, Any]]) -> None:
+        """Serve a recorded response (file path or parsed JSON) for ``path``."""
+        if isinstance(recorded, (str, Path)):
+            recorded = load_recorded_response(recorded)
+        self.responses[path] = recorded
+
+    def _admit(self, app_key: str) -> bool:
+        if self.rate_limit is None:
+            return True
+        with self._lock:
+            now = time.monotonic()
+            window = self._windows[app_key]
+            while window and now - window[0] >= 1.0:
+                window.popleft()
+            if len(window) >= self.rate_limit:
+                self.throttled += 1
+                return False
+            window.append(now)
+            return True
+
+    def _respond(self, path: str, params: Mapping[str, str], app_key: str = "") -> tuple[int, Mapping[str, Any]]:
+        with self._lock:
+            self.requests[path] += 1
+        if path == TOKEN_PATH:
+            return 200, {
+                "access_token": "fake-access-token",
+                "token_type": "Bearer",
+                "expires_in": 86400,
+                "access_token_token_expired": (datetime.now(KST) + timedelta(days=1)).strftime("%Y-%m-%d %H:%M:%S"),
+            }
+        if path == APPROVAL_PATH:
+            return 200, {"approval_key": "fake-approval-key"}
+        with self._lock:
+            self.requests_by_key[app_key] += 1
+        if not self._admit(app_key):
+            return 500, RATE_LIMIT_BODY
+        delay = self.latency + (random.uniform(0, self.jitter) if self.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+        response = self.responses.get(path)
+        if response is None:
+            return 404, {"rt_cd": "1", "msg_cd": "EGW00404", "msg1": f"Unknown path: {path}"}
+        if callable(response):
+            response = response(params)
+        return 200, response
+
+    def _handler_class(self) -> type:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+            # Headers and body are separate writes; avoid the keep-alive Nagle/delayed-ACK stall.
+            disable_nagle_algorithm = True
+
+            def _send(self, status: int, body: Mapping[str, Any]) -> None:
+                raw = json.dumps(body, ensure_ascii=False).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json; charset=utf-8")
+                self.send_header("Content-Length", str(len(raw)))
+                self.end_headers()
+                self.wfile.write(raw)
+
+            def _handle(self) -> None:
+                url = urlsplit(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+                params = {key.upper(): value for key, value in parse_qsl(url.query, keep_blank_values=True)}
+                self._send(*server._respond(url.path, params, self.headers.get("appkey", "")))
+
+            do_GET = _handle
+            do_POST = _handle
+
+            def log_message(self, format: str, *args: Any) -> None:  # noqa: A002
+                pass
+
+        return Handler
+
+
+def synthetic_execution_frame(code: str, seq: int = 0, trading_date: Optional[str] = None) -> str:
+    """``H0STCNT0`` data frame for ``code``; ``seq`` advances the execution time by one second from 09:00:00."""
+    from .realtime import EXECUTION_FIELDS, EXECUTION_TR_ID
+
+    price = _base_price(code) + seq % 20 * 10 - 100
+    hour = (datetime.strptime("090000", "%H%M%S") + timedelta(seconds=seq)).strftime("%H%M%S")
+    values = dict.fromkeys(EXECUTION_FIELDS, "0")
+    values.update({
+        "mksc_shrn_iscd": code,
+        "stck_cntg_hour": hour,
+        "stck_prpr": str(price),
+        "prdy_vrss_sign": "2",
+        "prdy_vrss": str(price // 100),
+        "prdy_ctrt": "1.00",
+        "stck_oprc": str(_base_price(code)),
+        "stck_hgpr": str(_base_price(code) + 100),
+        "stck_lwpr": str(_base_price(code) - 100),
+        "askp1": str(price + 10),
+        "bidp1": str(price),
+        "cntg_vol": str(10 + seq % 90),
+        "acml_vol": str(1_000 + seq * 50),
+        "acml_tr_pbmn": str((1_000 + seq * 50) * price),
+        "cttr": "100.00",
+        "bsop_date": trading_date or datetime.now(KST).strftime("%Y%m%d"),
+        "trht_yn": "N",
+    })
+    return f"0|{EXECUTION_TR_ID}|001|" + "^".join(values.values())
+
+
+def synthetic_quote_frame(code: str, seq: int = 0) -> str:
+    """``H0STASP0`` data frame for ``code`` (10 price levels around the synthetic price)."""
+    from .realtime import QUOTE_FIELDS, QUOTE_TR_ID
+
+    price = _base_price(code) + seq % 20 * 10 - 100
+    values = dict.fromkeys(QUOTE_FIELDS, "0")
+    values["mksc_shrn_iscd"] = code
+    values["bsop_hour"] = (datetime.strptime("090000", "%H%M%S") + timedelta(seconds=seq)).strftime("%H%M%S")
+    for level in range(1, 11):
+        values[f"askp{level}"] = str(price + level * 10)
+        values[f"bidp{level}"] = str(price - (level - 1) * 10)
+        values[f"askp_rsqn{level}"] = str(100 * level)
+        values[f"bidp_rsqn{level}"] = str(120 * level)
+    values["total_askp_rsqn"] = str(sum(100 * level for level in range(1, 11)))
+    values["total_bidp_rsqn"] = str(sum(120 * level for level in range(1, 11)))
+    return f"0|{QUOTE_TR_ID}|001|" + "^".join(values.values())
+
+
+class FakeKISRealtimeServer:
+    """WebSocket server that speaks the KIS realtime protocol for tests and load tests.
+
+    Subscribe/unsubscribe messages are acknowledged like KIS (``MAX SUBSCRIBE OVER`` past
+    ``MAX_SUBSCRIPTIONS``). Every ``interval`` seconds each connection receives one frame per
+    subscription: the next recorded frame for that ``(tr_id, code)`` if any were given with
+    ``replay``, otherwise a synthetic one stamped with the current KST time. ``disconnect()`` drops every connection to exercise
+    reconnects. Requires ``websockets``.
+
+    Args:
+        interval: Seconds between frame rounds.
+        ping_interval: Seconds between ``PINGPONG`` messages (``None`` disables them).
+        host, port: Bind address. Port 0 picks a free port.
+    """
+
+    def __init__(
+        self,
+        *,
+        interval: float = 0.05,
+        ping_interval: Optional[float] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ) -> None:
+        from websockets.sync.server import serve
+
+        self.interval = interval
+        self.ping_interval = ping_interval
+        self.connections = 0
+        self.pongs = 0
+        self.frames_sent = 0
+        self.subscriptions: Dict[Any, set] = {}
+        self._recorded: Dict[tuple, Deque[str]] = {}
+        self._lock = threading.Lock()
+        self._server = serve(self._handle, host, port)
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.socket.getsockname()[:2]
+        return f"ws://{host}:{port}"
+
+    def start(self) -> "FakeKISRealtimeServer":
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._server.serve_forever, name="fake-kis-realtime", daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self._server.shutdown()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "FakeKISRealtimeServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def replay(self, frames: Union[str, Path, List[str]]) -> None:
+        """Queue recorded raw frames (a list, or a file with one frame per line)."""
+        if isinstance(frames, (str, Path)):
+            frames = Path(frames).read_text(encoding="utf-8").splitlines()
+        with self._lock:
+            for raw in frames:
+                if not raw.strip():
+                    continue
+                _, tr_id, _, payload = raw.split("|", 3)
+                code = payload.split("^", 1)[0]
+                self._recorded.setdefault((tr_id, code), deque()).append(raw)
+
+    def disconnect(self) -> None:
+        """Close every open connection (clients are expected to reconnect)."""
+        with self._lock:
+            connections = list(self.subscriptions)
+        for connection in connections:
+            connection.close()
+
+    def _ack(self, connection: Any, message: Mapping[str, Any]) -> str:
+        header = message.get("header") or {}
+        body = (message.get("body") or {}).get("input") or {}
+        key = (body.get("tr_id"), body.get("tr_key"))
+        subscribed = self.subscriptions[connection]
+        if not header.get("approval_key"):
+            rt_cd, msg_cd, msg1 = "1", "OPSP0011", "invalid approval : NOT FOUND"
+        elif header.get("tr_type") == "2":
+            subscribed.discard(key)
+            rt_cd, msg_cd, msg1 = "0", "OPSP0000", "UNSUBSCRIBE SUCCESS"
+        elif key in subscribed:
+            rt_cd, msg_cd, msg1 = "1", "OPSP0002", "ALREADY IN SUBSCRIBE"
+        else:
+            from .realtime import MAX_SUBSCRIPTIONS
+
+            if len(subscribed) >= MAX_SUBSCRIPTIONS:
+                rt_cd, msg_cd, msg1 = "1", "OPSP0008", "MAX SUBSCRIBE OVER"
+            else:
+                subscribed.add(key)
+                rt_cd, msg_cd, msg1 = "0", "OPSP0000", "SUBSCRIBE SUCCESS"
+        return json.dumps({
+            "header": {"tr_id": key[0], "tr_key": key[1], "encrypt": "N"},
+            "body": {"rt_cd": rt_cd, "msg_cd": msg_cd, "msg1": msg1},
+        })
+
+    def _next_frame(self, tr_id: str, code: str, seq: int) -> Optional[str]:
+        from .realtime import EXECUTION_TR_ID, QUOTE_TR_ID
+
+        with self._lock:
+            recorded = self._recorded.get((tr_id, code))
+            if recorded:
+                return recorded.popleft()
+        if tr_id == EXECUTION_TR_ID:
+            return synthetic_execution_frame(code, seq)
+        if tr_id == QUOTE_TR_ID:
+            return synthetic_quote_frame(code, seq)
+        return None
+
+    def _handle(self, connection: Any) -> None:
+        from websockets.exceptions import ConnectionClosed
+
+        with self._lock:
+            self.connections += 1
+            self.subscriptions[connection] = set()
+        next_round = time.monotonic() + self.interval
+        next_ping = time.monotonic() + self.ping_interval if self.ping_interval else None
+        try:
+            while True:
+                timeout = max(0.0, next_round - time.monotonic())
+                try:
+                    raw = connection.recv(timeout=timeout)
+                except TimeoutError:
+                    raw = None
+                if raw is not None:
+                    message = json.loads(raw)
+                    if (message.get("header") or {}).get("tr_id") == "PINGPONG":
+                        with self._lock:
+                            self.pongs += 1
+                    else:
+                        connection.send(self._ack(connection, message))
+                    continue
+                # 합성 frame의 체결 시각은 현재 시각(KST)을 따른다.
+                now = datetime.now(KST)
+                seq = max(0, int((now - now.replace(hour=9, minute=0, second=0, microsecond=0)).total_seconds()))
+                for tr_id, code in sorted(self.subscriptions[connection]):
+                    frame = self._next_frame(tr_id, code, seq)
+                    if frame is not None:
+                        connection.send(frame)
+                        with self._lock:
+                            self.frames_sent += 1
+                next_round = time.monotonic() + self.interval
+                if next_ping is not None and time.monotonic() >= next_ping:
+                    connection.send(json.dumps({
+                        "header": {"tr_id": "PINGPONG", "datetime": datetime.now(KST).strftime("%Y%m%d%H%M%S")}
+                    }))
+                    next_ping = time.monotonic() + self.ping_interval
+        except ConnectionClosed:
+            pass
+        finally:
+            with self._lock:
+                self.subscriptions.pop(connection, None)
@@ -40,3 +40,25 @@ def kis_client() -> KISClient:
     base_url = os.getenv("KIS_BASE_URL", "https://openapi.koreainvestment.com:9443")
     timeout = float(os.getenv("KIS_TIMEOUT", "10"))
     return KISClient(app_key=app_key, app_secret=app_secret, base_url=base_url, timeout=timeout)
+
+
+@pytest.fixture()
+def fake_kis_server():
+    """Local KIS stand-in (kis_api.testing.FakeKISServer) for offline tests."""
+    from kis_api.testing import FakeKISServer
+
+    with FakeKISServer() as server:
+        yield server
+
+
+@pytest.fixture()
+def fake_kis_client(fake_kis_server) -> KISClient:
+    """KISClient pointed at ``fake_kis_server`` without request throttling."""
+    client = KISClient(
+        app_key="local",
+        app_secret="local",
+        base_url=fake_kis_server.base_url,
+        request_interval=0,
+    )
+    yield client
+    client.close()
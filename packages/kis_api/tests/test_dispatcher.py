@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import threading
+
+from kis_api.dispatcher import CollectorDispatcher, CollectorJob
+
+
+def test_dispatcher_runs_jobs_by_priority_and_dedups_codes() -> None:
+    """Higher priority jobs run first and each code is fetched once per job."""
+    calls: list[tuple[str, str]] = []
+    sunk: dict[str, int] = {}
+    lock = threading.Lock()
+
+    def fetch(name: str):
+        def _fetch(code: str):
+            with lock:
+                calls.append((name, code))
+            if code == "999999":
+                raise RuntimeError("boom")
+            return {"requested_fid_input_iscd": code}
+        return _fetch
+
+    dispatcher = CollectorDispatcher(
+        [
+            CollectorJob("history", 3, fetch("history"), lambda rows: sunk.setdefault("history", len(rows))),
+            CollectorJob("price", 0, fetch("price"), lambda rows: sunk.setdefault("price", len(rows))),
+        ],
+        max_workers=1,
+    )
+    reports = dispatcher.dispatch(["005930", "000660", "005930", "999999"])
+
+    assert [name for name, _ in calls] == ["price"] * 3 + ["history"] * 3
+    assert sunk == {"price": 2, "history": 2}
+    assert reports["price"].failed == ["999999"]
+    assert reports["history"].succeeded == ["005930", "000660"]
+    assert reports["price"].stored and reports["history"].stored
@@ -0,0 +1,97 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from pathlib import Path
+
+import httpx
+import pytest
+
+from kis_api import (
+    KISClient,
+    fetch_inquire_price,
+    fetch_volume_rank,
+    iter_inquire_time_itemconclusion_pages,
+)
+from kis_api.testing import FakeKISServer
+
+RECORDED = Path(__file__).resolve().parents[3] / "scripts" / "kis_test" / "국내주식정보조회예시응답.json"
+
+
+def test_collectors_against_fake_server(fake_kis_client: KISClient, fake_kis_server: FakeKISServer) -> None:
+    """Collectors run end-to-end against the synthetic responses."""
+    rank = fetch_volume_rank(fake_kis_client)
+    codes = [row["mksc_shrn_iscd"] for row in rank["output"]]
+    assert len(codes) == 30
+
+    price = fetch_inquire_price(fake_kis_client, codes[0])
+    assert price["requested_fid_input_iscd"] == codes[0]
+    assert int(price["stck_prpr"]) > 0
+
+    pages = list(iter_inquire_time_itemconclusion_pages(fake_kis_client, codes[0], "093000"))
+    hours = [row["stck_cntg_hour"] for page in pages for row in page]
+    assert hours[0] == "093000" and hours[-1] == "090000"
+    assert len(hours) == len(set(hours)) == 181
+
+    assert fake_kis_server.requests["/oauth2/tokenP"] == 1
+
+
+def test_fake_server_rate_limit_and_replay() -> None:
+    """Requests beyond the per-second budget fail like the KIS gateway; recorded bodies are replayed."""
+    path = "/uapi/domestic-stock/v1/quotations/search-stock-info"
+    with FakeKISServer(rate_limit=2) as server:
+        if RECORDED.is_file():
+            server.replay(path, RECORDED)
+        else:
+            server.replay(path, {"rt_cd": "0", "output": {"pdno": "00000A000660"}})
+        client = KISClient(app_key="local", app_secret="local", base_url=server.base_url)
+        try:
+            assert client.request("GET", path)["output"]["pdno"] == "00000A000660"
+            client.request("GET", path)
+            with pytest.raises(httpx.HTTPStatusError):
+                client.request("GET", path)
+        finally:
+            client.close()
+        assert server.throttled == 1
+
+
+class RecordingMetrics:
+    """Duck-typed stand-in for ``antic_extensions`` metrics."""
+
+    def __init__(self) -> None:
+        self.timings: list[dict] = []
+        self.counts: list[dict] = []
+
+    @contextmanager
+    def timer(self, name: str, **labels):
+        labels = {"name": name, **labels}
+        try:
+            yield labels
+            labels.setdefault("outcome", "ok")
+        except BaseException:
+            labels["outcome"] = "error"
+            raise
+        finally:
+            self.timings.append(labels)
+
+    def inc(self, name: str, value: float = 1.0, **labels) -> None:
+        self.counts.append({"name": name, **labels})
+
+
+def test_client_metrics_per_tr_id() -> None:
+    """Each request is timed under its tr_id and throttled responses are counted as errors."""
+    metrics = RecordingMetrics()
+    with FakeKISServer(rate_limit=1) as server:
+        client = KISClient(app_key="local", app_secret="local", base_url=server.base_url, metrics=metrics)
+        try:
+            fetch_volume_rank(client)
+            with pytest.raises(httpx.HTTPStatusError):
+                fetch_volume_rank(client)
+        finally:
+            client.close()
+
+    assert [(t["tr_id"], t["outcome"]) for t in metrics.timings] == [
+        ("tokenP", "ok"),
+        ("FHPST01710000", "ok"),
+        ("FHPST01710000", "error"),
+    ]
+    assert [c["status"] for c in metrics.counts if c["tr_id"] == "FHPST01710000"] == [200, 500]
@@ -13,3 +13,13 @@ def test_fetch_inquire_index_price(kis_client) -> None:
         result.get("acml_vol"),
         result.get("collected_at"),
     )
+
+
+def test_parse_index_codes_filters_groups() -> None:
+    from kis_api import parse_index_codes
+
+    lines = ["00001종합                    \n", "11001KOSDAQ                 \n", "22001KOSPI200\n", "99999      \n"]
+    assert [(c.code, c.name) for c in parse_index_codes(lines)] == [
+        ("0001", "종합"), ("1001", "KOSDAQ"), ("2001", "KOSPI200"),
+    ]
+    assert [c.code for c in parse_index_codes(lines, groups=["1"])] == ["1001"]
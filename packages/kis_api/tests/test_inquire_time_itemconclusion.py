@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from kis_api.collectors.inquire_time_itemconclusion import fetch_inquire_time_itemconclusion
+from kis_api.collectors.inquire_time_itemconclusion import (
+    fetch_inquire_time_itemconclusion,
+    iter_inquire_time_itemconclusion_pages,
+)
 
 
 def test_fetch_inquire_time_itemconclusion(kis_client) -> None:
@@ -24,3 +27,37 @@ def test_fetch_inquire_time_itemconclusion(kis_client) -> None:
             first.get("stck_prpr"),
             first.get("cnqn"),
         )
+
+
+class _PagedTickClient:
+    """Serve 30 ticks per page at or before the requested hour (descending)."""
+
+    def __init__(self, hours: list[str]) -> None:
+        self.hours = sorted(hours, reverse=True)
+        self.cursors: list[str] = []
+
+    def request(self, method, path, *, params=None, json=None, headers=None):
+        cursor = params["FID_INPUT_HOUR_1"]
+        self.cursors.append(cursor)
+        page = [h for h in self.hours if h <= cursor][:30]
+        return {"rt_cd": "0", "output2": [{"stck_cntg_hour": h} for h in page]}
+
+
+def test_iter_inquire_time_itemconclusion_pages_walks_back_to_stored_tick() -> None:
+    """Pages walk backwards by cursor and stop at an already-stored tick."""
+    hours = [f"09{m:02d}{s:02d}" for m in range(0, 3) for s in range(60)]
+    client = _PagedTickClient(hours)
+    pages = list(
+        iter_inquire_time_itemconclusion_pages(
+            client,  # type: ignore[arg-type]
+            "005930",
+            "090259",
+            stop_after="090044",
+        )
+    )
+    ticks = [row["stck_cntg_hour"] for page in pages for row in page]
+    assert ticks == sorted(hours, reverse=True)[: len(hours) - 45]
+    assert client.cursors == ["090259", "090229", "090159", "090129", "090059"]
+
+    full = list(iter_inquire_time_itemconclusion_pages(client, "005930", "090259"))  # type: ignore[arg-type]
+    assert sum(len(page) for page in full) == len(hours)
@@ -0,0 +1,26 @@
+from __future__ import annotations
+
+from kis_api import KISClient, fetch_inquire_price
+from kis_api.collectors.intstock_multprice import API_PATH, fetch_intstock_multprice
+from kis_api.testing import DEFAULT_CODES, FakeKISServer
+
+
+def test_fetch_intstock_multprice(kis_client) -> None:
+    """Ensure the multi-stock quote API responds with one row per code."""
+    result = fetch_intstock_multprice(kis_client, ["005930", "000660"])
+    assert [row["requested_fid_input_iscd"] for row in result] == ["005930", "000660"]
+    print("Multi-stock quote:", [(row["stck_shrn_iscd"], row.get("stck_prpr")) for row in result])
+
+
+def test_intstock_multprice_chunks_and_matches_inquire_price(
+    fake_kis_client: KISClient, fake_kis_server: FakeKISServer
+) -> None:
+    """45 codes take two calls and each row carries the single-quote fields."""
+    codes = list(DEFAULT_CODES) + [f"9{i:05d}" for i in range(15)] + ["005930"]
+    rows = fetch_intstock_multprice(fake_kis_client, codes)
+
+    assert fake_kis_server.requests[API_PATH] == 2
+    assert [row["requested_fid_input_iscd"] for row in rows] == list(dict.fromkeys(codes))
+    single = fetch_inquire_price(fake_kis_client, "005930")
+    for field in ("stck_shrn_iscd", "stck_prpr", "prdy_vrss", "acml_vol"):
+        assert rows[0][field] == single[field]
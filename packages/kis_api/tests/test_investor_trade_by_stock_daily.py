@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+from kis_api import KISClient
 from kis_api.collectors.investor_trade_by_stock_daily import fetch_investor_trade_by_stock_daily
 
 
@@ -21,3 +22,15 @@ def test_fetch_investor_trade_by_stock_daily(kis_client) -> None:
         )
     else:
         print("No investor trade data returned")
+
+
+def test_investor_trade_returns_full_series(fake_kis_client: KISClient) -> None:
+    """Every ``output2`` day is returned, newest first, with the request metadata."""
+    rows = fetch_investor_trade_by_stock_daily(fake_kis_client, "005930", "20261016")
+
+    assert len(rows) == 30
+    assert [row["stck_bsop_date"] for row in rows[:3]] == ["20261016", "20261015", "20261014"]
+    assert all(row["requested_fid_input_iscd"] == "005930" for row in rows)
+    # The next trading day prepends one row to the same history.
+    later = fetch_investor_trade_by_stock_daily(fake_kis_client, "005930", "20261019")
+    assert [row["frgn_ntby_qty"] for row in later[1:4]] == [row["frgn_ntby_qty"] for row in rows[:3]]
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from kis_api import CollectorDispatcher, CollectorJob, KISClient, KISClientPool, fetch_inquire_price
+from kis_api.pool import ROUTE_HASH
+from kis_api.testing import FakeKISServer
+
+CODES = [f"{i:06d}" for i in range(1, 61)]
+
+
+def test_pool_least_loaded_spreads_rate_budget() -> None:
+    """Each key keeps its own interval, so three keys serve 3x the per-key limit without throttling."""
+    with FakeKISServer(rate_limit=20) as server:
+        pool = KISClientPool.from_credentials(
+            [(f"key{i}", "secret") for i in range(3)], base_url=server.base_url, request_interval=0.06
+        )
+        try:
+            dispatcher = CollectorDispatcher(
+                [CollectorJob("current_price", 0, lambda code: fetch_inquire_price(pool, code))],
+                max_workers=6,
+            )
+            report = dispatcher.dispatch(CODES)["current_price"]
+        finally:
+            pool.close()
+    assert len(report.succeeded) == len(CODES) and not report.failed
+    assert server.throttled == 0
+    assert sorted(server.requests_by_key.values()) == [20, 20, 20]
+    assert server.requests["/oauth2/tokenP"] == 3
+
+
+def test_pool_hash_routing_is_stable() -> None:
+    """A code always uses the same key, and adding a key only moves part of the codes."""
+    with FakeKISServer() as server:
+        clients = [KISClient(app_key=f"key{i}", app_secret="secret", base_url=server.base_url) for i in range(4)]
+        pool = KISClientPool(clients[:3], strategy=ROUTE_HASH)
+        grown = KISClientPool(clients, strategy=ROUTE_HASH)
+        try:
+            for code in CODES[:5]:
+                fetch_inquire_price(pool, code)
+                fetch_inquire_price(pool, code)
+        finally:
+            grown.close()
+    assert all(count % 2 == 0 for count in server.requests_by_key.values())
+
+    before = {code: pool._hash_index(code) for code in CODES}
+    after = {code: grown._hash_index(code) for code in CODES}
+    moved = [code for code in CODES if before[code] != after[code]]
+    assert all(after[code] == 3 for code in moved)
+    assert 0 < len(moved) < len(CODES) / 2
@@ -0,0 +1,118 @@
+from __future__ import annotations
+
+import threading
+import time
+
+import pytest
+
+from kis_api import KISClient
+from kis_api.realtime import (
+    EXECUTION_TR_ID,
+    MAX_SUBSCRIPTIONS,
+    QUOTE_TR_ID,
+    KISRealtimeClient,
+    RealtimeFrame,
+    decode_frame,
+    execution_to_price,
+    execution_to_tick,
+)
+from kis_api.testing import FakeKISServer, synthetic_execution_frame
+
+pytest.importorskip("websockets")
+from kis_api.testing import FakeKISRealtimeServer  # noqa: E402
+
+
+def _wait_for(predicate, timeout: float = 5.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() > deadline:
+            raise AssertionError("condition not met in time")
+        time.sleep(0.01)
+
+
+def test_decode_multi_record_frame() -> None:
+    """Several records in one frame are split by field count, JSON control messages are not frames."""
+    first = synthetic_execution_frame("005930", 1, trading_date="20251111")
+    second = synthetic_execution_frame("000660", 2, trading_date="20251111")
+    raw = f"0|{EXECUTION_TR_ID}|002|{first.split('|', 3)[3]}^{second.split('|', 3)[3]}"
+
+    frame = decode_frame(raw)
+    assert frame is not None and len(frame.records) == 2
+    assert list(frame.latest_by_code()) == ["005930", "000660"]
+    price = execution_to_price(frame, frame.records[1])
+    assert price["requested_fid_input_iscd"] == "000660"
+    assert price["collected_at"].strftime("%Y%m%d%H%M%S") == "20251111090002"
+    assert execution_to_tick(frame, frame.records[0])["stck_cntg_hour"] == "090001"
+    assert decode_frame('{"header": {"tr_id": "PINGPONG"}}') is None
+    with pytest.raises(ValueError):
+        decode_frame(f"0|{EXECUTION_TR_ID}")
+    with pytest.raises(ValueError):
+        decode_frame(f"0|{EXECUTION_TR_ID}|002|{first.split('|', 3)[3]}")
+
+
+def test_receive_skips_undecodable_frames_and_caps_subscriptions() -> None:
+    """A broken frame is dropped without ending the session, and subscriptions stop at the KIS limit."""
+    frames: list[RealtimeFrame] = []
+    client = KISClient(app_key="local", app_secret="local", base_url="http://127.0.0.1:9")
+    feed = KISRealtimeClient(client, frames.append)
+    feed._receive([f"0|{EXECUTION_TR_ID}", synthetic_execution_frame("005930", 1)])
+    assert [frame.records[0][0] for frame in frames] == ["005930"]
+
+    codes = [f"{i:06d}" for i in range(MAX_SUBSCRIPTIONS + 5)]
+    assert feed.subscribe(QUOTE_TR_ID, codes[:1]) == codes[:1]
+    assert feed.subscribe(EXECUTION_TR_ID, codes) == codes[:MAX_SUBSCRIPTIONS - 1]
+    assert len(feed.subscriptions) == MAX_SUBSCRIPTIONS
+    # 해제한 만큼 다시 등록할 수 있다.
+    assert feed.set_codes(EXECUTION_TR_ID, codes[5:]) == codes[MAX_SUBSCRIPTIONS - 1:MAX_SUBSCRIPTIONS + 4]
+    client.close()
+
+
+def test_realtime_client_retries_rejected_handshake() -> None:
+    """A server that refuses the WebSocket upgrade is retried instead of ending the feed thread."""
+    with FakeKISServer() as rest:
+        client = KISClient(app_key="local", app_secret="local", base_url=rest.base_url)
+        feed = KISRealtimeClient(
+            client, lambda frame: None, url=rest.base_url.replace("http", "ws"), reconnect_delay=0.01,
+        )
+        with feed:
+            _wait_for(lambda: feed.reconnects >= 2)
+            assert feed._thread is not None and feed._thread.is_alive()
+        client.close()
+
+
+def test_realtime_client_resubscribes_after_reconnect() -> None:
+    """Frames stream for every subscription, PINGPONG is echoed and a dropped session resumes."""
+    frames: list[RealtimeFrame] = []
+    lock = threading.Lock()
+
+    def on_frame(frame: RealtimeFrame) -> None:
+        with lock:
+            frames.append(frame)
+
+    def codes() -> set:
+        with lock:
+            return {(f.tr_id, r[0]) for f in frames for r in f.records}
+
+    with FakeKISServer() as rest, FakeKISRealtimeServer(interval=0.02, ping_interval=0.05) as ws_server:
+        client = KISClient(app_key="local", app_secret="local", base_url=rest.base_url)
+        feed = KISRealtimeClient(client, on_frame, url=ws_server.url, reconnect_delay=0.05)
+        feed.subscribe(EXECUTION_TR_ID, ["005930", "000660"])
+        feed.subscribe(QUOTE_TR_ID, ["005930"])
+        with feed:
+            _wait_for(lambda: codes() == {
+                (EXECUTION_TR_ID, "005930"), (EXECUTION_TR_ID, "000660"), (QUOTE_TR_ID, "005930")
+            })
+            _wait_for(lambda: ws_server.pongs > 0)
+
+            feed.unsubscribe(EXECUTION_TR_ID, ["000660"])
+            ws_server.disconnect()
+            _wait_for(lambda: ws_server.connections == 2)
+            _wait_for(lambda: any(ws_server.subscriptions.values()))
+            with lock:
+                frames.clear()
+            _wait_for(lambda: (EXECUTION_TR_ID, "005930") in codes())
+            assert (EXECUTION_TR_ID, "000660") not in codes()
+        client.close()
+
+    assert feed.reconnects == 1
+    assert rest.requests["/oauth2/Approval"] == 2      # 재접속마다 접속키를 새로 발급
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import logging
+from datetime import datetime
+
+from kis_api.client import KST
+from kis_api.schedule import (
+    PHASE_AFTER_HOURS,
+    PHASE_CLOSED,
+    PHASE_PRE_OPEN,
+    PHASE_REGULAR,
+    AdaptiveInterval,
+    KRXCalendar,
+    ranking_churn,
+)
+
+
+def _kst(*args: int) -> datetime:
+    return datetime(*args, tzinfo=KST)
+
+
+def test_krx_calendar_phases_and_holidays() -> None:
+    calendar = KRXCalendar(extra_holidays=["20261020"])
+    assert calendar.phase(_kst(2026, 10, 19, 8, 45)) == PHASE_PRE_OPEN
+    assert calendar.phase(_kst(2026, 10, 19, 9, 0)) == PHASE_REGULAR
+    assert calendar.phase(_kst(2026, 10, 19, 16, 30)) == PHASE_AFTER_HOURS
+    assert calendar.phase(_kst(2026, 10, 19, 20, 0)) == PHASE_CLOSED
+    assert calendar.phase(_kst(2026, 10, 17, 10, 0)) == PHASE_CLOSED      # 토요일
+    assert calendar.phase(_kst(2026, 9, 25, 10, 0)) == PHASE_CLOSED       # 추석
+    assert calendar.phase(_kst(2026, 11, 19, 9, 30)) == PHASE_PRE_OPEN    # 수능일 10시 개장
+    # UTC 입력도 KST로 변환한다. (01:00 UTC == 10:00 KST)
+    assert calendar.phase(datetime.fromisoformat("2026-10-19T01:00:00+00:00")) == PHASE_REGULAR
+
+    # 추가 휴장일(10/20)을 건너뛰어 다음 정규장 시작을 찾는다.
+    assert calendar.next_open(_kst(2026, 10, 19, 16, 0)) == _kst(2026, 10, 21, 9, 0)
+    # 12/31(연말 휴장일), 1/1 이후 첫 거래일은 10시 개장
+    assert calendar.next_open(_kst(2026, 12, 30, 18, 0)) == _kst(2027, 1, 4, 10, 0)
+
+
+def test_adaptive_interval_follows_ranking_churn() -> None:
+    schedule = AdaptiveInterval(min_interval=60, max_interval=600)
+    quiet = schedule.next_interval(PHASE_REGULAR, churn=ranking_churn(["A", "B", "C"], ["A", "B", "C"]))
+    busy = schedule.next_interval(PHASE_REGULAR, churn=ranking_churn(["A", "B", "C"], ["A", "D", "E"]))
+    volatile = schedule.next_interval(PHASE_REGULAR, volatility=2.5)
+    assert quiet == 600 and busy == 60 and volatile == 330
+    assert schedule.next_interval(PHASE_AFTER_HOURS, churn=1.0) == 600
+    assert schedule.next_interval(PHASE_CLOSED) is None
+
+
+def test_krx_calendar_warns_for_years_without_holidays(caplog) -> None:
+    calendar = KRXCalendar()
+    with caplog.at_level(logging.WARNING):
+        assert calendar.is_trading_day(_kst(2026, 10, 19).date())
+        assert not caplog.records
+        calendar.is_trading_day(_kst(2030, 3, 4).date())
+        calendar.is_trading_day(_kst(2030, 3, 5).date())
+    assert [record.getMessage() for record in caplog.records] == [
+        "KRX holiday table has no entries for 2030; only weekends and year-end closures are applied "
+        "(update KRX_HOLIDAYS or pass extra_holidays)",
+    ]
+
+    # 그 해의 휴장일을 추가하면 경고하지 않는다.
+    caplog.clear()
+    with caplog.at_level(logging.WARNING):
+        KRXCalendar(extra_holidays=["20300101"]).is_trading_day(_kst(2030, 3, 4).date())
+    assert not caplog.records
@@ -12,3 +12,23 @@ def test_fetch_volume_rank(kis_client) -> None:
         print("Top ranked symbol:", first.get("mksc_shrn_iscd"), first.get("hts_kor_isnm"))
     else:
         print("No data returned from volume rank API")
+
+
+def test_diff_volume_rank_reports_only_changes() -> None:
+    from kis_api import diff_volume_rank
+
+    def rows(*entries):
+        return [
+            {"mksc_shrn_iscd": code, "data_rank": str(rank), "acml_vol": str(volume)}
+            for rank, (code, volume) in enumerate(entries, start=1)
+        ]
+
+    previous = rows(("A", 1000), ("B", 900), ("C", 800))
+    assert not diff_volume_rank(previous, rows(("A", 1020), ("B", 900), ("C", 800)))
+
+    delta = diff_volume_rank(previous, rows(("B", 1500), ("A", 1000), ("D", 700)), volume_threshold=0.1)
+    assert delta.entered == ["D"] and delta.left == ["C"]
+    assert delta.moved == {"B": (2, 1), "A": (1, 2)}
+    assert delta.volume_changed == {"B": (900, 1500)}
+    assert delta.changed_codes() == ["D", "B", "A"]
+    assert diff_volume_rank([], previous).entered == ["A", "B", "C"]
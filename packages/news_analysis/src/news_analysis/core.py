@@ -1,7 +1,7 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-from typing import Union, Optional
+from typing import Any, Union, Optional
 from .modules import *
 from .service import *
 
@@ -28,15 +28,22 @@ class NewsDataPipelineAPI:
     def __init__(
             self,
             api_client_id: Optional[str]=None,
-            api_secret_key: Optional[str]=None
+            api_secret_key: Optional[str]=None,
+            metrics: Optional[Any]=None
     ) -> None:
         """
         Args:
             api_client_id (Optional[str], optional): 발급된 API 아이디
             api_secret_key (Optional[str], optional): 발급된 시크릿 키
+            metrics (optional): 본문 스크랩 계측 객체. (``NewsScrapService`` 참고)
         """
         self._api_client_id = api_client_id
         self._api_secret_key = api_secret_key
+        # 호출마다 세션을 새로 만들지 않도록 서비스(및 내부 커넥션 풀)를 재사용한다.
+        self._fetch_service = NaverNewsFetchService(
+            self._api_client_id, self._api_secret_key
+        )
+        self._scrap_service = NewsScrapService(metrics=metrics)
 
     def fetch_news_from_naver_api(
         self,
@@ -63,20 +70,52 @@ class NewsDataPipelineAPI:
         :param preprocess: (bool) 문자열 전처리 여부. 
         """
 
-        fetch_service = NaverNewsFetchService(
-            self._api_client_id, self._api_secret_key
-        )
-        result = fetch_service.fetch_naver_news_api(query, sort, display)
+        result = self._fetch_service.fetch_naver_news_api(query, sort, display)
 
         if web_scrap_content and result:
-            scrapper = NewsScrapService()
-            result = scrapper.sync_start_news_scrap(result)
+            result = self._scrap_service.sync_start_news_scrap(result)
 
         preprocessor = NaverNewsDataProcessorService()
         if preprocess and result:
             preprocessor.clean_news_items(result)
         return result if result else []
 
+    def fetch_news_batch(
+        self,
+        targets: TNewsBatchTargets,
+        sort: str='date',
+        display: int=20,
+        web_scrap_content: bool=True,
+        preprocess: bool=True,
+        max_workers: int=4,
+    ) -> dict[str, list[Union[NaverNewsApiResultTDict,
+                              NaverNewsContentTDict]]]:
+        """여러 종목(검색어)의 뉴스를 동시에 수집/중복 제거/스크랩/전처리한다.
+
+        >>> api = NewsDataPipelineAPI()
+        >>> results = api.fetch_news_batch({'005930': '삼성전자', '000660': 'SK하이닉스'})
+        >>> results['005930']
+
+        :param targets: 종목 코드 -> 검색어(종목명) 매핑, 혹은 검색어 목록
+        :param sort: 정렬 방식. 'sim'은 정확도, 'date'는 날짜순.
+        :param display: 종목당 받아올 표시 개수. (최대 100)
+        :param web_scrap_content: (bool) 뉴스 링크를 타고 본문 스크랩 여부.
+        :param preprocess: (bool) 문자열 전처리 여부.
+        :param max_workers: (int) 동시 호출 스레드 수
+        """
+        service = NewsBatchPipelineService(
+            self._fetch_service,
+            scrap_service=self._scrap_service,
+            max_workers=max_workers,
+        )
+        return service.run(
+            targets,
+            sort=sort,
+            display=display,
+            web_scrap_content=web_scrap_content,
+            preprocess=preprocess,
+        )
+
     def select_top_k_by_date(
         self,
         data: list[Union[NaverNewsApiResultTDict,
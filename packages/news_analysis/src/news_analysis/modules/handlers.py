@@ -1,12 +1,68 @@
+import gzip
+import io
 import json
-from typing import Generator, Any, Union
+from itertools import islice
+from typing import Generator, Any, Union, Iterable, Iterator, Optional, IO
 import logging
 
 __all__ = (
     'JSONLoader',
-    'FileHandler'
+    'JSONLinesReader',
+    'JSONLinesWriter',
+    'FileHandler',
+    'chunked',
 )
 
+_COMPRESSIONS = ('gzip', 'zstd')
+
+
+def _infer_compression(path: str, compression: Optional[str]) -> Optional[str]:
+    if compression is not None:
+        if compression not in _COMPRESSIONS:
+            raise ValueError(f"Unsupported compression: {compression}")
+        return compression
+    if path.endswith('.gz'):
+        return 'gzip'
+    if path.endswith('.zst'):
+        return 'zstd'
+    return None
+
+
+def _open_text(path: str, mode: str, compression: Optional[str]=None) -> IO[str]:
+    """확장자(.gz, .zst) 혹은 ``compression`` 인자에 따라 (압축) 텍스트 스트림을 연다."""
+    compression = _infer_compression(path, compression)
+    if compression == 'gzip':
+        return gzip.open(path, mode + 't', encoding='utf-8')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError as e:
+            raise ImportError(
+                "zstd compression requires 'zstandard'. "
+                "(pip install news_analysis[zstd])"
+            ) from e
+        raw = open(path, mode + 'b')
+        if mode == 'r':
+            # append로 이어 붙인 frame까지 읽는다. (기본값은 버전에 따라 첫 frame에서 EOF)
+            stream = zstandard.ZstdDecompressor().stream_reader(raw, closefd=True, read_across_frames=True)
+        else:
+            stream = zstandard.ZstdCompressor().stream_writer(raw, closefd=True)
+        return io.TextIOWrapper(stream, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def chunked(iterable: Iterable[Any], size: int) -> Generator[list[Any], None, None]:
+    """이터러블을 ``size``개씩 묶은 리스트로 순차 반환한다. (마지막 묶음은 더 작을 수 있음)
+
+    >>> list(chunked(range(5), 2))
+    [[0, 1], [2, 3], [4]]
+    """
+    if size <= 0:
+        raise ValueError(f"Invalid chunk size: {size}")
+    iterator = iter(iterable)
+    while chunk := list(islice(iterator, size)):
+        yield chunk
+
 
 class FileHandler:
     @staticmethod
@@ -14,13 +70,34 @@ class FileHandler:
         if not data:
             raise ValueError(f"Empty or unexpeceted type of data: {type(data)}")
         with open(path, encoding='utf-8', mode='w') as f:
-            f.write(json.dumps(data, indent=4, ensure_ascii=False))
+            # json.dump은 인코딩 결과를 조각 단위로 기록하므로 전체 문자열을 메모리에 만들지 않는다.
+            json.dump(data, f, indent=4, ensure_ascii=False)
             logging.info(f'Saved result txt file to {path}')
 
+    @staticmethod
+    def save_to_jsonl(
+            items: Iterable[dict],
+            path: str='./news.jsonl',
+            append: bool=False,
+            compression: Optional[str]=None,
+    ) -> int:
+        """항목을 한 줄에 하나씩 JSON Lines 형식으로 기록하고, 기록한 줄 수를 반환한다.
+
+        :param append: (bool) 기존 파일 뒤에 이어서 기록할지 여부
+        :param compression: 'gzip' | 'zstd' | None (None이면 확장자로 판단)
+        """
+        with JSONLinesWriter(path, append=append, compression=compression) as writer:
+            count = writer.write_many(items)
+        logging.info(f'Saved {count} lines to {path}')
+        return count
+
 
 class JSONLoader:
     """제너레이터를 반환하는 JSONLoader.
-    
+
+    파일 전체를 ``json.load`` 하지 않고 최상위 배열/객체의 원소를 하나씩 파싱하므로
+    큰 파일도 원소 하나 크기의 메모리로 순회할 수 있습니다.
+
     ```python
     # Example
     loader = JSONLoader()
@@ -28,22 +105,148 @@ class JSONLoader:
         print(item)
     ```
     """
-    def __init__(self):
+    _WHITESPACE = ' \t\n\r'
+    _DELIMITERS = _WHITESPACE + ',:]}'
+
+    def __init__(self, chunk_size: int=64 * 1024):
         self._data = None
-    
+        self._chunk_size = chunk_size
+        self._decoder = json.JSONDecoder()
+
     def __call__(self, path: str) -> Generator[Any, None, None]:
-        with open(path, 'r', encoding='utf-8') as f:
-            self._data = json.load(f)
-        
-        if isinstance(self._data, list):
-            for item in self._data:
-                yield item
-        elif isinstance(self._data, dict):
-            for key, value in self._data.items():
-                yield {
-                    key: value
-                }
-                # yield key, value
-        else:
+        with _open_text(path, 'r') as f:
+            yield from self._iter_stream(f)
+
+    def _iter_stream(self, f: IO[str]) -> Generator[Any, None, None]:
+        buf = ''
+        pos = 0
+        eof = False
+
+        def fill() -> bool:
+            nonlocal buf, pos, eof
+            chunk = f.read(self._chunk_size)
+            if not chunk:
+                eof = True
+                return False
+            buf = buf[pos:] + chunk
+            pos = 0
+            return True
+
+        def skip(chars: str) -> Optional[str]:
+            """공백과 ``chars``를 건너뛰고 다음 문자를 반환한다. (EOF면 None)"""
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in chars:
+                    pos += 1
+                if pos < len(buf):
+                    return buf[pos]
+                if not fill():
+                    return None
+
+        def decode() -> Any:
+            """현재 위치의 JSON 값 하나를 디코드한다. 값이 잘려 있으면 더 읽어온다."""
+            nonlocal pos
+            while True:
+                try:
+                    value, end = self._decoder.raw_decode(buf, pos)
+                    # 숫자/리터럴이 버퍼 끝에서 잘렸을 수 있으므로 구분자가 보일 때까지 확인한다.
+                    if eof or (end < len(buf) and buf[end] in self._DELIMITERS):
+                        pos = end
+                        return value
+                except json.JSONDecodeError:
+                    if eof:
+                        raise
+                fill()
+
+        head = skip(self._WHITESPACE)
+        if head is None:
+            return
+        if head not in '[{':
+            # 최상위가 스칼라인 경우
+            self._data = decode()
             yield self._data
+            return
+
+        pos += 1
+        closing = ']' if head == '[' else '}'
+        while True:
+            nxt = skip(self._WHITESPACE + ',')
+            if nxt is None:
+                raise json.JSONDecodeError(f"Expecting '{closing}'", buf, pos)
+            if nxt == closing:
+                pos += 1
+                return
+            if head == '[':
+                yield decode()
+                continue
+            key = decode()
+            if skip(self._WHITESPACE) != ':':
+                raise json.JSONDecodeError("Expecting ':' delimiter", buf, pos)
+            pos += 1
+            skip(self._WHITESPACE)
+            yield {
+                key: decode()
+            }
+
+
+class JSONLinesReader:
+    """JSON Lines(.jsonl, .jsonl.gz, .jsonl.zst) 파일을 한 줄씩 읽는 리더.
+
+    >>> for item in JSONLinesReader("news.jsonl.gz"):
+            print(item['title'])
+    >>> for batch in JSONLinesReader("news.jsonl").iter_chunks(500):
+            ...
+    """
+    def __init__(self, path: str, compression: Optional[str]=None) -> None:
+        self._path = path
+        self._compression = compression
+
+    def __iter__(self) -> Iterator[Any]:
+        with _open_text(self._path, 'r', self._compression) as f:
+            for lineno, line in enumerate(f, start=1):
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    yield json.loads(line)
+                except json.JSONDecodeError as e:
+                    logging.warning(f"Skip invalid line {lineno} in {self._path}: {e}")
+
+    def iter_chunks(self, size: int) -> Generator[list[Any], None, None]:
+        yield from chunked(self, size)
+
+
+class JSONLinesWriter:
+    """JSON Lines 파일 작성기. ``append=True``로 기존 파일에 이어 쓸 수 있습니다.
+
+    >>> with JSONLinesWriter("news.jsonl.gz", append=True) as writer:
+            writer.write_many(items)
+    """
+    def __init__(
+            self,
+            path: str,
+            append: bool=False,
+            compression: Optional[str]=None,
+    ) -> None:
+        self._path = path
+        self._file = _open_text(path, 'a' if append else 'w', compression)
+
+    def write(self, item: Any) -> None:
+        self._file.write(json.dumps(item, ensure_ascii=False, default=str))
+        self._file.write('\n')
+
+    def write_many(self, items: Iterable[Any]) -> int:
+        count = 0
+        for item in items:
+            self.write(item)
+            count += 1
+        return count
+
+    def close(self) -> None:
+        self._file.close()
+
+    def __enter__(self):
+        return self
 
+    def __exit__(self, *exc):
+        self.close()
@@ -1,31 +1,206 @@
-from typing import Optional
+from typing import Optional, Any
+import asyncio
 import requests
+import httpx
 import logging
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 __all__ = (
     'HttpClient',
+    'AsyncHttpClient',
 )
 
+RETRY_STATUS_FORCELIST = (429, 500, 502, 503, 504)
+'''재시도 대상 HTTP 상태 코드 (Rate limit, 서버 오류)'''
+
 
 class HttpClient:
+    """Keep-alive 세션과 커넥션 풀을 소유하는 동기 HTTP 클라이언트.
+
+    같은 인스턴스를 재사용하면 TCP/TLS 연결이 풀에 유지되어 요청마다
+    핸드셰이크 비용을 지불하지 않습니다. 429/5xx 응답은 지수 백오프로 재시도합니다.
+
+    >>> client = HttpClient("https://openapi.naver.com/v1/search/news.json")
+    >>> data = client.get(params={"query": "삼성전자"})
+    >>> html = client.request("GET", "https://n.news.naver.com/...").text
+    """
     def __init__(
-            self, 
-            endpoint: str
+            self,
+            endpoint: str='',
+            timeout: float=10.0,
+            max_retries: int=3,
+            backoff_factor: float=0.5,
+            pool_maxsize: int=10,
+            session: Optional[requests.Session]=None,
     ) -> None:
+        """
+        :param endpoint: (str) 기본 요청 URL. ``request()``에 url을 넘기지 않으면 사용됩니다.
+        :param timeout: (float) 기본 타임아웃(초). 요청 시 ``timeout=``으로 덮어쓸 수 있습니다.
+        :param max_retries: (int) 429/5xx, 연결 오류에 대한 최대 재시도 횟수
+        :param backoff_factor: (float) 재시도 간 지수 백오프 계수 (0.5 -> 0.5s, 1s, 2s ...)
+        :param pool_maxsize: (int) 호스트당 유지할 최대 커넥션 수
+        :param session: (requests.Session, optional) 외부 세션 주입. 주입 시 어댑터를 새로 마운트하지 않습니다.
+        """
         self._endpoint = f"{endpoint}"
+        self._timeout = timeout
+        self._owns_session = session is None
+        self._session = session or self._build_session(
+            max_retries, backoff_factor, pool_maxsize
+        )
+
+    @staticmethod
+    def _build_session(
+            max_retries: int,
+            backoff_factor: float,
+            pool_maxsize: int,
+    ) -> requests.Session:
+        retry = Retry(
+            total=max_retries,
+            backoff_factor=backoff_factor,
+            status_forcelist=RETRY_STATUS_FORCELIST,
+            allowed_methods=frozenset({'GET', 'HEAD'}),
+            respect_retry_after_header=True,
+            # 재시도 소진 시 마지막 응답을 돌려받아 raise_for_status()로 처리한다.
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=pool_maxsize,
+            pool_maxsize=pool_maxsize,
+            max_retries=retry,
+        )
+        session = requests.Session()
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+
+    @property
+    def session(self) -> requests.Session:
+        return self._session
+
+    def request(
+            self,
+            method: str,
+            url: Optional[str]=None,
+            **kwargs
+    ) -> requests.Response:
+        """풀링된 세션으로 요청을 보내고 응답을 반환합니다.
+
+        Raises:
+            requests.RequestException: 연결 실패, 타임아웃, 4xx/5xx 응답
+        """
+        kwargs.setdefault('timeout', self._timeout)
+        res = self._session.request(
+            method.upper(), url or self._endpoint, **kwargs
+        )
+        res.raise_for_status()
+        return res
 
     def get(self, params: Optional[dict]=None, **kwargs) -> Optional[dict]:
         try:
-            res = requests.get(
-                self._endpoint, params=params or {}, **kwargs
-            )
-            res.raise_for_status()
-            logging.info(
-                f"Retrived GET({self._endpoint}): {str(res.json())[:100]}"
+            res = self.request('GET', params=params or {}, **kwargs)
+            data = res.json()
+        except requests.RequestException as e:
+            logging.warning(e)
+            return None
+        logging.info(
+            f"Retrived GET({self._endpoint}): {str(data)[:100]}"
+        )
+        return data
+
+    def close(self) -> None:
+        if self._owns_session:
+            self._session.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class AsyncHttpClient:
+    """``HttpClient``의 비동기 버전. ``httpx.AsyncClient``의 커넥션 풀을 사용합니다.
+
+    >>> async with AsyncHttpClient("https://openapi.naver.com/v1/search/news.json") as client:
+            data = await client.get(params={"query": "삼성전자"})
+    """
+    def __init__(
+            self,
+            endpoint: str='',
+            timeout: float=10.0,
+            max_retries: int=3,
+            backoff_factor: float=0.5,
+            max_connections: int=10,
+            client: Optional[httpx.AsyncClient]=None,
+    ) -> None:
+        self._endpoint = f"{endpoint}"
+        self._max_retries = max(0, max_retries)
+        self._backoff_factor = backoff_factor
+        self._owns_client = client is None
+        self._client = client or httpx.AsyncClient(
+            timeout=timeout,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_connections,
+            ),
+            transport=httpx.AsyncHTTPTransport(retries=self._max_retries),
+            follow_redirects=True,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        return self._client
+
+    def _backoff(self, attempt: int, response: Optional[httpx.Response]) -> float:
+        if response is not None:
+            retry_after = response.headers.get('Retry-After')
+            if retry_after and retry_after.isdigit():
+                return float(retry_after)
+        return self._backoff_factor * (2 ** attempt)
+
+    async def request(
+            self,
+            method: str,
+            url: Optional[str]=None,
+            **kwargs
+    ) -> httpx.Response:
+        """요청을 보내고 429/5xx 응답은 백오프 후 재시도합니다.
+
+        Raises:
+            httpx.HTTPError: 연결 실패, 타임아웃, 재시도 후에도 4xx/5xx인 응답
+        """
+        attempt = 0
+        while True:
+            res = await self._client.request(
+                method.upper(), url or self._endpoint, **kwargs
             )
-            return res.json()
-        except requests.HTTPError as e:
+            if res.status_code not in RETRY_STATUS_FORCELIST \
+                    or attempt >= self._max_retries:
+                break
+            await asyncio.sleep(self._backoff(attempt, res))
+            attempt += 1
+        res.raise_for_status()
+        return res
+
+    async def get(self, params: Optional[dict]=None, **kwargs) -> Optional[Any]:
+        try:
+            res = await self.request('GET', params=params or {}, **kwargs)
+            data = res.json()
+        except (httpx.HTTPError, ValueError) as e:
             logging.warning(e)
-        return None
-    
-    
\ No newline at end of file
+            return None
+        logging.info(
+            f"Retrived GET({self._endpoint}): {str(data)[:100]}"
+        )
+        return data
+
+    async def aclose(self) -> None:
+        if self._owns_client:
+            await self._client.aclose()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        await self.aclose()
@@ -21,17 +21,26 @@
 ```
 """
 from bs4 import BeautifulSoup
+import calendar
 import html
 import logging
 from datetime import datetime
+from email.utils import parsedate_to_datetime
+from functools import lru_cache
 
 
 __all__ = (
     'TextTagCleaner',
     'pubdate_to_datetime',
+    'pubdate_to_epoch',
     'to_unicode_escape',
 )
 
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12,
+}
+
 
 class TextTagCleaner:
     def __init__(
@@ -103,6 +112,45 @@ def pubdate_to_datetime(text: str | datetime):
         return text
     return datetime.strptime(text, "%a, %d %b %Y %H:%M:%S %z")
 
+@lru_cache(maxsize=8192)
+def _rfc2822_to_epoch(text: str) -> int:
+    """"Tue, 11 Nov 2025 11:00:00 +0900" 형식을 epoch(초)로 변환한다.
+
+    네이버 API의 고정 형식은 직접 분해하고, 그 외 형식은 ``email.utils``로 처리한다.
+    같은 분 단위 기사 시각이 반복되므로 결과를 LRU 캐시에 보관한다.
+    """
+    try:
+        _, day, mon, year, hms, tz = text.split()
+        hour, minute, second = hms.split(':')
+        offset = (int(tz[1:3]) * 60 + int(tz[3:5])) * 60
+        if tz[0] == '-':
+            offset = -offset
+        return calendar.timegm((
+            int(year), _MONTHS[mon], int(day),
+            int(hour), int(minute), int(second)
+        )) - offset
+    except (ValueError, KeyError, IndexError):
+        return int(parsedate_to_datetime(text).timestamp())
+
+
+def pubdate_to_epoch(text: str | datetime | int) -> int:
+    """pubDate 값을 정렬 키로 쓸 epoch(초) 정수로 변환한다.
+
+    >>> pubdate_to_epoch("Tue, 11 Nov 2025 11:00:00 +0900")
+    1762826400
+
+    Raises:
+        ValueError: 해석할 수 없는 형식인 경우
+    """
+    if isinstance(text, int):
+        return text
+    if isinstance(text, datetime):
+        return int(text.timestamp())
+    try:
+        return _rfc2822_to_epoch(text)
+    except (TypeError, AttributeError) as e:
+        raise ValueError(f"Invalid pubDate: {text!r}") from e
+
 def to_unicode_escape(text):
     return text.encode('unicode_escape').decode('utf-8')
     
@@ -118,4 +166,5 @@ if __name__ == '__main__':
     print(cleaner(text_2))
 
     print(f"{pubdate_to_datetime('Tue, 11 Nov 2025 11:00:00 +0900')!r}")
+    print(pubdate_to_epoch('Tue, 11 Nov 2025 11:00:00 +0900'))
 
@@ -4,6 +4,7 @@ from bs4 import BeautifulSoup
 import logging
 from typing import TypedDict, Optional
 import requests
+from .http import HttpClient
 
 __all__ = (
     'NaverNewsWebScrapClient',
@@ -16,6 +17,21 @@ class NewsWebScrapResultTDict(TypedDict):
 
 
 class NaverNewsWebScrapClient:
+    DEFAULT_HEADERS = {
+        # 일부 언론사는 헤더를 검사하므로 일반적인 브라우저 헤더를 추가합니다.
+        'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+    }
+
+    def __init__(self, http_client: Optional[HttpClient]=None) -> None:
+        """
+        :param http_client: (HttpClient, optional) 세션을 공유할 HTTP 클라이언트.  
+                            미지정 시 내부에서 keep-alive 세션을 하나 생성해 모든 스크랩 요청에 재사용합니다.
+        """
+        self._http = http_client or HttpClient(timeout=10)
+
+    @property
+    def http_client(self) -> HttpClient:
+        return self._http
 
     @staticmethod
     def filter_naver_news(url: str):
@@ -48,13 +64,10 @@ class NaverNewsWebScrapClient:
                 logging.warning(f"예상되지 않은 뉴스 링크: {url}")
                 return None
 
-        headers = {
-            # 일부 언론사는 헤더를 검사하므로 일반적인 브라우저 헤더를 추가합니다.
-            'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-        }
         try:
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
+            response = self._http.request(
+                'GET', url, headers=self.DEFAULT_HEADERS
+            )
         except requests.exceptions.RequestException as e:
             print(f"Error fetching URL {url}: {e}")
             return None
@@ -1,3 +1,4 @@
 from .news_preprocess import *
 from .fetch_news_list import *
-from .news_scrap import *
\ No newline at end of file
+from .news_scrap import *
+from .news_batch import *
\ No newline at end of file
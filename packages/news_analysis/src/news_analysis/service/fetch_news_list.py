@@ -9,7 +9,7 @@ from typing import Optional, Union, Any
 from os import getenv
 import logging
 from ..modules.http import HttpClient
-from .news_preprocess import NaverNewsApiResultTDict
+from .news_preprocess import NaverNewsApiResultTDict, NaverNewsDataProcessorService
 
 
 __all__ = (
@@ -25,10 +25,14 @@ class NaverApiClient(HttpClient):
             api_client_id: Optional[str]=None,
             api_secret_key: Optional[str]=None,
             service: str='news',
+            **http_kwargs
     ) -> None:
+        """
+        :param http_kwargs: ``HttpClient``에 전달할 세션 옵션 (timeout, max_retries, session 등)
+        """
         super().__init__(self.NAVER_API_SEARCH_ENDPOINT_VAR.format(
             service_id=f"{service}.json"
-        ))
+        ), **http_kwargs)
         self._api_client_id = api_client_id or getenv('NAVER_API_CLIENT_ID')
         self._api_secret_key = api_secret_key or getenv('NAVER_API_CLIENT_SECRET')
 
@@ -104,7 +108,11 @@ class NaverNewsFetchService:
         )
         if res:
             try:
-                return res['items']
+                items = res['items']
             except KeyError as e:
                 logging.error(e)
+                return None
+            # 정렬 키는 수집 시점에 한 번만 계산한다.
+            NaverNewsDataProcessorService.attach_pub_timestamps(items)
+            return items
         return None
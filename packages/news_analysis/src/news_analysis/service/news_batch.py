@@ -0,0 +1,147 @@
+"""
+(배치 서비스) 여러 종목의 뉴스를 동시에 수집/중복 제거/스크랩/전처리한다.
+
+거래량 상위 종목처럼 종목 코드와 검색어(종목명)의 쌍을 받아, 종목 코드별 결과를 반환한다.
+
+```python
+service = NewsBatchPipelineService(NaverNewsFetchService())
+results = service.run({'005930': '삼성전자', '000660': 'SK하이닉스'})
+results['005930']   # list[NaverNewsContentTDict]
+```
+"""
+from concurrent.futures import ThreadPoolExecutor
+import logging
+from typing import Iterable, Mapping, Optional, Union
+
+from .fetch_news_list import NaverNewsFetchService
+from .news_scrap import NewsScrapService
+from .news_preprocess import (
+    NaverNewsDataProcessorService,
+    NaverNewsApiResultTDict,
+    NaverNewsContentTDict,
+)
+
+__all__ = (
+    'NewsBatchPipelineService',
+    'TNewsBatchTargets',
+)
+
+TNewsBatchTargets = Union[Mapping[str, str], Iterable[str]]
+'''종목 코드 -> 검색어 매핑, 혹은 검색어 목록 (이 경우 검색어가 키로 사용된다)'''
+
+
+class NewsBatchPipelineService:
+    """여러 검색어에 대한 뉴스 파이프라인을 한 번에 수행하는 서비스 클래스."""
+
+    def __init__(
+            self,
+            fetch_service: NaverNewsFetchService,
+            scrap_service: Optional[NewsScrapService]=None,
+            processor: Optional[NaverNewsDataProcessorService]=None,
+            max_workers: int=4,
+    ) -> None:
+        """
+        Args:
+            fetch_service (NaverNewsFetchService): 네이버 뉴스 API 서비스 (세션 공유)
+            scrap_service (NewsScrapService, optional): 본문 스크랩 서비스
+            processor (NaverNewsDataProcessorService, optional): 전처리 서비스
+            max_workers (int): API 호출과 스크랩에 사용할 동시 스레드 수
+        """
+        self._fetch_service = fetch_service
+        self._scrap_service = scrap_service or NewsScrapService()
+        self._processor = processor or NaverNewsDataProcessorService()
+        self._max_workers = max(1, max_workers)
+
+    @staticmethod
+    def _normalize_targets(targets: TNewsBatchTargets) -> dict[str, str]:
+        if isinstance(targets, Mapping):
+            return {str(k): str(v) for k, v in targets.items() if k and v}
+        return {str(q): str(q) for q in targets if q}
+
+    @staticmethod
+    def _dedup_key(item: NaverNewsApiResultTDict) -> str:
+        return item.get('originallink') or item['link']
+
+    def _fetch(self, query: str, sort: str, display: int) -> list[NaverNewsApiResultTDict]:
+        try:
+            return self._fetch_service.fetch_naver_news_api(
+                query, sort, display
+            ) or []
+        except Exception as e:
+            logging.error(f"Failed to fetch news for {query}: {e}")
+            return []
+
+    def run(
+            self,
+            targets: TNewsBatchTargets,
+            sort: str='date',
+            display: int=20,
+            web_scrap_content: bool=True,
+            preprocess: bool=True,
+            drop_if_failed: bool=False,
+    ) -> dict[str, list[Union[NaverNewsApiResultTDict, NaverNewsContentTDict]]]:
+        """종목별 뉴스를 수집해 ``{종목 코드: 뉴스 목록}`` 형태로 반환합니다.
+
+        같은 기사(originallink 기준)는 한 종목 안에서 한 번만 남기고,
+        여러 종목에 걸친 기사는 한 번만 스크랩한 뒤 결과를 공유합니다.
+
+        :param targets: 종목 코드 -> 검색어 매핑 혹은 검색어 목록
+        :param sort: 정렬 방식. 'sim'은 정확도, 'date'는 날짜순.
+        :param display: 종목당 받아올 표시 개수. (최대 100)
+        :param web_scrap_content: (bool) 뉴스 링크를 타고 본문 스크랩 여부.
+        :param preprocess: (bool) 문자열 전처리 여부.
+        :param drop_if_failed: (bool) 스크랩 실패 항목을 결과에서 제외할지 여부.
+        """
+        queries = self._normalize_targets(targets)
+        if not queries:
+            return {}
+
+        # 1. 검색 (동시 호출)
+        with ThreadPoolExecutor(max_workers=self._max_workers) as executor:
+            fetched = list(executor.map(
+                lambda q: self._fetch(q, sort, display), queries.values()
+            ))
+
+        # 2. 종목 내 중복 제거 + 종목 간 공통 기사 수집
+        per_code: dict[str, list[NaverNewsApiResultTDict]] = {}
+        unique: dict[str, NaverNewsApiResultTDict] = {}
+        for code, items in zip(queries.keys(), fetched):
+            seen: set[str] = set()
+            deduped = []
+            for item in items:
+                key = self._dedup_key(item)
+                if key in seen:
+                    continue
+                seen.add(key)
+                deduped.append(item)
+                unique.setdefault(key, item)
+            per_code[code] = deduped
+
+        results: dict[str, list] = {code: list(items) for code, items in per_code.items()}
+
+        # 3. 고유 기사만 스크랩한 뒤 종목별 결과에 다시 매핑
+        if web_scrap_content and unique:
+            scrapped = self._scrap_service.start_news_scrap(
+                unique.values(),
+                drop_if_failed=drop_if_failed,
+                max_workers=self._max_workers,
+            )
+            by_key = {self._dedup_key(content): content for content in scrapped}
+            for code, items in per_code.items():
+                results[code] = [
+                    {**by_key[key], 'index': i}
+                    for i, key in enumerate(map(self._dedup_key, items))
+                    if key in by_key
+                ]
+
+        # 4. 전처리 (종목별 사본에 적용)
+        if preprocess:
+            for items in results.values():
+                self._processor.clean_news_items(items)
+
+        logging.info(
+            f"News batch finished: targets={len(queries)}, "
+            f"unique_articles={len(unique)}, "
+            f"items={sum(len(v) for v in results.values())}"
+        )
+        return results
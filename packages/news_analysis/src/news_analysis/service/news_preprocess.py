@@ -4,21 +4,25 @@
 """
 import heapq, logging
 from datetime import datetime
-from typing import TypedDict, Literal, Union, Iterable
+from typing import TypedDict, Literal, Union, Iterable, NotRequired
 from ..modules import (
     TextTagCleaner, 
-    pubdate_to_datetime,
+    pubdate_to_epoch,
 )
 
 __all__ = (
     'NaverNewsDataProcessorService',
     'NaverNewsApiResultTDict',
     'NaverNewsContentTDict',
-    'TSort'
+    'TSort',
+    'PUB_TIMESTAMP_KEY',
 )
 
 TSort = Literal['ascending', 'descending']
 
+PUB_TIMESTAMP_KEY = 'pubTimestamp'
+'''수집 시점에 pubDate를 미리 파싱해 저장하는 epoch(초) 정렬 키'''
+
 class NaverNewsApiResultTDict(TypedDict):
     """News API의 결괏값에서 'items'키에 담긴 배열 데이터에 대한 형식
     >>> [
@@ -37,6 +41,7 @@ class NaverNewsApiResultTDict(TypedDict):
     link: str
     description: str
     pubDate: str | datetime
+    pubTimestamp: NotRequired[int]
 
 class NaverNewsContentTDict(TypedDict):
     """방문한 News 페이지의 컨텐츠 데이터에 대한 형식
@@ -58,6 +63,7 @@ class NaverNewsContentTDict(TypedDict):
     title: str
     content: str
     pubDate: str | datetime
+    pubTimestamp: NotRequired[int]
 
 class NaverNewsDataProcessorService:
     """네이버 뉴스 데이터에 대해 클라이언트에서 바로 사용가능한 형태로 데이터를 제공하는 클래스."""
@@ -113,6 +119,68 @@ class NaverNewsDataProcessorService:
         except KeyError as e:
             logging.error(e)
 
+    @staticmethod
+    def attach_pub_timestamps(
+            items: Iterable[
+                Union[NaverNewsApiResultTDict,
+                      NaverNewsContentTDict]
+            ],
+    ) -> None:
+        """각 항목의 pubDate를 한 번만 파싱해 ``pubTimestamp``(epoch 초)로 저장한다.
+
+        수집(ingest) 시점에 호출해 두면 이후 정렬/Top-K 선택에서 날짜 파싱이 발생하지 않는다.
+        파싱할 수 없는 항목은 건너뛴다.
+        """
+        for item in items:
+            if PUB_TIMESTAMP_KEY in item:
+                continue
+            try:
+                item[PUB_TIMESTAMP_KEY] = pubdate_to_epoch(item['pubDate'])
+            except (KeyError, ValueError) as e:
+                logging.warning(f"Cannot parse pubDate: {e}")
+
+    @staticmethod
+    def select_top_k_by_date_stream(
+            items: Iterable[
+                Union[NaverNewsApiResultTDict,
+                      NaverNewsContentTDict]
+            ],
+            k: int,
+            sort: TSort='descending',
+            sort_item_key: str='pubDate'
+    ):
+        """이터레이터를 한 번 순회하며 크기 k의 힙만 유지해 상위 k개를 선택합니다.
+
+        제너레이터/파일 스트림처럼 전체를 메모리에 올릴 수 없는 입력에도 사용할 수 있습니다.
+        ``pubTimestamp``가 있으면 그대로 사용하고, 없으면 (캐시된) 파서로 한 번만 계산합니다.
+
+        :param items: 뉴스 항목 이터러블
+        :param k: (int) 선택할 항목 개수
+        :param sort: (str) 정렬 방향 ('descending' | 'ascending')
+        """
+        if sort not in ("descending", "ascending"):
+            raise ValueError(f"Invalid sort arg: {sort}")
+        if k <= 0:
+            return []
+        missing = 0 if sort == "descending" else float('inf')
+        use_timestamp = sort_item_key == 'pubDate'
+
+        def key(item) -> float:
+            if use_timestamp:
+                ts = item.get(PUB_TIMESTAMP_KEY)
+                if ts is not None:
+                    return ts
+            value = item.get(sort_item_key)
+            if value is None:
+                return missing
+            try:
+                return pubdate_to_epoch(value)
+            except ValueError:
+                return missing
+
+        heap_func = heapq.nlargest if sort == "descending" else heapq.nsmallest
+        return heap_func(k, items, key=key)
+
     def select_top_k_by_date_from(
             self, 
             data: list[Union[NaverNewsApiResultTDict,
@@ -168,11 +236,6 @@ class NaverNewsDataProcessorService:
             raise ValueError(f"Invalid sort arg: {sort}")
         elif not data:
             return []
-        heap_func = heapq.nlargest if sort == "descending" else heapq.nsmallest
-        default_date = datetime(1970, 1, 1) if sort == "descending" else datetime(2099, 1, 1)
-        top_k = heap_func(
-            k, data, 
-            key=lambda item: pubdate_to_datetime(item.get(sort_item_key, default_date))
+        return self.select_top_k_by_date_stream(
+            data, k, sort=sort, sort_item_key=sort_item_key
         )
-        return top_k
-    
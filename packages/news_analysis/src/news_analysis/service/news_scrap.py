@@ -1,11 +1,39 @@
-from typing import Iterable, TYPE_CHECKING, Optional, Union
-from ..modules import NaverNewsWebScrapClient
+from typing import Any, Iterable, TYPE_CHECKING, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from ..modules import NaverNewsWebScrapClient, NewsWebScrapResultTDict
 if TYPE_CHECKING:
     from .news_preprocess import NaverNewsApiResultTDict, NaverNewsContentTDict
 import time
 
 class NewsScrapService:
 
+    def __init__(
+            self,
+            client: Optional[NaverNewsWebScrapClient]=None,
+            metrics: Optional[Any]=None
+    ) -> None:
+        """
+        Args:
+            client (NaverNewsWebScrapClient, optional): 스크랩 클라이언트. 인스턴스가 유지되는 동안  
+                                                    같은 HTTP 세션(커넥션 풀)을 재사용합니다.
+            metrics (optional): ``timer(name, **labels)``를 가진 계측 객체 (예: ``antic_extensions.get_metrics()``).  
+                                기사별 스크랩 시간을 ``news_scrap_seconds{outcome=ok|empty|error}``로 기록합니다.
+        """
+        self._client = client or NaverNewsWebScrapClient()
+        self._metrics = metrics
+
+    def _scrap(self, link: str) -> Optional[NewsWebScrapResultTDict]:
+        timer = self._metrics.timer('news_scrap_seconds') if self._metrics is not None else nullcontext({})
+        with timer as labels:
+            scrapped = self._client.scrap_naver_news_content(
+                link,
+                stop_if_abnormal_news_link=True
+            )
+            if not scrapped:
+                labels['outcome'] = 'empty'
+        return scrapped
+
     def sync_start_news_scrap(
             self,
             news_results: "Iterable[NaverNewsApiResultTDict]",
@@ -20,25 +48,65 @@ class NewsScrapService:
                                             해당 기능이 비활성화된 경우 원본 데이터를 유지합니다.  
             force_latency (float): 강제 지연시간 
         """
-        client = NaverNewsWebScrapClient()
-        
         result = []
         for i, item in enumerate(news_results):
-            scrapped = client.scrap_naver_news_content(
-                item['link'],
-                stop_if_abnormal_news_link=True
-            )
+            scrapped = self._scrap(item['link'])
             if drop_if_failed and not scrapped:
                 continue
-            result.append(
-                {
-                    'index': i,
-                    'link': item['link'],
-                    'originallink': item['originallink'],
-                    'title': scrapped['title'] if scrapped else item['title'],
-                    'content': scrapped['body'] if scrapped else item['description'],
-                    'pubDate': item['pubDate']
-                }
-            )
+            result.append(self._to_content_item(i, item, scrapped))
             time.sleep(force_latency)
         return result
+
+    def start_news_scrap(
+            self,
+            news_results: "Iterable[NaverNewsApiResultTDict]",
+            drop_if_failed: bool = False,
+            max_workers: int=4,
+            force_latency: float=0.2
+    ) -> "list[NaverNewsContentTDict]":
+        """뉴스 스크랩을 ``max_workers``개의 스레드로 동시에 수행합니다.
+
+        스크랩 클라이언트의 커넥션 풀을 공유하며, 결과 순서는 입력 순서를 유지합니다.
+
+        Args:
+            news_results (Iterable[NaverNewsApiResultTDict]): 네이버 뉴스 API 결과 항목
+            drop_if_failed (bool, optional): 스크랩 실패하거나 본문이 인식되지 않는 경우 버립니다.
+            max_workers (int): 동시 스크랩 스레드 수
+            force_latency (float): 스레드별 요청 간 강제 지연시간
+        """
+        items = list(news_results)
+        if not items:
+            return []
+
+        def scrap(item: "NaverNewsApiResultTDict") -> Optional[NewsWebScrapResultTDict]:
+            scrapped = self._scrap(item['link'])
+            time.sleep(force_latency)
+            return scrapped
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            scrapped_items = list(executor.map(scrap, items))
+
+        result = []
+        for i, (item, scrapped) in enumerate(zip(items, scrapped_items)):
+            if drop_if_failed and not scrapped:
+                continue
+            result.append(self._to_content_item(i, item, scrapped))
+        return result
+
+    @staticmethod
+    def _to_content_item(
+            index: int,
+            item: "NaverNewsApiResultTDict",
+            scrapped: Optional[NewsWebScrapResultTDict]
+    ) -> "NaverNewsContentTDict":
+        content: "NaverNewsContentTDict" = {
+            'index': index,
+            'link': item['link'],
+            'originallink': item['originallink'],
+            'title': scrapped['title'] if scrapped else item['title'],
+            'content': scrapped['body'] if scrapped else item['description'],
+            'pubDate': item['pubDate']
+        }
+        if 'pubTimestamp' in item:
+            content['pubTimestamp'] = item['pubTimestamp']
+        return content
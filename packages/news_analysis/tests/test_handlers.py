@@ -0,0 +1,54 @@
+import json
+import pytest
+from news_analysis.modules import (
+    JSONLoader,
+    JSONLinesReader,
+    FileHandler,
+    chunked,
+)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 13, 64 * 1024])
+def test_json_loader_streams_same_items_as_json_load(chunk_size):
+    with open('tests/scrapped.json', encoding='utf-8') as f:
+        expected = json.load(f)
+    assert list(JSONLoader(chunk_size)('tests/scrapped.json')) == expected
+
+
+def test_json_loader_streams_object_entries():
+    entries = list(JSONLoader(7)('tests/news.json'))
+    assert [next(iter(e)) for e in entries] == [
+        'lastBuildDate', 'total', 'start', 'display', 'items'
+    ]
+
+
+def test_json_loader_handles_split_numbers(tmp_path):
+    path = tmp_path / 'numbers.json'
+    path.write_text('[1, 2.5e3 , "a", {"x": [1, {}]}, null, true]')
+    assert list(JSONLoader(1)(str(path))) == [1, 2500.0, 'a', {'x': [1, {}]}, None, True]
+
+
+def test_jsonl_round_trip_with_gzip_append(tmp_path):
+    items = list(JSONLoader()('tests/scrapped.json'))
+    path = str(tmp_path / 'scrapped.jsonl.gz')
+    FileHandler.save_to_jsonl(items[:10], path)
+    FileHandler.save_to_jsonl(items[10:], path, append=True)
+
+    assert list(JSONLinesReader(path)) == items
+    sizes = [len(c) for c in JSONLinesReader(path).iter_chunks(20)]
+    assert sum(sizes) == len(items) and max(sizes) == 20
+
+
+def test_jsonl_zstd_append_reads_every_frame(tmp_path):
+    pytest.importorskip('zstandard')
+    items = list(JSONLoader()('tests/scrapped.json'))
+    path = str(tmp_path / 'scrapped.jsonl.zst')
+    # append마다 새 zstd frame이 이어 붙는다.
+    FileHandler.save_to_jsonl(items[:10], path)
+    FileHandler.save_to_jsonl(items[10:], path, append=True)
+
+    assert list(JSONLinesReader(path)) == items
+
+
+def test_chunked():
+    assert list(chunked(range(5), 2)) == [[0, 1], [2, 3], [4]]
@@ -0,0 +1,55 @@
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+from news_analysis.modules.http import HttpClient, AsyncHttpClient
+
+
+class _FlakyHandler(BaseHTTPRequestHandler):
+    """처음 1회는 503, 이후에는 JSON을 반환하는 테스트 핸들러."""
+    protocol_version = 'HTTP/1.1'
+    calls = 0
+
+    def do_GET(self):
+        type(self).calls += 1
+        if type(self).calls == 1:
+            body = b'busy'
+            self.send_response(503)
+        else:
+            body = json.dumps({'items': [1, 2, 3]}).encode()
+            self.send_response(200)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture()
+def flaky_server():
+    _FlakyHandler.calls = 0
+    server = ThreadingHTTPServer(('127.0.0.1', 0), _FlakyHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}/"
+    server.shutdown()
+    server.server_close()
+
+
+def test_http_client_retries_and_reuses_session(flaky_server):
+    with HttpClient(flaky_server, backoff_factor=0) as client:
+        assert client.get() == {'items': [1, 2, 3]}
+        assert _FlakyHandler.calls == 2
+        assert client.get() == {'items': [1, 2, 3]}
+
+
+def test_async_http_client_retries(flaky_server):
+    async def run():
+        async with AsyncHttpClient(flaky_server, backoff_factor=0) as client:
+            return await client.get()
+
+    assert asyncio.run(run()) == {'items': [1, 2, 3]}
+    assert _FlakyHandler.calls == 2
@@ -0,0 +1,73 @@
+import pytest
+from contextlib import contextmanager
+from news_analysis.service import NewsBatchPipelineService, NewsScrapService
+
+
+class _FakeFetchService:
+    def fetch_naver_news_api(self, query, sort='date', display=100):
+        return [
+            {
+                'title': f'<b>{query}</b> {n}',
+                'originallink': f'https://press.example.com/{n}',
+                'link': f'https://n.news.naver.com/mnews/article/{n}',
+                'description': f'<b>{query}</b> 요약',
+                'pubDate': 'Tue, 11 Nov 2025 07:00:00 +0900',
+            }
+            # 'shared'는 모든 종목에 공통, 'a'는 한 종목 내 중복
+            for n in (f'{query}-a', f'{query}-a', 'shared')
+        ]
+
+
+class _FakeScrapClient:
+    def __init__(self):
+        self.urls = []
+
+    def scrap_naver_news_content(self, url, stop_if_abnormal_news_link=False):
+        self.urls.append(url)
+        return {'title': f'제목 {url}', 'body': f'<p>본문 {url}</p>'}
+
+
+def test_news_batch_dedups_and_scraps_shared_articles_once():
+    scrap_client = _FakeScrapClient()
+    service = NewsBatchPipelineService(
+        _FakeFetchService(),
+        scrap_service=NewsScrapService(scrap_client),
+    )
+    results = service.run({'005930': '삼성전자', '000660': 'SK하이닉스'})
+
+    assert set(results) == {'005930', '000660'}
+    assert [len(v) for v in results.values()] == [2, 2]
+    # 고유 기사 3건만 스크랩 (종목별 1건 + 공통 1건)
+    assert len(scrap_client.urls) == 3
+    assert results['005930'][0]['content'] == f"본문 {results['005930'][0]['link']}"
+
+
+def test_news_batch_without_scrap_keeps_api_items():
+    service = NewsBatchPipelineService(_FakeFetchService())
+    results = service.run(['삼성전자'], web_scrap_content=False)
+    assert results['삼성전자'][0]['title'] == '삼성전자 삼성전자-a'
+
+
+class _RecordingMetrics:
+    def __init__(self):
+        self.outcomes = []
+
+    @contextmanager
+    def timer(self, name, **labels):
+        yield labels
+        self.outcomes.append((name, labels.get('outcome', 'ok')))
+
+
+def test_news_scrap_records_latency_per_article():
+    class _EmptyForShared(_FakeScrapClient):
+        def scrap_naver_news_content(self, url, stop_if_abnormal_news_link=False):
+            return None if url.endswith('shared') else super().scrap_naver_news_content(url)
+
+    metrics = _RecordingMetrics()
+    service = NewsBatchPipelineService(
+        _FakeFetchService(),
+        scrap_service=NewsScrapService(_EmptyForShared(), metrics=metrics),
+    )
+    service.run(['삼성전자'])
+
+    assert sorted(metrics.outcomes) == [('news_scrap_seconds', 'empty'), ('news_scrap_seconds', 'ok')]
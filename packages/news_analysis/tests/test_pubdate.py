@@ -0,0 +1,40 @@
+import pytest
+from email.utils import parsedate_to_datetime
+from news_analysis.modules import pubdate_to_epoch, JSONLoader
+from news_analysis.service import NaverNewsDataProcessorService, PUB_TIMESTAMP_KEY
+
+
+@pytest.mark.parametrize('text', [
+    'Tue, 11 Nov 2025 07:00:00 +0900',
+    'Mon, 10 Nov 2025 23:59:59 -0330',
+    '11 Nov 2025 07:00:00 GMT',
+])
+def test_pubdate_to_epoch_matches_rfc2822(text):
+    assert pubdate_to_epoch(text) == int(parsedate_to_datetime(text).timestamp())
+
+
+def test_top_k_uses_precomputed_timestamps():
+    items = [
+        e for e in JSONLoader()('tests/news.json')
+        if 'items' in e
+    ][0]['items']
+    NaverNewsDataProcessorService.attach_pub_timestamps(items)
+    assert all(PUB_TIMESTAMP_KEY in item for item in items)
+
+    service = NaverNewsDataProcessorService()
+    top = service.select_top_k_by_date_from(items, 5, sort='descending')
+    expected = sorted(
+        items, key=lambda i: parsedate_to_datetime(i['pubDate']), reverse=True
+    )[:5]
+    assert [i['pubTimestamp'] for i in top] == [i['pubTimestamp'] for i in expected]
+
+
+def test_streaming_top_k_consumes_generator():
+    stream = (
+        {'pubDate': f'Tue, 11 Nov 2025 {h:02d}:00:00 +0900'}
+        for h in range(24)
+    )
+    top = NaverNewsDataProcessorService.select_top_k_by_date_stream(
+        stream, 3, sort='ascending'
+    )
+    assert [i['pubDate'][17:19] for i in top] == ['00', '01', '02']